@@ -8,6 +8,7 @@ All analysis is pure Python with no LLM calls.
 Usage:
     python scripts/analyze_mechanics.py playtest_results.json --output analysis.json
     python scripts/analyze_mechanics.py playtest_results.json --format text
+    python scripts/analyze_mechanics.py results/games --format text   # game table directory
     python scripts/analyze_mechanics.py --help
 
 The input playtest_results.json should have the structure:
@@ -35,6 +36,10 @@ The input playtest_results.json should have the structure:
     ...
   }
 }
+
+The input may also be a game table directory written by
+brinksmanship.testing.game_table.GameTableWriter (one row per game); it is
+memory-mapped and summarized into the same structure without parsing JSON.
 """
 
 import argparse
@@ -541,11 +546,64 @@ def format_text_report(report: AnalysisReport) -> str:
     return "\n".join(lines)
 
 
+def results_from_game_table(path: Path) -> dict:
+    """Summarize a game table directory into the playtest results structure.
+
+    Per-game VP scores are not expanded into lists; the VP standard
+    deviation goes into the aggregate instead.
+
+    Args:
+        path: Game table directory
+
+    Returns:
+        Playtest results dictionary (pairings and aggregate)
+    """
+    import numpy as np
+
+    from brinksmanship.testing.game_table import GameTable
+
+    table = GameTable.open(path)
+    if len(table) == 0:
+        return {"pairings": {}, "aggregate": {}}
+
+    opponents_a = table.categories["opponent_a"]
+    opponents_b = table.categories["opponent_b"]
+    winner_codes = {label: table.code("winner", label) for label in ("A", "B", "tie", "mutual_destruction")}
+    ending = table["ending_type"]
+    pair_keys = table["opponent_a"].astype(np.int64) * len(opponents_b) + table["opponent_b"]
+
+    pairings = {}
+    for key in np.unique(pair_keys).tolist():
+        rows = pair_keys == key
+        winners = table["winner"][rows]
+        pairing_name = f"{opponents_a[key // len(opponents_b)]}:{opponents_b[key % len(opponents_b)]}"
+        pairings[pairing_name] = {
+            "total_games": int(rows.sum()),
+            "total_turns": int(table["turns_played"][rows].sum()),
+            "wins_a": int((winners == winner_codes["A"]).sum()),
+            "wins_b": int((winners == winner_codes["B"]).sum()),
+            "ties": int((winners == winner_codes["tie"]).sum()),
+            "mutual_destructions": int((winners == winner_codes["mutual_destruction"]).sum()),
+            "settlements": int((ending[rows] == table.code("ending_type", "settlement")).sum()),
+        }
+
+    vp = np.concatenate([table["vp_a"], table["vp_b"]]).astype(np.float64)
+    return {
+        "pairings": pairings,
+        "aggregate": {
+            "total_games": len(table),
+            "avg_turns": float(table["turns_played"].mean()),
+            "settlement_rate": float(table.where(ending_type="settlement").mean()),
+            "vp_std_dev": float(vp.std(ddof=1)) if len(vp) > 1 else 0.0,
+        },
+    }
+
+
 def load_playtest_results(path: Path) -> dict:
-    """Load playtest results from a JSON file.
+    """Load playtest results from a JSON file or a game table directory.
 
     Args:
-        path: Path to the JSON file
+        path: Path to the JSON file or game table directory
 
     Returns:
         Parsed playtest results dictionary
@@ -554,6 +612,8 @@ def load_playtest_results(path: Path) -> dict:
         FileNotFoundError: If the file doesn't exist
         json.JSONDecodeError: If the file isn't valid JSON
     """
+    if path.is_dir():
+        return results_from_game_table(path)
     with open(path) as f:
         return json.load(f)
 
@@ -585,7 +645,7 @@ Thresholds (from GAME_MANUAL.md):
     parser.add_argument(
         "input",
         type=Path,
-        help="Path to playtest results JSON file",
+        help="Path to playtest results JSON file or game table directory",
     )
 
     parser.add_argument(
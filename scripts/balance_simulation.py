@@ -20,6 +20,26 @@ Usage:
     # Run with reproducible seed
     uv run python scripts/balance_simulation.py --games 100 --seed 42
 
+    # Run large batches on the vectorized engine
+    uv run python scripts/balance_simulation.py --games 100000 --vectorized
+
+    # Also write one row per game to a columnar game table
+    uv run python scripts/balance_simulation.py --games 100000 --vectorized --games-table results/games
+
+    # Stop each pairing once mean Total Value is known to +/-1 VP (at most 20000 games)
+    uv run python scripts/balance_simulation.py --games 20000 --precision 1.0
+
+    # Save progress as pairings grow; after a crash, rerun with --resume to continue
+    uv run python scripts/balance_simulation.py --games 100000 --checkpoint runs/balance
+    uv run python scripts/balance_simulation.py --games 100000 --checkpoint runs/balance --resume
+
+    # Spread the pairings over several machines sharing a queue file
+    uv run python scripts/balance_simulation.py --games 1000000 --queue /shared/queue.db --job balance-1
+    uv run python scripts/simulation_worker.py --queue /shared/queue.db   # on each worker host
+
+    # Reuse seeded pairings whose scenario, parameters and engine are unchanged
+    uv run python scripts/balance_simulation.py --games 100000 --seed 42 --cache .cache/simulations
+
 Opponents tested (from brinksmanship.opponents.deterministic):
     - NashCalculator: Pure game theorist, plays Nash equilibrium with risk awareness
     - SecuritySeeker: Spiral model actor, prefers cooperation unless threatened
@@ -36,8 +56,12 @@ from pathlib import Path
 from brinksmanship.testing.batch_runner import (
     DETERMINISTIC_OPPONENTS,
     BatchRunner,
+    PrecisionTarget,
     print_results_summary,
 )
+from brinksmanship.testing.distributed import Coordinator, SQLiteWorkQueue
+from brinksmanship.testing.game_table import GameTableWriter
+from brinksmanship.testing.result_cache import ResultCache
 
 
 def parse_pairings(pairings_str: str) -> list[tuple[str, str]]:
@@ -94,6 +118,15 @@ Examples:
 
   # Run with reproducible seed
   uv run python scripts/balance_simulation.py --games 100 --seed 42
+
+  # Run large batches on the vectorized engine
+  uv run python scripts/balance_simulation.py --games 100000 --vectorized
+
+  # Also write one row per game to a columnar game table
+  uv run python scripts/balance_simulation.py --games 100000 --vectorized --games-table results/games
+
+  # Stop each pairing once mean Total Value is known to +/-1 VP (at most 20000 games)
+  uv run python scripts/balance_simulation.py --games 20000 --precision 1.0
         """,
     )
 
@@ -139,6 +172,74 @@ Examples:
         default=None,
         help="Output directory for results JSON",
     )
+    parser.add_argument(
+        "--games-table",
+        type=str,
+        default=None,
+        help="Directory of a columnar game table to append one row per game to",
+    )
+    parser.add_argument(
+        "--vectorized",
+        action="store_true",
+        help="Run each pairing in lockstep on the NumPy batch engine, one pairing per worker",
+    )
+    parser.add_argument(
+        "--precision",
+        type=float,
+        default=None,
+        help="Stop a pairing once the 95%% CI half-width of mean Total Value is this small (--games is the maximum)",
+    )
+    parser.add_argument(
+        "--win-precision",
+        type=float,
+        default=None,
+        help="Stop a pairing once the 95%% CI half-width of player A's win rate is this small",
+    )
+    parser.add_argument(
+        "--min-games",
+        type=int,
+        default=100,
+        help="Games per pairing before early stopping is considered (default: 100)",
+    )
+    parser.add_argument(
+        "--crn",
+        action="store_true",
+        help="Common random numbers: play game i of every pairing on the same random draws",
+    )
+    parser.add_argument(
+        "--antithetic",
+        action="store_true",
+        help="Antithetic final resolution noise (pairs of games with opposite noise)",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        type=str,
+        default=None,
+        help="Directory to save each pairing's progress in (all-pairings runs only)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue the run saved in --checkpoint, skipping finished games",
+    )
+    parser.add_argument(
+        "--queue",
+        type=str,
+        default=None,
+        help="SQLite work queue shared with scripts/simulation_worker.py processes on other hosts",
+    )
+    parser.add_argument(
+        "--job",
+        type=str,
+        default=None,
+        help="Job name in --queue (rerun with the same name to continue an interrupted run)",
+    )
+    parser.add_argument(
+        "--cache",
+        type=str,
+        default=None,
+        help="Result cache directory: reuse seeded pairings whose inputs are unchanged",
+    )
     parser.add_argument(
         "--quiet",
         action="store_true",
@@ -146,18 +247,52 @@ Examples:
     )
 
     args = parser.parse_args()
+    if args.resume and args.checkpoint is None:
+        parser.error("--resume needs --checkpoint")
+    if args.checkpoint and args.pairings:
+        parser.error("--checkpoint only applies to runs of all pairings, not --pairings")
+    if args.queue and (args.pairings or args.checkpoint or args.games_table):
+        parser.error(
+            "--queue runs all pairings on the workers; it cannot be combined with --pairings, --checkpoint or --games-table"
+        )
+    if args.queue and (args.precision is not None or args.win_precision is not None):
+        parser.error("--queue cannot be combined with --precision/--win-precision")
+    if args.job and not args.queue:
+        parser.error("--job needs --queue")
+    if args.cache and args.queue:
+        parser.error("--cache cannot be combined with --queue (rerun the same --job to reuse finished units)")
+
+    target = None
+    if args.precision is not None or args.win_precision is not None:
+        if args.vectorized:
+            print("Error: --precision/--win-precision cannot be combined with --vectorized", file=sys.stderr)
+            sys.exit(1)
+        target = PrecisionTarget(
+            total_value_half_width=args.precision,
+            win_rate_half_width=args.win_precision,
+            min_games=args.min_games,
+        )
 
     print("=" * 80)
     print("BRINKSMANSHIP BALANCE SIMULATION")
     print("=" * 80)
     print(f"Scenario: {args.scenario}")
-    print(f"Games per pairing: {args.games}")
-    print(f"Workers: {args.workers}")
+    print(f"Games per pairing: {args.games}{' (maximum, early stopping)' if target else ''}")
+    print(f"Engine: {'vectorized' if args.vectorized else f'{args.workers} workers'}")
+    if args.queue:
+        print(f"Queue: {args.queue} (played by simulation_worker.py processes)")
     if args.seed is not None:
         print(f"Seed: {args.seed}")
     print()
 
-    runner = BatchRunner(scenario_id=args.scenario)
+    runner = BatchRunner(
+        scenario_id=args.scenario,
+        max_workers=args.workers,
+        common_random_numbers=args.crn,
+        antithetic=args.antithetic,
+        result_cache=ResultCache(args.cache) if args.cache else None,
+    )
+    games = GameTableWriter(args.games_table) if args.games_table else None
 
     if args.pairings:
         # Run specific pairings
@@ -179,22 +314,34 @@ Examples:
             timestamp=datetime.now().isoformat(),
         )
 
-        for idx, (name_a, name_b) in enumerate(pairings):
-            pairing_key = f"{name_a}:{name_b}"
-            print(f"  [{idx + 1}/{len(pairings)}] {pairing_key}...", end=" ", flush=True)
-
-            pairing_seed = (args.seed + idx * args.games) if args.seed is not None else None
-
-            stats = runner.run_pairing(
-                name_a,
-                name_b,
-                num_games=args.games,
-                seed=pairing_seed,
-                max_workers=args.workers,
-            )
-
-            results.pairings[pairing_key] = stats
-            print(f"A:{stats.win_rate_a * 100:.0f}% B:{stats.win_rate_b * 100:.0f}%")
+        # One worker pool for all requested pairings
+        with runner:
+            for idx, (name_a, name_b) in enumerate(pairings):
+                pairing_key = f"{name_a}:{name_b}"
+                print(f"  [{idx + 1}/{len(pairings)}] {pairing_key}...", end=" ", flush=True)
+
+                pairing_seed = args.seed
+                if args.seed is not None and not args.crn:
+                    pairing_seed = args.seed + idx * args.games
+
+                if args.vectorized:
+                    stats = runner.run_pairing_vectorized(
+                        name_a, name_b, num_games=args.games, seed=pairing_seed, games=games
+                    )
+                else:
+                    stats = runner.run_pairing(
+                        name_a,
+                        name_b,
+                        num_games=args.games,
+                        seed=pairing_seed,
+                        max_workers=args.workers,
+                        games=games,
+                        target=target,
+                    )
+
+                results.pairings[pairing_key] = stats
+                print(f"A:{stats.win_rate_a * 100:.0f}% B:{stats.win_rate_b * 100:.0f}%", end="")
+                print(f" ({stats.total_games} games)" if target else "")
 
         results.compute_aggregate()
         results.duration_seconds = time.time() - start_time
@@ -213,13 +360,35 @@ Examples:
 
         print(f"Running all pairings of {len(opponent_names or DETERMINISTIC_OPPONENTS)} opponents...")
 
-        results = runner.run_all_pairings(
-            opponent_names=opponent_names,
-            num_games=args.games,
-            seed=args.seed,
-            max_workers=args.workers,
-            output_dir=args.output,
-        )
+        if args.queue:
+            coordinator = Coordinator(SQLiteWorkQueue(args.queue), quiet=args.quiet)
+            results = coordinator.run_all_pairings(
+                runner,
+                opponent_names=opponent_names,
+                num_games=args.games,
+                seed=args.seed,
+                job=args.job,
+                vectorized=args.vectorized,
+            )
+        else:
+            results = runner.run_all_pairings(
+                opponent_names=opponent_names,
+                num_games=args.games,
+                seed=args.seed,
+                max_workers=args.workers,
+                output_dir=args.output,
+                vectorized=args.vectorized,
+                games=games,
+                target=target,
+                checkpoint_dir=args.checkpoint,
+                resume=args.resume,
+            )
+
+    if games is not None:
+        games.close()
+        print(f"Game table: {games.num_rows} games in {games.path}")
+    if runner.result_cache is not None:
+        print(f"Result cache: {runner.result_cache.hits} pairings reused, {runner.result_cache.misses} played")
 
     if not args.quiet:
         print_results_summary(results)
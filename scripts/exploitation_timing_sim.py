@@ -3,6 +3,7 @@
 
 Simulates games where Player A defects exactly once at turn N,
 measuring payoff to determine if late-game defection is dominant.
+Every defection turn's games run as one BatchGameEngine batch.
 
 This validates that capture mechanics don't create a dominant "late defection" strategy.
 If the peak defection turn is 12+, it indicates late-defection dominance which may
@@ -17,24 +18,31 @@ Usage:
     # Run with reproducible seed
     uv run python scripts/exploitation_timing_sim.py --games 100 --seed 42
 
+    # Save each finished defection turn; after a crash, rerun with --resume to skip them
+    uv run python scripts/exploitation_timing_sim.py --games 1000 --checkpoint runs/timing
+    uv run python scripts/exploitation_timing_sim.py --games 1000 --checkpoint runs/timing --resume
+
+    # Reuse seeded defection turns whose scenario, parameters and engine are unchanged
+    uv run python scripts/exploitation_timing_sim.py --games 1000 --seed 42 --cache .cache/simulations
+
 See GAME_MANUAL.md Appendix C.6 for simulation specifications.
 """
 
 from __future__ import annotations
 
 import argparse
-import asyncio
 import statistics
 import time
-from concurrent.futures import ProcessPoolExecutor, as_completed
-from dataclasses import dataclass, field
-
-from brinksmanship.engine.game_engine import EndingType, GameEngine
-from brinksmanship.models.actions import Action, ActionType
-from brinksmanship.models.state import GameState
-from brinksmanship.opponents.base import Opponent, SettlementProposal, SettlementResponse
-from brinksmanship.opponents.deterministic import TitForTat
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+import numpy as np
+
+from brinksmanship.engine.batch_engine import BatchGameEngine, BatchView
+from brinksmanship.opponents.batch_policies import BatchTitForTat
 from brinksmanship.storage import get_scenario_repository
+from brinksmanship.testing.checkpoint import RunCheckpoint
+from brinksmanship.testing.result_cache import ResultCache, params_values, scenario_hash, source_version
 
 
 @dataclass
@@ -51,27 +59,23 @@ class TimingResult:
     ties: int = 0
     mutual_destructions: int = 0
 
-    def add_game(
+    def add_games(
         self,
-        surplus_captured: float,
-        position_a: float,
-        vp_a: float,
-        winner: str,
+        surplus_captured: np.ndarray,
+        position_a: np.ndarray,
+        vp_a: np.ndarray,
+        winners: np.ndarray,
     ) -> None:
-        """Add a game result to the statistics."""
-        self.games_played += 1
-        self.surplus_captured_list.append(surplus_captured)
-        self.position_a_list.append(position_a)
-        self.vp_a_list.append(vp_a)
-
-        if winner == "A":
-            self.wins_a += 1
-        elif winner == "B":
-            self.wins_b += 1
-        elif winner == "tie":
-            self.ties += 1
-        elif winner == "mutual_destruction":
-            self.mutual_destructions += 1
+        """Add per-game result arrays to the statistics."""
+        self.games_played += len(vp_a)
+        self.surplus_captured_list.extend(surplus_captured.tolist())
+        self.position_a_list.extend(position_a.tolist())
+        self.vp_a_list.extend(vp_a.tolist())
+
+        self.wins_a += int(np.sum(winners == "A"))
+        self.wins_b += int(np.sum(winners == "B"))
+        self.ties += int(np.sum(winners == "tie"))
+        self.mutual_destructions += int(np.sum(winners == "mutual_destruction"))
 
     @property
     def avg_surplus_captured(self) -> float:
@@ -102,143 +106,49 @@ class TimingResult:
         return self.wins_a / self.games_played
 
 
-class TimedDefector(Opponent):
-    """Opponent that defects exactly once at a specified turn.
+class BatchTimedDefector:
+    """Opponent that defects exactly once, at a defection turn per game.
 
-    Cooperates on all turns except the specified defection turn.
-    Used to measure the payoff of defecting at different points in the game.
+    Cooperates on every other turn, takes the first action of the chosen
+    type and never settles, so the payoff of defecting at each point in the
+    game can be measured.
     """
 
-    def __init__(self, defect_turn: int) -> None:
-        """Initialize with the turn to defect on.
+    first_action = True
+
+    def __init__(self, defect_turns: np.ndarray) -> None:
+        """Initialize with the turn each game's player defects on.
 
         Args:
-            defect_turn: The turn number (1-indexed) to defect on.
-                        Cooperates on all other turns.
+            defect_turns: Defection turn (1-indexed) per game of the batch
         """
-        super().__init__(name=f"TimedDefector(turn={defect_turn})")
-        self.defect_turn = defect_turn
-        self._is_player_a: bool = True
-        self._defected: bool = False
+        self.name = "TimedDefector"
+        self.defect_turns = defect_turns
+        self.defected = np.zeros(len(defect_turns), dtype=bool)
 
-    def set_player_side(self, is_player_a: bool) -> None:
-        """Set which side this opponent is playing."""
-        self._is_player_a = is_player_a
+    def choose_cooperative(self, view: BatchView, rng: np.random.Generator) -> np.ndarray:
+        """Cooperate except on each game's defection turn."""
+        defect = (view.turn == self.defect_turns[view.idx]) & ~self.defected[view.idx]
+        self.defected[view.idx[defect]] = True
+        return ~defect
 
-    async def choose_action(self, state: GameState, available_actions: list[Action]) -> Action:
-        """Choose action based on timed defection strategy.
+    def observe(self, idx: np.ndarray, opponent_action: np.ndarray) -> None:
+        """The defection turn does not depend on the opponent."""
 
-        Defects only on the specified turn, cooperates otherwise.
-        """
-        # Determine action type for this turn
-        if state.turn == self.defect_turn and not self._defected:
-            self._defected = True
-            action_type = ActionType.COMPETITIVE
-        else:
-            action_type = ActionType.COOPERATIVE
-
-        # Find an action of the desired type
-        typed_actions = [a for a in available_actions if a.action_type == action_type]
-        if typed_actions:
-            return typed_actions[0]
-
-        # Fallback to any action if none of desired type
-        return (
-            available_actions[0]
-            if available_actions
-            else Action(name="Hold", action_type=ActionType.COOPERATIVE, description="Hold")
-        )
+    def propose_settlement(self, view: BatchView, rng: np.random.Generator) -> tuple[np.ndarray, np.ndarray]:
+        """Never propose settlement."""
+        return np.zeros(len(view), dtype=bool), np.zeros(len(view), dtype=np.int64)
 
-    async def evaluate_settlement(
+    def evaluate_settlement(
         self,
-        proposal: SettlementProposal,
-        state: GameState,
+        view: BatchView,
+        offered_vp: np.ndarray,
         is_final_offer: bool,
-    ) -> SettlementResponse:
-        """Reject all settlement proposals - we're testing defection timing."""
-        return SettlementResponse(
-            action="reject",
-            rejection_reason="Testing exploitation timing - no settlement.",
-        )
-
-    async def propose_settlement(self, state: GameState) -> SettlementProposal | None:
-        """Never propose settlement - we're testing defection timing."""
-        return None
-
-
-def _run_single_timing_game(args: tuple) -> dict:
-    """Worker function for running a single timed defection game.
-
-    Args:
-        args: Tuple of (scenario_id, defect_turn, seed)
-
-    Returns:
-        Dict with game results
-    """
-    scenario_id, defect_turn, seed = args
-
-    # Create opponents: TimedDefector as A, TitForTat as B
-    defector = TimedDefector(defect_turn)
-    defector.set_player_side(is_player_a=True)
-
-    responder = TitForTat()
-    responder.set_player_side(is_player_a=False)
-
-    # Get scenario repository
-    repo = get_scenario_repository()
-
-    # Create game engine
-    engine = GameEngine(scenario_id, repo, random_seed=seed)
-
-    # Run game
-    while not engine.is_game_over():
-        state = engine.get_current_state()
-        actions_a = engine.get_available_actions("A")
-        actions_b = engine.get_available_actions("B")
-
-        # Get actions (sync since our opponents are deterministic)
-        action_a = asyncio.run(defector.choose_action(state, actions_a))
-        action_b = asyncio.run(responder.choose_action(state, actions_b))
-
-        # Submit and check for ending
-        result = engine.submit_actions(action_a, action_b)
-
-        # Update GrimTrigger-like state in TitForTat if needed
-        if hasattr(responder, "receive_result") and result.action_result:
-            responder.receive_result(result.action_result)
-
-        if result.ending:
-            break
-
-    # Get final state and ending
-    final_state = engine.get_current_state()
-    ending = engine.get_ending()
-
-    # Determine winner and VP
-    if ending:
-        vp_a = ending.vp_a
-        vp_b = ending.vp_b
-        if ending.ending_type == EndingType.MUTUAL_DESTRUCTION:
-            winner = "mutual_destruction"
-        elif vp_a > vp_b + 0.01:
-            winner = "A"
-        elif vp_b > vp_a + 0.01:
-            winner = "B"
-        else:
-            winner = "tie"
-    else:
-        vp_a = 50.0
-        vp_b = 50.0
-        winner = "tie"
-
-    return {
-        "defect_turn": defect_turn,
-        "surplus_captured_a": final_state.surplus_captured_a,
-        "position_a": final_state.position_a,
-        "vp_a": vp_a,
-        "winner": winner,
-        "turns_played": final_state.turn - 1,
-    }
+        rng: np.random.Generator,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Reject all settlement proposals without countering."""
+        rejected = np.zeros(len(view), dtype=bool)
+        return rejected, rejected, np.zeros(len(view), dtype=np.int64)
 
 
 def run_timing_analysis(
@@ -246,8 +156,10 @@ def run_timing_analysis(
     games_per_turn: int = 100,
     max_defect_turn: int = 14,
     seed: int | None = None,
-    max_workers: int = 4,
     quiet: bool = False,
+    checkpoint_dir: str | Path | None = None,
+    resume: bool = False,
+    cache_dir: str | Path | None = None,
 ) -> dict[int, TimingResult]:
     """Run the exploitation timing analysis.
 
@@ -255,54 +167,98 @@ def run_timing_analysis(
     where Player A cooperates until that turn, defects once, then cooperates.
     Player B uses TitForTat (retaliates after defection).
 
+    The games of every defection turn still to play run as one
+    BatchGameEngine batch. Game i of the run draws from random numbers keyed
+    by seed and i, so a turn's results do not depend on which other turns
+    are in the batch.
+
+    With a checkpoint_dir, each defection turn is saved as a shard once all
+    its games are in, and a resumed run only plays the missing turns.
+    With a cache_dir, seeded defection turns are stored in a ResultCache
+    and reused while the scenario, parameters and engine are unchanged.
+
     Args:
         scenario_id: Scenario to use for simulation
         games_per_turn: Number of games to run per defection turn
         max_defect_turn: Maximum turn to test defection on
-        seed: Base random seed (game i uses seed + i)
-        max_workers: Number of parallel workers
+        seed: Base random seed (game i of turn t is game (t - 1) * games_per_turn + i of the run)
         quiet: Suppress progress output
+        checkpoint_dir: Save each finished defection turn here (see RunCheckpoint)
+        resume: Skip the defection turns already saved in checkpoint_dir
+        cache_dir: ResultCache directory for seeded defection turns
 
     Returns:
         Dict mapping defection turn to TimingResult
     """
+    checkpoint = None
+    if checkpoint_dir is not None:
+        config = {"scenario_id": scenario_id, "games_per_turn": games_per_turn, "max_defect_turn": max_defect_turn}
+        checkpoint = RunCheckpoint(checkpoint_dir, config, seed, resume)
+        seed = checkpoint.seed
+
+    repo = get_scenario_repository()
+    cache = ResultCache(cache_dir) if cache_dir is not None and seed is not None else None
+    cache_keys: dict[int, str] = {}
+    if cache is not None:
+        cell = {
+            "kind": "exploitation_timing",
+            "scenario": scenario_hash(repo, scenario_id),
+            "script": source_version(__file__),
+            "params": params_values(None),
+            "games_per_turn": games_per_turn,
+            "seed": seed,
+        }
+        for turn in range(1, max_defect_turn + 1):
+            cache_keys[turn] = cache.key(**cell, defect_turn=turn, first_game=(turn - 1) * games_per_turn)
+
     results: dict[int, TimingResult] = {}
 
-    # Initialize results for each turn
+    # Initialize results for each turn, from the checkpoint or the cache where saved
     for turn in range(1, max_defect_turn + 1):
-        results[turn] = TimingResult(defect_turn=turn)
-
-    # Prepare all game arguments
-    all_args = []
-    game_idx = 0
-    for defect_turn in range(1, max_defect_turn + 1):
-        for _game in range(games_per_turn):
-            game_seed = (seed + game_idx) if seed is not None else None
-            all_args.append((scenario_id, defect_turn, game_seed))
-            game_idx += 1
-
-    # Run games in parallel
-    total_games = len(all_args)
-    completed = 0
-
-    with ProcessPoolExecutor(max_workers=max_workers) as executor:
-        futures = {executor.submit(_run_single_timing_game, args): args for args in all_args}
-
-        for future in as_completed(futures):
-            result_dict = future.result()
-            defect_turn = result_dict["defect_turn"]
-
-            results[defect_turn].add_game(
-                surplus_captured=result_dict["surplus_captured_a"],
-                position_a=result_dict["position_a"],
-                vp_a=result_dict["vp_a"],
-                winner=result_dict["winner"],
+        shard = checkpoint.load(f"turn_{turn}") if checkpoint is not None else None
+        cached = cache.get(cache_keys[turn]) if cache is not None and shard is None else None
+        if shard is not None:
+            results[turn] = TimingResult(**shard.result)
+        elif cached is not None:
+            results[turn] = TimingResult(**cached)
+        else:
+            results[turn] = TimingResult(defect_turn=turn)
+
+    turns = [turn for turn in results if results[turn].games_played != games_per_turn]
+    if not turns:
+        return results
+    if not quiet:
+        print(f"  Playing {len(turns) * games_per_turn} games ({len(turns)} defection turns) in one batch")
+
+    # Game i of the run (turn t's games start at (t - 1) * games_per_turn) draws from keyed random numbers
+    game_keys = np.concatenate([np.arange((t - 1) * games_per_turn, t * games_per_turn) for t in turns])
+    engine = BatchGameEngine(
+        scenario_id, repo, len(game_keys), seed=seed, common_random_numbers=True, game_keys=game_keys
+    )
+    outcome = engine.run(
+        BatchTimedDefector(np.repeat(turns, games_per_turn)),
+        BatchTitForTat(len(game_keys), is_player_a=False),
+    )
+    winners = outcome.winners()
+
+    for k, turn in enumerate(turns):
+        rows = slice(k * games_per_turn, (k + 1) * games_per_turn)
+        results[turn].add_games(
+            surplus_captured=engine.state.surplus_captured_a[rows],
+            position_a=outcome.final_pos_a[rows],
+            vp_a=outcome.vp_a[rows],
+            winners=winners[rows],
+        )
+        if checkpoint is not None:
+            checkpoint.save(
+                f"turn_{turn}",
+                asdict(results[turn]),
+                seed,
+                games_per_turn,
+                first_game=(turn - 1) * games_per_turn,
             )
-
-            completed += 1
-            if not quiet and completed % (total_games // 10 or 1) == 0:
-                pct = (completed / total_games) * 100
-                print(f"  Progress: {completed}/{total_games} ({pct:.0f}%)")
+        if cache is not None:
+            cache.put(cache_keys[turn], asdict(results[turn]))
 
     return results
 
@@ -465,10 +421,21 @@ Examples:
         help="Random seed for reproducibility",
     )
     parser.add_argument(
-        "--workers",
-        type=int,
-        default=4,
-        help="Number of parallel workers (default: 4)",
+        "--checkpoint",
+        type=str,
+        default=None,
+        help="Directory to save each finished defection turn in (for --resume)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue the run saved in --checkpoint, skipping finished turns",
+    )
+    parser.add_argument(
+        "--cache",
+        type=str,
+        default=None,
+        help="Result cache directory: reuse seeded defection turns whose inputs are unchanged",
     )
     parser.add_argument(
         "--quiet",
@@ -477,6 +444,8 @@ Examples:
     )
 
     args = parser.parse_args()
+    if args.resume and args.checkpoint is None:
+        parser.error("--resume needs --checkpoint")
 
     print("=" * 80)
     print("BRINKSMANSHIP EXPLOITATION TIMING SIMULATION")
@@ -484,7 +453,6 @@ Examples:
     print(f"Scenario: {args.scenario}")
     print(f"Games per defection turn: {args.games}")
     print(f"Testing defection turns: 1 to {args.max_turn}")
-    print(f"Workers: {args.workers}")
     if args.seed is not None:
         print(f"Seed: {args.seed}")
     print()
@@ -497,8 +465,10 @@ Examples:
         games_per_turn=args.games,
         max_defect_turn=args.max_turn,
         seed=args.seed,
-        max_workers=args.workers,
         quiet=args.quiet,
+        checkpoint_dir=args.checkpoint,
+        resume=args.resume,
+        cache_dir=args.cache,
     )
 
     duration = time.time() - start_time
@@ -250,6 +250,7 @@ def print_validation_summary(result: ValidationResult) -> None:
         print(f"    VP std dev: {sim.vp_std_dev:.1f}")
         print(f"    Elimination rate: {sim.elimination_rate * 100:.1f}%")
         print(f"    Mutual destruction: {sim.mutual_destruction_rate * 100:.1f}%")
+        print(f"    Settlement rate: {sim.settlement_rate * 100:.1f}%")
 
         # Check for dominant strategies
         dominant = [(name, rate) for name, rate in sim.strategy_win_rates.items() if rate > 0.60]
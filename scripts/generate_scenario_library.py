@@ -452,11 +452,12 @@ Game statistics:
 - VP std dev: {sr.vp_std_dev:.1f}
 
 Strategy behaviors:
+- NashCalculator: plays the Nash equilibrium of each turn's game
+- SecuritySeeker: de-escalates unless directly threatened
+- Opportunist: probes for weakness and exploits it
+- Erratic: randomly mixes strategies
 - TitForTat: cooperates first, then mirrors opponent's last move
-- AlwaysDefect: always chooses competitive action
-- AlwaysCooperate: always chooses cooperative action
-- GrimTrigger: cooperates until opponent defects, then always defects
-- Pavlov: repeats if rewarded (CC or DD), switches if punished"""
+- GrimTrigger: cooperates until opponent defects, then always defects"""
 
                 fix_prompt = f"""The scenario file at {abs_output_path} has balance/simulation issues:
 
@@ -469,8 +470,8 @@ CRITICAL CONSTRAINTS TO PRESERVE:
 - Do NOT remove turns or change matrix_type unless necessary
 
 To fix dominant strategy issues:
-1. If AlwaysDefect/GrimTrigger dominates: REDUCE scale on CHICKEN/PRISONERS_DILEMMA turns
-2. If TitForTat/AlwaysCooperate dominates: INCREASE scale on competitive games
+1. If NashCalculator/Opportunist/GrimTrigger dominates: REDUCE scale on CHICKEN/PRISONERS_DILEMMA turns
+2. If TitForTat/SecuritySeeker dominates: INCREASE scale on competitive games
 3. Adjust "scale" field (0.5-2.0 range) - lower = less impact
 
 Read the file and use the Edit tool to adjust scale values on a few turns.
@@ -16,20 +16,48 @@ Usage:
     # Run with reproducible seed
     uv run python scripts/parameter_sweep.py --seed 42
 
+    # Run every combination in one process as vectorized batches
+    uv run python scripts/parameter_sweep.py --vectorized --games 10000
+
+    # Successive halving: many cheap candidates, full games only for the best
+    uv run python scripts/parameter_sweep.py --adaptive --samples 81 --games 1000 --vectorized
+
+    # Every combination on the same random numbers, so they differ only by their parameters
+    uv run python scripts/parameter_sweep.py --seed 42 --crn --antithetic
+
+    # Save each finished sweep point; after a crash, rerun with --resume to skip them
+    uv run python scripts/parameter_sweep.py --games 1000 --checkpoint runs/sweep
+    uv run python scripts/parameter_sweep.py --games 1000 --checkpoint runs/sweep --resume
+
+    # Spread the sweep over several machines sharing a queue file
+    uv run python scripts/parameter_sweep.py --games 1000 --queue /shared/queue.db --job sweep-1
+    uv run python scripts/simulation_worker.py --queue /shared/queue.db   # on each worker host
+
 See GAME_MANUAL.md Appendix C for parameter documentation.
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
+import math
+import random
 import sys
 import time
+import uuid
+from collections import defaultdict
+from collections.abc import Callable
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime
-from itertools import product
+from itertools import count, product
+from pathlib import Path
 
-# Import for type hints only - actual imports happen in worker
+from brinksmanship.engine.rng import fresh_seed
+from brinksmanship.parameters import DEFAULT_PARAMETERS, GameParameters
+from brinksmanship.testing.batch_runner import DETERMINISTIC_OPPONENTS, BatchResults, BatchRunner
+from brinksmanship.testing.checkpoint import RunCheckpoint
+from brinksmanship.testing.distributed import Coordinator, SQLiteWorkQueue, pairing_units
 
 
 @dataclass
@@ -50,152 +78,387 @@ class SweepResult:
     # Dominant strategy check
     dominant_strategies: list[str] = field(default_factory=list)
 
+    # Games per pairing behind the metrics
+    games_per_pairing: int = 0
+
     # Pass/fail status
     passes_all: bool = False
     failed_checks: list[str] = field(default_factory=list)
 
+    # How far the metrics are from passing (0.0 when they pass); each unit is
+    # roughly one clear miss: a dominant strategy, 10 VP of variance, 10% of
+    # settlement or destruction rate, or 2 turns of game length
+    shortfall: float = 0.0
+
     def check_criteria(self) -> None:
-        """Check all balance criteria and update pass/fail status."""
+        """Check all balance criteria and update pass/fail status and shortfall."""
         self.failed_checks = []
+        self.shortfall = 0.0
 
         # Check 1: No dominant strategy (>120 total AND >55% share)
         if self.dominant_strategies:
             self.failed_checks.append(f"Dominant: {', '.join(self.dominant_strategies)}")
+            self.shortfall += len(self.dominant_strategies)
 
         # Check 2: VP variance in 10-40 range
         if not (10 <= self.vp_std_dev <= 40):
             self.failed_checks.append(f"Variance {self.vp_std_dev:.1f} (need 10-40)")
+            self.shortfall += _distance_outside(self.vp_std_dev, 10, 40) / 10
 
         # Check 3: Settlement rate 30-70%
         if not (0.30 <= self.settlement_rate <= 0.70):
             self.failed_checks.append(f"Settle {self.settlement_rate * 100:.0f}% (need 30-70%)")
+            self.shortfall += _distance_outside(self.settlement_rate, 0.30, 0.70) / 0.10
 
         # Check 4: Mutual destruction rate <20%
         if self.mutual_destruction_rate >= 0.20:
             self.failed_checks.append(f"MD {self.mutual_destruction_rate * 100:.0f}% (need <20%)")
+            self.shortfall += (self.mutual_destruction_rate - 0.20) / 0.10
 
         # Check 5: Average game length 10-16 turns
         if not (10 <= self.avg_game_length <= 16):
             self.failed_checks.append(f"Length {self.avg_game_length:.1f} (need 10-16)")
+            self.shortfall += _distance_outside(self.avg_game_length, 10, 16) / 2
 
         self.passes_all = len(self.failed_checks) == 0
 
+    @property
+    def rank_key(self) -> tuple[bool, float, float]:
+        """Sort key, best first: passing, then smallest shortfall, then highest total value."""
+        return (not self.passes_all, self.shortfall, -self.avg_total_value)
+
     @property
     def param_str(self) -> str:
         """Short parameter description."""
         return f"CAPT={self.capture_rate} REJ={self.rejection_base_penalty} DD={self.dd_risk_increase}"
 
 
+def _distance_outside(value: float, low: float, high: float) -> float:
+    """How far value lies outside [low, high] (0.0 inside)."""
+    return max(low - value, 0.0, value - high)
+
+
+def _combination_params(capture_rate: float, rejection_penalty: float, dd_risk: float) -> GameParameters:
+    """Game parameters for one sweep combination (other parameters at their defaults)."""
+    return DEFAULT_PARAMETERS.replace(
+        capture_rate=capture_rate,
+        rejection_base_penalty=rejection_penalty,
+        dd_risk_increase=dd_risk,
+    )
+
+
+def _sweep_pairings() -> list[tuple[str, str]]:
+    """All unique pairings of deterministic opponents (including self-play)."""
+    opponent_names = list(DETERMINISTIC_OPPONENTS.keys())
+    return [(name_a, name_b) for i, name_a in enumerate(opponent_names) for name_b in opponent_names[i:]]
+
+
+def _summarize_combination(
+    results: BatchResults, capture_rate: float, rejection_penalty: float, dd_risk: float
+) -> dict:
+    """Aggregate metrics and dominant strategies of one combination's pairings."""
+    results.compute_aggregate()
+
+    # Check for dominant strategies
+    opponent_metrics: dict[str, dict] = defaultdict(
+        lambda: {"total_value_sum": 0.0, "vp_share_sum": 0.0, "game_count": 0}
+    )
+
+    for pairing_key, stats in results.pairings.items():
+        name_a, name_b = pairing_key.split(":")
+
+        opponent_metrics[name_a]["total_value_sum"] += stats.total_value_stats.total
+        opponent_metrics[name_a]["vp_share_sum"] += stats.vp_share_a_stats.total
+        opponent_metrics[name_a]["game_count"] += stats.total_value_stats.count
+
+        if name_a != name_b:
+            opponent_metrics[name_b]["total_value_sum"] += stats.total_value_stats.total
+            opponent_metrics[name_b]["vp_share_sum"] += stats.vp_share_a_stats.count - stats.vp_share_a_stats.total
+            opponent_metrics[name_b]["game_count"] += stats.total_value_stats.count
+
+    dominant_strategies = []
+    for name, data in opponent_metrics.items():
+        if data["game_count"] > 0:
+            avg_total = data["total_value_sum"] / data["game_count"]
+            avg_share = data["vp_share_sum"] / data["game_count"]
+            if avg_total > 120 and avg_share > 0.55:
+                dominant_strategies.append(name)
+
+    return {
+        "capture_rate": capture_rate,
+        "rejection_base_penalty": rejection_penalty,
+        "dd_risk_increase": dd_risk,
+        "avg_total_value": results.aggregate.get("avg_total_value", 0),
+        "vp_std_dev": results.aggregate.get("vp_std_dev", 0),
+        "settlement_rate": results.aggregate.get("settlement_rate", 0),
+        "mutual_destruction_rate": results.aggregate.get("mutual_destruction_rate", 0),
+        "avg_game_length": results.aggregate.get("avg_turns", 0),
+        "dominant_strategies": dominant_strategies,
+    }
+
+
 def _run_sweep_combination(args: tuple) -> dict:
     """Worker function to run simulation for a single parameter combination.
 
-    Runs in a subprocess to isolate parameter changes.
+    The combination's values are passed to the engine as GameParameters,
+    so the parameters module itself is never modified.
 
     Args:
         args: Tuple of (scenario_id, capture_rate, rejection_penalty, dd_risk,
-                       num_games, seed, max_workers)
+                       num_games, seed, max_workers, common_random_numbers, antithetic)
 
     Returns:
         Dict with sweep results
     """
-    (scenario_id, capture_rate, rejection_penalty, dd_risk, num_games, seed, max_workers) = args
+    (scenario_id, capture_rate, rejection_penalty, dd_risk, num_games, seed, max_workers, crn, antithetic) = args
 
-    # Monkey-patch the parameters module
-    from brinksmanship import parameters as params
+    runner = BatchRunner(
+        scenario_id=scenario_id,
+        params=_combination_params(capture_rate, rejection_penalty, dd_risk),
+        common_random_numbers=crn,
+        antithetic=antithetic,
+    )
+    results = BatchResults(
+        scenario_id=scenario_id,
+        timestamp=datetime.now().isoformat(),
+    )
 
-    original_capture = params.CAPTURE_RATE
-    original_rejection = params.REJECTION_BASE_PENALTY
-    original_dd = params.DD_RISK_INCREASE
+    # Run each pairing (sequentially in worker to avoid nested parallelism issues)
+    for idx, (name_a, name_b) in enumerate(_sweep_pairings()):
+        pairing_seed = (seed + idx * num_games) if seed is not None else None
+        results.pairings[f"{name_a}:{name_b}"] = runner.run_pairing(
+            name_a,
+            name_b,
+            num_games=num_games,
+            seed=pairing_seed,
+            max_workers=1,  # Sequential within worker
+            keep_games=False,  # Only the streaming summaries are used
+        )
 
-    try:
-        params.CAPTURE_RATE = capture_rate
-        params.REJECTION_BASE_PENALTY = rejection_penalty
-        params.DD_RISK_INCREASE = dd_risk
+    return _summarize_combination(results, capture_rate, rejection_penalty, dd_risk)
 
-        # Run the simulation with patched parameters
-        from collections import defaultdict
 
-        from brinksmanship.testing.batch_runner import (
-            DETERMINISTIC_OPPONENTS,
-            BatchResults,
-            BatchRunner,
-        )
+def _run_sweep_vectorized(
+    scenario_id: str,
+    combinations: list[tuple[float, float, float]],
+    num_games: int,
+    seed: int | None,
+    common_random_numbers: bool = False,
+    antithetic: bool = False,
+    checkpoint: RunCheckpoint | None = None,
+) -> list[dict]:
+    """Run every combination in one process, one batch per pairing.
 
-        runner = BatchRunner(scenario_id=scenario_id)
+    Each pairing is a single BatchGameEngine run with a parameter axis
+    covering all combinations (see BatchRunner.run_parameter_sets_vectorized).
+    With a checkpoint, each finished pairing batch is a shard.
 
-        # Run all pairings
-        opponent_names = list(DETERMINISTIC_OPPONENTS.keys())
+    Returns:
+        Sweep result dicts, in combinations order
+    """
+    runner = BatchRunner(scenario_id=scenario_id, common_random_numbers=common_random_numbers, antithetic=antithetic)
+    param_sets = [_combination_params(*combo) for combo in combinations]
+    timestamp = datetime.now().isoformat()
+    combo_results = [BatchResults(scenario_id=scenario_id, timestamp=timestamp) for _ in combinations]
+    combos_digest = hashlib.sha256(repr(combinations).encode("utf-8")).hexdigest()[:12]
+
+    for idx, (name_a, name_b) in enumerate(_sweep_pairings()):
+        pairing_seed = (seed + idx * num_games) if seed is not None else None
+        key = f"vectorized_{name_a}_{name_b}_{num_games}g_seed={pairing_seed}_{combos_digest}"
+        shard = checkpoint.load(key) if checkpoint is not None else None
+        if shard is not None:
+            per_set = shard.result
+        else:
+            per_set = runner.run_parameter_sets_vectorized(
+                name_a, name_b, param_sets, num_games=num_games, seed=pairing_seed, keep_games=False
+            )
+            if checkpoint is not None:
+                checkpoint.save(key, per_set, pairing_seed, num_games)
+        for results, stats in zip(combo_results, per_set, strict=True):
+            results.pairings[f"{name_a}:{name_b}"] = stats
+
+    return [_summarize_combination(results, *combo) for results, combo in zip(combo_results, combinations, strict=True)]
+
+
+def _run_sweep_distributed(
+    coordinator: Coordinator,
+    job: str,
+    scenario_id: str,
+    combinations: list[tuple[float, float, float]],
+    num_games: int,
+    seed: int | None,
+    vectorized: bool,
+    common_random_numbers: bool = False,
+    antithetic: bool = False,
+) -> list[dict]:
+    """Run every combination as one job of work units for remote workers.
+
+    Each pairing of each combination is split into units (one per pairing
+    if vectorized), seeded like the process pool path.
 
-        results = BatchResults(
+    Returns:
+        Sweep result dicts, in combinations order
+    """
+    opponent_names = list(DETERMINISTIC_OPPONENTS.keys())
+    units = []
+    for idx, combo in enumerate(combinations):
+        combo_seed = (seed + idx * 1000) if seed is not None and not common_random_numbers else seed
+        runner = BatchRunner(
             scenario_id=scenario_id,
-            timestamp=datetime.now().isoformat(),
+            params=_combination_params(*combo),
+            common_random_numbers=common_random_numbers,
+            antithetic=antithetic,
         )
+        units += pairing_units(
+            runner, job, opponent_names, num_games, combo_seed, vectorized=vectorized, key_prefix=f"{idx}/"
+        )
+    merged = coordinator.run(units)
+
+    timestamp = datetime.now().isoformat()
+    summaries = []
+    for idx, combo in enumerate(combinations):
+        results = BatchResults(scenario_id=scenario_id, timestamp=timestamp)
+        for name_a, name_b in _sweep_pairings():
+            results.pairings[f"{name_a}:{name_b}"] = merged[f"{idx}/{name_a}:{name_b}"]
+        summaries.append(_summarize_combination(results, *combo))
+    return summaries
+
+
+def _evaluate_combinations(
+    scenario_id: str,
+    combinations: list[tuple[float, float, float]],
+    num_games: int,
+    seed: int | None,
+    max_workers: int,
+    vectorized: bool,
+    on_result: Callable[[SweepResult], None] | None = None,
+    common_random_numbers: bool = False,
+    antithetic: bool = False,
+    checkpoint: RunCheckpoint | None = None,
+    coordinator: Coordinator | None = None,
+    job: str | None = None,
+) -> list[SweepResult]:
+    """Simulate each combination and check it against the balance criteria.
+
+    With common random numbers every combination runs on the same seed, so
+    game i of a pairing draws the same numbers under every combination.
+    With a checkpoint, each finished combination (a sweep point) is a
+    shard, and combinations that already have one are not simulated again.
+
+    Args:
+        scenario_id: Scenario to use for simulation
+        combinations: (capture_rate, rejection_penalty, dd_risk) tuples
+        num_games: Games per opponent pairing
+        seed: Base random seed
+        max_workers: Number of parallel workers (one combination per worker)
+        vectorized: Run all combinations in this process on BatchGameEngine
+        on_result: Called with each result as it completes
+        common_random_numbers: Share random numbers across combinations
+        antithetic: Antithetic final resolution noise within each pairing
+        checkpoint: Shards of finished combinations to save and skip
+        coordinator: Publish the combinations as work units of job instead
+            of simulating them here (see brinksmanship.testing.distributed)
+        job: Job name of the work units
 
-        # Generate all unique pairings
-        pairings = []
-        for i, name_a in enumerate(opponent_names):
-            for name_b in opponent_names[i:]:
-                pairings.append((name_a, name_b))
-
-        # Run each pairing (sequentially in worker to avoid nested parallelism issues)
-        for idx, (name_a, name_b) in enumerate(pairings):
-            pairing_key = f"{name_a}:{name_b}"
-            pairing_seed = (seed + idx * num_games) if seed is not None else None
-
-            stats = runner.run_pairing(
-                name_a,
-                name_b,
-                num_games=num_games,
-                seed=pairing_seed,
-                max_workers=1,  # Sequential within worker
+    Returns:
+        SweepResult per combination, in combinations order
+    """
+
+    def checked(result_dict: dict) -> SweepResult:
+        result = SweepResult(**result_dict, games_per_pairing=num_games)
+        result.check_criteria()
+        if on_result is not None:
+            on_result(result)
+        return result
+
+    if seed is None and common_random_numbers:
+        seed = fresh_seed()
+
+    if coordinator is not None:
+        return [
+            checked(d)
+            for d in _run_sweep_distributed(
+                coordinator,
+                job,
+                scenario_id,
+                combinations,
+                num_games,
+                seed,
+                vectorized,
+                common_random_numbers,
+                antithetic,
             )
-            results.pairings[pairing_key] = stats
+        ]
 
-        # Compute aggregates
-        results.compute_aggregate()
+    if vectorized:
+        return [
+            checked(d)
+            for d in _run_sweep_vectorized(
+                scenario_id, combinations, num_games, seed, common_random_numbers, antithetic, checkpoint
+            )
+        ]
+
+    results: list[SweepResult | None] = [None] * len(combinations)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        for idx, (capture, rejection, dd) in enumerate(combinations):
+            combo_seed = (seed + idx * 1000) if seed is not None and not common_random_numbers else seed
+            key = f"point_{capture}_{rejection}_{dd}_{num_games}g_seed={combo_seed}"
+            shard = checkpoint.load(key) if checkpoint is not None else None
+            if shard is not None:
+                results[idx] = checked(shard.result)
+                continue
+            args = (
+                scenario_id,
+                capture,
+                rejection,
+                dd,
+                num_games,
+                combo_seed,
+                max_workers,
+                common_random_numbers,
+                antithetic,
+            )
+            futures[executor.submit(_run_sweep_combination, args)] = (idx, key, combo_seed)
+        for future in as_completed(futures):
+            idx, key, combo_seed = futures[future]
+            if checkpoint is not None:
+                checkpoint.save(key, future.result(), combo_seed, num_games)
+            results[idx] = checked(future.result())
+    return results
 
-        # Check for dominant strategies
-        opponent_metrics: dict[str, dict] = defaultdict(
-            lambda: {"total_value_sum": 0.0, "vp_share_sum": 0.0, "game_count": 0}
-        )
 
-        for pairing_key, stats in results.pairings.items():
-            name_a, name_b = pairing_key.split(":")
-
-            opponent_metrics[name_a]["total_value_sum"] += sum(stats.total_value_list)
-            opponent_metrics[name_a]["vp_share_sum"] += sum(stats.vp_share_a_list)
-            opponent_metrics[name_a]["game_count"] += len(stats.total_value_list)
-
-            if name_a != name_b:
-                opponent_metrics[name_b]["total_value_sum"] += sum(stats.total_value_list)
-                opponent_metrics[name_b]["vp_share_sum"] += sum(1 - s for s in stats.vp_share_a_list)
-                opponent_metrics[name_b]["game_count"] += len(stats.total_value_list)
-
-        dominant_strategies = []
-        for name, data in opponent_metrics.items():
-            if data["game_count"] > 0:
-                avg_total = data["total_value_sum"] / data["game_count"]
-                avg_share = data["vp_share_sum"] / data["game_count"]
-                if avg_total > 120 and avg_share > 0.55:
-                    dominant_strategies.append(name)
-
-        return {
-            "capture_rate": capture_rate,
-            "rejection_base_penalty": rejection_penalty,
-            "dd_risk_increase": dd_risk,
-            "avg_total_value": results.aggregate.get("avg_total_value", 0),
-            "vp_std_dev": results.aggregate.get("vp_std_dev", 0),
-            "settlement_rate": results.aggregate.get("settlement_rate", 0),
-            "mutual_destruction_rate": results.aggregate.get("mutual_destruction_rate", 0),
-            "avg_game_length": results.aggregate.get("avg_turns", 0),
-            "dominant_strategies": dominant_strategies,
-        }
-
-    finally:
-        # Restore original parameters
-        params.CAPTURE_RATE = original_capture
-        params.REJECTION_BASE_PENALTY = original_rejection
-        params.DD_RISK_INCREASE = original_dd
+def _open_checkpoint(
+    checkpoint_dir: str | Path | None, config: dict, seed: int | None, resume: bool
+) -> RunCheckpoint | None:
+    """The sweep's checkpoint, if it has a directory."""
+    if checkpoint_dir is None:
+        return None
+    return RunCheckpoint(checkpoint_dir, config, seed, resume)
+
+
+def _open_coordinator(
+    queue_path: str | Path | None, job: str | None, checkpoint_dir: str | Path | None, quiet: bool
+) -> tuple[Coordinator | None, str]:
+    """The sweep's coordinator, if it has a queue, and its job name."""
+    if queue_path is None:
+        return None, job or ""
+    if checkpoint_dir is not None:
+        raise ValueError("A queued sweep keeps its finished units in the queue; do not combine it with a checkpoint")
+    return Coordinator(SQLiteWorkQueue(queue_path), quiet=quiet), job or uuid.uuid4().hex[:12]
+
+
+def _default_ranges(
+    capture_rates: list[float] | None,
+    rejection_penalties: list[float] | None,
+    dd_risks: list[float] | None,
+) -> tuple[list[float], list[float], list[float]]:
+    """Fill in the default value lists for parameters that were not given."""
+    return (
+        capture_rates if capture_rates is not None else [0.3, 0.4, 0.5],
+        rejection_penalties if rejection_penalties is not None else [1.0, 1.5, 2.0],
+        dd_risks if dd_risks is not None else [1.5, 1.8, 2.0],
+    )
 
 
 def run_parameter_sweep(
@@ -207,6 +470,13 @@ def run_parameter_sweep(
     seed: int | None = None,
     max_workers: int = 4,
     quiet: bool = False,
+    vectorized: bool = False,
+    common_random_numbers: bool = False,
+    antithetic: bool = False,
+    checkpoint_dir: str | Path | None = None,
+    resume: bool = False,
+    queue_path: str | Path | None = None,
+    job: str | None = None,
 ) -> list[SweepResult]:
     """Run the parameter sweep.
 
@@ -219,17 +489,42 @@ def run_parameter_sweep(
         seed: Base random seed
         max_workers: Number of parallel workers
         quiet: Suppress progress output
+        vectorized: Run all combinations in this process on BatchGameEngine,
+            one batch per pairing with a parameter axis
+        common_random_numbers: Run every combination on the same random
+            numbers (needs a seed to be reproducible across runs)
+        antithetic: Antithetic final resolution noise
+        checkpoint_dir: Save each finished combination here (see RunCheckpoint)
+        resume: Skip the combinations already saved in checkpoint_dir
+        queue_path: SQLite work queue to publish the sweep to; workers on
+            any host sharing the file play it (see scripts/simulation_worker.py)
+        job: Job name in the queue (default: a new one); rerun with the same
+            name to continue an interrupted job
 
     Returns:
         List of SweepResult for each parameter combination
+
+    Raises:
+        ValueError: If both checkpoint_dir and queue_path are given
     """
-    # Default parameter ranges
-    if capture_rates is None:
-        capture_rates = [0.3, 0.4, 0.5]
-    if rejection_penalties is None:
-        rejection_penalties = [1.0, 1.5, 2.0]
-    if dd_risks is None:
-        dd_risks = [1.5, 1.8, 2.0]
+    capture_rates, rejection_penalties, dd_risks = _default_ranges(capture_rates, rejection_penalties, dd_risks)
+    coordinator, job = _open_coordinator(queue_path, job, checkpoint_dir, quiet)
+    checkpoint = _open_checkpoint(
+        checkpoint_dir,
+        {
+            "sweep": "grid",
+            "scenario_id": scenario_id,
+            "ranges": [capture_rates, rejection_penalties, dd_risks],
+            "num_games": num_games,
+            "vectorized": vectorized,
+            "common_random_numbers": common_random_numbers,
+            "antithetic": antithetic,
+        },
+        seed,
+        resume,
+    )
+    if checkpoint is not None:
+        seed = checkpoint.seed
 
     # Generate all combinations
     combinations = list(product(capture_rates, rejection_penalties, dd_risks))
@@ -242,41 +537,162 @@ def run_parameter_sweep(
         print(f"  DD_RISK_INCREASE: {dd_risks}")
         print()
 
-    # Prepare arguments for workers
-    all_args = []
-    for idx, (capture, rejection, dd) in enumerate(combinations):
-        combo_seed = (seed + idx * 1000) if seed is not None else None
-        all_args.append((scenario_id, capture, rejection, dd, num_games, combo_seed, max_workers))
-
-    # Run combinations in parallel
-    results: list[SweepResult] = []
     completed = 0
 
-    with ProcessPoolExecutor(max_workers=max_workers) as executor:
-        futures = {executor.submit(_run_sweep_combination, args): args for args in all_args}
+    def report(result: SweepResult) -> None:
+        nonlocal completed
+        completed += 1
+        if not quiet:
+            status = "PASS" if result.passes_all else "FAIL"
+            print(f"  [{completed}/{total_combos}] {result.param_str}: {status}")
+
+    return _evaluate_combinations(
+        scenario_id,
+        combinations,
+        num_games,
+        seed,
+        max_workers,
+        vectorized,
+        report,
+        common_random_numbers=common_random_numbers,
+        antithetic=antithetic,
+        checkpoint=checkpoint,
+        coordinator=coordinator,
+        job=job,
+    )
 
-        for future in as_completed(futures):
-            result_dict = future.result()
-
-            sweep_result = SweepResult(
-                capture_rate=result_dict["capture_rate"],
-                rejection_base_penalty=result_dict["rejection_base_penalty"],
-                dd_risk_increase=result_dict["dd_risk_increase"],
-                avg_total_value=result_dict["avg_total_value"],
-                vp_std_dev=result_dict["vp_std_dev"],
-                settlement_rate=result_dict["settlement_rate"],
-                mutual_destruction_rate=result_dict["mutual_destruction_rate"],
-                avg_game_length=result_dict["avg_game_length"],
-                dominant_strategies=result_dict["dominant_strategies"],
-            )
-            sweep_result.check_criteria()
-            results.append(sweep_result)
 
-            completed += 1
-            if not quiet:
-                status = "PASS" if sweep_result.passes_all else "FAIL"
-                print(f"  [{completed}/{total_combos}] {sweep_result.param_str}: {status}")
+def run_adaptive_sweep(
+    scenario_id: str = "cuban_missile_crisis",
+    capture_rates: list[float] = None,
+    rejection_penalties: list[float] = None,
+    dd_risks: list[float] = None,
+    num_games: int = 100,
+    initial_games: int = 10,
+    eta: int = 3,
+    samples: int = 0,
+    seed: int | None = None,
+    max_workers: int = 4,
+    quiet: bool = False,
+    vectorized: bool = False,
+    common_random_numbers: bool = False,
+    antithetic: bool = False,
+    checkpoint_dir: str | Path | None = None,
+    resume: bool = False,
+    queue_path: str | Path | None = None,
+    job: str | None = None,
+) -> list[SweepResult]:
+    """Successive-halving search over the parameter space.
+
+    Every candidate is first simulated with initial_games games per
+    pairing. After each round the best 1/eta of the candidates (by
+    SweepResult.rank_key: passing first, then smallest shortfall) go on to
+    a round with eta times as many games, capped at num_games. Games are
+    thus spent mostly on promising combinations; the search stops after the
+    round that simulates the survivors with num_games.
+
+    Args:
+        scenario_id: Scenario to use for simulation
+        capture_rates: CAPTURE_RATE values (grid points, or the range for samples)
+        rejection_penalties: REJECTION_BASE_PENALTY values
+        dd_risks: DD_RISK_INCREASE values
+        num_games: Games per opponent pairing in the final round
+        initial_games: Games per opponent pairing in the first round
+        eta: Reduction factor per round (keep 1/eta, eta times the games)
+        samples: If positive, draw this many combinations uniformly from the
+            range of each value list instead of using the grid
+        seed: Base random seed (also seeds the samples)
+        max_workers: Number of parallel workers
+        quiet: Suppress progress output
+        vectorized: Simulate each round in this process on BatchGameEngine
+        common_random_numbers: Run a round's candidates on the same random
+            numbers, so ranking them is not a lottery at small game counts
+        antithetic: Antithetic final resolution noise
+        checkpoint_dir: Save each finished combination of every round here
+        resume: Skip the combinations already saved in checkpoint_dir (the
+            rounds are replayed from the saved results, so they pick the
+            same survivors)
+        queue_path: SQLite work queue to publish each round to
+        job: Job name in the queue (default: a new one); round n is job
+            "<job>-round<n>"
+
+    Returns:
+        SweepResult of the final round's candidates, best first
 
+    Raises:
+        ValueError: If eta < 2, initial_games is not in 1..num_games, or
+            both checkpoint_dir and queue_path are given
+    """
+    if eta < 2:
+        raise ValueError(f"eta must be at least 2, got {eta}")
+    if not 1 <= initial_games <= num_games:
+        raise ValueError(f"initial_games must be in 1..{num_games}, got {initial_games}")
+
+    ranges = _default_ranges(capture_rates, rejection_penalties, dd_risks)
+    coordinator, job = _open_coordinator(queue_path, job, checkpoint_dir, quiet)
+    checkpoint = _open_checkpoint(
+        checkpoint_dir,
+        {
+            "sweep": "adaptive",
+            "scenario_id": scenario_id,
+            "ranges": list(ranges),
+            "num_games": num_games,
+            "initial_games": initial_games,
+            "eta": eta,
+            "samples": samples,
+            "vectorized": vectorized,
+            "common_random_numbers": common_random_numbers,
+            "antithetic": antithetic,
+        },
+        seed,
+        resume,
+    )
+    if checkpoint is not None:
+        seed = checkpoint.seed
+    if samples > 0:
+        rng = random.Random(seed)
+        candidates = [
+            tuple(round(rng.uniform(min(values), max(values)), 3) for values in ranges) for _ in range(samples)
+        ]
+    else:
+        candidates = list(product(*ranges))
+
+    games = initial_games
+    simulated = 0
+    for round_number in count():
+        if not quiet:
+            print(f"Round {round_number + 1}: {len(candidates)} candidates x {games} games per pairing")
+        round_seed = (seed + round_number * 1_000_000) if seed is not None else None
+        results = _evaluate_combinations(
+            scenario_id,
+            candidates,
+            games,
+            round_seed,
+            max_workers,
+            vectorized,
+            common_random_numbers=common_random_numbers,
+            antithetic=antithetic,
+            checkpoint=checkpoint,
+            coordinator=coordinator,
+            job=f"{job}-round{round_number + 1}",
+        )
+        results.sort(key=lambda r: r.rank_key)
+        simulated += len(candidates) * games
+
+        if not quiet:
+            best = results[0]
+            status = "PASS" if best.passes_all else f"shortfall {best.shortfall:.2f}"
+            print(f"  best: {best.param_str} ({status})")
+
+        if games >= num_games:
+            break
+        results = results[: max(eta, math.ceil(len(results) / eta))]
+        candidates = [(r.capture_rate, r.rejection_base_penalty, r.dd_risk_increase) for r in results]
+        games = min(num_games, games * eta)
+
+    if not quiet:
+        print(f"Simulated {simulated} games per pairing in total")
+        print()
     return results
 
 
@@ -436,13 +852,81 @@ Examples:
         default=4,
         help="Number of parallel workers (default: 4)",
     )
+    parser.add_argument(
+        "--adaptive",
+        action="store_true",
+        help="Successive-halving search instead of the full grid (--games is the final round's count)",
+    )
+    parser.add_argument(
+        "--initial-games",
+        type=int,
+        default=10,
+        help="Adaptive: games per pairing in the first round (default: 10)",
+    )
+    parser.add_argument(
+        "--eta",
+        type=int,
+        default=3,
+        help="Adaptive: keep 1/eta of the candidates per round, with eta times the games (default: 3)",
+    )
+    parser.add_argument(
+        "--samples",
+        type=int,
+        default=0,
+        help="Adaptive: sample this many combinations from the value ranges instead of the grid",
+    )
+    parser.add_argument(
+        "--vectorized",
+        action="store_true",
+        help="Run all combinations in one process on the vectorized engine (parameter axis)",
+    )
+    parser.add_argument(
+        "--crn",
+        action="store_true",
+        help="Common random numbers: every combination on the same random draws (use with --seed)",
+    )
+    parser.add_argument(
+        "--antithetic",
+        action="store_true",
+        help="Antithetic final resolution noise (pairs of games with opposite noise)",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        type=str,
+        default=None,
+        help="Directory to save each finished sweep point in (for --resume)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue the sweep saved in --checkpoint, skipping finished points",
+    )
     parser.add_argument(
         "--quiet",
         action="store_true",
         help="Suppress progress output",
     )
 
+    parser.add_argument(
+        "--queue",
+        type=str,
+        default=None,
+        help="SQLite work queue shared with scripts/simulation_worker.py processes on other hosts",
+    )
+    parser.add_argument(
+        "--job",
+        type=str,
+        default=None,
+        help="Job name in --queue (rerun with the same name to continue an interrupted sweep)",
+    )
+
     args = parser.parse_args()
+    if args.resume and args.checkpoint is None:
+        parser.error("--resume needs --checkpoint")
+    if args.queue and args.checkpoint:
+        parser.error("--queue keeps finished units in the queue; use --job instead of --checkpoint")
+    if args.job and not args.queue:
+        parser.error("--job needs --queue")
 
     # Parse parameter ranges
     capture_rates = None
@@ -469,16 +953,45 @@ Examples:
 
     start_time = time.time()
 
-    results = run_parameter_sweep(
-        scenario_id=args.scenario,
-        capture_rates=capture_rates,
-        rejection_penalties=rejection_penalties,
-        dd_risks=dd_risks,
-        num_games=args.games,
-        seed=args.seed,
-        max_workers=args.workers,
-        quiet=args.quiet,
-    )
+    if args.adaptive:
+        results = run_adaptive_sweep(
+            scenario_id=args.scenario,
+            capture_rates=capture_rates,
+            rejection_penalties=rejection_penalties,
+            dd_risks=dd_risks,
+            num_games=args.games,
+            initial_games=min(args.initial_games, args.games),
+            eta=args.eta,
+            samples=args.samples,
+            seed=args.seed,
+            max_workers=args.workers,
+            quiet=args.quiet,
+            vectorized=args.vectorized,
+            common_random_numbers=args.crn,
+            antithetic=args.antithetic,
+            checkpoint_dir=args.checkpoint,
+            resume=args.resume,
+            queue_path=args.queue,
+            job=args.job,
+        )
+    else:
+        results = run_parameter_sweep(
+            scenario_id=args.scenario,
+            capture_rates=capture_rates,
+            rejection_penalties=rejection_penalties,
+            dd_risks=dd_risks,
+            num_games=args.games,
+            seed=args.seed,
+            max_workers=args.workers,
+            quiet=args.quiet,
+            vectorized=args.vectorized,
+            common_random_numbers=args.crn,
+            antithetic=args.antithetic,
+            checkpoint_dir=args.checkpoint,
+            resume=args.resume,
+            queue_path=args.queue,
+            job=args.job,
+        )
 
     duration = time.time() - start_time
 
@@ -11,6 +11,7 @@ Usage:
 
     # Run specific simulations
     python scripts/run_all_simulations.py --only balance
+    python scripts/run_all_simulations.py --only tournament
     python scripts/run_all_simulations.py --only crisis
     python scripts/run_all_simulations.py --only stability
     python scripts/run_all_simulations.py --only variance
@@ -19,6 +20,9 @@ Usage:
 
     # Run multiple specific simulations
     python scripts/run_all_simulations.py --only balance,crisis,stability
+
+    # Reuse cached results of simulations whose inputs are unchanged
+    python scripts/run_all_simulations.py --cache .cache/simulations
 """
 
 import argparse
@@ -31,6 +35,13 @@ SIMULATIONS = {
         "script": "balance_simulation.py",
         "description": "Core game balance with strategy pairings",
         "args": ["--games", "200"],  # Reduced for orchestrator
+        "cache": True,
+    },
+    "tournament": {
+        "script": "tournament.py",
+        "description": "All scenarios x all pairings, both sides",
+        "args": ["--games", "20", "--quiet"],  # Reduced for orchestrator
+        "cache": True,
     },
     "crisis": {
         "script": "sim_crisis_termination.py",
@@ -127,6 +138,7 @@ def main():
         epilog="""
 Available simulations:
   balance      Core game balance with strategy pairings
+  tournament   All scenarios x all pairings, both sides
   crisis       Crisis termination probability mechanics
   stability    Stability update and decay mechanics
   variance     Variance formula and final resolution
@@ -141,6 +153,9 @@ Examples:
     )
     parser.add_argument("--only", type=str, default=None, help="Comma-separated list of simulations to run")
     parser.add_argument("--seed", type=int, default=42, help="Random seed for reproducibility (default: 42)")
+    parser.add_argument(
+        "--cache", type=str, default=None, help="Result cache directory for simulations that support one"
+    )
     parser.add_argument("--verbose", "-v", action="store_true", help="Show full output from each simulation")
     args = parser.parse_args()
 
@@ -160,6 +175,8 @@ Examples:
     print_header()
     print(f"Running simulations: {', '.join(sim_names)}")
     print(f"Random seed: {args.seed}")
+    if args.cache:
+        print(f"Result cache: {args.cache}")
     print()
 
     results = {}
@@ -172,6 +189,8 @@ Examples:
 
         # Add seed to args if supported
         sim_args = sim_info["args"] + ["--seed", str(args.seed)]
+        if args.cache and sim_info.get("cache"):
+            sim_args += ["--cache", args.cache]
 
         success, output = run_simulation(name, sim_info["script"], sim_args, scripts_dir)
 
@@ -6,14 +6,24 @@ Tests the crisis termination mechanic from GAME_MANUAL.md:
 - Starting Turn 10, if Risk > 7: P(Termination) = (Risk - 7) * 0.08
 - Risk 8 = 8% per turn, Risk 9 = 16% per turn, Risk 10 = 100% (mutual destruction)
 
-This simulation verifies that the probability calculation works correctly
-and tracks termination statistics by risk level.
+This simulation verifies the probability calculation the engine uses
+(brinksmanship.engine.endings.get_crisis_termination_probability) and tracks
+termination statistics by risk level. Trials are NumPy arrays of uniform
+draws, one row per game and one column per checked turn; next to each
+simulated rate the report shows the exact value of the Markov chain
+"survive each check with probability 1 - p(turn)".
 """
 
 import argparse
-import random
-from collections import defaultdict
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+
+import numpy as np
+
+from brinksmanship.engine.endings import get_crisis_termination_probability
+
+RISK_LEVELS = (8, 9)  # Risk 10 is automatic mutual destruction
+FIRST_TURN = 10
+LAST_TURN = 16
 
 
 @dataclass
@@ -22,7 +32,7 @@ class TerminationStats:
 
     trials: int = 0
     terminations: int = 0
-    turns_when_terminated: list = field(default_factory=list)
+    avg_termination_turn: float = 0.0
 
     @property
     def termination_rate(self) -> float:
@@ -30,91 +40,96 @@ class TerminationStats:
             return 0.0
         return self.terminations / self.trials
 
-    @property
-    def avg_termination_turn(self) -> float:
-        if not self.turns_when_terminated:
-            return 0.0
-        return sum(self.turns_when_terminated) / len(self.turns_when_terminated)
-
 
-def calculate_termination_probability(risk_level: float) -> float:
-    """Calculate P(Termination) based on risk level.
+def calculate_termination_probability(risk_level: float, turn: int = FIRST_TURN) -> float:
+    """Calculate P(Termination) based on risk level, as the engine does.
 
     From GAME_MANUAL.md Section 4.6:
-        if Risk_Level > 7:
+        if Turn >= 10 and Risk_Level > 7:
             P(Crisis_Termination) = (Risk_Level - 7) * 0.08
     """
-    if risk_level <= 7:
-        return 0.0
-    return (risk_level - 7) * 0.08
+    return get_crisis_termination_probability(risk_level, turn)
 
 
-def simulate_crisis_turn(risk_level: float) -> bool:
-    """Simulate a single turn's crisis termination check.
+def check_probabilities(risk_level: float, first_turn: int = FIRST_TURN, last_turn: int = LAST_TURN) -> np.ndarray:
+    """Termination probability at each checked turn, first_turn to last_turn."""
+    return np.array([calculate_termination_probability(risk_level, turn) for turn in range(first_turn, last_turn + 1)])
 
-    Returns True if crisis termination is triggered.
-    """
-    prob = calculate_termination_probability(risk_level)
-    return random.random() < prob
 
+def exact_reach_probabilities(
+    risk_level: float, first_turn: int = FIRST_TURN, last_turn: int = LAST_TURN
+) -> dict[int, float]:
+    """Exact P(reaching turn N) from first_turn at a fixed risk level.
 
-def simulate_game_from_turn_10(risk_level: float, max_turns: int = 16) -> tuple[bool, int]:
-    """Simulate a game starting from Turn 10 with a fixed risk level.
+    The game survives each turn's check independently, so
+    P(reach N) = prod over turns first_turn..N-1 of (1 - p(turn)).
+    """
+    survival = np.concatenate([[1.0], np.cumprod(1 - check_probabilities(risk_level, first_turn, last_turn))])
+    return {turn: float(survival[turn - first_turn]) for turn in range(first_turn, last_turn + 1)}
+
+
+def exact_termination_stats(
+    risk_level: float, first_turn: int = FIRST_TURN, last_turn: int = LAST_TURN
+) -> tuple[float, float]:
+    """Exact (P(termination by last_turn), mean termination turn given termination)."""
+    reach = exact_reach_probabilities(risk_level, first_turn, last_turn)
+    turns = np.arange(first_turn, last_turn + 1)
+    # Terminating at turn N: reach N, then fail that turn's check
+    p_at = np.array([reach[turn] for turn in turns]) * check_probabilities(risk_level, first_turn, last_turn)
+    total = float(p_at.sum())
+    return total, float((p_at * turns).sum() / total) if total > 0 else 0.0
+
+
+def termination_turns(
+    risk_level: float,
+    num_games: int,
+    rng: np.random.Generator,
+    first_turn: int = FIRST_TURN,
+    last_turn: int = LAST_TURN,
+) -> np.ndarray:
+    """Simulate games from first_turn at a fixed risk level.
 
     Returns:
-        (terminated, turn_terminated_or_max)
-        - terminated: True if crisis termination triggered
-        - turn: The turn when terminated, or max_turns if not terminated
+        Termination turn per game, or 0 where the game reached last_turn
+        without terminating
     """
-    for turn in range(10, max_turns + 1):
-        if simulate_crisis_turn(risk_level):
-            return True, turn
-    return False, max_turns
+    triggered = rng.random((num_games, last_turn - first_turn + 1)) < check_probabilities(
+        risk_level, first_turn, last_turn
+    )
+    terminated = triggered.any(axis=1)
+    return np.where(terminated, first_turn + triggered.argmax(axis=1), 0)
 
 
-def run_per_turn_simulation(num_trials: int = 10000) -> dict[int, TerminationStats]:
+def run_per_turn_simulation(num_trials: int, rng: np.random.Generator) -> dict[int, TerminationStats]:
     """Run simulation to verify per-turn termination rates.
 
     Tests that each individual turn has the expected termination probability.
     """
     results = {}
-
-    for risk in range(8, 10):  # Risk 8 and 9 (10 is automatic destruction)
-        stats = TerminationStats()
-
-        for _ in range(num_trials):
-            stats.trials += 1
-            if simulate_crisis_turn(risk):
-                stats.terminations += 1
-
-        results[risk] = stats
-
+    for risk in RISK_LEVELS:
+        terminations = int((rng.random(num_trials) < calculate_termination_probability(risk)).sum())
+        results[risk] = TerminationStats(trials=num_trials, terminations=terminations)
     return results
 
 
-def run_cumulative_simulation(num_games: int = 5000) -> dict[int, TerminationStats]:
+def run_cumulative_simulation(num_games: int, rng: np.random.Generator) -> dict[int, TerminationStats]:
     """Run simulation to track when games terminate over multiple turns.
 
     Simulates games from Turn 10 to Turn 16 with various risk levels.
     """
     results = {}
-
-    for risk in range(8, 10):  # Risk 8 and 9
-        stats = TerminationStats()
-
-        for _ in range(num_games):
-            stats.trials += 1
-            terminated, turn = simulate_game_from_turn_10(risk)
-            if terminated:
-                stats.terminations += 1
-                stats.turns_when_terminated.append(turn)
-
-        results[risk] = stats
-
+    for risk in RISK_LEVELS:
+        turns = termination_turns(risk, num_games, rng)
+        terminated = turns[turns > 0]
+        results[risk] = TerminationStats(
+            trials=num_games,
+            terminations=len(terminated),
+            avg_termination_turn=float(terminated.mean()) if len(terminated) else 0.0,
+        )
     return results
 
 
-def run_reach_turn_simulation(num_games: int = 5000) -> dict[int, dict[int, float]]:
+def run_reach_turn_simulation(num_games: int, rng: np.random.Generator) -> dict[int, dict[int, float]]:
     """Calculate probability of reaching specific turns from Turn 10.
 
     This verifies the values given in GAME_MANUAL.md Section 4.6:
@@ -122,19 +137,12 @@ def run_reach_turn_simulation(num_games: int = 5000) -> dict[int, dict[int, floa
     - At Risk 9: P(reaching Turn 12) = 70%, P(reaching Turn 14) = 49%
     """
     results = {}
-
-    for risk in range(8, 10):
-        turn_counts = defaultdict(int)
-
-        for _ in range(num_games):
-            for turn in range(10, 17):  # Check turns 10-16
-                turn_counts[turn] += 1
-                if simulate_crisis_turn(risk):
-                    break  # Game terminated
-
-        # Calculate probability of reaching each turn
-        results[risk] = {turn: turn_counts[turn] / num_games for turn in range(10, 17)}
-
+    for risk in RISK_LEVELS:
+        turns = termination_turns(risk, num_games, rng)
+        # A game reaches turn N unless it terminated at an earlier turn
+        results[risk] = {
+            turn: float(((turns == 0) | (turns >= turn)).mean()) for turn in range(FIRST_TURN, LAST_TURN + 1)
+        }
     return results
 
 
@@ -152,7 +160,7 @@ def print_results(per_turn: dict, cumulative: dict, reach_turn: dict, num_trials
     print(f"\n{'Risk Level':<15} {'Expected Rate':>15} {'Observed Rate':>15} {'Difference':>15}")
     print("-" * 60)
 
-    for risk in range(8, 10):
+    for risk in RISK_LEVELS:
         expected = calculate_termination_probability(risk) * 100
         observed = per_turn[risk].termination_rate * 100
         diff = observed - expected
@@ -163,14 +171,18 @@ def print_results(per_turn: dict, cumulative: dict, reach_turn: dict, num_trials
     print("CUMULATIVE TERMINATION (Games from Turn 10 to Turn 16)")
     print(f"Games per risk level: {num_games}")
     print("-" * 80)
-    print(f"\n{'Risk Level':<15} {'Games Terminated':>18} {'Termination Rate':>18} {'Avg Turn':>12}")
-    print("-" * 70)
+    print(
+        f"\n{'Risk Level':<12} {'Games Terminated':>17} {'Rate (Sim)':>11} {'(Exact)':>9}"
+        f" {'Avg Turn (Sim)':>15} {'(Exact)':>9}"
+    )
+    print("-" * 77)
 
-    for risk in range(8, 10):
+    for risk in RISK_LEVELS:
         stats = cumulative[risk]
+        exact_rate, exact_turn = exact_termination_stats(risk)
         print(
-            f"{risk:<15} {stats.terminations:>18} {stats.termination_rate * 100:>17.1f}% "
-            f"{stats.avg_termination_turn:>12.1f}"
+            f"{risk:<12} {stats.terminations:>17} {stats.termination_rate * 100:>10.1f}% {exact_rate * 100:>8.1f}%"
+            f" {stats.avg_termination_turn:>15.2f} {exact_turn:>9.2f}"
         )
 
     # Probability of reaching specific turns
@@ -178,45 +190,36 @@ def print_results(per_turn: dict, cumulative: dict, reach_turn: dict, num_trials
     print("PROBABILITY OF REACHING TURN (from Turn 10)")
     print("-" * 80)
 
-    # Calculate theoretical probabilities
     # P(reach turn N) = (1 - p)^(N - 10) where p = (Risk - 7) * 0.08
-    def theoretical_reach_prob(risk: int, target_turn: int) -> float:
-        p = calculate_termination_probability(risk)
-        turns_to_survive = target_turn - 10
-        return (1 - p) ** turns_to_survive
+    exact_reach = {risk: exact_reach_probabilities(risk) for risk in RISK_LEVELS}
 
     print(f"\n{'Turn':<8}", end="")
-    for risk in range(8, 10):
-        print(f"{'Risk ' + str(risk) + ' (Sim)':>14} {'(Theory)':>12}", end="")
+    for risk in RISK_LEVELS:
+        print(f"{'Risk ' + str(risk) + ' (Sim)':>14} {'(Exact)':>12}", end="")
     print()
     print("-" * 56)
 
-    for turn in [10, 11, 12, 13, 14, 15, 16]:
+    for turn in range(FIRST_TURN, LAST_TURN + 1):
         print(f"{turn:<8}", end="")
-        for risk in range(8, 10):
+        for risk in RISK_LEVELS:
             simulated = reach_turn[risk][turn] * 100
-            theoretical = theoretical_reach_prob(risk, turn) * 100
-            print(f"{simulated:>13.1f}% {theoretical:>11.1f}%", end="")
+            exact = exact_reach[risk][turn] * 100
+            print(f"{simulated:>13.1f}% {exact:>11.1f}%", end="")
         print()
 
     # Comparison with GAME_MANUAL.md values
     print("\n" + "-" * 80)
     print("COMPARISON WITH GAME_MANUAL.md STATED VALUES")
     print("-" * 80)
-    print(f"\n{'Metric':<40} {'Manual':>12} {'Simulated':>12}")
-    print("-" * 65)
-
-    manual_values = [
-        ("Risk 8: P(reaching Turn 12)", 85, reach_turn[8].get(12, 0) * 100),
-        ("Risk 8: P(reaching Turn 14)", 72, reach_turn[8].get(14, 0) * 100),
-        ("Risk 8: P(reaching Turn 16)", 61, reach_turn[8].get(16, 0) * 100),
-        ("Risk 9: P(reaching Turn 12)", 70, reach_turn[9].get(12, 0) * 100),
-        ("Risk 9: P(reaching Turn 14)", 49, reach_turn[9].get(14, 0) * 100),
-        ("Risk 9: P(reaching Turn 16)", 35, reach_turn[9].get(16, 0) * 100),
-    ]
+    print(f"\n{'Metric':<40} {'Manual':>8} {'Exact':>9} {'Simulated':>11}")
+    print("-" * 70)
 
-    for metric, manual, simulated in manual_values:
-        print(f"{metric:<40} {manual:>11}% {simulated:>11.1f}%")
+    manual_values = [(8, 12, 85), (8, 14, 72), (8, 16, 61), (9, 12, 70), (9, 14, 49), (9, 16, 35)]
+    for risk, turn, manual in manual_values:
+        metric = f"Risk {risk}: P(reaching Turn {turn})"
+        exact = exact_reach[risk][turn] * 100
+        simulated = reach_turn[risk][turn] * 100
+        print(f"{metric:<40} {manual:>7}% {exact:>8.1f}% {simulated:>10.1f}%")
 
     print("\n" + "=" * 80)
     print("SUMMARY")
@@ -240,16 +243,15 @@ def main():
     parser.add_argument("--seed", type=int, default=None, help="Random seed for reproducibility")
     args = parser.parse_args()
 
-    if args.seed is not None:
-        random.seed(args.seed)
+    rng = np.random.default_rng(args.seed)
 
     print("Running crisis termination simulation...")
     print(f"  Per-turn trials: {args.trials}")
     print(f"  Cumulative games: {args.games}")
 
-    per_turn = run_per_turn_simulation(args.trials)
-    cumulative = run_cumulative_simulation(args.games)
-    reach_turn = run_reach_turn_simulation(args.games)
+    per_turn = run_per_turn_simulation(args.trials, rng)
+    cumulative = run_cumulative_simulation(args.games, rng)
+    reach_turn = run_reach_turn_simulation(args.games, rng)
 
     print_results(per_turn, cumulative, reach_turn, args.trials, args.games)
 
@@ -16,12 +16,16 @@ Test Scenarios:
     - When behind (-2 position): lower suggested VP
     - With high cooperation: bonus to suggested VP
     - With low cooperation: penalty to suggested VP
+
+Acceptance trials are drawn as one NumPy array per table, next to the
+exact acceptance probability.
 """
 
 import argparse
-import random
 from dataclasses import dataclass
 
+import numpy as np
+
 
 @dataclass
 class SettlementParams:
@@ -173,7 +177,12 @@ def run_offer_range_verification():
     return all_valid
 
 
-def run_acceptance_simulation(num_trials: int = 10000):
+def simulate_acceptance(probabilities: list[float], num_trials: int, rng: np.random.Generator) -> np.ndarray:
+    """Observed acceptance rate for each probability over num_trials draws."""
+    return (rng.random((len(probabilities), num_trials)) < np.asarray(probabilities)[:, None]).mean(axis=1)
+
+
+def run_acceptance_simulation(num_trials: int, rng: np.random.Generator):
     """Simulate settlement acceptance probabilities."""
     print("=" * 90)
     print("SETTLEMENT ACCEPTANCE SIMULATION")
@@ -184,30 +193,25 @@ def run_acceptance_simulation(num_trials: int = 10000):
     # Test acceptance at different offer levels
     print("Acceptance rates at different offer levels (neutral personality):")
     print()
-    print(f"{'Offer to Opp':>14} {'Fair Value':>12} {'Delta':>8} {'Accept %':>12}")
-    print("-" * 46)
+    print(f"{'Offer to Opp':>14} {'Fair Value':>12} {'Delta':>8} {'Accept %':>12} {'(Exact)':>10}")
+    print("-" * 57)
 
     fair_value = 50.0  # Assume equal position baseline
     test_offers = [30, 35, 40, 45, 50, 55, 60, 65, 70]
+    probabilities = [compute_acceptance_probability(offer, fair_value) for offer in test_offers]
+    accept_rates = simulate_acceptance(probabilities, num_trials, rng)
 
-    for offer in test_offers:
-        accepts = 0
-        for _ in range(num_trials):
-            prob = compute_acceptance_probability(offer, fair_value)
-            if random.random() < prob:
-                accepts += 1
-
-        accept_rate = accepts / num_trials * 100
+    for offer, prob, accept_rate in zip(test_offers, probabilities, accept_rates, strict=True):
         delta = offer - fair_value
-        print(f"{offer:>14.1f} {fair_value:>12.1f} {delta:>8.1f} {accept_rate:>11.1f}%")
+        print(f"{offer:>14.1f} {fair_value:>12.1f} {delta:>8.1f} {accept_rate * 100:>11.1f}% {prob * 100:>9.1f}%")
 
-    print("-" * 46)
+    print("-" * 57)
     print()
 
     return True
 
 
-def run_personality_analysis(num_trials: int = 10000):
+def run_personality_analysis(num_trials: int, rng: np.random.Generator):
     """Analyze how personality affects acceptance."""
     print("=" * 90)
     print("PERSONALITY EFFECT ON ACCEPTANCE")
@@ -228,20 +232,16 @@ def run_personality_analysis(num_trials: int = 10000):
 
     print(f"Test: Offer {offer} VP when fair value is {fair_value} VP")
     print()
-    print(f"{'Personality':>35} {'Factor':>8} {'Accept %':>12}")
-    print("-" * 55)
+    print(f"{'Personality':>35} {'Factor':>8} {'Accept %':>12} {'(Exact)':>10}")
+    print("-" * 66)
 
-    for factor, description in personalities:
-        accepts = 0
-        for _ in range(num_trials):
-            prob = compute_acceptance_probability(offer, fair_value, factor)
-            if random.random() < prob:
-                accepts += 1
+    probabilities = [compute_acceptance_probability(offer, fair_value, factor) for factor, _ in personalities]
+    accept_rates = simulate_acceptance(probabilities, num_trials, rng)
 
-        accept_rate = accepts / num_trials * 100
-        print(f"{description:>35} {factor:>8.2f} {accept_rate:>11.1f}%")
+    for (factor, description), prob, accept_rate in zip(personalities, probabilities, accept_rates, strict=True):
+        print(f"{description:>35} {factor:>8.2f} {accept_rate * 100:>11.1f}% {prob * 100:>9.1f}%")
 
-    print("-" * 55)
+    print("-" * 66)
     print()
 
 
@@ -349,8 +349,7 @@ def main():
     parser.add_argument("--seed", type=int, default=None, help="Random seed for reproducibility")
     args = parser.parse_args()
 
-    if args.seed is not None:
-        random.seed(args.seed)
+    rng = np.random.default_rng(args.seed)
 
     print()
     print("SETTLEMENT PROTOCOL SIMULATION")
@@ -359,8 +358,8 @@ def main():
 
     # Run all tests
     run_offer_range_verification()
-    run_acceptance_simulation(args.trials)
-    run_personality_analysis(args.trials)
+    run_acceptance_simulation(args.trials, rng)
+    run_personality_analysis(args.trials, rng)
     run_strategic_offer_analysis()
     run_edge_case_tests()
 
@@ -20,13 +20,29 @@ Expected sigma ranges (approximate):
     - Neutral mid (~19σ): moderate values, act 2
     - Tense late (~27σ): high risk, low cooperation, low stability, act 3
     - Crisis (~37σ): extreme values
+
+Sigma factors come from brinksmanship.engine.variance. Resolutions are
+drawn as NumPy arrays; next to each simulated value the report shows the
+exact one (normal CDF for clamping and win rates, quadrature over the
+noise density for VP moments).
 """
 
 import argparse
-import random
-import statistics
+import math
 from dataclasses import dataclass
 
+import numpy as np
+
+from brinksmanship.engine.variance import (
+    calculate_base_sigma,
+    calculate_chaos_factor,
+    calculate_instability_factor,
+)
+
+# Standard normal grid for exact expectations over the resolution noise
+_Z = np.linspace(-10.0, 10.0, 40001)
+_Z_WEIGHTS = np.exp(-0.5 * _Z**2) / math.sqrt(2 * math.pi) * (_Z[1] - _Z[0])
+
 
 @dataclass
 class VarianceParams:
@@ -47,38 +63,60 @@ def compute_shared_sigma(params: VarianceParams) -> float:
     Returns:
         The computed shared_sigma value
     """
-    base_sigma = 8 + (params.risk_level * 1.2)
-    chaos_factor = 1.2 - (params.cooperation_score / 50)
-    instability_factor = 1 + (10 - params.stability) / 20
+    base_sigma = calculate_base_sigma(params.risk_level)
+    chaos_factor = calculate_chaos_factor(params.cooperation_score)
+    instability_factor = calculate_instability_factor(params.stability)
     act_multiplier = {1: 0.7, 2: 1.0, 3: 1.3}[params.act]
     shared_sigma = base_sigma * chaos_factor * instability_factor * act_multiplier
     return shared_sigma
 
 
-def final_resolution(pos_a: float, pos_b: float, shared_sigma: float) -> tuple[float, float]:
-    """Compute final VP distribution based on positions and variance.
+def expected_vp_a(pos_a: float, pos_b: float) -> float:
+    """Player A's expected VP from the position ratio."""
+    total = pos_a + pos_b
+    return (pos_a / total) * 100 if total > 0 else 50.0
+
+
+def final_resolution(pos_a: float, pos_b: float, noise: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Compute final VP distributions based on positions, one per noise draw.
 
     Args:
         pos_a: Player A's position
         pos_b: Player B's position
-        shared_sigma: Standard deviation for gaussian noise
+        noise: Gaussian noise draws (standard normals times shared_sigma)
 
     Returns:
-        Tuple of (vp_a, vp_b) normalized to sum to 100
+        Tuple of (vp_a, vp_b) arrays normalized to sum to 100
     """
-    total = pos_a + pos_b
-    ev_a = (pos_a / total) * 100 if total > 0 else 50
+    ev_a = expected_vp_a(pos_a, pos_b)
     ev_b = 100 - ev_a
-    noise = random.gauss(0, shared_sigma)
     vp_a_raw = ev_a + noise
     vp_b_raw = ev_b - noise  # Symmetric
     # Clamp and renormalize
-    vp_a_clamped = max(5, min(95, vp_a_raw))
-    vp_b_clamped = max(5, min(95, vp_b_raw))
+    vp_a_clamped = np.clip(vp_a_raw, 5, 95)
+    vp_b_clamped = np.clip(vp_b_raw, 5, 95)
     total_vp = vp_a_clamped + vp_b_clamped
     return vp_a_clamped * 100 / total_vp, vp_b_clamped * 100 / total_vp
 
 
+def normal_cdf(x: float) -> float:
+    """Standard normal CDF."""
+    return 0.5 * (1 + math.erf(x / math.sqrt(2)))
+
+
+def exact_vp_moments(pos_a: float, pos_b: float, shared_sigma: float) -> tuple[float, float]:
+    """Exact (mean, std) of Player A's final VP, integrating over the noise density."""
+    vp_a, _ = final_resolution(pos_a, pos_b, _Z * shared_sigma)
+    mean = float(np.dot(_Z_WEIGHTS, vp_a))
+    return mean, math.sqrt(max(0.0, float(np.dot(_Z_WEIGHTS, (vp_a - mean) ** 2))))
+
+
+def exact_win_rate(pos_a: float, pos_b: float, shared_sigma: float) -> float:
+    """Exact P(vp_a > vp_b): the noise must exceed (ev_b - ev_a) / 2."""
+    ev_a = expected_vp_a(pos_a, pos_b)
+    return 1 - normal_cdf((50 - ev_a) / shared_sigma)
+
+
 # Test scenarios with expected approximate sigma values
 # Parameters tuned to produce the target sigma ranges
 SCENARIOS = {
@@ -148,7 +186,7 @@ def run_sigma_verification():
     return all_passed
 
 
-def run_resolution_simulation(num_trials: int = 10000):
+def run_resolution_simulation(num_trials: int, rng: np.random.Generator):
     """Run many final resolutions and verify VP std dev matches expected range."""
     print("=" * 80)
     print("FINAL RESOLUTION SIMULATION")
@@ -161,38 +199,36 @@ def run_resolution_simulation(num_trials: int = 10000):
 
     print(f"Test positions: A={pos_a}, B={pos_b} (EV = 50/50)")
     print()
-    print(f"{'Scenario':<20} {'σ Used':>10} {'VP A Mean':>12} {'VP A Std':>12} {'Expected Std':>14}")
-    print("-" * 68)
+    print(f"{'Scenario':<20} {'σ Used':>8} {'VP A Mean':>11} {'VP A Std':>10} {'Exact Std':>11} {'Unclamped':>11}")
+    print("-" * 76)
 
     results = {}
 
     for name, params in SCENARIOS.items():
         sigma = compute_shared_sigma(params)
-        vp_a_samples = []
+        vp_a_samples, _ = final_resolution(pos_a, pos_b, rng.normal(0, sigma, num_trials))
 
-        for _ in range(num_trials):
-            vp_a, vp_b = final_resolution(pos_a, pos_b, sigma)
-            vp_a_samples.append(vp_a)
-
-        mean_vp = statistics.mean(vp_a_samples)
-        std_vp = statistics.stdev(vp_a_samples)
+        mean_vp = float(vp_a_samples.mean())
+        std_vp = float(vp_a_samples.std(ddof=1))
+        _, exact_std = exact_vp_moments(pos_a, pos_b, sigma)
 
         results[name] = {
             "sigma": sigma,
             "mean": mean_vp,
             "std": std_vp,
+            "exact_std": exact_std,
         }
 
-        # Expected std is roughly sigma (before clamping effects)
-        print(f"{name:<20} {sigma:>10.2f} {mean_vp:>12.2f} {std_vp:>12.2f} {sigma:>14.2f}")
+        # Unclamped std would be sigma; clamping at 5/95 pulls it below
+        print(f"{name:<20} {sigma:>8.2f} {mean_vp:>11.2f} {std_vp:>10.2f} {exact_std:>11.2f} {sigma:>11.2f}")
 
-    print("-" * 68)
+    print("-" * 76)
     print()
 
     return results
 
 
-def run_position_bias_test(num_trials: int = 10000):
+def run_position_bias_test(num_trials: int, rng: np.random.Generator):
     """Test that position advantage translates to VP advantage."""
     print("=" * 80)
     print("POSITION ADVANTAGE TEST")
@@ -214,29 +250,27 @@ def run_position_bias_test(num_trials: int = 10000):
 
     print(f"Using σ = {sigma:.2f} (neutral_mid scenario)")
     print()
-    print(f"{'Pos A':>8} {'Pos B':>8} {'EV A':>10} {'Mean VP A':>12} {'A Wins %':>12}")
-    print("-" * 52)
+    print(f"{'Pos A':>8} {'Pos B':>8} {'EV A':>8} {'Mean VP A':>11} {'(Exact)':>9} {'A Wins %':>10} {'(Exact)':>9}")
+    print("-" * 69)
 
     for pos_a, pos_b, expected_ev in test_cases:
-        vp_a_samples = []
-        wins_a = 0
-
-        for _ in range(num_trials):
-            vp_a, vp_b = final_resolution(pos_a, pos_b, sigma)
-            vp_a_samples.append(vp_a)
-            if vp_a > vp_b:
-                wins_a += 1
+        vp_a_samples, vp_b_samples = final_resolution(pos_a, pos_b, rng.normal(0, sigma, num_trials))
 
-        mean_vp = statistics.mean(vp_a_samples)
-        win_rate = wins_a / num_trials * 100
+        mean_vp = float(vp_a_samples.mean())
+        win_rate = float((vp_a_samples > vp_b_samples).mean()) * 100
+        exact_mean, _ = exact_vp_moments(pos_a, pos_b, sigma)
+        exact_win = exact_win_rate(pos_a, pos_b, sigma) * 100
 
-        print(f"{pos_a:>8.1f} {pos_b:>8.1f} {expected_ev:>10.1f} {mean_vp:>12.2f} {win_rate:>11.1f}%")
+        print(
+            f"{pos_a:>8.1f} {pos_b:>8.1f} {expected_ev:>8.1f} {mean_vp:>11.2f} {exact_mean:>9.2f}"
+            f" {win_rate:>9.1f}% {exact_win:>8.1f}%"
+        )
 
-    print("-" * 52)
+    print("-" * 69)
     print()
 
 
-def run_clamping_analysis(num_trials: int = 10000):
+def run_clamping_analysis(num_trials: int, rng: np.random.Generator):
     """Analyze how clamping affects VP distribution at extreme sigmas."""
     print("=" * 80)
     print("CLAMPING EFFECT ANALYSIS")
@@ -248,35 +282,28 @@ def run_clamping_analysis(num_trials: int = 10000):
     pos_a, pos_b = 5.0, 5.0
     sigmas = [5, 10, 15, 20, 25, 30, 35, 40]
 
-    print(f"{'Sigma':>8} {'Mean A':>10} {'Std A':>10} {'Clamp Low %':>14} {'Clamp High %':>15}")
-    print("-" * 57)
+    print(f"{'Sigma':>6} {'Mean A':>8} {'Std A':>7} {'(Exact)':>8} {'Clamp Low %':>12} {'High %':>8} {'(Exact)':>8}")
+    print("-" * 63)
 
     for sigma in sigmas:
-        vp_a_samples = []
-        clamp_low = 0
-        clamp_high = 0
-
-        for _ in range(num_trials):
-            # Compute raw values to check clamping
-            noise = random.gauss(0, sigma)
-            vp_a_raw = 50 + noise
-
-            if vp_a_raw < 5:
-                clamp_low += 1
-            if vp_a_raw > 95:
-                clamp_high += 1
-
-            vp_a, vp_b = final_resolution(pos_a, pos_b, sigma)
-            vp_a_samples.append(vp_a)
-
-        mean_vp = statistics.mean(vp_a_samples)
-        std_vp = statistics.stdev(vp_a_samples)
-        clamp_low_pct = clamp_low / num_trials * 100
-        clamp_high_pct = clamp_high / num_trials * 100
-
-        print(f"{sigma:>8} {mean_vp:>10.2f} {std_vp:>10.2f} {clamp_low_pct:>14.1f} {clamp_high_pct:>15.1f}")
-
-    print("-" * 57)
+        noise = rng.normal(0, sigma, num_trials)
+        vp_a_raw = 50 + noise
+        clamp_low_pct = float((vp_a_raw < 5).mean()) * 100
+        clamp_high_pct = float((vp_a_raw > 95).mean()) * 100
+        # Equal positions: both tails have probability P(noise > 45)
+        exact_clamp_pct = (1 - normal_cdf(45 / sigma)) * 100
+
+        vp_a_samples, _ = final_resolution(pos_a, pos_b, noise)
+        mean_vp = float(vp_a_samples.mean())
+        std_vp = float(vp_a_samples.std(ddof=1))
+        _, exact_std = exact_vp_moments(pos_a, pos_b, sigma)
+
+        print(
+            f"{sigma:>6} {mean_vp:>8.2f} {std_vp:>7.2f} {exact_std:>8.2f}"
+            f" {clamp_low_pct:>12.1f} {clamp_high_pct:>8.1f} {exact_clamp_pct:>8.1f}"
+        )
+
+    print("-" * 63)
     print()
     print("Note: High clamping rates indicate variance is 'wasted' at extremes.")
     print()
@@ -289,8 +316,7 @@ def main():
     parser.add_argument("--seed", type=int, default=None, help="Random seed for reproducibility")
     args = parser.parse_args()
 
-    if args.seed is not None:
-        random.seed(args.seed)
+    rng = np.random.default_rng(args.seed)
 
     print()
     print("VARIANCE AND FINAL RESOLUTION SIMULATION")
@@ -299,9 +325,9 @@ def main():
 
     # Run all tests
     run_sigma_verification()
-    run_resolution_simulation(args.trials)
-    run_position_bias_test(args.trials)
-    run_clamping_analysis(args.trials)
+    run_resolution_simulation(args.trials, rng)
+    run_position_bias_test(args.trials, rng)
+    run_clamping_analysis(args.trials, rng)
 
     print("=" * 80)
     print("SIMULATION COMPLETE")
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Simulation worker for distributed balance runs and parameter sweeps.
+
+Pulls work units from a queue shared with a coordinator (balance_simulation.py
+or parameter_sweep.py with --queue), plays their games and stores the
+partial statistics back in the queue. Start one worker per core on as many
+hosts as can reach the queue file; workers can join or leave at any time,
+and the units of a worker that dies are retried by the others once their
+lease expires.
+
+Workers load scenarios from their configured repository unless a unit
+carries its own, so every host needs the scenarios of the runs it works on.
+
+Usage:
+    # Work until stopped
+    uv run python scripts/simulation_worker.py --queue /shared/queue.db
+
+    # Four workers on this host, each exiting after a minute without work
+    for i in 1 2 3 4; do
+        uv run python scripts/simulation_worker.py --queue /shared/queue.db --idle-timeout 60 &
+    done
+"""
+
+import argparse
+
+from brinksmanship.testing.distributed import SQLiteWorkQueue, default_worker_id, run_worker
+
+
+def main() -> None:
+    """Run a simulation worker."""
+    parser = argparse.ArgumentParser(description="Play work units from a shared simulation queue")
+    parser.add_argument(
+        "--queue",
+        type=str,
+        required=True,
+        help="SQLite work queue shared with the coordinator",
+    )
+    parser.add_argument(
+        "--worker-id",
+        type=str,
+        default=None,
+        help="Name of this worker in leases (default: host:pid)",
+    )
+    parser.add_argument(
+        "--lease",
+        type=float,
+        default=300.0,
+        help="Lease length in seconds; units of a worker silent this long are retried elsewhere (default: 300)",
+    )
+    parser.add_argument(
+        "--poll",
+        type=float,
+        default=1.0,
+        help="Seconds between polls of an empty queue (default: 1)",
+    )
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=None,
+        help="Exit after the queue has been empty this many seconds (default: run until stopped)",
+    )
+    parser.add_argument(
+        "--max-units",
+        type=int,
+        default=None,
+        help="Exit after completing this many units",
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Suppress per-unit output",
+    )
+
+    args = parser.parse_args()
+    worker_id = args.worker_id or default_worker_id()
+    print(f"Worker {worker_id} on {args.queue}")
+    try:
+        completed = run_worker(
+            SQLiteWorkQueue(args.queue),
+            worker_id=worker_id,
+            lease_seconds=args.lease,
+            poll_interval=args.poll,
+            idle_timeout=args.idle_timeout,
+            max_units=args.max_units,
+            quiet=args.quiet,
+        )
+    except KeyboardInterrupt:
+        print("\nStopped; the unit in progress is retried once its lease expires")
+        return
+    print(f"Completed {completed} units")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""Cross-scenario tournament for Brinksmanship.
+
+Plays every scenario x every ordered pairing of opponents (each opponent
+on both sides) as one run on a shared process pool, longest jobs first,
+and prints one opponent x opponent matrix per scenario.
+
+Usage:
+    # All scenarios, all deterministic opponents
+    uv run python scripts/tournament.py --games 200 --seed 42
+
+    # Some scenarios and opponents, 16 workers
+    uv run python scripts/tournament.py --scenarios cuban_missile_crisis,berlin_blockade \\
+        --opponents TitForTat,Opportunist,NashCalculator --workers 16
+
+    # Large tournaments on the vectorized engine (one batch per job)
+    uv run python scripts/tournament.py --games 100000 --vectorized
+
+    # Show win rates instead of VP shares, and save everything as JSON
+    uv run python scripts/tournament.py --metric win_rate_a --output results/tournament
+
+    # Reuse seeded jobs whose scenario, parameters and engine are unchanged
+    uv run python scripts/tournament.py --games 1000 --seed 42 --cache .cache/simulations
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from brinksmanship.testing.batch_runner import DETERMINISTIC_OPPONENTS
+from brinksmanship.testing.result_cache import ResultCache
+from brinksmanship.testing.tournament import TOURNAMENT_METRICS, TournamentRunner, print_tournament_results
+
+
+def main() -> None:
+    """Run the tournament."""
+    parser = argparse.ArgumentParser(
+        description="Play all scenarios x all opponent pairings on one shared process pool",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--scenarios",
+        type=str,
+        default=None,
+        help="Comma-separated scenario IDs (default: all scenarios)",
+    )
+    parser.add_argument(
+        "--opponents",
+        type=str,
+        default=None,
+        help="Comma-separated opponent names (default: all deterministic)",
+    )
+    parser.add_argument(
+        "--games",
+        type=int,
+        default=100,
+        help="Games per scenario and ordered pairing (default: 100)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Random seed for reproducibility",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Worker processes of the shared pool (default: 4)",
+    )
+    parser.add_argument(
+        "--vectorized",
+        action="store_true",
+        help="Play each job as one BatchGameEngine batch (deterministic opponents only)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=None,
+        help="Games per worker task (default: about four tasks per worker per job)",
+    )
+    parser.add_argument(
+        "--pilot-games",
+        type=int,
+        default=16,
+        help="Games per pilot batch estimating each job's length, for scheduling (0: use max_turns)",
+    )
+    parser.add_argument(
+        "--metric",
+        choices=TOURNAMENT_METRICS,
+        default="avg_vp_share_a",
+        help="Matrix entries (default: avg_vp_share_a)",
+    )
+    parser.add_argument(
+        "--crn",
+        action="store_true",
+        help="Common random numbers: every job on the same random draws (use with --seed)",
+    )
+    parser.add_argument(
+        "--antithetic",
+        action="store_true",
+        help="Antithetic final resolution noise (pairs of games with opposite noise)",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="Directory to save tournament_results.json in",
+    )
+    parser.add_argument(
+        "--cache",
+        type=str,
+        default=None,
+        help="Result cache directory: reuse seeded jobs whose inputs are unchanged",
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Suppress per-job progress output",
+    )
+
+    args = parser.parse_args()
+
+    scenario_ids = [s.strip() for s in args.scenarios.split(",")] if args.scenarios else None
+    opponent_names = [name.strip() for name in args.opponents.split(",")] if args.opponents else None
+    for name in opponent_names or []:
+        if name not in DETERMINISTIC_OPPONENTS:
+            print(f"Error: Unknown opponent '{name}'", file=sys.stderr)
+            print(f"Available: {list(DETERMINISTIC_OPPONENTS.keys())}", file=sys.stderr)
+            sys.exit(1)
+
+    print("=" * 80)
+    print("BRINKSMANSHIP TOURNAMENT")
+    print("=" * 80)
+
+    runner = TournamentRunner(
+        scenario_ids=scenario_ids,
+        opponent_names=opponent_names,
+        max_workers=args.workers,
+        common_random_numbers=args.crn,
+        antithetic=args.antithetic,
+        result_cache=ResultCache(args.cache) if args.cache else None,
+    )
+    start_time = time.time()
+    try:
+        results = runner.run(
+            num_games=args.games,
+            seed=args.seed,
+            vectorized=args.vectorized,
+            chunk_size=args.chunk_size,
+            pilot_games=args.pilot_games,
+            quiet=args.quiet,
+        )
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print_tournament_results(results, metric=args.metric)
+
+    if args.output:
+        output_path = Path(args.output)
+        output_path.mkdir(parents=True, exist_ok=True)
+        results_file = output_path / "tournament_results.json"
+        results_file.write_text(results.to_json())
+        print(f"\nResults saved to: {results_file}")
+
+    print()
+    print(f"Tournament completed in {time.time() - start_time:.1f} seconds")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
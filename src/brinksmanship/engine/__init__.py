@@ -5,6 +5,10 @@ This module contains the core game logic including:
 - endings: End condition checks (deterministic endings, crisis termination)
 - resolution: Matrix resolution and action handling
 - game_engine: Core game loop and state management
+- batch_engine: Lockstep NumPy engine for many deterministic games at once
+- solver: Exact outcome distributions by probability-mass propagation
+- rng: Per-game random streams derived from (seed, game_index)
+- instrumentation: Opt-in per-phase metrics for submit_actions
 
 Usage:
     from brinksmanship.engine import GameEngine, create_game
@@ -29,7 +33,14 @@ Usage:
         print(f"Game over: {ending.description}")
 """
 
+from brinksmanship.engine.batch_engine import (
+    BatchGameEngine,
+    BatchOutcome,
+    BatchPolicy,
+    BatchState,
+)
 from brinksmanship.engine.game_engine import (
+    CompiledScenario,
     EndingType,
     GameEnding,
     GameEngine,
@@ -37,8 +48,20 @@ from brinksmanship.engine.game_engine import (
     TurnPhase,
     TurnRecord,
     TurnResult,
+    clear_scenario_cache,
+    compile_scenario,
     create_game,
+    get_compiled_scenario,
+)
+from brinksmanship.engine.instrumentation import (
+    CallbackSink,
+    EngineInstrumentation,
+    HistogramSink,
+    JsonlSink,
+    TurnMetrics,
 )
+from brinksmanship.engine.rng import GameStreams, derive_rng, game_streams
+from brinksmanship.engine.solver import GameTreeSolver, SolverResult
 from brinksmanship.engine.variance import (
     calculate_base_sigma,
     calculate_chaos_factor,
@@ -60,6 +83,29 @@ __all__ = [
     "GameEnding",
     "EndingType",
     "create_game",
+    # Compiled scenario cache
+    "CompiledScenario",
+    "compile_scenario",
+    "get_compiled_scenario",
+    "clear_scenario_cache",
+    # Batch engine
+    "BatchGameEngine",
+    "BatchOutcome",
+    "BatchPolicy",
+    "BatchState",
+    # Instrumentation
+    "EngineInstrumentation",
+    "TurnMetrics",
+    "CallbackSink",
+    "HistogramSink",
+    "JsonlSink",
+    # Random streams
+    "GameStreams",
+    "derive_rng",
+    "game_streams",
+    # Exact solver
+    "GameTreeSolver",
+    "SolverResult",
     # Variance functions
     "calculate_base_sigma",
     "calculate_chaos_factor",
@@ -0,0 +1,1257 @@
+"""Lockstep NumPy engine for running many deterministic games at once.
+
+BatchGameEngine advances N games of one scenario together, keeping state as
+struct-of-arrays (BatchState) instead of one GameState per game. Each loop
+iteration runs, for every active game at once, the same sequence as
+GameRunner + GameEngine.submit_actions:
+
+1. Settlement negotiation between the two policies (turn > 4, stability > 2)
+2. Action selection from the turn's menu
+3. Resolution (matrix, reconnaissance, inspection, settlement)
+4. State update (apply_action_result + apply_surplus_effects)
+5. Deterministic, crisis and natural ending checks
+6. Branching advance to the next turn key
+
+Games are statistically equivalent to GameRunner games between the matching
+deterministic opponents, not bit-for-bit identical: the batch draws from one
+numpy Generator instead of per-game random.Random streams. Information states
+(reconnaissance/inspection results) are not tracked because no deterministic
+policy reads them.
+
+With common_random_numbers, max turns, crisis termination and final
+resolution draw counter-based numbers keyed by (seed, game key, turn)
+instead (see brinksmanship.engine.rng.hashed_uniforms), so batches on the
+same seed share them game by game whatever their opponents do. Policy
+and menu draws come from a KeyedGenerator per side and decision, keyed
+the same way by game and loop iteration.
+
+Usage:
+    from brinksmanship.engine.batch_engine import BatchGameEngine
+    from brinksmanship.opponents.batch_policies import BATCH_POLICIES
+
+    engine = BatchGameEngine("cuban_missile_crisis", repo, num_games=100_000, seed=42)
+    outcome = engine.run(
+        BATCH_POLICIES["TitForTat"](engine.num_games, is_player_a=True),
+        BATCH_POLICIES["NashCalculator"](engine.num_games, is_player_a=False),
+    )
+
+    # A parameter axis: games 0..N-1 use params_a, games N..2N-1 params_b
+    engine = BatchGameEngine("cuban_missile_crisis", repo, num_games=2 * N, params=[params_a] * N + [params_b] * N)
+
+    # ... with game i of each parameter set on the same random numbers
+    engine = BatchGameEngine(
+        "cuban_missile_crisis", repo, num_games=2 * N, seed=42, params=[params_a] * N + [params_b] * N,
+        common_random_numbers=True, game_keys=np.tile(np.arange(N), 2),
+    )
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass, fields
+from typing import TYPE_CHECKING, Protocol
+
+import numpy as np
+
+from brinksmanship.engine.game_engine import (
+    CompiledScenario,
+    EndingType,
+    TurnConfiguration,
+    _default_turn_config,
+    get_compiled_scenario,
+)
+from brinksmanship.engine.rng import (
+    CRISIS_STREAM,
+    ENGINE_STREAM,
+    PLAYER_A_STREAM,
+    PLAYER_B_STREAM,
+    RESOLUTION_STREAM,
+    fresh_seed,
+    hashed_normals,
+    hashed_uniforms,
+)
+from brinksmanship.models.actions import ActionCategory, ActionType
+from brinksmanship.models.state import GameState, PlayerState
+from brinksmanship.parameters import DEFAULT_PARAMETERS, GameParameters
+
+if TYPE_CHECKING:
+    from brinksmanship.storage import ScenarioRepository
+
+
+# =============================================================================
+# Encodings
+# =============================================================================
+
+# Action types: -1 = no previous action
+COOPERATIVE = 0
+COMPETITIVE = 1
+NO_ACTION = -1
+
+ACTION_TYPES: tuple[ActionType, ActionType] = (ActionType.COOPERATIVE, ActionType.COMPETITIVE)
+
+# Action categories
+CATEGORIES: tuple[ActionCategory, ...] = (
+    ActionCategory.STANDARD,
+    ActionCategory.SETTLEMENT,
+    ActionCategory.RECONNAISSANCE,
+    ActionCategory.INSPECTION,
+    ActionCategory.COSTLY_SIGNALING,
+)
+CAT_STANDARD, CAT_SETTLEMENT, CAT_RECONNAISSANCE, CAT_INSPECTION, CAT_SIGNALING = range(len(CATEGORIES))
+
+# Outcome codes; the first four are indexed by choice_a * 2 + choice_b
+OUTCOME_CODES: tuple[str, ...] = ("CC", "CD", "DC", "DD", "RECON", "INSPECT", "SETTLE_FAIL", "SETTLE")
+OUT_CC, OUT_CD, OUT_DC, OUT_DD, OUT_RECON, OUT_INSPECT, OUT_SETTLE_FAIL, OUT_SETTLE = range(len(OUTCOME_CODES))
+
+# Ending types; -1 = game still running
+ENDING_TYPES: tuple[EndingType, ...] = tuple(EndingType)
+NO_ENDING = -1
+_END = {ending: i for i, ending in enumerate(ENDING_TYPES)}
+
+# Turns beyond the longest possible game (max_turns <= 16, checked at turn 17)
+_TURN_LIMIT = 18
+
+
+# =============================================================================
+# Batch State
+# =============================================================================
+
+
+@dataclass
+class BatchState:
+    """Struct-of-arrays game state for N games.
+
+    Field names mirror GameState. previous_type_* use COOPERATIVE,
+    COMPETITIVE or NO_ACTION; turn_key indexes BatchScenarioTables.configs,
+    with -1 meaning "look the turn up by number".
+    """
+
+    position_a: np.ndarray
+    position_b: np.ndarray
+    resources_a: np.ndarray
+    resources_b: np.ndarray
+    risk_level: np.ndarray
+    cooperation_score: np.ndarray
+    stability: np.ndarray
+    cooperation_surplus: np.ndarray
+    surplus_captured_a: np.ndarray
+    surplus_captured_b: np.ndarray
+    cooperation_streak: np.ndarray
+    turn: np.ndarray
+    max_turns: np.ndarray
+    previous_type_a: np.ndarray
+    previous_type_b: np.ndarray
+    turn_key: np.ndarray
+
+    @classmethod
+    def initial(cls, max_turns: np.ndarray, start_key: int = -1) -> BatchState:
+        """Create the GameEngine starting state for len(max_turns) games."""
+        n = len(max_turns)
+        return cls(
+            position_a=np.full(n, 5.0),
+            position_b=np.full(n, 5.0),
+            resources_a=np.full(n, 5.0),
+            resources_b=np.full(n, 5.0),
+            risk_level=np.full(n, 2.0),
+            cooperation_score=np.full(n, 5.0),
+            stability=np.full(n, 5.0),
+            cooperation_surplus=np.zeros(n),
+            surplus_captured_a=np.zeros(n),
+            surplus_captured_b=np.zeros(n),
+            cooperation_streak=np.zeros(n, dtype=np.int64),
+            turn=np.ones(n, dtype=np.int64),
+            max_turns=np.clip(np.asarray(max_turns, dtype=np.int64), 12, 16),
+            previous_type_a=np.full(n, NO_ACTION, dtype=np.int8),
+            previous_type_b=np.full(n, NO_ACTION, dtype=np.int8),
+            turn_key=np.full(n, start_key, dtype=np.int32),
+        )
+
+    @classmethod
+    def from_game_states(cls, states: list[GameState]) -> BatchState:
+        """Pack GameStates into a batch (turn keys resolve by turn number)."""
+
+        def prev(action_type: ActionType | None) -> int:
+            return NO_ACTION if action_type is None else ACTION_TYPES.index(action_type)
+
+        return cls(
+            position_a=np.array([s.position_a for s in states], dtype=float),
+            position_b=np.array([s.position_b for s in states], dtype=float),
+            resources_a=np.array([s.resources_a for s in states], dtype=float),
+            resources_b=np.array([s.resources_b for s in states], dtype=float),
+            risk_level=np.array([s.risk_level for s in states], dtype=float),
+            cooperation_score=np.array([s.cooperation_score for s in states], dtype=float),
+            stability=np.array([s.stability for s in states], dtype=float),
+            cooperation_surplus=np.array([s.cooperation_surplus for s in states], dtype=float),
+            surplus_captured_a=np.array([s.surplus_captured_a for s in states], dtype=float),
+            surplus_captured_b=np.array([s.surplus_captured_b for s in states], dtype=float),
+            cooperation_streak=np.array([s.cooperation_streak for s in states], dtype=np.int64),
+            turn=np.array([s.turn for s in states], dtype=np.int64),
+            max_turns=np.array([s.max_turns for s in states], dtype=np.int64),
+            previous_type_a=np.array([prev(s.previous_type_a) for s in states], dtype=np.int8),
+            previous_type_b=np.array([prev(s.previous_type_b) for s in states], dtype=np.int8),
+            turn_key=np.full(len(states), -1, dtype=np.int32),
+        )
+
+    def __len__(self) -> int:
+        return len(self.turn)
+
+    def to_game_state(self, i: int) -> GameState:
+        """Unpack game i into a GameState (information states are fresh)."""
+
+        def prev(code: int) -> ActionType | None:
+            return None if code == NO_ACTION else ACTION_TYPES[code]
+
+        return GameState(
+            player_a=PlayerState(
+                position=float(self.position_a[i]),
+                resources=float(self.resources_a[i]),
+                previous_type=prev(int(self.previous_type_a[i])),
+            ),
+            player_b=PlayerState(
+                position=float(self.position_b[i]),
+                resources=float(self.resources_b[i]),
+                previous_type=prev(int(self.previous_type_b[i])),
+            ),
+            cooperation_score=float(self.cooperation_score[i]),
+            stability=float(self.stability[i]),
+            risk_level=float(self.risk_level[i]),
+            turn=int(self.turn[i]),
+            max_turns=int(self.max_turns[i]),
+            cooperation_surplus=float(self.cooperation_surplus[i]),
+            surplus_captured_a=float(self.surplus_captured_a[i]),
+            surplus_captured_b=float(self.surplus_captured_b[i]),
+            cooperation_streak=int(self.cooperation_streak[i]),
+        )
+
+    def take(self, idx: np.ndarray) -> BatchState:
+        """Gather the games at idx into a new (copied) batch."""
+        return BatchState(**{f.name: getattr(self, f.name)[idx] for f in fields(self)})
+
+    def put(self, idx: np.ndarray, other: BatchState) -> None:
+        """Scatter a batch produced by take(idx) back into this one."""
+        for f in fields(self):
+            getattr(self, f.name)[idx] = getattr(other, f.name)
+
+    @property
+    def act_multiplier(self) -> np.ndarray:
+        """Act multiplier per game (0.7 / 1.0 / 1.3), as GameState.act_multiplier."""
+        return np.where(self.turn <= 4, 0.7, np.where(self.turn <= 8, 1.0, 1.3))
+
+    @property
+    def expected_vp_a(self) -> np.ndarray:
+        """Player A's expected VP from the position ratio (50 when both positions are 0)."""
+        total_pos = self.position_a + self.position_b
+        return np.where(total_pos == 0, 50.0, self.position_a / np.where(total_pos == 0, 1.0, total_pos) * 100)
+
+    @property
+    def shared_sigma(self) -> np.ndarray:
+        """Shared variance per game, as GameState.shared_sigma."""
+        base_sigma = 8.0 + self.risk_level * 1.2
+        chaos_factor = 1.2 - self.cooperation_score / 50.0
+        instability_factor = 1.0 + (10.0 - self.stability) / 20.0
+        return base_sigma * chaos_factor * instability_factor * self.act_multiplier
+
+
+@dataclass(frozen=True)
+class BatchParameters:
+    """GameParameters for a batch: one value for all games, or an array with one per game.
+
+    Field names mirror GameParameters, so the vectorized steps accept either.
+    """
+
+    surplus_base: float | np.ndarray
+    surplus_streak_bonus: float | np.ndarray
+    capture_rate: float | np.ndarray
+    exploit_position_gain: float | np.ndarray
+    cc_risk_reduction: float | np.ndarray
+    exploit_risk_increase: float | np.ndarray
+    dd_risk_increase: float | np.ndarray
+    dd_burn_rate: float | np.ndarray
+    rejection_base_penalty: float | np.ndarray
+    rejection_escalation: float | np.ndarray
+    variance_scale: float | np.ndarray
+    per_game: bool = False
+
+    @classmethod
+    def build(cls, params: GameParameters | Sequence[GameParameters] | None, num_games: int) -> BatchParameters:
+        """Batch parameters from one GameParameters (or None for the defaults) or one per game.
+
+        Raises:
+            ValueError: If a sequence does not hold exactly num_games entries
+        """
+        if params is None:
+            params = DEFAULT_PARAMETERS
+        if isinstance(params, GameParameters):
+            return cls(**params.to_dict())
+        if len(params) != num_games:
+            raise ValueError(f"Expected {num_games} GameParameters (one per game), got {len(params)}")
+        names = [f.name for f in fields(GameParameters)]
+        columns = np.array([[getattr(p, name) for name in names] for p in params], dtype=float).reshape(-1, len(names))
+        return cls(**{name: columns[:, i] for i, name in enumerate(names)}, per_game=True)
+
+    def take(self, idx: np.ndarray) -> BatchParameters:
+        """Parameters of the games at idx (self if all games share them)."""
+        if not self.per_game:
+            return self
+        return BatchParameters(
+            **{f.name: getattr(self, f.name)[idx] for f in fields(self) if f.name != "per_game"}, per_game=True
+        )
+
+
+@dataclass
+class BatchActionResult:
+    """Struct-of-arrays ActionResult; outcome indexes OUTCOME_CODES."""
+
+    action_a: np.ndarray
+    action_b: np.ndarray
+    position_delta_a: np.ndarray
+    position_delta_b: np.ndarray
+    resource_cost_a: np.ndarray
+    resource_cost_b: np.ndarray
+    risk_delta: np.ndarray
+    outcome: np.ndarray
+
+
+# =============================================================================
+# Vectorized State Updates
+# =============================================================================
+
+
+def batch_apply_action_result(state: BatchState, result: BatchActionResult) -> BatchState:
+    """Vectorized apply_action_result: returns a new batch with the turn applied."""
+    act_mult = state.act_multiplier
+    mutual_coop = (result.action_a == COOPERATIVE) & (result.action_b == COOPERATIVE)
+    mutual_defect = (result.action_a == COMPETITIVE) & (result.action_b == COMPETITIVE)
+
+    # Stability: decay toward neutral, then consistency bonus or switch penalty
+    switches = ((state.previous_type_a != NO_ACTION) & (result.action_a != state.previous_type_a)).astype(np.int8) + (
+        (state.previous_type_b != NO_ACTION) & (result.action_b != state.previous_type_b)
+    )
+    stability = state.stability * 0.8 + 1.0 + np.select([switches == 0, switches == 1], [1.5, -3.5], -5.5)
+
+    return BatchState(
+        position_a=np.clip(state.position_a + result.position_delta_a * act_mult, 0.0, 10.0),
+        position_b=np.clip(state.position_b + result.position_delta_b * act_mult, 0.0, 10.0),
+        resources_a=np.clip(state.resources_a - result.resource_cost_a, 0.0, 10.0),
+        resources_b=np.clip(state.resources_b - result.resource_cost_b, 0.0, 10.0),
+        risk_level=np.clip(state.risk_level + result.risk_delta * act_mult, 0.0, 10.0),
+        cooperation_score=np.clip(state.cooperation_score + mutual_coop - mutual_defect, 0.0, 10.0),
+        stability=np.clip(stability, 1.0, 10.0),
+        cooperation_surplus=state.cooperation_surplus.copy(),
+        surplus_captured_a=state.surplus_captured_a.copy(),
+        surplus_captured_b=state.surplus_captured_b.copy(),
+        cooperation_streak=state.cooperation_streak.copy(),
+        turn=state.turn + 1,
+        max_turns=state.max_turns.copy(),
+        previous_type_a=result.action_a.astype(np.int8),
+        previous_type_b=result.action_b.astype(np.int8),
+        turn_key=state.turn_key.copy(),
+    )
+
+
+def batch_apply_surplus_effects(
+    state: BatchState, outcome: np.ndarray, params: BatchParameters | GameParameters = DEFAULT_PARAMETERS
+) -> BatchState:
+    """Vectorized apply_surplus_effects; games with non-matrix outcomes are untouched.
+
+    Modifies the state in place and returns it. params may hold one value
+    per game (BatchParameters aligned with state).
+    """
+    cc = outcome == OUT_CC
+    cd = outcome == OUT_CD
+    dc = outcome == OUT_DC
+    dd = outcome == OUT_DD
+    exploit = cd | dc
+
+    # CC: create surplus scaled by streak, extend streak, reduce risk
+    created = params.surplus_base * (1.0 + params.surplus_streak_bonus * state.cooperation_streak)
+    surplus = state.cooperation_surplus + np.where(cc, created, 0.0)
+
+    # CD/DC: exploiter captures a share of the pool and gains position
+    captured = np.where(exploit, surplus * params.capture_rate, 0.0)
+    state.surplus_captured_a = state.surplus_captured_a + np.where(dc, captured, 0.0)
+    state.surplus_captured_b = state.surplus_captured_b + np.where(cd, captured, 0.0)
+    surplus = surplus - captured
+    shift = np.where(dc, params.exploit_position_gain, 0.0) - np.where(cd, params.exploit_position_gain, 0.0)
+    state.position_a = np.clip(state.position_a + shift, 0.0, 10.0)
+    state.position_b = np.clip(state.position_b - shift, 0.0, 10.0)
+
+    # DD: deadweight loss
+    state.cooperation_surplus = np.where(dd, surplus * (1.0 - params.dd_burn_rate), surplus)
+
+    matrix_outcome = cc | exploit | dd
+    state.cooperation_streak = np.where(
+        cc, state.cooperation_streak + 1, np.where(matrix_outcome, 0, state.cooperation_streak)
+    )
+    risk_change = np.select(
+        [cc, exploit, dd], [-params.cc_risk_reduction, params.exploit_risk_increase, params.dd_risk_increase], 0.0
+    )
+    state.risk_level = np.where(matrix_outcome, np.clip(state.risk_level + risk_change, 0.0, 10.0), state.risk_level)
+    return state
+
+
+# =============================================================================
+# Vectorized Ending Checks
+# =============================================================================
+
+
+def batch_deterministic_endings(state: BatchState) -> np.ndarray:
+    """Deterministic ending per game (index into ENDING_TYPES, or NO_ENDING).
+
+    Same precedence as GameEngine._check_deterministic_endings.
+    """
+    return np.select(
+        [
+            state.risk_level >= 10,
+            state.position_a <= 0,
+            state.position_b <= 0,
+            state.resources_a <= 0,
+            state.resources_b <= 0,
+        ],
+        [
+            _END[EndingType.MUTUAL_DESTRUCTION],
+            _END[EndingType.POSITION_COLLAPSE_A],
+            _END[EndingType.POSITION_COLLAPSE_B],
+            _END[EndingType.RESOURCE_EXHAUSTION_A],
+            _END[EndingType.RESOURCE_EXHAUSTION_B],
+        ],
+        NO_ENDING,
+    ).astype(np.int8)
+
+
+# Fixed VP for deterministic endings, indexed like ENDING_TYPES
+_DETERMINISTIC_VP = {
+    EndingType.MUTUAL_DESTRUCTION: (0.0, 0.0),
+    EndingType.POSITION_COLLAPSE_A: (10.0, 90.0),
+    EndingType.POSITION_COLLAPSE_B: (90.0, 10.0),
+    EndingType.RESOURCE_EXHAUSTION_A: (15.0, 85.0),
+    EndingType.RESOURCE_EXHAUSTION_B: (85.0, 15.0),
+}
+_FIXED_VP_A = np.array([_DETERMINISTIC_VP.get(e, (0.0, 0.0))[0] for e in ENDING_TYPES])
+_FIXED_VP_B = np.array([_DETERMINISTIC_VP.get(e, (0.0, 0.0))[1] for e in ENDING_TYPES])
+
+
+def batch_crisis_probability(state: BatchState) -> np.ndarray:
+    """Crisis termination probability per game (Turn >= 10, Risk > 7, p = (Risk - 7) * 0.08)."""
+    eligible = (state.turn >= 10) & (state.risk_level > 7)
+    return np.where(eligible, (state.risk_level - 7) * 0.08, 0.0)
+
+
+def batch_crisis_termination(
+    state: BatchState, rng: np.random.Generator, draws: np.ndarray | None = None
+) -> np.ndarray:
+    """Which games trigger crisis termination this turn (draws: uniforms to use instead of rng's)."""
+    if draws is None:
+        draws = rng.random(len(state))
+    return draws < batch_crisis_probability(state)
+
+
+def batch_final_resolution(
+    state: BatchState,
+    rng: np.random.Generator,
+    params: BatchParameters | GameParameters = DEFAULT_PARAMETERS,
+    normals: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized GameEngine._final_resolution: noisy VP split that sums to 100.
+
+    normals are standard normal draws to use instead of rng's.
+    """
+    ev_a = state.expected_vp_a
+    ev_b = 100.0 - ev_a
+
+    if normals is None:
+        normals = rng.normal(0.0, 1.0, len(state))
+    noise = normals * state.shared_sigma * params.variance_scale
+    vp_a_clamped = np.clip(ev_a + noise, 5.0, 95.0)
+    vp_b_clamped = np.clip(ev_b - noise, 5.0, 95.0)
+
+    total = vp_a_clamped + vp_b_clamped
+    return vp_a_clamped * 100.0 / total, vp_b_clamped * 100.0 / total
+
+
+# =============================================================================
+# Scenario Tables
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class BatchScenarioTables:
+    """A compiled scenario flattened into arrays indexed by config number.
+
+    configs holds every scenario turn key followed by the default
+    configuration for each turn number, so a turn key that is missing from
+    the scenario (or None) resolves exactly as GameEngine._get_current_config.
+
+    Attributes:
+        configs: TurnConfigurations by index
+        key_index: Scenario turn key -> config index
+        start_key: Config index of the first turn
+        by_turn: Config used for turn number t when the turn key is unknown
+        deltas: (C, 4, 5) matrix deltas per outcome:
+            pos_a, pos_b, res_cost_a, res_cost_b, risk_delta
+        next_key: (C, len(OUTCOME_CODES)) config index after each outcome (-1 = by turn)
+        settlement_available: (C,) whether settlement may be proposed
+        has_menu: (C,) whether the turn defines scenario actions
+        menu_type, menu_category, menu_cost: (C, J) scenario action tables
+            (padding has infinite cost, so is never affordable)
+    """
+
+    configs: tuple[TurnConfiguration, ...]
+    key_index: dict[str, int]
+    start_key: int
+    by_turn: np.ndarray
+    deltas: np.ndarray
+    next_key: np.ndarray
+    settlement_available: np.ndarray
+    has_menu: np.ndarray
+    menu_type: np.ndarray
+    menu_category: np.ndarray
+    menu_cost: np.ndarray
+
+    @classmethod
+    def from_compiled(cls, compiled: CompiledScenario) -> BatchScenarioTables:
+        """Flatten a CompiledScenario (plus default turn configs) into arrays."""
+        keys = list(compiled.turn_configs)
+        configs = [compiled.turn_configs[k] for k in keys]
+        key_index = {k: i for i, k in enumerate(keys)}
+
+        by_turn = np.empty(_TURN_LIMIT + 1, dtype=np.int32)
+        for turn in range(_TURN_LIMIT + 1):
+            turn_key = f"turn_{turn}"
+            if turn_key in key_index:
+                by_turn[turn] = key_index[turn_key]
+            else:
+                by_turn[turn] = len(configs)
+                configs.append(_default_turn_config(max(turn, 1)))
+
+        num_configs = len(configs)
+        menu_width = max([len(c.scenario_actions) for c in configs] + [1])
+        deltas = np.zeros((num_configs, 4, 5))
+        next_key = np.full((num_configs, len(OUTCOME_CODES)), -1, dtype=np.int32)
+        settlement_available = np.zeros(num_configs, dtype=bool)
+        has_menu = np.zeros(num_configs, dtype=bool)
+        menu_type = np.zeros((num_configs, menu_width), dtype=np.int8)
+        menu_category = np.zeros((num_configs, menu_width), dtype=np.int8)
+        menu_cost = np.full((num_configs, menu_width), np.inf)
+
+        for c, config in enumerate(configs):
+            matrix = config.payoff_matrix
+            for o, outcome in enumerate((matrix.cc, matrix.cd, matrix.dc, matrix.dd)):
+                d = outcome.deltas
+                deltas[c, o] = (d.pos_a, d.pos_b, d.res_cost_a, d.res_cost_b, d.risk_delta)
+
+            # Mirror GameEngine._advance_turn; unknown or None keys resolve by turn number
+            for o, code in enumerate(OUTCOME_CODES):
+                if config.branches and code in config.branches:
+                    target = config.branches[code]
+                elif config.default_next:
+                    target = config.default_next
+                else:
+                    target = None
+                next_key[c, o] = key_index.get(target, -1) if target else -1
+
+            settlement_available[c] = config.settlement_available
+            if config.has_scenario_actions():
+                has_menu[c] = True
+                for j, scenario_action in enumerate(config.scenario_actions):
+                    action = scenario_action.to_action()
+                    menu_type[c, j] = ACTION_TYPES.index(action.action_type)
+                    menu_category[c, j] = CATEGORIES.index(action.category)
+                    menu_cost[c, j] = action.resource_cost
+
+        return cls(
+            configs=tuple(configs),
+            key_index=key_index,
+            start_key=key_index.get(compiled.start_key, -1),
+            by_turn=by_turn,
+            deltas=deltas,
+            next_key=next_key,
+            settlement_available=settlement_available,
+            has_menu=has_menu,
+            menu_type=menu_type,
+            menu_category=menu_category,
+            menu_cost=menu_cost,
+        )
+
+    def resolve(self, turn_key: np.ndarray, turn: np.ndarray) -> np.ndarray:
+        """Config index per game, falling back to the turn number like GameEngine."""
+        return np.where(turn_key >= 0, turn_key, self.by_turn[np.minimum(turn, _TURN_LIMIT)])
+
+
+# =============================================================================
+# Policy Interface
+# =============================================================================
+
+
+@dataclass
+class BatchView:
+    """One player's view of a subset of games, handed to batch policies.
+
+    Attributes:
+        idx: Global game indices of this subset (for per-game policy state)
+        my_position, opponent_position: Positions from this player's side
+        risk_level, cooperation_score, stability, turn: Shared state
+        opponent_previous_type: COOPERATIVE, COMPETITIVE or NO_ACTION
+        has_cooperative_action: Whether the menu offers an affordable cooperative action
+    """
+
+    idx: np.ndarray
+    my_position: np.ndarray
+    opponent_position: np.ndarray
+    risk_level: np.ndarray
+    cooperation_score: np.ndarray
+    stability: np.ndarray
+    turn: np.ndarray
+    opponent_previous_type: np.ndarray
+    has_cooperative_action: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.idx)
+
+    def take(self, rows: np.ndarray) -> BatchView:
+        """Gather the games at rows (positions in this view) into a new view."""
+        return BatchView(**{f.name: getattr(self, f.name)[rows] for f in fields(self)})
+
+    def fair_vp(self) -> np.ndarray:
+        """Vectorized Opponent.get_position_fair_vp for this player."""
+        suggested = 50 + (self.my_position - self.opponent_position) * 5 + (self.cooperation_score - 5) * 2
+        return np.trunc(np.clip(suggested, 20, 80)).astype(np.int64)
+
+
+class BatchPolicy(Protocol):
+    """Vectorized opponent strategy (see brinksmanship.opponents.batch_policies).
+
+    Attributes:
+        name: Opponent name reported in outcomes
+        first_action: If True, the policy plays the first menu action of the
+            chosen type, like an opponent that takes typed_actions[0],
+            instead of a random one
+    """
+
+    name: str
+    first_action: bool
+
+    def choose_cooperative(self, view: BatchView, rng: np.random.Generator) -> np.ndarray: ...
+
+    def observe(self, idx: np.ndarray, opponent_action: np.ndarray) -> None: ...
+
+    def propose_settlement(self, view: BatchView, rng: np.random.Generator) -> tuple[np.ndarray, np.ndarray]: ...
+
+    def evaluate_settlement(
+        self,
+        view: BatchView,
+        offered_vp: np.ndarray,
+        is_final_offer: bool,
+        rng: np.random.Generator,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]: ...
+
+
+class KeyedGenerator:
+    """Stand-in for np.random.Generator whose draws are keyed by game.
+
+    Supports the draws batch policies make (random and integers, one value
+    per game of the view). The k-th call on an instance draws
+    hashed_uniforms(seed, stream, keys, step * 64 + k), so a game's draws
+    depend only on its key, the loop iteration and the call order within
+    one decision, never on which other games are in the batch.
+    """
+
+    def __init__(self, seed: int, stream: int, keys: np.ndarray, step: int):
+        self.seed = seed
+        self.stream = stream
+        self.keys = keys
+        self.step = step
+        self._calls = 0
+
+    def random(self, size: int | None = None) -> np.ndarray:
+        """One uniform in [0, 1) per key.
+
+        Raises:
+            ValueError: If size is not the number of keys
+        """
+        if size is not None and size != len(self.keys):
+            raise ValueError(f"Keyed draws are one per game: asked for {size}, have {len(self.keys)} games")
+        counter = self.step * 64 + self._calls
+        self._calls += 1
+        return hashed_uniforms(self.seed, self.stream, self.keys, counter)
+
+    def integers(self, low: int, high: int | None = None, size: int | None = None) -> np.ndarray:
+        """One integer in [low, high) per key (like Generator.integers)."""
+        if high is None:
+            low, high = 0, low
+        return low + (self.random(size) * (high - low)).astype(np.int64)
+
+
+class _FirstActionDraws:
+    """Uniforms of 0, so _select_actions picks the first candidate action."""
+
+    def random(self, size: int | None = None) -> np.ndarray:
+        return np.zeros(size)
+
+
+def _subset_uniforms(
+    rng: np.random.Generator | KeyedGenerator | _FirstActionDraws, n: int, rows: np.ndarray
+) -> np.ndarray:
+    """Uniforms for the rows of n games (a keyed draw covers all n to stay aligned)."""
+    if isinstance(rng, KeyedGenerator):
+        return rng.random(n)[rows]
+    return rng.random(len(rows))
+
+
+# Per-side decisions with their own keyed streams
+_CHOOSE, _PROPOSE, _EVALUATE, _COUNTER, _SELECT = range(5)
+
+
+# =============================================================================
+# Batch Outcome
+# =============================================================================
+
+
+@dataclass
+class BatchOutcome:
+    """Final results of a batch run, one entry per game.
+
+    Attributes:
+        ending_type: Index into ENDING_TYPES per game
+        vp_a, vp_b: Final victory points
+        turns_played: Turns completed (final turn - 1, as GameResult)
+        final_*: Final state values
+    """
+
+    scenario_id: str
+    opponent_a_name: str
+    opponent_b_name: str
+    ending_type: np.ndarray
+    vp_a: np.ndarray
+    vp_b: np.ndarray
+    turns_played: np.ndarray
+    final_pos_a: np.ndarray
+    final_pos_b: np.ndarray
+    final_res_a: np.ndarray
+    final_res_b: np.ndarray
+    final_risk: np.ndarray
+    final_cooperation: np.ndarray
+    final_stability: np.ndarray
+
+    @property
+    def num_games(self) -> int:
+        return len(self.ending_type)
+
+    def ending_mask(self, *ending_types: EndingType) -> np.ndarray:
+        """Boolean mask of games that ended with any of the given ending types."""
+        return np.isin(self.ending_type, [_END[e] for e in ending_types])
+
+    def winners(self) -> np.ndarray:
+        """Winner per game using GameRunner's rule: "A", "B", "tie" or "mutual_destruction"."""
+        return np.select(
+            [
+                self.ending_mask(EndingType.MUTUAL_DESTRUCTION),
+                self.vp_a > self.vp_b + 0.01,
+                self.vp_b > self.vp_a + 0.01,
+            ],
+            ["mutual_destruction", "A", "B"],
+            "tie",
+        )
+
+    def ending_type_values(self) -> np.ndarray:
+        """EndingType value string per game."""
+        return np.array([e.value for e in ENDING_TYPES])[self.ending_type]
+
+    def take(self, rows: np.ndarray | slice) -> BatchOutcome:
+        """Outcome of the games at rows (e.g. one parameter set of a parameter axis)."""
+        return BatchOutcome(
+            **{
+                f.name: getattr(self, f.name)[rows]
+                if isinstance(getattr(self, f.name), np.ndarray)
+                else getattr(self, f.name)
+                for f in fields(self)
+            }
+        )
+
+
+# =============================================================================
+# Vectorized Turn Steps
+# =============================================================================
+
+
+def batch_view(
+    tables: BatchScenarioTables,
+    idx: np.ndarray,
+    state: BatchState,
+    config: np.ndarray,
+    is_player_a: bool,
+) -> BatchView:
+    """Build one player's view of the games in state (config from tables.resolve)."""
+    if is_player_a:
+        mine, theirs, resources, opp_prev = (
+            state.position_a,
+            state.position_b,
+            state.resources_a,
+            state.previous_type_b,
+        )
+    else:
+        mine, theirs, resources, opp_prev = (
+            state.position_b,
+            state.position_a,
+            state.resources_b,
+            state.previous_type_a,
+        )
+
+    # Generic menus always include Hold / Maintain
+    scenario_menu = tables.has_menu[config]
+    affordable_coop = (tables.menu_cost[config] <= resources[:, None]) & (tables.menu_type[config] == COOPERATIVE)
+    has_coop = ~scenario_menu | affordable_coop.any(axis=1)
+
+    return BatchView(
+        idx=idx,
+        my_position=mine,
+        opponent_position=theirs,
+        risk_level=state.risk_level,
+        cooperation_score=state.cooperation_score,
+        stability=state.stability,
+        turn=state.turn,
+        opponent_previous_type=opp_prev,
+        has_cooperative_action=has_coop,
+    )
+
+
+def batch_resolve(
+    tables: BatchScenarioTables,
+    config: np.ndarray,
+    state: BatchState,
+    type_a: np.ndarray,
+    category_a: np.ndarray,
+    cost_a: np.ndarray,
+    type_b: np.ndarray,
+    category_b: np.ndarray,
+    cost_b: np.ndarray,
+) -> tuple[BatchActionResult, np.ndarray]:
+    """Vectorized GameEngine._resolve_actions for the games in state.
+
+    Returns:
+        (result, settlement_vp_a) where settlement_vp_a is player A's VP
+        if both players proposed settlement this turn
+    """
+    settle_a, settle_b = category_a == CAT_SETTLEMENT, category_b == CAT_SETTLEMENT
+    settlement = settle_a | settle_b
+    recon = ~settlement & ((category_a == CAT_RECONNAISSANCE) | (category_b == CAT_RECONNAISSANCE))
+    inspection = ~settlement & ~recon & ((category_a == CAT_INSPECTION) | (category_b == CAT_INSPECTION))
+    matrix = ~(settlement | recon | inspection)
+
+    # Matrix game: deltas from the precomputed tables plus action costs
+    matrix_outcome = type_a.astype(np.int64) * 2 + type_b
+    deltas = tables.deltas[config, matrix_outcome]
+    outcome = np.where(matrix, matrix_outcome, OUT_SETTLE_FAIL)
+    pos_delta_a = np.where(matrix, deltas[:, 0], 0.0)
+    pos_delta_b = np.where(matrix, deltas[:, 1], 0.0)
+    res_cost_a = np.where(matrix, deltas[:, 2] + cost_a, 0.0)
+    res_cost_b = np.where(matrix, deltas[:, 3] + cost_b, 0.0)
+    risk_delta = np.where(matrix, deltas[:, 4], 0.0)
+
+    # Reconnaissance: initiator pays 0.5; a vigilant (cooperative) opponent detects the probe
+    recon_by_a = recon & (category_a == CAT_RECONNAISSANCE)
+    recon_by_b = recon & ~recon_by_a
+    outcome = np.where(recon, OUT_RECON, outcome)
+    res_cost_a = np.where(recon_by_a, 0.5, res_cost_a)
+    res_cost_b = np.where(recon_by_b, 0.5, res_cost_b)
+    detected = (recon_by_a & (type_b == COOPERATIVE)) | (recon_by_b & (type_a == COOPERATIVE))
+    risk_delta = np.where(detected, 0.5, risk_delta)
+
+    # Inspection: initiator pays 0.3; a cheating (competitive) opponent is caught
+    inspect_by_a = inspection & (category_a == CAT_INSPECTION)
+    inspect_by_b = inspection & ~inspect_by_a
+    outcome = np.where(inspection, OUT_INSPECT, outcome)
+    res_cost_a = np.where(inspect_by_a, 0.3, res_cost_a)
+    res_cost_b = np.where(inspect_by_b, 0.3, res_cost_b)
+    caught_b = inspect_by_a & (type_b == COMPETITIVE)
+    caught_a = inspect_by_b & (type_a == COMPETITIVE)
+    pos_delta_a = np.where(caught_a, -0.5, pos_delta_a)
+    pos_delta_b = np.where(caught_b, -0.5, pos_delta_b)
+    risk_delta = np.where(caught_a | caught_b, 1.0, risk_delta)
+
+    # Settlement: mutual proposals settle on position share plus cooperation bonus;
+    # a one-sided proposal fails and raises risk
+    both_settle = settle_a & settle_b
+    settle_failed = settlement & ~both_settle
+    outcome = np.where(both_settle, OUT_SETTLE, outcome)
+    risk_delta = np.where(settle_failed, 1.0, risk_delta)
+    action_a = np.where(both_settle, COOPERATIVE, type_a).astype(np.int8)
+    action_b = np.where(both_settle, COOPERATIVE, type_b).astype(np.int8)
+
+    total_pos = state.position_a + state.position_b
+    share_a = np.where(total_pos > 0, state.position_a / np.where(total_pos > 0, total_pos, 1.0) * 100, 50.0)
+    settle_vp_a = np.clip(share_a + (state.cooperation_score - 5) * 2, 5, 95)
+
+    result = BatchActionResult(
+        action_a=action_a,
+        action_b=action_b,
+        position_delta_a=pos_delta_a,
+        position_delta_b=pos_delta_b,
+        resource_cost_a=res_cost_a,
+        resource_cost_b=res_cost_b,
+        risk_delta=risk_delta,
+        outcome=outcome.astype(np.int8),
+    )
+    return result, settle_vp_a
+
+
+# =============================================================================
+# Batch Game Engine
+# =============================================================================
+
+
+class BatchGameEngine:
+    """Runs N games of one scenario in lockstep with NumPy.
+
+    Mirrors GameRunner's game loop over GameEngine, with per-game branching
+    through the scenario's turn graph and a BatchPolicy per side.
+    """
+
+    def __init__(
+        self,
+        scenario_id: str,
+        scenario_repo: ScenarioRepository,
+        num_games: int,
+        max_turns: int | None = None,
+        seed: int | None = None,
+        params: GameParameters | Sequence[GameParameters] | None = None,
+        common_random_numbers: bool = False,
+        antithetic: bool = False,
+        game_keys: np.ndarray | None = None,
+    ):
+        """Initialize the batch engine.
+
+        Args:
+            scenario_id: ID of scenario to load
+            scenario_repo: Repository for loading scenarios
+            num_games: Number of games to run in lockstep
+            max_turns: Override max turns for every game (default: random 12-16 each)
+            seed: Seed for the batch's numpy Generator
+            params: Game balance parameters for every game, or a sequence with
+                one GameParameters per game (default: DEFAULT_PARAMETERS)
+            common_random_numbers: Draw max turns, crisis termination and final
+                resolution from numbers keyed by game, shared by every batch
+                on the same seed
+            antithetic: Negate the final resolution noise of odd game keys,
+                pairing them with the key before
+            game_keys: Key of each game's common random numbers (default:
+                its index); equal keys share draws
+
+        Raises:
+            ValueError: If scenario not found or invalid, or params or
+                game_keys has the wrong length
+        """
+        if num_games < 1:
+            raise ValueError(f"num_games must be positive, got {num_games}")
+        if game_keys is not None and len(game_keys) != num_games:
+            raise ValueError(f"game_keys needs one key per game: got {len(game_keys)} for {num_games} games")
+
+        self.scenario_id = scenario_id
+        self.num_games = num_games
+        self.params = BatchParameters.build(params, num_games)
+        self.rng = np.random.default_rng(seed)
+        self.tables = BatchScenarioTables.from_compiled(get_compiled_scenario(scenario_id, scenario_repo))
+
+        self.common_random_numbers = common_random_numbers
+        self.antithetic = antithetic
+        self.game_keys = np.arange(num_games) if game_keys is None else np.asarray(game_keys, dtype=np.int64)
+        # Counter-based draws need a fixed seed even for an unseeded batch
+        self._stream_seed = seed
+        if seed is None and (common_random_numbers or antithetic):
+            self._stream_seed = fresh_seed()
+
+        self._steps = 0
+
+        if max_turns is None and common_random_numbers:
+            turns = 12 + (hashed_uniforms(self._stream_seed, ENGINE_STREAM, self.game_keys, 0) * 5).astype(np.int64)
+        elif max_turns is None:
+            turns = self.rng.integers(12, 17, size=num_games)
+        else:
+            turns = np.full(num_games, max_turns)
+        self.state = BatchState.initial(turns, start_key=self.tables.start_key)
+
+        self.ending_type = np.full(num_games, NO_ENDING, dtype=np.int8)
+        self.vp_a = np.zeros(num_games)
+        self.vp_b = np.zeros(num_games)
+
+    def is_game_over(self) -> np.ndarray:
+        """Per-game game-over mask."""
+        return self.ending_type != NO_ENDING
+
+    def run(self, policy_a: BatchPolicy, policy_b: BatchPolicy, max_iterations: int = 1000) -> BatchOutcome:
+        """Play every game to completion.
+
+        Args:
+            policy_a: Policy for player A
+            policy_b: Policy for player B
+            max_iterations: Safety cap on loop iterations (a game whose chosen
+                actions are invalid retries the turn, as in GameRunner)
+
+        Returns:
+            BatchOutcome with per-game results
+
+        Raises:
+            RuntimeError: If games are still running after max_iterations
+        """
+        for _ in range(max_iterations):
+            idx = np.flatnonzero(~self.is_game_over())
+            if len(idx) == 0:
+                break
+            self._step(idx, policy_a, policy_b)
+        else:
+            raise RuntimeError(f"Batch did not finish within {max_iterations} iterations")
+
+        state = self.state
+        return BatchOutcome(
+            scenario_id=self.scenario_id,
+            opponent_a_name=policy_a.name,
+            opponent_b_name=policy_b.name,
+            ending_type=self.ending_type.copy(),
+            vp_a=self.vp_a.copy(),
+            vp_b=self.vp_b.copy(),
+            turns_played=state.turn - 1,
+            final_pos_a=state.position_a.copy(),
+            final_pos_b=state.position_b.copy(),
+            final_res_a=state.resources_a.copy(),
+            final_res_b=state.resources_b.copy(),
+            final_risk=state.risk_level.copy(),
+            final_cooperation=state.cooperation_score.copy(),
+            final_stability=state.stability.copy(),
+        )
+
+    # =========================================================================
+    # Turn Loop
+    # =========================================================================
+
+    def _draws(self, idx: np.ndarray, is_player_a: bool, decision: int) -> np.random.Generator | KeyedGenerator:
+        """Random source for one side's decision over the games at idx."""
+        if not self.common_random_numbers:
+            return self.rng
+        stream = 16 * (PLAYER_A_STREAM if is_player_a else PLAYER_B_STREAM) + decision
+        return KeyedGenerator(self._stream_seed, stream, self.game_keys[idx], self._steps)
+
+    def _selection_draws(
+        self, policy: BatchPolicy, idx: np.ndarray, is_player_a: bool
+    ) -> np.random.Generator | KeyedGenerator | _FirstActionDraws:
+        """Random source for one side's pick within the chosen action type."""
+        if policy.first_action:
+            return _FirstActionDraws()
+        return self._draws(idx, is_player_a, _SELECT)
+
+    def _step(self, idx: np.ndarray, policy_a: BatchPolicy, policy_b: BatchPolicy) -> None:
+        """Run one loop iteration for the active games at idx."""
+        self._steps += 1
+        state = self.state.take(idx)
+        config = self.tables.resolve(state.turn_key, state.turn)
+
+        # Settlement negotiation (GameRunner._try_settlement)
+        settled = self._negotiate(idx, state, config, policy_a, policy_b)
+        if settled.any():
+            keep = ~settled
+            idx, state, config = idx[keep], state.take(keep), config[keep]
+            if len(idx) == 0:
+                return
+
+        # Action selection
+        view_a = batch_view(self.tables, idx, state, config, is_player_a=True)
+        view_b = batch_view(self.tables, idx, state, config, is_player_a=False)
+        type_a, category_a, cost_a = self._select_actions(
+            config,
+            state,
+            policy_a.choose_cooperative(view_a, self._draws(idx, True, _CHOOSE)),
+            is_player_a=True,
+            rng=self._selection_draws(policy_a, idx, True),
+        )
+        type_b, category_b, cost_b = self._select_actions(
+            config,
+            state,
+            policy_b.choose_cooperative(view_b, self._draws(idx, False, _CHOOSE)),
+            is_player_a=False,
+            rng=self._selection_draws(policy_b, idx, False),
+        )
+
+        # Invalid settlement proposals are rejected; GameRunner retries the turn
+        can_settle = (state.turn > 4) & (state.stability > 2)
+        valid = ~(((category_a == CAT_SETTLEMENT) | (category_b == CAT_SETTLEMENT)) & ~can_settle)
+        if not valid.all():
+            idx, state, config = idx[valid], state.take(valid), config[valid]
+            type_a, category_a, cost_a = type_a[valid], category_a[valid], cost_a[valid]
+            type_b, category_b, cost_b = type_b[valid], category_b[valid], cost_b[valid]
+            if len(idx) == 0:
+                return
+
+        # Resolution and state update
+        params = self.params.take(idx)
+        result, settle_vp_a = batch_resolve(
+            self.tables, config, state, type_a, category_a, cost_a, type_b, category_b, cost_b
+        )
+        new_state = batch_apply_surplus_effects(batch_apply_action_result(state, result), result.outcome, params)
+        policy_a.observe(idx, result.action_b)
+        policy_b.observe(idx, result.action_a)
+
+        # Endings (deterministic > crisis > natural > mutual settlement)
+        ending = batch_deterministic_endings(new_state)
+        vp_a = _FIXED_VP_A[np.maximum(ending, 0)]
+        vp_b = _FIXED_VP_B[np.maximum(ending, 0)]
+        open_games = ending == NO_ENDING
+        crisis_draws = None
+        if self.common_random_numbers:
+            crisis_draws = hashed_uniforms(self._stream_seed, CRISIS_STREAM, self.game_keys[idx], new_state.turn)
+        crisis = open_games & batch_crisis_termination(new_state, self.rng, crisis_draws)
+        natural = open_games & ~crisis & (new_state.turn > new_state.max_turns)
+        resolved = crisis | natural
+        if resolved.any():
+            normals = None
+            if self.common_random_numbers or self.antithetic:
+                keys = self.game_keys[idx[resolved]]
+                normals = hashed_normals(self._stream_seed, RESOLUTION_STREAM, keys, self.antithetic)
+            final_a, final_b = batch_final_resolution(
+                new_state.take(resolved), self.rng, params.take(resolved), normals
+            )
+            vp_a[resolved], vp_b[resolved] = final_a, final_b
+        ending[crisis] = _END[EndingType.CRISIS_TERMINATION]
+        ending[natural] = _END[EndingType.NATURAL_ENDING]
+        mutual_settlement = (ending == NO_ENDING) & (result.outcome == OUT_SETTLE)
+        ending[mutual_settlement] = _END[EndingType.SETTLEMENT]
+        vp_a[mutual_settlement] = settle_vp_a[mutual_settlement]
+        vp_b[mutual_settlement] = 100.0 - settle_vp_a[mutual_settlement]
+
+        # Advance to the next turn key. Like GameEngine._advance_turn, the config is
+        # looked up after the turn counter moves, so a by-number turn branches
+        # from the next turn's entry.
+        advance_config = self.tables.resolve(new_state.turn_key, new_state.turn)
+        new_state.turn_key = self.tables.next_key[advance_config, result.outcome]
+
+        self.state.put(idx, new_state)
+        self.ending_type[idx] = ending
+        self.vp_a[idx] = vp_a
+        self.vp_b[idx] = vp_b
+
+    def _negotiate(
+        self,
+        idx: np.ndarray,
+        state: BatchState,
+        config: np.ndarray,
+        policy_a: BatchPolicy,
+        policy_b: BatchPolicy,
+    ) -> np.ndarray:
+        """Vectorized GameRunner._try_settlement; records endings and returns the settled mask."""
+        settled = np.zeros(len(idx), dtype=bool)
+        eligible = (state.turn > 4) & (state.stability > 2)
+        if not eligible.any():
+            return settled
+
+        for proposer, evaluator, proposer_is_a in ((policy_a, policy_b, True), (policy_b, policy_a, False)):
+            sub = np.flatnonzero(eligible & ~settled)
+            if len(sub) == 0:
+                break
+            sub_state = state.take(sub)
+            proposer_view = batch_view(self.tables, idx[sub], sub_state, config[sub], is_player_a=proposer_is_a)
+            evaluator_view = batch_view(self.tables, idx[sub], sub_state, config[sub], is_player_a=not proposer_is_a)
+
+            sub_games = idx[sub]
+            proposing, offered = proposer.propose_settlement(
+                proposer_view, self._draws(sub_games, proposer_is_a, _PROPOSE)
+            )
+            accept, counter, counter_vp = evaluator.evaluate_settlement(
+                evaluator_view, offered, False, self._draws(sub_games, not proposer_is_a, _EVALUATE)
+            )
+            accept &= proposing
+            counter &= proposing & ~accept & (counter_vp > 0)
+
+            # Proposer's offered VP goes to the evaluator; an accepted counter's VP to the proposer
+            proposer_vp = np.where(accept, 100 - offered, counter_vp).astype(float)
+            if counter.any():
+                counter_accept, _, _ = proposer.evaluate_settlement(
+                    proposer_view, counter_vp, True, self._draws(sub_games, proposer_is_a, _COUNTER)
+                )
+                counter &= counter_accept
+            done = accept | counter
+            if not done.any():
+                continue
+
+            vp_a = np.where(proposer_is_a, proposer_vp, 100 - proposer_vp)[done]
+            games = idx[sub[done]]
+            self.ending_type[games] = _END[EndingType.SETTLEMENT]
+            self.vp_a[games] = vp_a
+            self.vp_b[games] = 100 - vp_a
+            settled[sub[done]] = True
+
+        return settled
+
+    def _select_actions(
+        self,
+        config: np.ndarray,
+        state: BatchState,
+        cooperative: np.ndarray,
+        is_player_a: bool,
+        rng: np.random.Generator | KeyedGenerator | _FirstActionDraws | None = None,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Pick a random menu action of the wanted type per game.
+
+        Mirrors DeterministicOpponent._select_random_from_type over
+        GameEngine.get_available_actions: uniform within the wanted type,
+        falling back to any available action.
+
+        Returns:
+            (action_type, category, resource_cost) arrays
+        """
+        if rng is None:
+            rng = self.rng
+        position = state.position_a if is_player_a else state.position_b
+        resources = state.resources_a if is_player_a else state.resources_b
+        wanted = np.where(cooperative, COOPERATIVE, COMPETITIVE).astype(np.int8)
+        n = len(config)
+
+        action_type = wanted.copy()
+        category = np.full(n, CAT_STANDARD, dtype=np.int8)
+        cost = np.zeros(n)
+
+        scenario_menu = self.tables.has_menu[config]
+        if scenario_menu.any():
+            rows = np.flatnonzero(scenario_menu)
+            cfg = config[rows]
+            types = self.tables.menu_type[cfg]
+            affordable = self.tables.menu_cost[cfg] <= resources[rows, None]
+            typed = affordable & (types == wanted[rows, None])
+            candidates = np.where(typed.any(axis=1)[:, None], typed, affordable)
+            counts = candidates.sum(axis=1)
+            if (counts == 0).any():
+                raise ValueError("No affordable actions available for a scenario turn")
+            pick = (_subset_uniforms(rng, n, rows) * counts).astype(np.int64)
+            column = np.argmax(np.cumsum(candidates, axis=1) > pick[:, None], axis=1)
+            action_type[rows] = types[np.arange(len(rows)), column]
+            category[rows] = self.tables.menu_category[cfg, column]
+            cost[rows] = self.tables.menu_cost[cfg, column]
+
+        # Generic menu: competitive picks are always standard actions; cooperative
+        # picks draw from the tier's standard actions plus affordable specials
+        generic_coop = ~scenario_menu & cooperative
+        if generic_coop.any():
+            rows = np.flatnonzero(generic_coop)
+            risk_int = np.trunc(state.risk_level[rows])
+            num_standard = np.where(risk_int <= 3, 4, np.where(risk_int <= 6, 3, 2))
+            signal_cost = np.where(position[rows] >= 7, 0.3, np.where(position[rows] >= 4, 0.7, 1.2))
+            res = resources[rows]
+            specials = np.column_stack(
+                [
+                    (state.turn[rows] > 4)
+                    & (state.stability[rows] > 2)
+                    & self.tables.settlement_available[config[rows]],
+                    res >= 0.5,
+                    res >= 0.3,
+                    res >= signal_cost,
+                ]
+            )
+            special_categories = np.array([CAT_SETTLEMENT, CAT_RECONNAISSANCE, CAT_INSPECTION, CAT_SIGNALING])
+            special_costs = np.column_stack(
+                [np.zeros(len(rows)), np.full(len(rows), 0.5), np.full(len(rows), 0.3), signal_cost]
+            )
+
+            pick = (_subset_uniforms(rng, n, rows) * (num_standard + specials.sum(axis=1))).astype(np.int64)
+            special_pick = pick >= num_standard
+            column = np.argmax(np.cumsum(specials, axis=1) > (pick - num_standard)[:, None], axis=1)
+            category[rows] = np.where(special_pick, special_categories[column], CAT_STANDARD)
+            cost[rows] = np.where(special_pick, special_costs[np.arange(len(rows)), column], 0.0)
+
+        return action_type, category, cost
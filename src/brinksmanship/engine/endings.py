@@ -28,13 +28,17 @@ Crisis Termination Formula (from GAME_MANUAL.md):
 
 from __future__ import annotations
 
-import random
 from dataclasses import dataclass
 from enum import Enum, auto
+from typing import TYPE_CHECKING
 
+from brinksmanship.engine.rng import resolve_rng
 from brinksmanship.engine.variance import final_resolution
 from brinksmanship.models.state import GameState
 
+if TYPE_CHECKING:
+    import random
+
 
 class EndingType(Enum):
     """Types of game endings."""
@@ -213,7 +217,11 @@ def get_crisis_termination_probability(risk_level: float, turn: int) -> float:
     return (risk_level - 7.0) * 0.08
 
 
-def check_crisis_termination(state: GameState, seed: int | None = None) -> GameEnding | None:
+def check_crisis_termination(
+    state: GameState,
+    seed: int | None = None,
+    rng: random.Random | None = None,
+) -> GameEnding | None:
     """Check for probabilistic crisis termination.
 
     From GAME_MANUAL.md:
@@ -226,6 +234,7 @@ def check_crisis_termination(state: GameState, seed: int | None = None) -> GameE
     Args:
         state: Current game state
         seed: Optional random seed for deterministic testing
+        rng: Random stream for the roll and final resolution (takes precedence over seed)
 
     Returns:
         GameEnding if crisis terminates, None otherwise
@@ -235,16 +244,10 @@ def check_crisis_termination(state: GameState, seed: int | None = None) -> GameE
     if probability <= 0.0:
         return None
 
-    # Use seeded random if provided for testing
-    if seed is not None:
-        rng = random.Random(seed)
-        roll = rng.random()
-    else:
-        roll = random.random()
-
-    if roll < probability:
+    rng = resolve_rng(rng, seed)
+    if rng.random() < probability:
         # Crisis termination uses final resolution VP calculation
-        vp_a, vp_b = final_resolution(state, seed)
+        vp_a, vp_b = final_resolution(state, rng=rng)
         return GameEnding(
             ending_type=EndingType.CRISIS_TERMINATION,
             vp_a=vp_a,
@@ -258,7 +261,11 @@ def check_crisis_termination(state: GameState, seed: int | None = None) -> GameE
     return None
 
 
-def check_max_turns(state: GameState, seed: int | None = None) -> GameEnding | None:
+def check_max_turns(
+    state: GameState,
+    seed: int | None = None,
+    rng: random.Random | None = None,
+) -> GameEnding | None:
     """Check if game has reached maximum turns.
 
     From GAME_MANUAL.md:
@@ -268,12 +275,13 @@ def check_max_turns(state: GameState, seed: int | None = None) -> GameEnding | N
     Args:
         state: Current game state
         seed: Optional random seed for deterministic final resolution
+        rng: Random stream for final resolution (takes precedence over seed)
 
     Returns:
         GameEnding if max turns reached, None otherwise
     """
     if state.turn >= state.max_turns:
-        vp_a, vp_b = final_resolution(state, seed)
+        vp_a, vp_b = final_resolution(state, seed, rng)
         return GameEnding(
             ending_type=EndingType.MAX_TURNS,
             vp_a=vp_a,
@@ -286,7 +294,11 @@ def check_max_turns(state: GameState, seed: int | None = None) -> GameEnding | N
     return None
 
 
-def check_all_endings(state: GameState, seed: int | None = None) -> GameEnding | None:
+def check_all_endings(
+    state: GameState,
+    seed: int | None = None,
+    rng: random.Random | None = None,
+) -> GameEnding | None:
     """Check all ending conditions in the correct order.
 
     The order of checks is important per GAME_MANUAL.md:
@@ -306,6 +318,7 @@ def check_all_endings(state: GameState, seed: int | None = None) -> GameEnding |
     Args:
         state: Current game state
         seed: Optional random seed for deterministic testing
+        rng: Random stream shared by the probabilistic checks (takes precedence over seed)
 
     Returns:
         GameEnding if any ending condition is met, None otherwise
@@ -327,15 +340,16 @@ def check_all_endings(state: GameState, seed: int | None = None) -> GameEnding |
     if ending is not None:
         return ending
 
-    # 2. Probabilistic endings
+    # 2. Probabilistic endings (one stream, so a seed gives independent draws)
+    rng = resolve_rng(rng, seed)
 
     # 2a. Crisis Termination (probabilistic)
-    ending = check_crisis_termination(state, seed)
+    ending = check_crisis_termination(state, rng=rng)
     if ending is not None:
         return ending
 
     # 2b. Max Turns (natural ending)
-    ending = check_max_turns(state, seed)
+    ending = check_max_turns(state, rng=rng)
     if ending is not None:
         return ending
 
@@ -17,12 +17,19 @@ Turn Sequence (from GAME_MANUAL.md Section 3.3):
 
 from __future__ import annotations
 
+import copy
 import random
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from typing import TYPE_CHECKING, Literal
 
+from brinksmanship.engine.history import LoggedState, StateLog
+from brinksmanship.engine.snapshot import EngineSnapshot, pack_snapshot, unpack_snapshot
 from brinksmanship.engine.state_deltas import apply_surplus_effects
+from brinksmanship.engine.variance import calculate_shared_sigma
 from brinksmanship.models.actions import (
     Action,
     ActionCategory,
@@ -40,14 +47,17 @@ from brinksmanship.models.matrices import (
 )
 from brinksmanship.models.state import (
     ActionResult,
+    EngineState,
     GameState,
     InformationState,
-    PlayerState,
-    apply_action_result,
+    apply_action_result_in_place,
     clamp,
 )
+from brinksmanship.parameters import DEFAULT_PARAMETERS, GameParameters
 
 if TYPE_CHECKING:
+    from brinksmanship.engine.instrumentation import EngineInstrumentation
+    from brinksmanship.engine.rng import GameStreams
     from brinksmanship.storage import ScenarioRepository
 
 
@@ -127,7 +137,8 @@ class TurnRecord:
         action_a: Action taken by player A (None if not yet submitted)
         action_b: Action taken by player B (None if not yet submitted)
         outcome: Result of action resolution (None if not yet resolved)
-        state_before: Game state at start of turn
+        state_before: Game state at start of turn (rebuilt from the engine's
+            StateLog on first access)
         state_after: Game state after turn completion (None if not yet completed)
         narrative: Briefing or outcome narrative text
         matrix_type: Game type used this turn (None for special actions)
@@ -138,8 +149,9 @@ class TurnRecord:
     action_a: Action | None = None
     action_b: Action | None = None
     outcome: ActionResult | None = None
-    state_before: GameState | None = None
-    state_after: GameState | None = None
+    # Descriptor-typed fields: accept GameState | StateRef | None, read as GameState | None
+    state_before: LoggedState = LoggedState()
+    state_after: LoggedState = LoggedState()
     narrative: str = ""
     matrix_type: MatrixType | None = None
 
@@ -165,7 +177,7 @@ class TurnResult:
     error: str | None = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class ScenarioAction:
     """A scenario-defined action with narrative context.
 
@@ -206,10 +218,13 @@ class ScenarioAction:
         )
 
 
-@dataclass
+@dataclass(frozen=True)
 class TurnConfiguration:
     """Configuration for the current turn from the scenario.
 
+    Turn configurations are immutable: a compiled scenario's configurations
+    are shared by every engine playing that scenario.
+
     Attributes:
         turn: Turn number
         act: Act number (1, 2, or 3)
@@ -222,6 +237,7 @@ class TurnConfiguration:
         default_next: Default next turn if settlement fails or special action
         settlement_available: Whether settlement can be proposed
         settlement_failed_narrative: Narrative for failed settlement
+        payoff_matrix: Matrix built once from matrix_type and matrix_params
     """
 
     turn: int
@@ -229,18 +245,286 @@ class TurnConfiguration:
     narrative_briefing: str
     matrix_type: MatrixType
     matrix_params: MatrixParameters
-    scenario_actions: list[ScenarioAction] = field(default_factory=list)
+    scenario_actions: tuple[ScenarioAction, ...] = ()
     outcome_narratives: dict[str, str] | None = None
     branches: dict[str, str] | None = None
     default_next: str | None = None
     settlement_available: bool = True
     settlement_failed_narrative: str = "Negotiations failed. The crisis continues."
+    payoff_matrix: PayoffMatrix = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Build (or fetch the memoized) matrix up front so resolution is a lookup
+        object.__setattr__(self, "payoff_matrix", build_matrix(self.matrix_type, self.matrix_params))
 
     def has_scenario_actions(self) -> bool:
         """Check if this turn has scenario-defined actions."""
         return len(self.scenario_actions) > 0
 
 
+# =============================================================================
+# Compiled Scenario Cache
+# =============================================================================
+
+# Alias mapping for common matrix type variations (documented mappings only)
+MATRIX_TYPE_ALIASES = {
+    "inspection": "inspection_game",
+    "inspect": "inspection_game",
+    "recon": "reconnaissance",
+    "pd": "prisoners_dilemma",
+    "prisoner_dilemma": "prisoners_dilemma",
+    "bos": "battle_of_sexes",
+    "battle": "battle_of_sexes",
+    "stag": "stag_hunt",
+    "coord": "pure_coordination",
+    "coordination": "pure_coordination",
+    "trust": "stag_hunt",  # Trust game maps to Stag Hunt (similar structure)
+    "trust_game": "stag_hunt",
+    "security": "security_dilemma",
+}
+
+
+@dataclass(frozen=True)
+class CompiledScenario:
+    """Immutable, pre-parsed turn graph for one version of a scenario.
+
+    Built once per (scenario_id, version) and shared by every GameEngine
+    playing the scenario, so creating an engine does not re-read or
+    re-parse the scenario JSON.
+
+    Attributes:
+        scenario_id: ID of the compiled scenario
+        version: Repository version stamp the graph was built from
+        turn_configs: Turn configurations keyed by turn key (never mutated)
+        start_key: Turn key of the first turn
+    """
+
+    scenario_id: str
+    version: str
+    turn_configs: dict[str, TurnConfiguration]
+    start_key: str
+
+
+# Process-wide LRU of compiled scenarios keyed by (scenario_id, version)
+SCENARIO_CACHE_SIZE = 32
+_scenario_cache: OrderedDict[tuple[str, str], CompiledScenario] = OrderedDict()
+_scenario_cache_lock = threading.Lock()
+
+
+def get_compiled_scenario(scenario_id: str, scenario_repo: ScenarioRepository) -> CompiledScenario:
+    """Get the compiled turn graph for a scenario, compiling it on first use.
+
+    The repository's version stamp is checked on every call, so edits to a
+    scenario are picked up by the next engine that loads it.
+
+    Args:
+        scenario_id: ID of scenario to load
+        scenario_repo: Repository for loading scenarios
+
+    Returns:
+        Shared CompiledScenario
+
+    Raises:
+        ValueError: If scenario not found or invalid
+    """
+    version = scenario_repo.get_scenario_version(scenario_id)
+    if version is None:
+        raise ValueError(f"Scenario not found: {scenario_id}")
+
+    key = (scenario_id, version)
+    with _scenario_cache_lock:
+        compiled = _scenario_cache.get(key)
+        if compiled is not None:
+            _scenario_cache.move_to_end(key)
+            return compiled
+
+    scenario = scenario_repo.get_scenario(scenario_id)
+    if scenario is None:
+        raise ValueError(f"Scenario not found: {scenario_id}")
+    compiled = compile_scenario(scenario_id, scenario, version)
+
+    with _scenario_cache_lock:
+        _scenario_cache[key] = compiled
+        _scenario_cache.move_to_end(key)
+        while len(_scenario_cache) > SCENARIO_CACHE_SIZE:
+            _scenario_cache.popitem(last=False)
+
+    return compiled
+
+
+def clear_scenario_cache() -> None:
+    """Drop all compiled scenarios (e.g. after bulk scenario edits in tests)."""
+    with _scenario_cache_lock:
+        _scenario_cache.clear()
+
+
+def compile_scenario(scenario_id: str, scenario: dict, version: str = "") -> CompiledScenario:
+    """Parse scenario JSON into an immutable turn graph.
+
+    Args:
+        scenario_id: ID of the scenario
+        scenario: Scenario dict as returned by the repository
+        version: Repository version stamp for cache bookkeeping
+
+    Returns:
+        CompiledScenario with all linear and branch turns parsed
+
+    Raises:
+        ValueError: If a turn has an unknown matrix type or invalid parameters
+    """
+    turn_configs: dict[str, TurnConfiguration] = {}
+    start_key = ""
+
+    # Handle linear turn list or branching structure
+    turns = scenario.get("turns", [])
+    branches = scenario.get("branches", {})
+
+    # Parse linear turns
+    for i, turn_data in enumerate(turns):
+        turn_num = turn_data.get("turn", i + 1)
+        key = f"turn_{turn_num}"
+        turn_configs[key] = _parse_turn_config(turn_data)
+
+        # Set first turn as current
+        if i == 0:
+            start_key = key
+
+    # Parse branch turns
+    for branch_key, turn_data in branches.items():
+        turn_configs[branch_key] = _parse_turn_config(turn_data)
+
+    # If no turns defined, create default configuration
+    if not turn_configs:
+        turn_configs["turn_1"] = _default_turn_config(1)
+        start_key = "turn_1"
+
+    return CompiledScenario(
+        scenario_id=scenario_id,
+        version=version,
+        turn_configs=turn_configs,
+        start_key=start_key,
+    )
+
+
+def _parse_matrix_type(matrix_type_str: str, turn: int) -> MatrixType:
+    """Parse matrix type string with alias support.
+
+    Raises ValueError if the matrix type is unknown - no fallbacks.
+    """
+    # Normalize the string
+    normalized = matrix_type_str.lower().replace("-", "_").replace(" ", "_")
+
+    # Apply alias if exists
+    if normalized in MATRIX_TYPE_ALIASES:
+        normalized = MATRIX_TYPE_ALIASES[normalized]
+
+    # Try direct enum lookup
+    try:
+        return MatrixType(normalized)
+    except ValueError:
+        pass
+
+    # Try uppercase enum name
+    try:
+        return MatrixType[matrix_type_str.upper().replace("-", "_").replace(" ", "_")]
+    except KeyError:
+        pass
+
+    # No fallbacks - fail with clear error
+    valid_types = [t.value for t in MatrixType]
+    raise ValueError(
+        f"Unknown matrix type '{matrix_type_str}' at turn {turn}. "
+        f"Valid types: {valid_types}. "
+        f"Valid aliases: {list(MATRIX_TYPE_ALIASES.keys())}"
+    )
+
+
+def _parse_turn_config(turn_data: dict) -> TurnConfiguration:
+    """Parse a single turn configuration from scenario data."""
+    turn_num = turn_data.get("turn", 1)
+    act = _get_act_for_turn(turn_num)
+
+    # Parse matrix type with alias mapping - no fallbacks, fail on invalid
+    matrix_type_str = turn_data.get("matrix_type", "PRISONERS_DILEMMA")
+    matrix_type = _parse_matrix_type(matrix_type_str, turn_num)
+
+    # Parse matrix parameters or use defaults
+    params_data = turn_data.get("matrix_parameters", {})
+    if params_data:
+        matrix_params = MatrixParameters(**params_data)
+    else:
+        matrix_params = get_default_params_for_type(matrix_type)
+
+    # Parse scenario-defined actions (new format with narrative descriptions)
+    scenario_actions: list[ScenarioAction] = []
+    actions_data = turn_data.get("actions", [])
+    for action_data in actions_data:
+        # Parse action_type string to enum
+        action_type_str = action_data.get("action_type", "cooperative")
+        if isinstance(action_type_str, str):
+            action_type = ActionType(action_type_str.lower())
+        else:
+            action_type = action_type_str
+
+        scenario_actions.append(
+            ScenarioAction(
+                action_id=action_data.get("action_id", "hold"),
+                narrative_description=action_data.get("narrative_description", ""),
+                action_type=action_type,
+                resource_cost=float(action_data.get("resource_cost", 0.0)),
+            )
+        )
+
+    return TurnConfiguration(
+        turn=turn_num,
+        act=act,
+        narrative_briefing=turn_data.get("narrative_briefing", ""),
+        matrix_type=matrix_type,
+        matrix_params=matrix_params,
+        scenario_actions=tuple(scenario_actions),
+        outcome_narratives=turn_data.get("outcome_narratives"),
+        branches=turn_data.get("branches"),
+        default_next=turn_data.get("default_next"),
+        settlement_available=turn_data.get("settlement_available", True),
+        settlement_failed_narrative=turn_data.get(
+            "settlement_failed_narrative",
+            "Negotiations failed. The crisis continues.",
+        ),
+    )
+
+
+@lru_cache(maxsize=64)
+def _default_turn_config(turn: int) -> TurnConfiguration:
+    """Create a default turn configuration (shared, since configs are immutable)."""
+    act = _get_act_for_turn(turn)
+
+    # Select appropriate matrix type based on act
+    if act == 1:
+        matrix_type = MatrixType.STAG_HUNT
+    elif act == 2:
+        matrix_type = MatrixType.PRISONERS_DILEMMA
+    else:
+        matrix_type = MatrixType.CHICKEN
+
+    return TurnConfiguration(
+        turn=turn,
+        act=act,
+        narrative_briefing=f"Turn {turn} - The situation develops...",
+        matrix_type=matrix_type,
+        matrix_params=get_default_params_for_type(matrix_type),
+    )
+
+
+def _get_act_for_turn(turn: int) -> int:
+    """Determine act number from turn number."""
+    if turn <= 4:
+        return 1
+    elif turn <= 8:
+        return 2
+    else:
+        return 3
+
+
 class GameEngine:
     """Core game engine managing the complete game loop.
 
@@ -254,6 +538,7 @@ class GameEngine:
 
     Attributes:
         scenario_id: ID of the loaded scenario
+        params: Game balance parameters used by this engine
         state: Current game state
         phase: Current phase within the turn
         history: Complete turn history
@@ -266,6 +551,10 @@ class GameEngine:
         scenario_repo: ScenarioRepository,
         max_turns: int | None = None,
         random_seed: int | None = None,
+        rng: random.Random | None = None,
+        instrumentation: EngineInstrumentation | None = None,
+        params: GameParameters | None = None,
+        streams: GameStreams | None = None,
     ) -> None:
         """Initialize the game engine with a scenario.
 
@@ -274,36 +563,46 @@ class GameEngine:
             scenario_repo: Repository for loading scenarios
             max_turns: Override for maximum turns (default: random 12-16)
             random_seed: Seed for random number generation (for reproducibility)
+            rng: Random stream to draw from instead of seeding one from
+                random_seed (see brinksmanship.engine.rng.game_streams)
+            instrumentation: Optional per-phase metrics for submit_actions
+            params: Game balance parameters (default: DEFAULT_PARAMETERS, the
+                constants of brinksmanship.parameters)
+            streams: A game's streams (overrides rng); separate crisis and
+                resolution streams give common random numbers across runs
 
         Raises:
             ValueError: If scenario not found or invalid
         """
         self.scenario_id = scenario_id
+        self.params = params if params is not None else DEFAULT_PARAMETERS
         self._scenario_repo = scenario_repo
-        self._random = random.Random(random_seed)
-
-        # Load scenario
-        scenario = scenario_repo.get_scenario(scenario_id)
-        if scenario is None:
-            raise ValueError(f"Scenario not found: {scenario_id}")
-
-        self._scenario = scenario
-        self._turn_configs: dict[str, TurnConfiguration] = {}
-        self._current_turn_key: str = ""
-
-        # Parse scenario structure
-        self._parse_scenario(scenario)
-
-        # Initialize game state
+        if streams is not None:
+            rng = streams.engine
+        self._random = rng if rng is not None else random.Random(random_seed)
+        # Common random numbers: a crisis draw every turn, resolution noise on its own stream
+        self._crisis_random = streams.crisis if streams is not None else None
+        self._resolution_random = streams.resolution if streams is not None else None
+        self._antithetic = streams is not None and streams.antithetic
+        self.instrumentation = instrumentation
+
+        # Load the pre-parsed turn graph (shared with other engines)
+        self._scenario = get_compiled_scenario(scenario_id, scenario_repo)
+        self._turn_configs = self._scenario.turn_configs
+        self._current_turn_key: str | None = self._scenario.start_key
+
+        # Initialize game state (public GameState view is built on demand)
         if max_turns is None:
             max_turns = self._random.randint(12, 16)
-        self.state = self._create_initial_state(max_turns)
+        self._core = self._create_initial_state(max_turns)
+        self._state_view: GameState | None = None
 
         # Track current phase
         self.phase = TurnPhase.BRIEFING
 
         # History and ending
         self.history: list[TurnRecord] = []
+        self._state_log = StateLog()
         self.ending: GameEnding | None = None
 
         # Pending actions (collected during DECISION phase)
@@ -313,191 +612,51 @@ class GameEngine:
         # Record initial state
         self._record_turn_start()
 
-    def _parse_scenario(self, scenario: dict) -> None:
-        """Parse scenario JSON into turn configurations."""
-        # Handle linear turn list or branching structure
-        turns = scenario.get("turns", [])
-        branches = scenario.get("branches", {})
-
-        # Parse linear turns
-        for i, turn_data in enumerate(turns):
-            turn_num = turn_data.get("turn", i + 1)
-            key = f"turn_{turn_num}"
-            self._turn_configs[key] = self._parse_turn_config(turn_data)
-
-            # Set first turn as current
-            if i == 0:
-                self._current_turn_key = key
-
-        # Parse branch turns
-        for branch_key, turn_data in branches.items():
-            self._turn_configs[branch_key] = self._parse_turn_config(turn_data)
-
-        # If no turns defined, create default configuration
-        if not self._turn_configs:
-            self._turn_configs["turn_1"] = self._create_default_turn_config(1)
-            self._current_turn_key = "turn_1"
-
-    def _parse_matrix_type(self, matrix_type_str: str, turn: int) -> MatrixType:
-        """Parse matrix type string with alias support.
-
-        Raises ValueError if the matrix type is unknown - no fallbacks.
-        """
-        # Normalize the string
-        normalized = matrix_type_str.lower().replace("-", "_").replace(" ", "_")
-
-        # Alias mapping for common variations (documented mappings only)
-        aliases = {
-            "inspection": "inspection_game",
-            "inspect": "inspection_game",
-            "recon": "reconnaissance",
-            "pd": "prisoners_dilemma",
-            "prisoner_dilemma": "prisoners_dilemma",
-            "bos": "battle_of_sexes",
-            "battle": "battle_of_sexes",
-            "stag": "stag_hunt",
-            "coord": "pure_coordination",
-            "coordination": "pure_coordination",
-            "trust": "stag_hunt",  # Trust game maps to Stag Hunt (similar structure)
-            "trust_game": "stag_hunt",
-            "security": "security_dilemma",
-        }
-
-        # Apply alias if exists
-        if normalized in aliases:
-            normalized = aliases[normalized]
-
-        # Try direct enum lookup
-        try:
-            return MatrixType(normalized)
-        except ValueError:
-            pass
-
-        # Try uppercase enum name
-        try:
-            return MatrixType[matrix_type_str.upper().replace("-", "_").replace(" ", "_")]
-        except KeyError:
-            pass
-
-        # No fallbacks - fail with clear error
-        valid_types = [t.value for t in MatrixType]
-        raise ValueError(
-            f"Unknown matrix type '{matrix_type_str}' at turn {turn}. "
-            f"Valid types: {valid_types}. "
-            f"Valid aliases: {list(aliases.keys())}"
-        )
-
-    def _parse_turn_config(self, turn_data: dict) -> TurnConfiguration:
-        """Parse a single turn configuration from scenario data."""
-        turn_num = turn_data.get("turn", 1)
-        act = self._get_act_for_turn(turn_num)
-
-        # Parse matrix type with alias mapping - no fallbacks, fail on invalid
-        matrix_type_str = turn_data.get("matrix_type", "PRISONERS_DILEMMA")
-        matrix_type = self._parse_matrix_type(matrix_type_str, turn_num)
-
-        # Parse matrix parameters or use defaults
-        params_data = turn_data.get("matrix_parameters", {})
-        if params_data:
-            matrix_params = MatrixParameters(**params_data)
-        else:
-            matrix_params = get_default_params_for_type(matrix_type)
-
-        # Parse scenario-defined actions (new format with narrative descriptions)
-        scenario_actions: list[ScenarioAction] = []
-        actions_data = turn_data.get("actions", [])
-        for action_data in actions_data:
-            # Parse action_type string to enum
-            action_type_str = action_data.get("action_type", "cooperative")
-            if isinstance(action_type_str, str):
-                action_type = ActionType(action_type_str.lower())
-            else:
-                action_type = action_type_str
-
-            scenario_actions.append(
-                ScenarioAction(
-                    action_id=action_data.get("action_id", "hold"),
-                    narrative_description=action_data.get("narrative_description", ""),
-                    action_type=action_type,
-                    resource_cost=float(action_data.get("resource_cost", 0.0)),
-                )
-            )
-
-        return TurnConfiguration(
-            turn=turn_num,
-            act=act,
-            narrative_briefing=turn_data.get("narrative_briefing", ""),
-            matrix_type=matrix_type,
-            matrix_params=matrix_params,
-            scenario_actions=scenario_actions,
-            outcome_narratives=turn_data.get("outcome_narratives"),
-            branches=turn_data.get("branches"),
-            default_next=turn_data.get("default_next"),
-            settlement_available=turn_data.get("settlement_available", True),
-            settlement_failed_narrative=turn_data.get(
-                "settlement_failed_narrative",
-                "Negotiations failed. The crisis continues.",
-            ),
-        )
-
-    def _create_default_turn_config(self, turn: int) -> TurnConfiguration:
-        """Create a default turn configuration."""
-        act = self._get_act_for_turn(turn)
-
-        # Select appropriate matrix type based on act
-        if act == 1:
-            matrix_type = MatrixType.STAG_HUNT
-        elif act == 2:
-            matrix_type = MatrixType.PRISONERS_DILEMMA
-        else:
-            matrix_type = MatrixType.CHICKEN
-
-        return TurnConfiguration(
-            turn=turn,
-            act=act,
-            narrative_briefing=f"Turn {turn} - The situation develops...",
-            matrix_type=matrix_type,
-            matrix_params=get_default_params_for_type(matrix_type),
-        )
-
-    def _get_act_for_turn(self, turn: int) -> int:
-        """Determine act number from turn number."""
-        if turn <= 4:
-            return 1
-        elif turn <= 8:
-            return 2
-        else:
-            return 3
-
-    def _create_initial_state(self, max_turns: int) -> GameState:
+    def _create_initial_state(self, max_turns: int) -> EngineState:
         """Create the initial game state."""
-        return GameState(
-            player_a=PlayerState(
-                position=5.0,
-                resources=5.0,
-                previous_type=None,
-                information=InformationState(),
-            ),
-            player_b=PlayerState(
-                position=5.0,
-                resources=5.0,
-                previous_type=None,
-                information=InformationState(),
-            ),
+        return EngineState(
+            position_a=5.0,
+            position_b=5.0,
+            resources_a=5.0,
+            resources_b=5.0,
             cooperation_score=5.0,
             stability=5.0,
             risk_level=2.0,
             turn=1,
-            max_turns=max_turns,
+            max_turns=max(12, min(16, max_turns)),
         )
 
+    @property
+    def state(self) -> GameState:
+        """Current game state as a GameState.
+
+        The engine keeps its state in a compact EngineState and builds this
+        view on first access. The view is live until the next turn resolves:
+        edits made through it are picked up by the engine. The view holds its
+        own information states, since the engine's may be shared with forks.
+        """
+        if self._state_view is None:
+            self._state_view = self._core.to_game_state()
+        return self._state_view
+
+    @state.setter
+    def state(self, value: GameState) -> None:
+        self._core = EngineState.from_game_state(value, copy_information=False)
+        self._state_view = value
+
+    def _sync_core(self) -> EngineState:
+        """Return the internal state, first picking up edits made through the public view."""
+        if self._state_view is not None:
+            self._core = EngineState.from_game_state(self._state_view, copy_information=False)
+        return self._core
+
     def _record_turn_start(self) -> None:
         """Record the start of a new turn in history."""
         config = self._get_current_config()
         record = TurnRecord(
-            turn=self.state.turn,
+            turn=self._core.turn,
             phase=self.phase,
-            state_before=self.state.model_copy(deep=True),
+            state_before=self._state_log.append(self._core),
             narrative=config.narrative_briefing,
             matrix_type=config.matrix_type,
         )
@@ -505,18 +664,17 @@ class GameEngine:
 
     def _get_current_config(self) -> TurnConfiguration:
         """Get the configuration for the current turn."""
+        state = self._sync_core()
         if self._current_turn_key and self._current_turn_key in self._turn_configs:
             return self._turn_configs[self._current_turn_key]
 
         # Fallback: look for turn by number
-        turn_key = f"turn_{self.state.turn}"
+        turn_key = f"turn_{state.turn}"
         if turn_key in self._turn_configs:
             return self._turn_configs[turn_key]
 
-        # Create default if not found
-        config = self._create_default_turn_config(self.state.turn)
-        self._turn_configs[turn_key] = config
-        return config
+        # Use default if not found
+        return _default_turn_config(state.turn)
 
     # =========================================================================
     # Public API
@@ -528,7 +686,7 @@ class GameEngine:
         Returns:
             Copy of current GameState
         """
-        return self.state.model_copy(deep=True)
+        return self._sync_core().to_game_state()
 
     def get_available_actions(self, player: Literal["A", "B"]) -> list[Action]:
         """Get available actions for a player.
@@ -542,12 +700,13 @@ class GameEngine:
         Returns:
             List of available actions
         """
+        self._sync_core()
         if player == "A":
-            position = self.state.position_a
-            resources = self.state.resources_a
+            position = self._core.position_a
+            resources = self._core.resources_a
         else:
-            position = self.state.position_b
-            resources = self.state.resources_b
+            position = self._core.position_b
+            resources = self._core.resources_b
 
         config = self._get_current_config()
 
@@ -562,9 +721,9 @@ class GameEngine:
 
         # Otherwise, fall back to generic action menu based on Risk Level
         menu = get_action_menu(
-            risk_level=int(self.state.risk_level),
-            turn=self.state.turn,
-            stability=self.state.stability,
+            risk_level=int(self._core.risk_level),
+            turn=self._core.turn,
+            stability=self._core.stability,
             player_position=position,
             player_resources=resources,
         )
@@ -585,12 +744,13 @@ class GameEngine:
         Returns:
             ActionMenu with standard and special actions
         """
+        self._sync_core()
         if player == "A":
-            position = self.state.position_a
-            resources = self.state.resources_a
+            position = self._core.position_a
+            resources = self._core.resources_a
         else:
-            position = self.state.position_b
-            resources = self.state.resources_b
+            position = self._core.position_b
+            resources = self._core.resources_b
 
         config = self._get_current_config()
 
@@ -609,16 +769,16 @@ class GameEngine:
             return ActionMenu(
                 standard_actions=standard_actions,
                 special_actions=special_actions,
-                risk_level=int(self.state.risk_level),
-                turn=self.state.turn,
+                risk_level=int(self._core.risk_level),
+                turn=self._core.turn,
                 can_propose_settlement=config.settlement_available,
             )
 
         # Fall back to generic action menu
         menu = get_action_menu(
-            risk_level=int(self.state.risk_level),
-            turn=self.state.turn,
-            stability=self.state.stability,
+            risk_level=int(self._core.risk_level),
+            turn=self._core.turn,
+            stability=self._core.stability,
             player_position=position,
             player_resources=resources,
         )
@@ -660,54 +820,85 @@ class GameEngine:
         Returns:
             TurnResult with outcome information
         """
+        probe = self.instrumentation
+        if probe is None:
+            return self._submit_actions(action_a, action_b, None)
+
+        probe.begin_turn(self.scenario_id, self._sync_core().turn, TurnPhase.DECISION)
+        result = None
+        try:
+            result = self._submit_actions(action_a, action_b, probe)
+        finally:
+            probe.end_turn(result)
+        return result
+
+    def _submit_actions(
+        self,
+        action_a: Action,
+        action_b: Action,
+        probe: EngineInstrumentation | None,
+    ) -> TurnResult:
+        """Run the turn sequence for submit_actions, marking phases on probe."""
         if self.is_game_over():
             return TurnResult(
                 success=False,
                 error="Game is already over",
             )
 
+        # The engine updates its own state from here on; earlier views go stale
+        self._sync_core()
+        self._state_view = None
+
         # Phase 2: DECISION - Validate actions
         valid_a, error_a = validate_action_availability(
             action_a,
-            self.state.turn,
-            self.state.stability,
-            self.state.resources_a,
+            self._core.turn,
+            self._core.stability,
+            self._core.resources_a,
         )
         if not valid_a:
+            if probe is not None:
+                probe.validation_failed(f"Player A: {error_a}")
             return TurnResult(success=False, error=f"Player A: {error_a}")
 
         valid_b, error_b = validate_action_availability(
             action_b,
-            self.state.turn,
-            self.state.stability,
-            self.state.resources_b,
+            self._core.turn,
+            self._core.stability,
+            self._core.resources_b,
         )
         if not valid_b:
+            if probe is not None:
+                probe.validation_failed(f"Player B: {error_b}")
             return TurnResult(success=False, error=f"Player B: {error_b}")
 
         self._pending_action_a = action_a
         self._pending_action_b = action_b
         self.phase = TurnPhase.RESOLUTION
+        if probe is not None:
+            probe.mark(TurnPhase.RESOLUTION)
 
         # Phase 3: RESOLUTION
         action_result, narrative = self._resolve_actions(action_a, action_b)
 
         # Phase 4: STATE UPDATE
         self.phase = TurnPhase.STATE_UPDATE
-        new_state = self._update_state(action_result)
+        if probe is not None:
+            probe.mark(TurnPhase.STATE_UPDATE)
+        self._update_state(action_result)
 
         # Update history
         if self.history:
             self.history[-1].action_a = action_a
             self.history[-1].action_b = action_b
             self.history[-1].outcome = action_result
-            self.history[-1].state_after = new_state.model_copy(deep=True)
+            self.history[-1].state_after = self._state_log.append(self._core)
             self.history[-1].narrative = narrative
 
-        self.state = new_state
-
         # Phase 5: CHECK DETERMINISTIC ENDINGS
         self.phase = TurnPhase.CHECK_DETERMINISTIC
+        if probe is not None:
+            probe.mark(TurnPhase.CHECK_DETERMINISTIC)
         ending = self._check_deterministic_endings()
         if ending:
             self.ending = ending
@@ -721,6 +912,8 @@ class GameEngine:
 
         # Phase 6: CHECK CRISIS TERMINATION (Turn >= 10, Risk > 7)
         self.phase = TurnPhase.CHECK_CRISIS
+        if probe is not None:
+            probe.mark(TurnPhase.CHECK_CRISIS)
         ending = self._check_crisis_termination()
         if ending:
             self.ending = ending
@@ -734,6 +927,8 @@ class GameEngine:
 
         # Phase 7: CHECK NATURAL ENDING
         self.phase = TurnPhase.CHECK_NATURAL
+        if probe is not None:
+            probe.mark(TurnPhase.CHECK_NATURAL)
         ending = self._check_natural_ending()
         if ending:
             self.ending = ending
@@ -747,6 +942,8 @@ class GameEngine:
 
         # Phase 8: ADVANCE
         self.phase = TurnPhase.ADVANCE
+        if probe is not None:
+            probe.mark(TurnPhase.ADVANCE)
         self._advance_turn(action_result)
 
         return TurnResult(
@@ -788,10 +985,138 @@ class GameEngine:
         Returns:
             InformationState for that player
         """
+        state = self._sync_core()
         if player == "A":
-            return self.state.player_a.information.model_copy(deep=True)
+            return state.information_a.fast_copy()
         else:
-            return self.state.player_b.information.model_copy(deep=True)
+            return state.information_b.fast_copy()
+
+    def snapshot(self) -> bytes:
+        """Serialize the engine to a compact binary snapshot.
+
+        The snapshot covers the current turn key, phase, full state
+        (including both information states), the state of the engine RNG
+        and of any separate crisis/resolution streams, the antithetic flag,
+        the GameParameters and the ending, so restore() resumes the game
+        exactly, including branch position and future random draws. Turn
+        history is not included.
+
+        Returns:
+            Snapshot bytes (see brinksmanship.engine.snapshot for the layout)
+        """
+        ending = None
+        if self.ending is not None:
+            ending = (
+                self.ending.ending_type.value,
+                self.ending.vp_a,
+                self.ending.vp_b,
+                self.ending.turn,
+                self.ending.description,
+            )
+        return pack_snapshot(
+            EngineSnapshot(
+                scenario_id=self.scenario_id,
+                turn_key=self._current_turn_key,
+                phase=self.phase.value,
+                core=self._sync_core(),
+                rng_state=self._random.getstate(),
+                ending=ending,
+                crisis_rng_state=None if self._crisis_random is None else self._crisis_random.getstate(),
+                resolution_rng_state=None if self._resolution_random is None else self._resolution_random.getstate(),
+                antithetic=self._antithetic,
+                params=self.params,
+            )
+        )
+
+    @classmethod
+    def restore(
+        cls, data: bytes, scenario_repo: ScenarioRepository, params: GameParameters | None = None
+    ) -> GameEngine:
+        """Rebuild an engine from snapshot() output.
+
+        The scenario graph comes from the compiled scenario cache, so no
+        scenario JSON is re-parsed. History starts afresh with a record for
+        the current turn.
+
+        Args:
+            data: Bytes returned by snapshot()
+            scenario_repo: Repository for loading the snapshot's scenario
+            params: Game balance parameters; must match the snapshot's
+                (default: the snapshot's, or DEFAULT_PARAMETERS for version 1
+                snapshots, which do not record them)
+
+        Returns:
+            GameEngine positioned where the snapshot was taken
+
+        Raises:
+            ValueError: If the snapshot is malformed, its scenario is not
+                found, or params differ from the parameters it recorded
+        """
+        snap = unpack_snapshot(data)
+        if snap.params is not None:
+            if params is not None and params != snap.params:
+                raise ValueError("params differ from the parameters recorded in the snapshot")
+            params = params or snap.params
+        engine = cls(snap.scenario_id, scenario_repo, max_turns=snap.core.max_turns, params=params)
+        engine._random.setstate(snap.rng_state)
+        if snap.crisis_rng_state is not None:
+            engine._crisis_random = random.Random()
+            engine._crisis_random.setstate(snap.crisis_rng_state)
+        if snap.resolution_rng_state is not None:
+            engine._resolution_random = random.Random()
+            engine._resolution_random.setstate(snap.resolution_rng_state)
+        engine._antithetic = snap.antithetic
+        engine._current_turn_key = snap.turn_key
+        engine._core = snap.core
+        engine.phase = TurnPhase(snap.phase)
+        if snap.ending is not None:
+            ending_type, vp_a, vp_b, turn, description = snap.ending
+            engine.ending = GameEnding(EndingType(ending_type), vp_a, vp_b, turn, description)
+
+        engine.history = []
+        engine._state_log = StateLog()
+        engine._record_turn_start()
+        return engine
+
+    def fork(self, random_seed: int | None = None) -> GameEngine:
+        """Create an independent copy of the engine for lookahead play.
+
+        The fork shares everything immutable with this engine: the compiled
+        scenario, logged history states and, until either engine learns new
+        information, both information states. Turns played on the fork never
+        affect this engine, and vice versa. Completed turn records are shared
+        and should be treated as read-only.
+
+        Args:
+            random_seed: Reseed the fork's RNG; by default it continues this
+                engine's random stream exactly
+
+        Returns:
+            Forked GameEngine
+        """
+        core = self._sync_core()
+        forked = copy.copy(self)
+
+        # A live view may have handed out the information states; copy them then
+        forked._core = core.copy(copy_information=self._state_view is not None)
+        forked._state_view = None
+        if random_seed is None:
+            forked._random = _copy_random(self._random)
+            if self._crisis_random is not None:
+                forked._crisis_random = _copy_random(self._crisis_random)
+            if self._resolution_random is not None:
+                forked._resolution_random = _copy_random(self._resolution_random)
+        else:
+            forked._random = random.Random(random_seed)
+            forked._crisis_random = forked._resolution_random = None
+            forked._antithetic = False
+
+        # Only the current turn's record is still updated by submit_actions
+        forked.history = self.history[:-1]
+        if self.history:
+            forked.history.append(copy.copy(self.history[-1]))
+        forked._state_log = self._state_log.fork()
+        return forked
 
     # =========================================================================
     # Resolution Logic
@@ -834,8 +1159,7 @@ class GameEngine:
         config: TurnConfiguration,
     ) -> tuple[ActionResult, str]:
         """Resolve actions via matrix game."""
-        # Build the matrix
-        matrix = build_matrix(config.matrix_type, config.matrix_params)
+        matrix = config.payoff_matrix
 
         # Map actions to matrix choices (0=cooperate/first, 1=defect/second)
         choice_a = 0 if action_a.action_type == ActionType.COOPERATIVE else 1
@@ -922,28 +1246,28 @@ class GameEngine:
                 narrative = "Your reconnaissance attempt was detected. Risk increases."
             elif choice_a == "Probe" and choice_b == "Project":
                 # Success - A learns B's position
-                self.state.player_a.information.update_position(self.state.position_b, self.state.turn)
+                self._learn_position("A")
                 narrative = (
-                    f"Reconnaissance successful. You learned your opponent's position: {self.state.position_b:.1f}"
+                    f"Reconnaissance successful. You learned your opponent's position: {self._core.position_b:.1f}"
                 )
             elif choice_a == "Mask" and choice_b == "Vigilant":
                 # Stalemate
                 narrative = "Your cautious approach yielded no information."
             else:  # Mask + Project
                 # Exposed - B learns A's position
-                self.state.player_b.information.update_position(self.state.position_a, self.state.turn)
+                self._learn_position("B")
                 narrative = "Your position was exposed to your opponent."
         else:  # initiator == "B"
             if choice_b == "Probe" and choice_a == "Vigilant":
                 risk_delta = 0.5
                 narrative = "Opponent's reconnaissance was detected. Risk increases."
             elif choice_b == "Probe" and choice_a == "Project":
-                self.state.player_b.information.update_position(self.state.position_a, self.state.turn)
+                self._learn_position("B")
                 narrative = "Opponent gained intelligence on your position."
             elif choice_b == "Mask" and choice_a == "Vigilant":
                 narrative = "Stalemate in intelligence gathering."
             else:
-                self.state.player_a.information.update_position(self.state.position_b, self.state.turn)
+                self._learn_position("A")
                 narrative = "Your counterintelligence revealed opponent's position."
 
         # Resource cost for initiator
@@ -964,6 +1288,30 @@ class GameEngine:
 
         return result, narrative
 
+    def _learn_position(self, player: Literal["A", "B"]) -> None:
+        """Record that player learned the opponent's current position.
+
+        Information states may be shared with forks, so they are replaced
+        with an updated copy rather than modified in place.
+        """
+        core = self._core
+        if player == "A":
+            core.information_a = core.information_a.fast_copy()
+            core.information_a.update_position(core.position_b, core.turn)
+        else:
+            core.information_b = core.information_b.fast_copy()
+            core.information_b.update_position(core.position_a, core.turn)
+
+    def _learn_resources(self, player: Literal["A", "B"]) -> None:
+        """Record that player learned the opponent's current resources (see _learn_position)."""
+        core = self._core
+        if player == "A":
+            core.information_a = core.information_a.fast_copy()
+            core.information_a.update_resources(core.resources_b, core.turn)
+        else:
+            core.information_b = core.information_b.fast_copy()
+            core.information_b.update_resources(core.resources_a, core.turn)
+
     def _resolve_inspection(
         self,
         action_a: Action,
@@ -996,26 +1344,26 @@ class GameEngine:
         if initiator == "A":
             if opponent_choice == "Comply":
                 # Verified - A learns B's resources
-                self.state.player_a.information.update_resources(self.state.resources_b, self.state.turn)
-                narrative = f"Inspection verified. Opponent resources: {self.state.resources_b:.1f}"
+                self._learn_resources("A")
+                narrative = f"Inspection verified. Opponent resources: {self._core.resources_b:.1f}"
             else:  # Cheat -> Caught
-                self.state.player_a.information.update_resources(self.state.resources_b, self.state.turn)
+                self._learn_resources("A")
                 pos_delta_b = -0.5
                 risk_delta = 1.0
                 narrative = (
                     f"Inspection caught opponent cheating! "
-                    f"Their resources: {self.state.resources_b:.1f}. "
+                    f"Their resources: {self._core.resources_b:.1f}. "
                     f"They lose position and risk increases."
                 )
         else:  # initiator == "B"
             if opponent_choice == "Comply":
-                self.state.player_b.information.update_resources(self.state.resources_a, self.state.turn)
+                self._learn_resources("B")
                 narrative = (
                     f"Opponent's inspection verified your compliance. "
-                    f"Your resources revealed: {self.state.resources_a:.1f}"
+                    f"Your resources revealed: {self._core.resources_a:.1f}"
                 )
             else:  # Cheat -> Caught
-                self.state.player_b.information.update_resources(self.state.resources_a, self.state.turn)
+                self._learn_resources("B")
                 pos_delta_a = -0.5
                 risk_delta = 1.0
                 narrative = "You were caught cheating during inspection! Position and risk affected."
@@ -1057,12 +1405,12 @@ class GameEngine:
 
         if both_settle:
             # Both want to settle - calculate fair split based on positions
-            total_pos = self.state.position_a + self.state.position_b
-            vp_a = self.state.position_a / total_pos * 100 if total_pos > 0 else 50.0
+            total_pos = self._core.position_a + self._core.position_b
+            vp_a = self._core.position_a / total_pos * 100 if total_pos > 0 else 50.0
             vp_b = 100.0 - vp_a
 
             # Apply cooperation bonus
-            coop_bonus = (self.state.cooperation_score - 5) * 2
+            coop_bonus = (self._core.cooperation_score - 5) * 2
             vp_a = clamp(vp_a + coop_bonus, 5, 95)
             vp_b = 100.0 - vp_a
 
@@ -1071,7 +1419,7 @@ class GameEngine:
                 ending_type=EndingType.SETTLEMENT,
                 vp_a=vp_a,
                 vp_b=vp_b,
-                turn=self.state.turn,
+                turn=self._core.turn,
                 description=f"Settlement reached. Player A: {vp_a:.1f} VP, Player B: {vp_b:.1f} VP",
             )
 
@@ -1118,10 +1466,10 @@ class GameEngine:
     # State Update
     # =========================================================================
 
-    def _update_state(self, result: ActionResult) -> GameState:
-        """Apply action result to update game state.
+    def _update_state(self, result: ActionResult) -> None:
+        """Apply action result to update game state in place.
 
-        Uses the apply_action_result function from state.py which handles:
+        Uses apply_action_result_in_place from state.py which handles:
         - Position changes (scaled by act multiplier)
         - Resource costs
         - Risk level changes
@@ -1134,14 +1482,12 @@ class GameEngine:
         - CD/DC: Captures surplus, resets streak, increases risk
         - DD: Burns surplus, resets streak, spikes risk
         """
-        new_state = apply_action_result(self.state, result)
+        apply_action_result_in_place(self._core, result)
 
         # Apply surplus mechanics for standard matrix outcomes
         outcome_code = result.outcome_code.upper()
         if outcome_code in ("CC", "CD", "DC", "DD"):
-            new_state = apply_surplus_effects(new_state, outcome_code)
-
-        return new_state
+            apply_surplus_effects(self._core, outcome_code, self.params)
 
     # =========================================================================
     # Ending Checks
@@ -1155,51 +1501,52 @@ class GameEngine:
         - Position = 0: That player loses (10 VP, opponent 90 VP)
         - Resources = 0: That player loses (15 VP, opponent 85 VP)
         """
+        state = self._sync_core()
         # Risk = 10: Mutual Destruction - worst possible outcome, all value lost
-        if self.state.risk_level >= 10:
+        if state.risk_level >= 10:
             return GameEnding(
                 ending_type=EndingType.MUTUAL_DESTRUCTION,
                 vp_a=0.0,
                 vp_b=0.0,
-                turn=self.state.turn,
+                turn=state.turn,
                 description="The crisis has spiraled out of control. Mutual destruction - all value is lost.",
             )
 
         # Position = 0: That player loses
-        if self.state.position_a <= 0:
+        if state.position_a <= 0:
             return GameEnding(
                 ending_type=EndingType.POSITION_COLLAPSE_A,
                 vp_a=10.0,
                 vp_b=90.0,
-                turn=self.state.turn,
+                turn=state.turn,
                 description="Player A's position collapsed. Total defeat.",
             )
 
-        if self.state.position_b <= 0:
+        if state.position_b <= 0:
             return GameEnding(
                 ending_type=EndingType.POSITION_COLLAPSE_B,
                 vp_a=90.0,
                 vp_b=10.0,
-                turn=self.state.turn,
+                turn=state.turn,
                 description="Player B's position collapsed. Total defeat.",
             )
 
         # Resources = 0: That player loses
-        if self.state.resources_a <= 0:
+        if state.resources_a <= 0:
             return GameEnding(
                 ending_type=EndingType.RESOURCE_EXHAUSTION_A,
                 vp_a=15.0,
                 vp_b=85.0,
-                turn=self.state.turn,
+                turn=state.turn,
                 description="Player A exhausted all resources. Defeat.",
             )
 
-        if self.state.resources_b <= 0:
+        if state.resources_b <= 0:
             return GameEnding(
                 ending_type=EndingType.RESOURCE_EXHAUSTION_B,
                 vp_a=85.0,
                 vp_b=15.0,
-                turn=self.state.turn,
+                turn=state.turn,
                 description="Player B exhausted all resources. Defeat.",
             )
 
@@ -1212,40 +1559,46 @@ class GameEngine:
         - Only checked for Turn >= 10 and Risk > 7
         - P(Termination) = (Risk - 7) * 0.08
         - Risk 8: 8%, Risk 9: 16%
+
+        With a crisis stream, a number is drawn every turn, checked or not,
+        so turn t always uses the stream's t-th draw.
         """
-        if self.state.turn < 10:
+        state = self._sync_core()
+        draw = self._crisis_random.random() if self._crisis_random is not None else None
+        if state.turn < 10:
             return None
 
-        if self.state.risk_level <= 7:
+        if state.risk_level <= 7:
             return None
 
         # Calculate termination probability
-        p_termination = (self.state.risk_level - 7) * 0.08
+        p_termination = (state.risk_level - 7) * 0.08
 
-        if self._random.random() < p_termination:
+        if (draw if draw is not None else self._random.random()) < p_termination:
             # Crisis termination triggered - perform final resolution
             vp_a, vp_b = self._final_resolution()
             return GameEnding(
                 ending_type=EndingType.CRISIS_TERMINATION,
                 vp_a=vp_a,
                 vp_b=vp_b,
-                turn=self.state.turn,
-                description=f"Crisis spiraled out of control at Risk {self.state.risk_level:.1f}.",
+                turn=state.turn,
+                description=f"Crisis spiraled out of control at Risk {state.risk_level:.1f}.",
             )
 
         return None
 
     def _check_natural_ending(self) -> GameEnding | None:
         """Check for natural game ending at max turns."""
-        # Note: state.turn has already been incremented by apply_action_result
+        state = self._sync_core()
+        # Note: state.turn has already been incremented by apply_action_result_in_place
         # So we check if we've completed the max turn
-        if self.state.turn > self.state.max_turns:
+        if state.turn > state.max_turns:
             vp_a, vp_b = self._final_resolution()
             return GameEnding(
                 ending_type=EndingType.NATURAL_ENDING,
                 vp_a=vp_a,
                 vp_b=vp_b,
-                turn=self.state.turn - 1,  # The turn we just completed
+                turn=state.turn - 1,  # The turn we just completed
                 description="The crisis reached its natural conclusion.",
             )
 
@@ -1260,16 +1613,19 @@ class GameEngine:
         3. Apply symmetric noise
         4. Clamp and renormalize to sum to 100
         """
+        state = self._sync_core()
         # Expected values from position
-        total_pos = self.state.position_a + self.state.position_b
-        ev_a = 50.0 if total_pos == 0 else self.state.position_a / total_pos * 100
+        total_pos = state.position_a + state.position_b
+        ev_a = 50.0 if total_pos == 0 else state.position_a / total_pos * 100
         ev_b = 100.0 - ev_a
 
-        # Calculate shared variance (use state's computed property)
-        shared_sigma = self.state.shared_sigma
+        # Calculate shared variance
+        shared_sigma = calculate_shared_sigma(state, self.params)
 
         # Apply symmetric noise
-        noise = self._random.gauss(0, shared_sigma)
+        noise = (self._resolution_random or self._random).gauss(0, shared_sigma)
+        if self._antithetic:
+            noise = -noise
         vp_a_raw = ev_a + noise
         vp_b_raw = ev_b - noise  # Symmetric: both move together
 
@@ -1305,7 +1661,7 @@ class GameEngine:
             self._current_turn_key = config.default_next
         else:
             # Default: increment turn number
-            self._current_turn_key = f"turn_{self.state.turn}"
+            self._current_turn_key = f"turn_{self._core.turn}"
 
         # Reset phase
         self.phase = TurnPhase.BRIEFING
@@ -1321,11 +1677,20 @@ class GameEngine:
 # =============================================================================
 
 
+def _copy_random(rng: random.Random) -> random.Random:
+    """Independent copy of a stream at its current position."""
+    # setstate() fully initializes the generator, so skip the OS-entropy seeding
+    copied = random.Random.__new__(random.Random)
+    copied.setstate(rng.getstate())
+    return copied
+
+
 def create_game(
     scenario_id: str,
     scenario_repo: ScenarioRepository,
     max_turns: int | None = None,
     random_seed: int | None = None,
+    rng: random.Random | None = None,
 ) -> GameEngine:
     """Create a new game with the specified scenario.
 
@@ -1334,6 +1699,7 @@ def create_game(
         scenario_repo: Repository for loading scenarios
         max_turns: Override for maximum turns (default: random 12-16)
         random_seed: Seed for reproducibility
+        rng: Random stream for the engine (overrides random_seed)
 
     Returns:
         Initialized GameEngine
@@ -1346,4 +1712,5 @@ def create_game(
         scenario_repo=scenario_repo,
         max_turns=max_turns,
         random_seed=random_seed,
+        rng=rng,
     )
@@ -0,0 +1,119 @@
+"""Compact turn history for GameEngine.
+
+Each TurnRecord exposes state_before and state_after as full GameState
+objects. Instead of storing two copies of the state per turn, the engine
+appends one EngineState snapshot per transition to a StateLog, which keeps
+only the fields that changed since the previous entry. Records hold a
+StateRef into the log, and the GameState is rebuilt the first time it is
+read.
+
+Usage:
+    log = StateLog()
+    ref = log.append(engine_state)
+    record.state_before = ref  # resolved to a GameState on first access
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import islice
+from typing import cast
+
+from brinksmanship.models.state import EngineState, EngineStateTuple, GameState
+
+
+class StateLog:
+    """Append-only log of EngineState snapshots stored as field deltas.
+
+    Entry 0 is stored in full (as EngineState.to_tuple()); every later
+    entry is a tuple of (field_index, value) pairs for the fields that
+    changed. Reconstructing entry n replays n deltas, which stays cheap
+    for games of at most 16 turns.
+    """
+
+    __slots__ = ("_base", "_deltas", "_last")
+
+    def __init__(self) -> None:
+        self._base: EngineStateTuple | None = None
+        self._deltas: list[tuple[tuple[int, object], ...]] = []
+        self._last: EngineStateTuple | None = None
+
+    def __len__(self) -> int:
+        return 0 if self._base is None else len(self._deltas) + 1
+
+    def append(self, state: EngineState) -> StateRef:
+        """Record a snapshot of state and return a reference to it."""
+        values = state.to_tuple()
+        last = self._last
+        if last is None:
+            self._base = values
+        elif values == last:
+            # Common case: a turn's state_after is the next turn's state_before
+            self._deltas.append(())
+        else:
+            self._deltas.append(tuple((i, v) for i, v in enumerate(values) if v != last[i]))
+        self._last = values
+        return StateRef(self, len(self) - 1)
+
+    def fork(self) -> StateLog:
+        """Independent log with the same entries.
+
+        Entries are immutable tuples, so they are shared; only the list of
+        deltas is copied. References into this log stay valid either way.
+        """
+        forked = StateLog()
+        forked._base = self._base
+        forked._deltas = list(self._deltas)
+        forked._last = self._last
+        return forked
+
+    def values_at(self, index: int) -> EngineStateTuple:
+        """Full to_tuple() values of entry index."""
+        if self._base is None or not 0 <= index < len(self):
+            raise IndexError(f"State log index out of range: {index}")
+        values: list[object] = list(self._base)
+        for delta in islice(self._deltas, index):
+            for i, value in delta:
+                values[i] = value
+        return cast("EngineStateTuple", tuple(values))
+
+    def state_at(self, index: int) -> EngineState:
+        """Rebuild the EngineState of entry index."""
+        return EngineState.from_tuple(self.values_at(index))
+
+
+@dataclass(frozen=True, slots=True)
+class StateRef:
+    """Reference to one StateLog entry."""
+
+    log: StateLog
+    index: int
+
+    def resolve(self) -> GameState:
+        """Rebuild the referenced state as a new GameState."""
+        return self.log.state_at(self.index).to_game_state(copy_information=False)
+
+
+class LoggedState:
+    """Dataclass field descriptor holding a GameState or a lazy StateRef.
+
+    Assigning a StateRef defers reconstruction until the attribute is read;
+    the rebuilt GameState then replaces the reference. Assigning a GameState
+    (or None) stores it as-is.
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._attr = f"_{name}"
+
+    def __get__(self, record: object, owner: type | None = None) -> GameState | None:
+        if record is None:
+            # Class access: dataclasses reads the field default here
+            return None
+        value: GameState | StateRef | None = record.__dict__[self._attr]
+        if isinstance(value, StateRef):
+            value = value.resolve()
+            record.__dict__[self._attr] = value
+        return value
+
+    def __set__(self, record: object, value: GameState | StateRef | None) -> None:
+        record.__dict__[self._attr] = value
@@ -0,0 +1,295 @@
+"""Opt-in per-turn instrumentation for GameEngine.submit_actions.
+
+An engine created with an EngineInstrumentation reports one TurnMetrics
+per submit_actions call: wall time spent in each TurnPhase, whether the
+turn was resolved through the payoff matrix, the ending check that fired,
+any action-validation failure and, optionally, net and peak allocations
+traced with tracemalloc. (Payoff matrices are built when the scenario is
+compiled, never inside submit_actions, so there is no per-turn build
+count to report.) Metrics go to a sink:
+
+- CallbackSink: call a function with each TurnMetrics
+- HistogramSink: in-memory per-phase latency histograms and counters
+- JsonlSink: append one JSON object per turn to a file
+
+Engines without instrumentation pay a single None check per turn.
+
+Usage:
+    from brinksmanship.engine.instrumentation import EngineInstrumentation, HistogramSink
+
+    sink = HistogramSink()
+    engine = GameEngine("cuban_missile_crisis", repo, instrumentation=EngineInstrumentation(sink))
+    ...  # play turns
+    print(sink.summary())
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import time
+import tracemalloc
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Protocol
+
+if TYPE_CHECKING:
+    from brinksmanship.engine.game_engine import TurnPhase, TurnResult
+
+
+@dataclass
+class TurnMetrics:
+    """Measurements for one submit_actions call.
+
+    Attributes:
+        scenario_id: Scenario being played
+        turn: Turn number the actions were submitted for
+        phase_seconds: Wall time per TurnPhase value, in phase order
+        total_seconds: Wall time of the whole call
+        matrix_resolved: Whether the actions were resolved through the payoff
+            matrix (False for settlement, reconnaissance and inspection)
+        ending: EndingType value if the game ended this turn
+        ending_phase: TurnPhase value of the check that ended the game
+        validation_error: Error message if action validation rejected the actions
+        aborted: Whether submit_actions raised before finishing
+        allocated_bytes: Net bytes allocated (None unless allocations are tracked)
+        peak_bytes: Peak traced bytes above the starting level (None unless tracked)
+    """
+
+    scenario_id: str
+    turn: int
+    phase_seconds: dict[str, float] = field(default_factory=dict)
+    total_seconds: float = 0.0
+    matrix_resolved: bool = False
+    ending: str | None = None
+    ending_phase: str | None = None
+    validation_error: str | None = None
+    aborted: bool = False
+    allocated_bytes: int | None = None
+    peak_bytes: int | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return asdict(self)
+
+
+# =============================================================================
+# Sinks
+# =============================================================================
+
+
+class MetricsSink(Protocol):
+    """Destination for TurnMetrics."""
+
+    def record(self, metrics: TurnMetrics) -> None: ...
+
+
+class CallbackSink:
+    """Pass each TurnMetrics to a callback."""
+
+    def __init__(self, callback: Callable[[TurnMetrics], None]):
+        self.callback = callback
+
+    def record(self, metrics: TurnMetrics) -> None:
+        self.callback(metrics)
+
+
+class HistogramSink:
+    """Aggregate metrics in memory.
+
+    Phase latencies go into power-of-two microsecond buckets (bucket k
+    counts durations in [2**(k-1), 2**k) us; bucket 0 is under 1 us), so
+    memory stays constant however many turns are recorded.
+    """
+
+    def __init__(self) -> None:
+        self.turns = 0
+        self.validation_failures = 0
+        self.matrix_resolutions = 0
+        self.aborted = 0
+        self.endings: Counter[str] = Counter()
+        self.phase_counts: Counter[str] = Counter()
+        self.phase_totals: dict[str, float] = {}
+        self.phase_max: dict[str, float] = {}
+        self.phase_buckets: dict[str, Counter[int]] = {}
+        self.allocated_bytes = 0
+        self.peak_bytes = 0
+
+    def record(self, metrics: TurnMetrics) -> None:
+        self.turns += 1
+        self.matrix_resolutions += metrics.matrix_resolved
+        self.aborted += metrics.aborted
+        if metrics.validation_error is not None:
+            self.validation_failures += 1
+        if metrics.ending is not None:
+            self.endings[metrics.ending] += 1
+        if metrics.allocated_bytes is not None:
+            self.allocated_bytes += metrics.allocated_bytes
+            self.peak_bytes = max(self.peak_bytes, metrics.peak_bytes or 0)
+
+        for phase, seconds in metrics.phase_seconds.items():
+            self.phase_counts[phase] += 1
+            self.phase_totals[phase] = self.phase_totals.get(phase, 0.0) + seconds
+            self.phase_max[phase] = max(self.phase_max.get(phase, 0.0), seconds)
+            micros = seconds * 1e6
+            bucket = 0 if micros < 1.0 else math.frexp(micros)[1]
+            self.phase_buckets.setdefault(phase, Counter())[bucket] += 1
+
+    def summary(self) -> dict[str, Any]:
+        """Counters plus per-phase count, mean, max and bucket counts (microseconds)."""
+        phases = {
+            phase: {
+                "count": count,
+                "mean_us": round(self.phase_totals[phase] / count * 1e6, 3),
+                "max_us": round(self.phase_max[phase] * 1e6, 3),
+                "buckets": {f"<{2**k}us": n for k, n in sorted(self.phase_buckets[phase].items())},
+            }
+            for phase, count in self.phase_counts.items()
+        }
+        return {
+            "turns": self.turns,
+            "validation_failures": self.validation_failures,
+            "matrix_resolutions": self.matrix_resolutions,
+            "aborted": self.aborted,
+            "endings": dict(self.endings),
+            "allocated_bytes": self.allocated_bytes,
+            "peak_bytes": self.peak_bytes,
+            "phases": phases,
+        }
+
+
+class JsonlSink:
+    """Append each TurnMetrics as one JSON line.
+
+    The file is opened on the first record; call close() (or use the sink
+    as a context manager) to flush it.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._file: IO[str] | None = None
+
+    def record(self, metrics: TurnMetrics) -> None:
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "a")  # noqa: SIM115 - closed by close()
+        self._file.write(json.dumps(metrics.to_dict()) + "\n")
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> JsonlSink:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+# =============================================================================
+# Instrumentation
+# =============================================================================
+
+_MATRIX_OUTCOMES = frozenset({"CC", "CD", "DC", "DD"})
+
+
+class EngineInstrumentation:
+    """Times the phases of submit_actions and reports to a sink.
+
+    GameEngine calls begin_turn, then mark at every phase change (and
+    validation_failed if an action is rejected), then end_turn, even if the
+    turn raised. One instance may be shared by several engines as long as
+    they do not run turns concurrently.
+    """
+
+    def __init__(self, sink: MetricsSink, track_allocations: bool = False):
+        """Initialize instrumentation.
+
+        Args:
+            sink: Where to send each turn's metrics
+            track_allocations: Trace allocations with tracemalloc (slow; if
+                tracing is not already running it is started for each turn
+                and stopped again afterwards)
+        """
+        self.sink = sink
+        self.track_allocations = track_allocations
+        self._metrics: TurnMetrics | None = None
+        self._phase: str = ""
+        self._started = 0.0
+        self._last = 0.0
+        self._traced = 0
+        self._stop_tracing = False
+
+    def begin_turn(self, scenario_id: str, turn: int, phase: TurnPhase) -> None:
+        """Start measuring a submit_actions call that begins in phase."""
+        if self.track_allocations:
+            self._stop_tracing = not tracemalloc.is_tracing()
+            if self._stop_tracing:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            self._traced = tracemalloc.get_traced_memory()[0]
+        self._metrics = TurnMetrics(scenario_id=scenario_id, turn=turn)
+        self._phase = phase.value
+        self._started = self._last = time.perf_counter()
+
+    def _current(self) -> TurnMetrics:
+        """Metrics of the turn being measured.
+
+        Raises:
+            RuntimeError: If called outside begin_turn/end_turn
+        """
+        if self._metrics is None:
+            raise RuntimeError("EngineInstrumentation used outside begin_turn/end_turn")
+        return self._metrics
+
+    def mark(self, phase: TurnPhase) -> None:
+        """Close the current phase and start timing phase."""
+        now = time.perf_counter()
+        phase_seconds = self._current().phase_seconds
+        phase_seconds[self._phase] = phase_seconds.get(self._phase, 0.0) + now - self._last
+        self._phase = phase.value
+        self._last = now
+
+    def validation_failed(self, error: str) -> None:
+        """Record that action validation rejected the submitted actions."""
+        self._current().validation_error = error
+
+    def end_turn(self, result: TurnResult | None) -> None:
+        """Finish the call and send its metrics to the sink.
+
+        Args:
+            result: The call's TurnResult, or None if it raised
+        """
+        now = time.perf_counter()
+        metrics = self._current()
+        metrics.phase_seconds[self._phase] = metrics.phase_seconds.get(self._phase, 0.0) + now - self._last
+        metrics.total_seconds = now - self._started
+        if result is None:
+            metrics.aborted = True
+        elif result.action_result is not None:
+            metrics.matrix_resolved = result.action_result.outcome_code in _MATRIX_OUTCOMES
+            if result.ending is not None:
+                metrics.ending = result.ending.ending_type.value
+                metrics.ending_phase = self._phase
+        if self.track_allocations:
+            current, peak = tracemalloc.get_traced_memory()
+            metrics.allocated_bytes = current - self._traced
+            metrics.peak_bytes = peak - self._traced
+            if self._stop_tracing:
+                tracemalloc.stop()
+
+        self._metrics = None
+        self.sink.record(metrics)
+
+
+__all__ = [
+    "CallbackSink",
+    "EngineInstrumentation",
+    "HistogramSink",
+    "JsonlSink",
+    "MetricsSink",
+    "TurnMetrics",
+]
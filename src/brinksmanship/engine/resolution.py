@@ -28,9 +28,7 @@ from brinksmanship.models.state import (
     GameState,
     clamp,
 )
-from brinksmanship.parameters import (
-    calculate_rejection_penalty,
-)
+from brinksmanship.parameters import DEFAULT_PARAMETERS, GameParameters
 
 # =============================================================================
 # Matrix Choice Enum
@@ -641,6 +639,7 @@ def handle_settlement_acceptance(
 def handle_settlement_rejection(
     state: GameState,
     exchange_number: int,
+    params: GameParameters | None = None,
 ) -> tuple[GameState, SettlementResult]:
     """Handle a settlement rejection with escalating risk penalty.
 
@@ -651,12 +650,13 @@ def handle_settlement_rejection(
     Args:
         state: Current game state
         exchange_number: Which exchange this is (1, 2, or 3)
+        params: Game parameters (default: DEFAULT_PARAMETERS)
 
     Returns:
         Tuple of (new_state, settlement_result)
     """
     # Calculate escalating penalty
-    risk_penalty = calculate_rejection_penalty(exchange_number)
+    risk_penalty = (params or DEFAULT_PARAMETERS).rejection_penalty(exchange_number)
 
     # Apply risk penalty
     new_risk = clamp(state.risk_level + risk_penalty, 0.0, 10.0)
@@ -706,6 +706,7 @@ def process_settlement_response(
     proposal: SettlementProposal,
     response: SettlementResponse,
     exchange_number: int,
+    params: GameParameters | None = None,
 ) -> tuple[GameState, SettlementResult]:
     """Process a settlement response (accept, counter, or reject).
 
@@ -715,6 +716,7 @@ def process_settlement_response(
         proposal: The settlement proposal being responded to
         response: The recipient's response
         exchange_number: Which exchange this is (1, 2, or 3)
+        params: Game parameters for the rejection penalty (default: DEFAULT_PARAMETERS)
 
     Returns:
         Tuple of (new_state, settlement_result)
@@ -723,7 +725,7 @@ def process_settlement_response(
         return handle_settlement_acceptance(state, proposer, proposal)
 
     elif response.action == SettlementAction.REJECT:
-        return handle_settlement_rejection(state, exchange_number)
+        return handle_settlement_rejection(state, exchange_number, params)
 
     else:  # COUNTER
         # Counter is treated as a new proposal from the other side
@@ -1068,6 +1070,7 @@ def resolve_inspection_turn(
 def handle_failed_settlement(
     state: GameState,
     exchange_number: int = 1,
+    params: GameParameters | None = None,
 ) -> GameState:
     """Apply state changes for a failed settlement attempt.
 
@@ -1080,12 +1083,13 @@ def handle_failed_settlement(
         state: Current game state
         exchange_number: Which exchange this is (1, 2, or 3). Defaults to 1
             for backward compatibility.
+        params: Game parameters (default: DEFAULT_PARAMETERS)
 
     Returns:
         New game state with escalating risk increased and turn advanced
     """
     # Use escalating penalty based on exchange number
-    risk_penalty = calculate_rejection_penalty(exchange_number)
+    risk_penalty = (params or DEFAULT_PARAMETERS).rejection_penalty(exchange_number)
     new_risk = clamp(state.risk_level + risk_penalty, 0.0, 10.0)
 
     return state.model_copy(
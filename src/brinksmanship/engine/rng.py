@@ -0,0 +1,198 @@
+"""Per-game random streams for reproducible parallel simulation.
+
+Every random draw in a game (max turns, crisis termination, final
+resolution, opponent choices) comes from one of three streams owned by
+that game: the engine's, player A's and player B's. Each stream is derived
+only from (seed, *key), typically (seed, game_index), using NumPy's
+SeedSequence spawn keys. No stream depends on which process ran earlier
+games or how many draws they made, so a batch split across any number of
+workers or machines reproduces the same games, and keeping the players on
+their own streams means one opponent's extra draws never shift the
+engine's.
+
+Streams are random.Random instances (Mersenne Twister seeded from the
+derived entropy), so engine snapshots and forks keep working unchanged.
+
+Common random numbers: comparing two pairings or parameter sets on the
+same seed already gives each game the same streams, but the engine's
+stream is shared by max turns, crisis termination and final resolution,
+so one extra crisis check shifts every later draw. With common=True,
+crisis termination and final resolution get streams of their own and the
+engine draws one crisis number every turn, so game i sees the same
+crisis draws and resolution noise whatever happened earlier in it. With
+antithetic=True, games 2k and 2k+1 share one resolution draw with
+opposite signs. Both leave each game's distribution unchanged; they only
+correlate games across runs (and within antithetic pairs), which shrinks
+the variance of differences and means.
+
+The batch engine cannot keep a stream per game, so it uses hashed_uniforms:
+counter-based draws that depend only on (seed, stream, game, counter).
+
+Usage:
+    from brinksmanship.engine.rng import game_streams
+
+    streams = game_streams(seed=42, game_index=7)
+    engine = GameEngine("cuban_missile_crisis", repo, rng=streams.engine)
+    opponent_a.rng = streams.player_a
+    opponent_b.rng = streams.player_b
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+
+import numpy as np
+
+# Stream indices within one game
+ENGINE_STREAM = 0
+PLAYER_A_STREAM = 1
+PLAYER_B_STREAM = 2
+CRISIS_STREAM = 3
+RESOLUTION_STREAM = 4
+
+_MASK64 = np.uint64(0xFFFFFFFFFFFFFFFF)
+
+
+def derive_rng(seed: int | None, *key: int) -> random.Random:
+    """Create the random stream identified by (seed, *key).
+
+    Args:
+        seed: Base seed; None gives an unseeded (OS entropy) stream
+        *key: Non-negative integers naming the stream, e.g. (game_index, stream)
+
+    Returns:
+        A random.Random that depends only on seed and key
+    """
+    if seed is None:
+        return random.Random()
+    words = np.random.SeedSequence(seed, spawn_key=key).generate_state(4, np.uint32)
+    return random.Random(int.from_bytes(words.tobytes(), "little"))
+
+
+@dataclass(frozen=True)
+class GameStreams:
+    """The independent random streams of one game.
+
+    Attributes:
+        engine: GameEngine draws (max turns, and crisis termination and
+            final resolution unless they have their own streams)
+        player_a: Player A's opponent draws
+        player_b: Player B's opponent draws
+        crisis: Crisis termination draws, one per turn (None: engine stream)
+        resolution: Final resolution noise (None: engine stream)
+        antithetic: Negate the final resolution noise
+    """
+
+    engine: random.Random
+    player_a: random.Random
+    player_b: random.Random
+    crisis: random.Random | None = None
+    resolution: random.Random | None = None
+    antithetic: bool = False
+
+
+def game_streams(seed: int | None, game_index: int = 0, common: bool = False, antithetic: bool = False) -> GameStreams:
+    """Derive the streams of game game_index in a run seeded with seed.
+
+    Args:
+        seed: Base seed of the run (None for unseeded streams)
+        game_index: Index of the game within the run
+        common: Give crisis termination and final resolution their own streams
+        antithetic: Pair game 2k with 2k+1 on one resolution stream, with the
+            odd game's noise negated (implies its own resolution stream)
+
+    Returns:
+        GameStreams for that game
+    """
+    resolution = None
+    if common or antithetic:
+        key = game_index // 2 if antithetic else game_index
+        resolution = derive_rng(seed, key, RESOLUTION_STREAM)
+    return GameStreams(
+        engine=derive_rng(seed, game_index, ENGINE_STREAM),
+        player_a=derive_rng(seed, game_index, PLAYER_A_STREAM),
+        player_b=derive_rng(seed, game_index, PLAYER_B_STREAM),
+        crisis=derive_rng(seed, game_index, CRISIS_STREAM) if common else None,
+        resolution=resolution,
+        antithetic=antithetic and game_index % 2 == 1,
+    )
+
+
+def fresh_seed() -> int:
+    """A base seed from OS entropy, for runs that must share draws but were given no seed."""
+    return int(np.random.SeedSequence().generate_state(1, np.uint32)[0])
+
+
+def _splitmix64(x: np.ndarray) -> np.ndarray:
+    x = (x + np.uint64(0x9E3779B97F4A7C15)) & _MASK64
+    x = ((x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)) & _MASK64
+    x = ((x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)) & _MASK64
+    return x ^ (x >> np.uint64(31))
+
+
+def hashed_uniforms(seed: int | None, stream: int, keys: np.ndarray, counter: int | np.ndarray) -> np.ndarray:
+    """Counter-based uniforms in [0, 1), one per key.
+
+    Each value depends only on (seed, stream, key, counter), never on how
+    many values were drawn before or alongside it. Used by the batch
+    engine for common random numbers.
+
+    Args:
+        seed: Base seed (None draws a fresh random seed)
+        stream: Stream index, e.g. CRISIS_STREAM
+        keys: Non-negative integer keys, typically game indices
+        counter: Draw number per key (scalar or array like keys), e.g. the turn
+
+    Returns:
+        float64 array shaped like keys
+    """
+    if seed is None:
+        seed = fresh_seed()
+    base = np.random.SeedSequence(seed, spawn_key=(stream,)).generate_state(1, np.uint64)[0]
+    with np.errstate(over="ignore"):
+        x = _splitmix64(np.asarray(keys, dtype=np.uint64) ^ base)
+        x = _splitmix64(x ^ np.asarray(counter, dtype=np.uint64))
+    return (x >> np.uint64(11)).astype(np.float64) / float(1 << 53)
+
+
+def hashed_normals(seed: int | None, stream: int, keys: np.ndarray, antithetic: bool = False) -> np.ndarray:
+    """Counter-based standard normals, one per key (Box-Muller over hashed_uniforms).
+
+    With antithetic, keys 2k and 2k+1 get the same magnitude with opposite signs.
+    """
+    keys = np.asarray(keys, dtype=np.int64)
+    base = keys // 2 if antithetic else keys
+    u1 = hashed_uniforms(seed, stream, base, 0)
+    u2 = hashed_uniforms(seed, stream, base, 1)
+    z = np.sqrt(-2.0 * np.log1p(-u1)) * np.cos(2.0 * np.pi * u2)
+    if antithetic:
+        z = np.where(keys % 2 == 1, -z, z)
+    return z
+
+
+def resolve_rng(rng: random.Random | None, seed: int | None) -> random.Random:
+    """Return rng, or a fresh stream seeded with seed (unseeded if None).
+
+    Used by the module-level helpers that accept either an injected stream
+    or a legacy seed argument. Never touches the global random state.
+    """
+    if rng is not None:
+        return rng
+    return random.Random(seed)
+
+
+__all__ = [
+    "CRISIS_STREAM",
+    "ENGINE_STREAM",
+    "PLAYER_A_STREAM",
+    "PLAYER_B_STREAM",
+    "RESOLUTION_STREAM",
+    "GameStreams",
+    "derive_rng",
+    "fresh_seed",
+    "game_streams",
+    "hashed_normals",
+    "hashed_uniforms",
+    "resolve_rng",
+]
@@ -0,0 +1,330 @@
+"""Compact binary snapshots of a GameEngine.
+
+A snapshot holds everything needed to resume a game exactly where it
+stopped: the scenario and current turn key (so branch position survives),
+the phase, every EngineState field including both InformationStates, the
+Mersenne Twister state of the engine's RNG and of its separate crisis and
+resolution streams (common random numbers), the antithetic flag, the
+GameParameters values, and the ending if the game is over. Turn history is
+not included.
+
+The format is a fixed struct layout, not pickle, so snapshots read back
+from a database or a client cannot execute code when decoded.
+
+Layout (little-endian):
+    header      magic b"BKSS", format version (B)
+    strings     scenario_id, turn_key, phase (H length + UTF-8; turn_key
+                uses length 0xFFFF for None)
+    core        EngineState scalars (_CORE)
+    info x2     InformationState for A then B (_INFO)
+    rng         random.Random.getstate(): version (B), 625 words (I),
+                gauss_next presence (B) + value (d)
+    streams     flags (B): 1 antithetic, 2 crisis stream, 4 resolution
+                stream; then an rng block per present stream
+    params      field count (B), GameParameters values in field order (d)
+    ending      presence (B); if present ending_type, vp_a, vp_b, turn,
+                description
+
+Version 1 snapshots (no streams or params blocks) are still read.
+
+Usage:
+    data = pack_snapshot(snapshot)
+    snapshot = unpack_snapshot(data)
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import struct
+from dataclasses import dataclass
+from typing import Any
+
+from brinksmanship.models.actions import ActionType
+from brinksmanship.models.state import EngineState, InformationState
+from brinksmanship.parameters import GameParameters
+
+SNAPSHOT_MAGIC = b"BKSS"
+SNAPSHOT_VERSION = 2
+
+_HEADER = struct.Struct("<4sB")
+_STR_LEN = struct.Struct("<H")
+_NONE_STR = 0xFFFF
+# position_a/b, resources_a/b, previous_type_a/b, cooperation_score, stability,
+# risk_level, turn, max_turns, cooperation_surplus, surplus_captured_a/b,
+# cooperation_streak
+_CORE = struct.Struct("<4d2b3d2H3dH")
+# presence mask, position_bounds, resources_bounds, known_position(_turn),
+# known_resources(_turn)
+_INFO = struct.Struct("<B4ddhdh")
+_RNG = struct.Struct("<B625IBd")
+_ENDING = struct.Struct("<2dH")
+_FLAG = struct.Struct("<B")
+
+_ANTITHETIC = 1
+_CRISIS_STREAM = 2
+_RESOLUTION_STREAM = 4
+
+_PARAM_FIELDS = tuple(field.name for field in dataclasses.fields(GameParameters))
+
+# previous_type codes; -1 means no previous action
+_ACTION_TYPES = (ActionType.COOPERATIVE, ActionType.COMPETITIVE)
+
+
+@dataclass
+class EngineSnapshot:
+    """Decoded contents of a snapshot.
+
+    Attributes:
+        scenario_id: Scenario the game is playing
+        turn_key: Key of the current turn in the scenario graph
+        phase: TurnPhase value
+        core: Engine state, including information states
+        rng_state: random.Random.getstate() of the engine RNG
+        ending: (ending_type value, vp_a, vp_b, turn, description), or None
+        crisis_rng_state: getstate() of the crisis stream, or None
+        resolution_rng_state: getstate() of the resolution stream, or None
+        antithetic: Whether final resolution noise is negated
+        params: The engine's GameParameters (None in version 1 snapshots)
+    """
+
+    scenario_id: str
+    turn_key: str | None
+    phase: str
+    core: EngineState
+    rng_state: tuple[Any, ...]
+    ending: tuple[str, float, float, int, str] | None = None
+    crisis_rng_state: tuple[Any, ...] | None = None
+    resolution_rng_state: tuple[Any, ...] | None = None
+    antithetic: bool = False
+    params: GameParameters | None = None
+
+
+def _pack_str(value: str | None) -> bytes:
+    if value is None:
+        return _STR_LEN.pack(_NONE_STR)
+    encoded = value.encode("utf-8")
+    if len(encoded) >= _NONE_STR:
+        raise ValueError(f"String too long for snapshot: {len(encoded)} bytes")
+    return _STR_LEN.pack(len(encoded)) + encoded
+
+
+def _pack_info(info: InformationState) -> bytes:
+    optional = (info.known_position, info.known_position_turn, info.known_resources, info.known_resources_turn)
+    mask = sum(1 << i for i, value in enumerate(optional) if value is not None)
+    return _INFO.pack(
+        mask,
+        *info.position_bounds,
+        *info.resources_bounds,
+        *(0 if value is None else value for value in optional),
+    )
+
+
+def _pack_rng(state: tuple[Any, ...]) -> bytes:
+    rng_version, words, gauss_next = state
+    return _RNG.pack(rng_version, *words, gauss_next is not None, gauss_next or 0.0)
+
+
+def _action_code(action_type: ActionType | None) -> int:
+    return -1 if action_type is None else _ACTION_TYPES.index(action_type)
+
+
+def pack_snapshot(snapshot: EngineSnapshot) -> bytes:
+    """Encode a snapshot to bytes."""
+    core = snapshot.core
+    params = snapshot.params if snapshot.params is not None else GameParameters()
+    flags = (
+        (_ANTITHETIC if snapshot.antithetic else 0)
+        | (_CRISIS_STREAM if snapshot.crisis_rng_state is not None else 0)
+        | (_RESOLUTION_STREAM if snapshot.resolution_rng_state is not None else 0)
+    )
+    parts = [
+        _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION),
+        _pack_str(snapshot.scenario_id),
+        _pack_str(snapshot.turn_key),
+        _pack_str(snapshot.phase),
+        _CORE.pack(
+            core.position_a,
+            core.position_b,
+            core.resources_a,
+            core.resources_b,
+            _action_code(core.previous_type_a),
+            _action_code(core.previous_type_b),
+            core.cooperation_score,
+            core.stability,
+            core.risk_level,
+            core.turn,
+            core.max_turns,
+            core.cooperation_surplus,
+            core.surplus_captured_a,
+            core.surplus_captured_b,
+            core.cooperation_streak,
+        ),
+        _pack_info(core.information_a),
+        _pack_info(core.information_b),
+        _pack_rng(snapshot.rng_state),
+        _FLAG.pack(flags),
+    ]
+    for stream_state in (snapshot.crisis_rng_state, snapshot.resolution_rng_state):
+        if stream_state is not None:
+            parts.append(_pack_rng(stream_state))
+    parts.append(struct.pack(f"<B{len(_PARAM_FIELDS)}d", len(_PARAM_FIELDS), *dataclasses.astuple(params)))
+    if snapshot.ending is None:
+        parts.append(_FLAG.pack(0))
+    else:
+        ending_type, vp_a, vp_b, turn, description = snapshot.ending
+        parts += [_FLAG.pack(1), _pack_str(ending_type), _ENDING.pack(vp_a, vp_b, turn), _pack_str(description)]
+    return b"".join(parts)
+
+
+class _Reader:
+    """Sequential reader over snapshot bytes."""
+
+    __slots__ = ("_data", "_offset")
+
+    def __init__(self, data: bytes) -> None:
+        self._data = data
+        self._offset = 0
+
+    def unpack(self, layout: struct.Struct) -> tuple[Any, ...]:
+        values = layout.unpack_from(self._data, self._offset)
+        self._offset += layout.size
+        return values
+
+    def string(self) -> str | None:
+        (length,) = self.unpack(_STR_LEN)
+        if length == _NONE_STR:
+            return None
+        end = self._offset + length
+        if end > len(self._data):
+            raise ValueError("Truncated snapshot")
+        value = self._data[self._offset : end].decode("utf-8")
+        self._offset = end
+        return value
+
+    def info(self) -> InformationState:
+        mask, pos_lo, pos_hi, res_lo, res_hi, *optional = self.unpack(_INFO)
+        known = [value if mask & (1 << i) else None for i, value in enumerate(optional)]
+        return InformationState(
+            position_bounds=(pos_lo, pos_hi),
+            resources_bounds=(res_lo, res_hi),
+            known_position=known[0],
+            known_position_turn=known[1],
+            known_resources=known[2],
+            known_resources_turn=known[3],
+        )
+
+    def rng(self) -> tuple[Any, ...]:
+        rng_version, *words, has_gauss, gauss_next = self.unpack(_RNG)
+        return (rng_version, tuple(words), gauss_next if has_gauss else None)
+
+    def params(self) -> GameParameters:
+        (count,) = self.unpack(_FLAG)
+        if count != len(_PARAM_FIELDS):
+            raise ValueError(f"Snapshot has {count} parameters, expected {len(_PARAM_FIELDS)}")
+        values = self.unpack(struct.Struct(f"<{count}d"))
+        return GameParameters(**dict(zip(_PARAM_FIELDS, values, strict=True)))
+
+    def at_end(self) -> bool:
+        return self._offset == len(self._data)
+
+
+def unpack_snapshot(data: bytes) -> EngineSnapshot:
+    """Decode bytes produced by pack_snapshot.
+
+    Raises:
+        ValueError: If the data is not a snapshot, uses an unsupported
+            format version, or is truncated or malformed
+    """
+    reader = _Reader(data)
+    try:
+        magic, version = reader.unpack(_HEADER)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError("Not an engine snapshot")
+        if version not in (1, SNAPSHOT_VERSION):
+            raise ValueError(f"Unsupported snapshot version: {version}")
+
+        scenario_id = reader.string()
+        turn_key = reader.string()
+        phase = reader.string()
+        (
+            position_a,
+            position_b,
+            resources_a,
+            resources_b,
+            previous_a,
+            previous_b,
+            cooperation_score,
+            stability,
+            risk_level,
+            turn,
+            max_turns,
+            cooperation_surplus,
+            surplus_captured_a,
+            surplus_captured_b,
+            cooperation_streak,
+        ) = reader.unpack(_CORE)
+        core = EngineState(
+            position_a=position_a,
+            position_b=position_b,
+            resources_a=resources_a,
+            resources_b=resources_b,
+            previous_type_a=None if previous_a < 0 else _ACTION_TYPES[previous_a],
+            previous_type_b=None if previous_b < 0 else _ACTION_TYPES[previous_b],
+            cooperation_score=cooperation_score,
+            stability=stability,
+            risk_level=risk_level,
+            turn=turn,
+            max_turns=max_turns,
+            cooperation_surplus=cooperation_surplus,
+            surplus_captured_a=surplus_captured_a,
+            surplus_captured_b=surplus_captured_b,
+            cooperation_streak=cooperation_streak,
+            information_a=reader.info(),
+            information_b=reader.info(),
+        )
+
+        rng_state = reader.rng()
+        crisis_rng_state = resolution_rng_state = params = None
+        flags = 0
+        if version >= 2:
+            (flags,) = reader.unpack(_FLAG)
+            if flags & _CRISIS_STREAM:
+                crisis_rng_state = reader.rng()
+            if flags & _RESOLUTION_STREAM:
+                resolution_rng_state = reader.rng()
+            params = reader.params()
+
+        ending = None
+        (has_ending,) = reader.unpack(_FLAG)
+        if has_ending:
+            ending_type = reader.string()
+            vp_a, vp_b, ending_turn = reader.unpack(_ENDING)
+            description = reader.string()
+            if ending_type is None or description is None:
+                raise ValueError("Malformed snapshot: missing ending fields")
+            ending = (ending_type, vp_a, vp_b, ending_turn, description)
+    except (struct.error, IndexError, UnicodeDecodeError) as e:
+        raise ValueError(f"Malformed snapshot: {e}") from e
+
+    if scenario_id is None or phase is None or not reader.at_end():
+        raise ValueError("Malformed snapshot")
+    return EngineSnapshot(
+        scenario_id,
+        turn_key,
+        phase,
+        core,
+        rng_state,
+        ending,
+        crisis_rng_state=crisis_rng_state,
+        resolution_rng_state=resolution_rng_state,
+        antithetic=bool(flags & _ANTITHETIC),
+        params=params,
+    )
+
+
+__all__ = [
+    "SNAPSHOT_VERSION",
+    "EngineSnapshot",
+    "pack_snapshot",
+    "unpack_snapshot",
+]
@@ -0,0 +1,645 @@
+"""Exact outcome solver for games between vectorized policies.
+
+Instead of sampling games, GameTreeSolver pushes probability mass through
+the scenario's turn graph. Every turn, each distinct game state is expanded
+into all of its successors, weighted by the probability of reaching them:
+
+1. Settlement negotiation, from each policy's proposal and response distributions
+2. Action choice, from cooperate_probability and a uniform pick from the menu
+3. Resolution and state update (the same vectorized steps as BatchGameEngine)
+4. Deterministic endings, crisis termination probability and natural ending
+
+Successors that share a state key are merged by adding their
+probabilities, which acts as a transposition table. The key holds the
+discrete fields (turn, turn key, previous actions, policy memory) exactly
+and the continuous ones (positions, resources, risk, cooperation,
+stability) on a grid; a merged state takes the mass-weighted mean of its
+members' continuous values. Pairings of mostly deterministic policies keep
+a small frontier on the default fine grid and are exact. Random policies
+such as Erratic make the continuous values diverge combinatorially, so
+whenever a turn's frontier exceeds max_states the grid is doubled until it
+fits: memory stays bounded (Erratic pairings solve in a few seconds in
+under 200 MB) at the cost of approximating nearby states by their mean,
+typically within a VP or two of the sampled expectation.
+SolverResult.resolution reports the coarsest grid used. Final resolution is handled analytically: with symmetric
+noise and a [5, 95] clamp, player A's VP is a normal distribution clipped to
+[5, 95], so its mean and win probabilities have closed forms.
+
+The rules mirror BatchGameEngine, so solved probabilities are the exact
+limit of what BatchGameEngine (and GameRunner) converge to.
+
+Usage:
+    from brinksmanship.engine.solver import GameTreeSolver
+    from brinksmanship.opponents.batch_policies import BATCH_POLICIES
+
+    solver = GameTreeSolver("cuban_missile_crisis", repo)
+    result = solver.solve(
+        BATCH_POLICIES["TitForTat"](1, is_player_a=True),
+        BATCH_POLICIES["Opportunist"](1, is_player_a=False),
+    )
+    print(result.expected_vp_a, result.ending_probabilities)
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field, fields
+from typing import TYPE_CHECKING, Protocol
+
+import numpy as np
+
+from brinksmanship.engine.batch_engine import (
+    _FIXED_VP_A,
+    _FIXED_VP_B,
+    CAT_INSPECTION,
+    CAT_RECONNAISSANCE,
+    CAT_SETTLEMENT,
+    CAT_SIGNALING,
+    CAT_STANDARD,
+    COMPETITIVE,
+    COOPERATIVE,
+    ENDING_TYPES,
+    NO_ENDING,
+    OUT_SETTLE,
+    BatchScenarioTables,
+    BatchState,
+    BatchView,
+    batch_apply_action_result,
+    batch_apply_surplus_effects,
+    batch_crisis_probability,
+    batch_deterministic_endings,
+    batch_resolve,
+    batch_view,
+)
+from brinksmanship.engine.game_engine import EndingType, get_compiled_scenario
+from brinksmanship.parameters import DEFAULT_PARAMETERS, GameParameters
+
+if TYPE_CHECKING:
+    from brinksmanship.storage import ScenarioRepository
+
+_END = {ending: i for i, ending in enumerate(ENDING_TYPES)}
+_WINNERS = ("A", "B", "tie", "mutual_destruction")
+
+# Generic cooperative menus: standard actions, then settlement, recon, inspection, signaling
+_SPECIAL_CATEGORIES = np.array([CAT_SETTLEMENT, CAT_RECONNAISSANCE, CAT_INSPECTION, CAT_SIGNALING])
+_GENERIC_WIDTH = 1 + len(_SPECIAL_CATEGORIES)
+
+# Fields that can influence the rest of the game, split into exact and
+# gridded parts of the state key. The surplus fields and the cooperation
+# streak only feed each other (no ending, policy or final resolution reads
+# them), so states that differ only there are merged.
+_SURPLUS_FIELDS = ("cooperation_surplus", "surplus_captured_a", "surplus_captured_b", "cooperation_streak")
+_CONTINUOUS_FIELDS = (
+    "position_a",
+    "position_b",
+    "resources_a",
+    "resources_b",
+    "risk_level",
+    "cooperation_score",
+    "stability",
+)
+_DISCRETE_FIELDS = tuple(
+    f.name for f in fields(BatchState) if f.name not in _SURPLUS_FIELDS and f.name not in _CONTINUOUS_FIELDS
+)
+
+# Continuous fields span 0-10; a grid this coarse merges everything
+_MAX_RESOLUTION = 16.0
+
+
+class SolverPolicy(Protocol):
+    """Policy interface used by the solver (see DeterministicBatchPolicy)."""
+
+    name: str
+    memory_fields: tuple[str, ...]
+
+    def cooperate_probability(self, view: BatchView) -> np.ndarray: ...
+
+    def observe(self, idx: np.ndarray, opponent_action: np.ndarray) -> None: ...
+
+    def proposal_distribution(self, view: BatchView) -> tuple[np.ndarray, np.ndarray]: ...
+
+    def response_distribution(
+        self,
+        view: BatchView,
+        offered_vp: np.ndarray,
+        is_final_offer: bool,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]: ...
+
+
+@dataclass
+class SolverResult:
+    """Exact outcome distribution of one pairing.
+
+    Attributes:
+        ending_probabilities: Probability of each ending type
+        winner_probabilities: Probability of "A", "B", "tie" and
+            "mutual_destruction", as BatchOutcome.winners
+        expected_vp_a, expected_vp_b: Expected final VP
+        expected_turns: Expected turns played (as GameResult.turns_played)
+        states_expanded: Distinct game states expanded
+        resolution: Coarsest state-key grid used (the solver's resolution
+            unless max_states forced coarser merging)
+        unresolved_probability: Probability mass dropped by min_probability
+    """
+
+    scenario_id: str
+    opponent_a_name: str
+    opponent_b_name: str
+    ending_probabilities: dict[EndingType, float]
+    winner_probabilities: dict[str, float]
+    expected_vp_a: float
+    expected_vp_b: float
+    expected_turns: float
+    states_expanded: int
+    resolution: float = 0.0
+    unresolved_probability: float = 0.0
+
+
+@dataclass
+class _Totals:
+    """Probability-weighted sums over finished games."""
+
+    ending: np.ndarray = field(default_factory=lambda: np.zeros(len(ENDING_TYPES)))
+    winner: np.ndarray = field(default_factory=lambda: np.zeros(len(_WINNERS)))
+    vp_a: float = 0.0
+    vp_b: float = 0.0
+    turns: float = 0.0
+    unresolved: float = 0.0
+    variance_scale: float = 1.0
+
+    def add_fixed(self, mass: np.ndarray, ending: np.ndarray, vp_a: np.ndarray, vp_b: np.ndarray, turns: np.ndarray):
+        """Games that ended with known VP."""
+        np.add.at(self.ending, ending, mass)
+        mutual_destruction = ending == _END[EndingType.MUTUAL_DESTRUCTION]
+        a_wins = ~mutual_destruction & (vp_a > vp_b + 0.01)
+        b_wins = ~mutual_destruction & (vp_b > vp_a + 0.01)
+        self.winner += [
+            mass[a_wins].sum(),
+            mass[b_wins].sum(),
+            mass[~(mutual_destruction | a_wins | b_wins)].sum(),
+            mass[mutual_destruction].sum(),
+        ]
+        self.vp_a += mass @ vp_a
+        self.vp_b += mass @ vp_b
+        self.turns += mass @ turns
+
+    def add_resolution(self, mass: np.ndarray, state: BatchState, ending: EndingType):
+        """Games settled by final resolution, integrated over the noise.
+
+        Player A's VP is clip(ev_a + noise, 5, 95) and B gets the rest.
+        """
+        mu, sigma = state.expected_vp_a, state.shared_sigma * self.variance_scale
+        alpha, beta = (5.0 - mu) / sigma, (95.0 - mu) / sigma
+        cdf_alpha, cdf_beta = _norm_cdf(alpha), _norm_cdf(beta)
+        mean_a = (
+            5.0 * cdf_alpha
+            + 95.0 * (1.0 - cdf_beta)
+            + mu * (cdf_beta - cdf_alpha)
+            + sigma * (_norm_pdf(alpha) - _norm_pdf(beta))
+        )
+        p_a = 1.0 - _norm_cdf((50.005 - mu) / sigma)
+        p_b = _norm_cdf((49.995 - mu) / sigma)
+
+        total = mass.sum()
+        self.ending[_END[ending]] += total
+        self.winner += [mass @ p_a, mass @ p_b, total - mass @ p_a - mass @ p_b, 0.0]
+        self.vp_a += mass @ mean_a
+        self.vp_b += mass @ (100.0 - mean_a)
+        self.turns += mass @ (state.turn - 1)
+
+
+# Chebyshev fit of erfc (Numerical Recipes erfcc), fractional error below 1.2e-7
+# everywhere, tails included. A frompyfunc over math.erf is an order of
+# magnitude slower on the millions of states a mixed-strategy pairing resolves.
+_ERFC_COEFFICIENTS = (
+    0.17087277,
+    -0.82215223,
+    1.48851587,
+    -1.13520398,
+    0.27886807,
+    -0.18628806,
+    0.09678418,
+    0.37409196,
+    1.00002368,
+    -1.26551223,
+)
+
+
+def _norm_cdf(x: np.ndarray) -> np.ndarray:
+    z = np.abs(np.asarray(x, dtype=float)) / math.sqrt(2.0)
+    t = 1.0 / (1.0 + 0.5 * z)
+    poly = np.zeros_like(t)
+    for coefficient in _ERFC_COEFFICIENTS:
+        poly = poly * t + coefficient
+    upper_tail = 0.5 * t * np.exp(poly - z * z)
+    return np.where(np.asarray(x) < 0, upper_tail, 1.0 - upper_tail)
+
+
+def _norm_pdf(x: np.ndarray) -> np.ndarray:
+    return np.exp(-0.5 * np.asarray(x) ** 2) / math.sqrt(2.0 * math.pi)
+
+
+class GameTreeSolver:
+    """Outcome distributions for one scenario by probability-mass propagation.
+
+    Games run through the same turn graph and rules as BatchGameEngine; see
+    the module docstring for the method.
+    """
+
+    def __init__(
+        self,
+        scenario_id: str,
+        scenario_repo: ScenarioRepository,
+        max_turns: int | None = None,
+        resolution: float = 1e-6,
+        min_probability: float = 0.0,
+        max_states: int = 5_000,
+        params: GameParameters | None = None,
+    ):
+        """Initialize the solver.
+
+        Args:
+            scenario_id: ID of scenario to load
+            scenario_repo: Repository for loading scenarios
+            max_turns: Fixed max turns (default: uniform 12-16, as GameEngine)
+            resolution: Grid for the continuous fields of the state key;
+                states whose values agree on this grid are merged
+            min_probability: Drop successor states less likely than this
+                (0 keeps every state; dropped mass is reported)
+            max_states: Most states kept after a turn; the grid is coarsened
+                (doubled) until the frontier fits
+            params: Game balance parameters (default: DEFAULT_PARAMETERS)
+
+        Raises:
+            ValueError: If scenario not found or invalid
+        """
+        if resolution <= 0:
+            raise ValueError(f"resolution must be positive, got {resolution}")
+        if max_states < 1:
+            raise ValueError(f"max_states must be positive, got {max_states}")
+
+        self.scenario_id = scenario_id
+        self.tables = BatchScenarioTables.from_compiled(get_compiled_scenario(scenario_id, scenario_repo))
+        self.max_turns = max_turns
+        self.resolution = resolution
+        self.min_probability = min_probability
+        self.max_states = max_states
+        self.params = params if params is not None else DEFAULT_PARAMETERS
+        self._grid = resolution
+
+    def solve(self, policy_a: SolverPolicy, policy_b: SolverPolicy) -> SolverResult:
+        """Compute the exact outcome distribution of policy_a vs policy_b.
+
+        Policy memory fields are replaced by the solver's per-state arrays
+        while solving; they start from the policy's value for game 0.
+
+        Raises:
+            ValueError: If a reachable turn has no valid action combination,
+                or the frontier exceeds max_states even on the coarsest grid
+        """
+        self._grid = self.resolution
+        if self.max_turns is None:
+            turns = np.arange(12, 17)
+        else:
+            turns = np.array([self.max_turns])
+        state = BatchState.initial(turns, start_key=self.tables.start_key)
+        mass = np.full(len(state), 1.0 / len(state))
+        memory = (_initial_memory(policy_a, len(state)), _initial_memory(policy_b, len(state)))
+
+        totals = _Totals(variance_scale=self.params.variance_scale)
+        expanded = 0
+        while len(mass):
+            expanded += len(mass)
+            state, mass, memory = self._step(state, mass, memory, policy_a, policy_b, totals)
+
+        winners = totals.winner
+        return SolverResult(
+            scenario_id=self.scenario_id,
+            opponent_a_name=policy_a.name,
+            opponent_b_name=policy_b.name,
+            ending_probabilities={e: float(totals.ending[i]) for i, e in enumerate(ENDING_TYPES)},
+            winner_probabilities={w: float(winners[i]) for i, w in enumerate(_WINNERS)},
+            expected_vp_a=float(totals.vp_a),
+            expected_vp_b=float(totals.vp_b),
+            expected_turns=float(totals.turns),
+            states_expanded=expanded,
+            resolution=self._grid,
+            unresolved_probability=float(totals.unresolved),
+        )
+
+    # =========================================================================
+    # Turn Expansion
+    # =========================================================================
+
+    def _step(
+        self,
+        state: BatchState,
+        mass: np.ndarray,
+        memory: tuple[dict[str, np.ndarray], dict[str, np.ndarray]],
+        policy_a: SolverPolicy,
+        policy_b: SolverPolicy,
+        totals: _Totals,
+    ) -> tuple[BatchState, np.ndarray, tuple[dict[str, np.ndarray], dict[str, np.ndarray]]]:
+        """Expand every state by one turn; return the merged successor states."""
+        tables = self.tables
+        n = len(mass)
+        idx = np.arange(n)
+        config = tables.resolve(state.turn_key, state.turn)
+        _install_memory(policy_a, memory[0])
+        _install_memory(policy_b, memory[1])
+
+        mass = self._negotiate(state, config, mass, policy_a, policy_b, totals)
+
+        # Joint action distribution, conditioned on valid combinations (GameRunner retries the rest)
+        prob_a, type_a, category_a, cost_a = self._action_distribution(
+            config, state, policy_a.cooperate_probability(batch_view(tables, idx, state, config, True)), True
+        )
+        prob_b, type_b, category_b, cost_b = self._action_distribution(
+            config, state, policy_b.cooperate_probability(batch_view(tables, idx, state, config, False)), False
+        )
+        joint = prob_a[:, :, None] * prob_b[:, None, :]
+        can_settle = ((state.turn > 4) & (state.stability > 2))[:, None, None]
+        settling = (category_a == CAT_SETTLEMENT)[:, :, None] | (category_b == CAT_SETTLEMENT)[:, None, :]
+        joint = np.where(settling & ~can_settle, 0.0, joint)
+        valid_mass = joint.sum(axis=(1, 2))
+        if np.any((valid_mass == 0) & (mass > 0)):
+            raise ValueError("A reachable turn has no valid action combination")
+        joint /= np.where(valid_mass > 0, valid_mass, 1.0)[:, None, None]
+
+        rows, col_a, col_b = np.nonzero(joint * mass[:, None, None] > 0)
+        child_mass = mass[rows] * joint[rows, col_a, col_b]
+        parent = state.take(rows)
+        result, settle_vp_a = batch_resolve(
+            tables,
+            config[rows],
+            parent,
+            type_a[rows, col_a],
+            category_a[rows, col_a],
+            cost_a[rows, col_a],
+            type_b[rows, col_b],
+            category_b[rows, col_b],
+            cost_b[rows, col_b],
+        )
+        child = batch_apply_surplus_effects(batch_apply_action_result(parent, result), result.outcome, self.params)
+        child_memory = (
+            _observe(policy_a, memory[0], rows, result.action_b),
+            _observe(policy_b, memory[1], rows, result.action_a),
+        )
+
+        # Endings (deterministic > crisis > natural > mutual settlement)
+        ending = batch_deterministic_endings(child)
+        done = ending != NO_ENDING
+        if done.any():
+            totals.add_fixed(
+                child_mass[done],
+                ending[done],
+                _FIXED_VP_A[ending[done]],
+                _FIXED_VP_B[ending[done]],
+                child.turn[done] - 1,
+            )
+        open_games = ~done
+        p_crisis = np.where(open_games, batch_crisis_probability(child), 0.0)
+        crisis = p_crisis > 0
+        if crisis.any():
+            totals.add_resolution(
+                child_mass[crisis] * p_crisis[crisis], child.take(crisis), EndingType.CRISIS_TERMINATION
+            )
+        child_mass = child_mass * (1.0 - p_crisis)
+
+        natural = open_games & (child.turn > child.max_turns)
+        if natural.any():
+            totals.add_resolution(child_mass[natural], child.take(natural), EndingType.NATURAL_ENDING)
+        settled = open_games & ~natural & (result.outcome == OUT_SETTLE)
+        if settled.any():
+            totals.add_fixed(
+                child_mass[settled],
+                np.full(settled.sum(), _END[EndingType.SETTLEMENT]),
+                settle_vp_a[settled],
+                100.0 - settle_vp_a[settled],
+                child.turn[settled] - 1,
+            )
+
+        # Advance the survivors (config looked up after the turn counter moves, as GameEngine)
+        alive = open_games & ~natural & ~settled
+        if self.min_probability > 0:
+            dropped = alive & (child_mass < self.min_probability)
+            totals.unresolved += child_mass[dropped].sum()
+            alive &= ~dropped
+        child = child.take(alive)
+        child.turn_key = tables.next_key[tables.resolve(child.turn_key, child.turn), result.outcome[alive]]
+        child_memory = tuple({name: values[alive] for name, values in m.items()} for m in child_memory)
+        return self._merge(child, child_mass[alive], child_memory)
+
+    def _negotiate(
+        self,
+        state: BatchState,
+        config: np.ndarray,
+        mass: np.ndarray,
+        policy_a: SolverPolicy,
+        policy_b: SolverPolicy,
+        totals: _Totals,
+    ) -> np.ndarray:
+        """Settle the share of each state that agrees to a settlement; return the remaining mass."""
+        eligible = np.flatnonzero((state.turn > 4) & (state.stability > 2))
+        if len(eligible) == 0:
+            return mass
+
+        mass = mass.copy()
+        sub_state = state.take(eligible)
+        sub_config = config[eligible]
+        for proposer, evaluator, proposer_is_a in ((policy_a, policy_b, True), (policy_b, policy_a, False)):
+            proposer_view = batch_view(self.tables, eligible, sub_state, sub_config, proposer_is_a)
+            evaluator_view = batch_view(self.tables, eligible, sub_state, sub_config, not proposer_is_a)
+
+            # Offers: one row per (state, offer)
+            p_offer, offered = proposer.proposal_distribution(proposer_view)
+            offer_rows = np.repeat(np.arange(len(eligible)), offered.shape[1])
+            p_offer, offered = p_offer.ravel(), offered.ravel()
+            p_accept, p_counter, counter_vp = evaluator.response_distribution(
+                evaluator_view.take(offer_rows), offered, False
+            )
+            p_accept = p_offer * p_accept
+
+            # Counters: one row per (state, offer, counter); the proposer gets counter_vp if accepted
+            p_counter = np.where(counter_vp > 0, p_offer[:, None] * p_counter, 0.0).ravel()
+            counter_rows = np.repeat(offer_rows, counter_vp.shape[1])
+            counter_vp = counter_vp.ravel()
+            live = p_counter > 0
+            p_counter, counter_rows, counter_vp = p_counter[live], counter_rows[live], counter_vp[live]
+            if len(counter_rows):
+                p_counter_accept, _, _ = proposer.response_distribution(
+                    proposer_view.take(counter_rows), counter_vp, True
+                )
+                p_counter = p_counter * p_counter_accept
+
+            rows = np.concatenate([offer_rows, counter_rows])
+            p_settle = np.concatenate([p_accept, p_counter])
+            proposer_vp = np.concatenate([100.0 - offered, counter_vp]).astype(float)
+            settling = p_settle > 0
+            if not settling.any():
+                continue
+
+            rows, p_settle, proposer_vp = rows[settling], p_settle[settling], proposer_vp[settling]
+            vp_a = proposer_vp if proposer_is_a else 100.0 - proposer_vp
+            totals.add_fixed(
+                mass[eligible[rows]] * p_settle,
+                np.full(len(rows), _END[EndingType.SETTLEMENT]),
+                vp_a,
+                100.0 - vp_a,
+                sub_state.turn[rows] - 1,
+            )
+            mass[eligible] *= 1.0 - np.bincount(rows, p_settle, minlength=len(eligible))
+
+        return mass
+
+    def _action_distribution(
+        self,
+        config: np.ndarray,
+        state: BatchState,
+        p_cooperate: np.ndarray,
+        is_player_a: bool,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Distribution over concrete actions, as BatchGameEngine._select_actions draws them.
+
+        Returns:
+            (probability, action_type, category, resource_cost) arrays of
+            shape (states, choices): cooperative choices, then competitive
+        """
+        tables = self.tables
+        position = state.position_a if is_player_a else state.position_b
+        resources = state.resources_a if is_player_a else state.resources_b
+        n = len(config)
+        width = max(tables.menu_type.shape[1], _GENERIC_WIDTH)
+        scenario_menu = tables.has_menu[config]
+        menu_rows = np.flatnonzero(scenario_menu)
+        generic_rows = np.flatnonzero(~scenario_menu)
+
+        sides = []
+        for wanted, p_wanted in ((COOPERATIVE, p_cooperate), (COMPETITIVE, 1.0 - p_cooperate)):
+            prob = np.zeros((n, width))
+            action_type = np.full((n, width), wanted, dtype=np.int8)
+            category = np.full((n, width), CAT_STANDARD, dtype=np.int8)
+            cost = np.zeros((n, width))
+
+            # Scenario menu: uniform over affordable actions of the wanted type, else any affordable
+            if len(menu_rows):
+                cfg = config[menu_rows]
+                menu_width = tables.menu_type.shape[1]
+                types = tables.menu_type[cfg]
+                affordable = tables.menu_cost[cfg] <= resources[menu_rows, None]
+                typed = affordable & (types == wanted)
+                candidates = np.where(typed.any(axis=1)[:, None], typed, affordable)
+                counts = candidates.sum(axis=1)
+                if (counts == 0).any():
+                    raise ValueError("No affordable actions available for a scenario turn")
+                prob[menu_rows, :menu_width] = candidates / counts[:, None]
+                action_type[menu_rows, :menu_width] = types
+                category[menu_rows, :menu_width] = tables.menu_category[cfg]
+                cost[menu_rows, :menu_width] = np.where(candidates, tables.menu_cost[cfg], 0.0)
+
+            # Generic menu: competitive is a standard action; cooperative adds affordable specials
+            if len(generic_rows) and wanted == COMPETITIVE:
+                prob[generic_rows, 0] = 1.0
+            elif len(generic_rows):
+                rows = generic_rows
+                risk_int = np.trunc(state.risk_level[rows])
+                num_standard = np.where(risk_int <= 3, 4, np.where(risk_int <= 6, 3, 2))
+                signal_cost = np.where(position[rows] >= 7, 0.3, np.where(position[rows] >= 4, 0.7, 1.2))
+                res = resources[rows]
+                specials = np.column_stack(
+                    [
+                        (state.turn[rows] > 4)
+                        & (state.stability[rows] > 2)
+                        & tables.settlement_available[config[rows]],
+                        res >= 0.5,
+                        res >= 0.3,
+                        res >= signal_cost,
+                    ]
+                )
+                total = num_standard + specials.sum(axis=1)
+                prob[rows, 0] = num_standard / total
+                prob[rows, 1:_GENERIC_WIDTH] = specials / total[:, None]
+                category[rows, 1:_GENERIC_WIDTH] = _SPECIAL_CATEGORIES
+                cost[rows, 1:_GENERIC_WIDTH] = np.column_stack(
+                    [np.zeros(len(rows)), np.full(len(rows), 0.5), np.full(len(rows), 0.3), signal_cost]
+                )
+
+            sides.append((prob * p_wanted[:, None], action_type, category, cost))
+
+        return tuple(np.concatenate(parts, axis=1) for parts in zip(*sides, strict=True))
+
+    def _merge(
+        self,
+        state: BatchState,
+        mass: np.ndarray,
+        memory: tuple[dict[str, np.ndarray], dict[str, np.ndarray]],
+    ) -> tuple[BatchState, np.ndarray, tuple[dict[str, np.ndarray], dict[str, np.ndarray]]]:
+        """Merge states with equal keys (the transposition table), summing their mass.
+
+        Coarsens self._grid while the merged frontier exceeds max_states.
+        """
+        if len(mass) == 0:
+            return state, mass, memory
+
+        exact = np.column_stack(
+            [getattr(state, name).astype(np.int64) for name in _DISCRETE_FIELDS]
+            + [values.astype(np.int64) for m in memory for values in m.values()]
+        )
+        continuous = np.column_stack([getattr(state, name) for name in _CONTINUOUS_FIELDS])
+        while True:
+            key = np.column_stack([exact, np.round(continuous / self._grid).astype(np.int64)])
+            _, first, inverse = np.unique(key, axis=0, return_index=True, return_inverse=True)
+            if len(first) <= self.max_states:
+                break
+            if self._grid >= _MAX_RESOLUTION:
+                raise ValueError(
+                    f"{len(first)} states remain after merging all continuous values; raise max_states "
+                    f"(currently {self.max_states})"
+                )
+            self._grid = min(self._grid * 2, _MAX_RESOLUTION)
+
+        # Merged states sit at the mass-weighted mean of their members
+        inverse = inverse.ravel()
+        merged_mass = np.bincount(inverse, mass, minlength=len(first))
+        weights = mass / merged_mass[inverse]
+        merged = state.take(first)
+        for column, name in enumerate(_CONTINUOUS_FIELDS):
+            setattr(merged, name, np.bincount(inverse, continuous[:, column] * weights, minlength=len(first)))
+        merged_memory = tuple({name: values[first] for name, values in m.items()} for m in memory)
+        return merged, merged_mass, merged_memory
+
+
+# =============================================================================
+# Policy Memory
+# =============================================================================
+
+
+def _initial_memory(policy: SolverPolicy, n: int) -> dict[str, np.ndarray]:
+    return {name: np.repeat(getattr(policy, name)[:1], n) for name in policy.memory_fields}
+
+
+def _install_memory(policy: SolverPolicy, memory: dict[str, np.ndarray]) -> None:
+    for name, values in memory.items():
+        setattr(policy, name, values)
+
+
+def _observe(
+    policy: SolverPolicy,
+    memory: dict[str, np.ndarray],
+    rows: np.ndarray,
+    opponent_action: np.ndarray,
+) -> dict[str, np.ndarray]:
+    """Memory of each successor state after the policy observes the opponent's action."""
+    if not memory:
+        return memory
+    child_memory = {name: values[rows] for name, values in memory.items()}
+    _install_memory(policy, child_memory)
+    policy.observe(np.arange(len(rows)), opponent_action)
+    return {name: getattr(policy, name) for name in memory}
+
+
+__all__ = [
+    "GameTreeSolver",
+    "SolverPolicy",
+    "SolverResult",
+]
@@ -13,19 +13,10 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from brinksmanship.models.matrices import MatrixParameters, MatrixType
-from brinksmanship.parameters import (
-    CAPTURE_RATE,
-    CC_RISK_REDUCTION,
-    DD_BURN_RATE,
-    DD_RISK_INCREASE,
-    EXPLOIT_POSITION_GAIN,
-    EXPLOIT_RISK_INCREASE,
-    SURPLUS_BASE,
-    SURPLUS_STREAK_BONUS,
-)
+from brinksmanship.parameters import DEFAULT_PARAMETERS, GameParameters
 
 if TYPE_CHECKING:
-    from brinksmanship.models.state import GameState
+    from brinksmanship.models.state import EngineState, GameState
 
 
 @dataclass(frozen=True)
@@ -851,15 +842,18 @@ def validate_all_templates() -> dict[MatrixType, tuple[bool, list[str]]]:
 # =============================================================================
 
 
-def apply_surplus_effects(state: "GameState", outcome: str) -> "GameState":
+def apply_surplus_effects(
+    state: "GameState | EngineState", outcome: str, params: GameParameters | None = None
+) -> "GameState | EngineState":
     """Apply surplus mechanics based on outcome.
 
     Implements the Joint Investment model from GAME_MANUAL.md Section 3.4.
     This function modifies the state in place and returns it.
 
     Args:
-        state: Current game state (modified in place)
+        state: Current GameState or EngineState (modified in place)
         outcome: One of "CC", "CD", "DC", "DD"
+        params: Game parameters (default: DEFAULT_PARAMETERS)
 
     Returns:
         The modified game state
@@ -888,55 +882,57 @@ def apply_surplus_effects(state: "GameState", outcome: str) -> "GameState":
             - No position change
             - Streak resets, risk spikes
     """
+    if params is None:
+        params = DEFAULT_PARAMETERS
     outcome_upper = outcome.upper()
 
     if outcome_upper == "CC":
         # Create new surplus - scales with cooperation streak
-        new_surplus = SURPLUS_BASE * (1.0 + SURPLUS_STREAK_BONUS * state.cooperation_streak)
+        new_surplus = params.surplus_for_streak(state.cooperation_streak)
         state.cooperation_surplus = state.cooperation_surplus + new_surplus
         state.cooperation_streak = state.cooperation_streak + 1
 
         # Risk decreases (situation safer)
-        new_risk = state.risk_level - CC_RISK_REDUCTION
+        new_risk = state.risk_level - params.cc_risk_reduction
         state.risk_level = max(0.0, new_risk)
 
     elif outcome_upper == "CD":
         # B captures portion of surplus
-        captured = state.cooperation_surplus * CAPTURE_RATE
+        captured = state.cooperation_surplus * params.capture_rate
         state.surplus_captured_b = state.surplus_captured_b + captured
         state.cooperation_surplus = state.cooperation_surplus - captured
 
         # Position shift toward B
-        state.position_b = min(10.0, state.player_b.position + EXPLOIT_POSITION_GAIN)
-        state.position_a = max(0.0, state.player_a.position - EXPLOIT_POSITION_GAIN)
+        state.position_b = min(10.0, state.position_b + params.exploit_position_gain)
+        state.position_a = max(0.0, state.position_a - params.exploit_position_gain)
 
         # Reset streak, increase risk
         state.cooperation_streak = 0
-        state.risk_level = min(10.0, state.risk_level + EXPLOIT_RISK_INCREASE)
+        state.risk_level = min(10.0, state.risk_level + params.exploit_risk_increase)
 
     elif outcome_upper == "DC":
         # A captures portion of surplus
-        captured = state.cooperation_surplus * CAPTURE_RATE
+        captured = state.cooperation_surplus * params.capture_rate
         state.surplus_captured_a = state.surplus_captured_a + captured
         state.cooperation_surplus = state.cooperation_surplus - captured
 
         # Position shift toward A
-        state.position_a = min(10.0, state.player_a.position + EXPLOIT_POSITION_GAIN)
-        state.position_b = max(0.0, state.player_b.position - EXPLOIT_POSITION_GAIN)
+        state.position_a = min(10.0, state.position_a + params.exploit_position_gain)
+        state.position_b = max(0.0, state.position_b - params.exploit_position_gain)
 
         # Reset streak, increase risk
         state.cooperation_streak = 0
-        state.risk_level = min(10.0, state.risk_level + EXPLOIT_RISK_INCREASE)
+        state.risk_level = min(10.0, state.risk_level + params.exploit_risk_increase)
 
     elif outcome_upper == "DD":
         # Surplus is partially destroyed (deadweight loss)
-        state.cooperation_surplus = state.cooperation_surplus * (1.0 - DD_BURN_RATE)
+        state.cooperation_surplus = state.cooperation_surplus * (1.0 - params.dd_burn_rate)
 
         # No position change
 
         # Reset streak, spike risk
         state.cooperation_streak = 0
-        state.risk_level = min(10.0, state.risk_level + DD_RISK_INCREASE)
+        state.risk_level = min(10.0, state.risk_level + params.dd_risk_increase)
 
     else:
         raise ValueError(f"Invalid outcome: {outcome}. Must be CC, CD, DC, or DD")
@@ -24,11 +24,15 @@ Expected variance scenarios (from GAME_MANUAL.md Section 7.4):
 
 from __future__ import annotations
 
-import random
 from typing import TYPE_CHECKING
 
+from brinksmanship.engine.rng import resolve_rng
+from brinksmanship.parameters import DEFAULT_PARAMETERS, GameParameters
+
 if TYPE_CHECKING:
-    from brinksmanship.models.state import GameState
+    import random
+
+    from brinksmanship.models.state import EngineState, GameState
 
 
 def clamp(value: float, min_val: float, max_val: float) -> float:
@@ -154,7 +158,7 @@ def get_act_multiplier(turn: int) -> float:
         return 1.3
 
 
-def calculate_shared_sigma(state: GameState) -> float:
+def calculate_shared_sigma(state: GameState | EngineState, params: GameParameters | None = None) -> float:
     """Calculate the shared variance (sigma) for the current game state.
 
     Formula from GAME_MANUAL.md Section 4.2:
@@ -164,7 +168,9 @@ def calculate_shared_sigma(state: GameState) -> float:
     The variance is "shared" because it affects both players equally (symmetric).
 
     Args:
-        state: Current game state
+        state: Current GameState or EngineState
+        params: Game parameters; sigma is scaled by params.variance_scale
+            (default: DEFAULT_PARAMETERS, no scaling)
 
     Returns:
         Shared sigma value (expected range ~10-40)
@@ -180,10 +186,16 @@ def calculate_shared_sigma(state: GameState) -> float:
     instability_factor = calculate_instability_factor(state.stability)
     act_multiplier = get_act_multiplier(state.turn)
 
-    return base_sigma * chaos_factor * instability_factor * act_multiplier
+    variance_scale = (params or DEFAULT_PARAMETERS).variance_scale
+    return base_sigma * chaos_factor * instability_factor * act_multiplier * variance_scale
 
 
-def final_resolution(state: GameState, seed: int | None = None) -> tuple[float, float]:
+def final_resolution(
+    state: GameState,
+    seed: int | None = None,
+    rng: random.Random | None = None,
+    params: GameParameters | None = None,
+) -> tuple[float, float]:
     """Calculate final Victory Points for both players.
 
     This implements the Final Resolution algorithm from GAME_MANUAL.md Section 6.3.
@@ -202,6 +214,8 @@ def final_resolution(state: GameState, seed: int | None = None) -> tuple[float,
     Args:
         state: Final game state at resolution
         seed: Optional random seed for reproducibility (for testing)
+        rng: Random stream to draw the noise from (takes precedence over seed)
+        params: Game parameters for the shared sigma (default: DEFAULT_PARAMETERS)
 
     Returns:
         Tuple of (vp_a, vp_b). Total can exceed 100 due to captured surplus.
@@ -213,8 +227,7 @@ def final_resolution(state: GameState, seed: int | None = None) -> tuple[float,
         >>> vp_a, vp_b = final_resolution(state, seed=42)
         >>> # Base ~60/40 + captured surplus = ~70/45
     """
-    if seed is not None:
-        random.seed(seed)
+    rng = resolve_rng(rng, seed)
 
     # Calculate expected values from position ratio
     total_pos = state.position_a + state.position_b
@@ -228,10 +241,10 @@ def final_resolution(state: GameState, seed: int | None = None) -> tuple[float,
     ev_b = 100.0 - ev_a
 
     # Calculate shared variance
-    shared_sigma = calculate_shared_sigma(state)
+    shared_sigma = calculate_shared_sigma(state, params)
 
     # Apply shared noise (symmetric: same noise affects both players)
-    noise = random.gauss(0, shared_sigma)
+    noise = rng.gauss(0, shared_sigma)
 
     vp_a_raw = ev_a + noise
     vp_b_raw = ev_b - noise  # Symmetric: both move together
@@ -7,6 +7,9 @@ The Agent SDK shells out to Claude Code CLI, which means:
 - Authentication uses your existing Claude Code auth (Max plan, API key, etc.)
 - No separate API key configuration needed
 - Full access to Claude's capabilities
+
+Calls run on warm CLI sessions from brinksmanship.llm_pool rather than
+starting a CLI process per call; each call still starts a fresh conversation.
 """
 
 import logging
@@ -19,9 +22,10 @@ from claude_agent_sdk import (
     ClaudeAgentOptions,
     ResultMessage,
     TextBlock,
-    query,
 )
 
+from brinksmanship.llm_pool import get_session_pool
+
 logger = logging.getLogger(__name__)
 
 
@@ -55,7 +59,7 @@ async def generate_text(
         )
 
     response_text = ""
-    async for message in query(prompt=prompt, options=options):
+    for message in await get_session_pool().query(prompt, options):
         if isinstance(message, AssistantMessage):
             for block in message.content:
                 if isinstance(block, TextBlock):
@@ -120,7 +124,7 @@ async def generate_json(
     response_text = ""
     structured_output = None
 
-    async for message in query(prompt=prompt, options=options):
+    for message in await get_session_pool().query(prompt, options):
         if isinstance(message, AssistantMessage):
             for block in message.content:
                 if isinstance(block, TextBlock):
@@ -194,7 +198,7 @@ async def stream_text(
 
     options = ClaudeAgentOptions(**options_kwargs)
 
-    async for message in query(prompt=prompt, options=options):
+    async for message in get_session_pool().stream(prompt, options):
         if isinstance(message, AssistantMessage):
             for block in message.content:
                 if isinstance(block, TextBlock):
@@ -248,7 +252,7 @@ async def agentic_query(
     options = ClaudeAgentOptions(**options_kwargs)
 
     response_text = ""
-    async for message in query(prompt=prompt, options=options):
+    for message in await get_session_pool().query(prompt, options):
         if isinstance(message, AssistantMessage):
             for block in message.content:
                 if isinstance(block, TextBlock):
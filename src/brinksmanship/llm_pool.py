@@ -0,0 +1,385 @@
+"""Pool of warm Claude Agent SDK sessions.
+
+Every claude_agent_sdk.query() call starts a Claude Code CLI subprocess and
+waits for it to boot before the prompt is even sent. LLM opponents make
+one to three calls per turn, so that start-up cost lands on every decision.
+
+SessionPool keeps a bounded number of connected ClaudeSDKClient sessions
+and lends them out one query at a time:
+
+- sessions are keyed by their ClaudeAgentOptions (system prompt, tools,
+  output format, ...): a query only reuses a session started with the same
+  options;
+- after each query the session's conversation is reset with /clear, so
+  every query starts fresh, as it did with query();
+- a session is closed instead of reused when its query or its /clear
+  failed (the SDK has no public liveness check, so a CLI process that
+  died shows up as a failed query), it has served max_uses queries, is
+  older than max_age or has been idle longer than max_idle seconds;
+- when max_sessions are open, a new kind of query closes the longest-idle
+  session of another kind, or waits for one to be returned.
+
+The sessions live on the pool's own event loop thread, so they survive the
+asyncio.run() that each CLI command, web request or GameRunner game makes
+and are reused across turns of a game and across games. A forked process
+starts its own sessions.
+
+Usage:
+    from brinksmanship.llm_pool import get_session_pool
+
+    messages = await get_session_pool().query("Choose an action", options)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import logging
+import os
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Coroutine
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any
+
+from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient, Message, ResultMessage
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+@dataclass
+class _Session:
+    """A connected client and its bookkeeping."""
+
+    key: str
+    client: Any
+    created: float
+    last_used: float
+    uses: int = 1
+    broken: bool = False
+
+
+class SessionPool:
+    """Bounded pool of long-lived ClaudeSDKClient sessions.
+
+    Attributes:
+        started: Sessions connected (one CLI start each)
+        reused: Queries answered by an already running session
+        recycled: Sessions closed by health checks, limits or eviction
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = 4,
+        max_uses: int = 50,
+        max_age: float = 1800.0,
+        max_idle: float = 600.0,
+        reset_timeout: float = 10.0,
+        client_factory: Callable[..., Any] = ClaudeSDKClient,
+    ):
+        """Initialize an empty pool; sessions start on first use.
+
+        Args:
+            max_sessions: Maximum number of sessions open at once
+            max_uses: Queries a session serves before it is replaced
+            max_age: Seconds after which a session is replaced
+            max_idle: Seconds a session may sit unused before it is replaced
+            reset_timeout: Seconds to wait for /clear before giving up on a session
+            client_factory: Called with options=... to create a client
+
+        Raises:
+            ValueError: If max_sessions or max_uses is less than 1
+        """
+        if max_sessions < 1:
+            raise ValueError(f"max_sessions must be at least 1, got {max_sessions}")
+        if max_uses < 1:
+            raise ValueError(f"max_uses must be at least 1, got {max_uses}")
+
+        self.max_sessions = max_sessions
+        self.max_uses = max_uses
+        self.max_age = max_age
+        self.max_idle = max_idle
+        self.reset_timeout = reset_timeout
+        self.client_factory = client_factory
+
+        self.started = 0
+        self.reused = 0
+        self.recycled = 0
+
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+        # Replaced with the loop: a Condition is bound to the loop it is first used on
+        self._changed = asyncio.Condition()
+        self._idle: dict[str, list[_Session]] = {}
+        self._size = 0
+        self._resetting: dict[str, int] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    @property
+    def idle_sessions(self) -> int:
+        """Connected sessions waiting for a query."""
+        return sum(len(sessions) for sessions in self._idle.values())
+
+    async def query(self, prompt: str, options: ClaudeAgentOptions) -> list[Message]:
+        """Send prompt on a pooled session and collect the response.
+
+        Args:
+            prompt: The prompt to send
+            options: Options the session must have been started with
+
+        Returns:
+            Every message of the response, ending with its ResultMessage
+        """
+        loop = self._ensure_loop()
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(self._collect(prompt, options), loop))
+
+    async def stream(self, prompt: str, options: ClaudeAgentOptions) -> AsyncIterator[Message]:
+        """Send prompt on a pooled session and yield messages as they arrive.
+
+        Args:
+            prompt: The prompt to send
+            options: Options the session must have been started with
+
+        Yields:
+            Messages of the response, ending with its ResultMessage
+        """
+        caller = asyncio.get_running_loop()
+        queue: asyncio.Queue[Any] = asyncio.Queue()
+
+        async def produce() -> None:
+            async with self._lease(options) as session:
+                await session.client.query(prompt)
+                async for message in session.client.receive_response():
+                    caller.call_soon_threadsafe(queue.put_nowait, message)
+
+        loop = self._ensure_loop()
+        future = asyncio.wrap_future(asyncio.run_coroutine_threadsafe(produce(), loop))
+        future.add_done_callback(lambda _: queue.put_nowait(_DONE))
+        try:
+            while (message := await queue.get()) is not _DONE:
+                yield message
+            await future
+        finally:
+            future.cancel()
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Disconnect every session and stop the pool's loop.
+
+        Call when no queries are running. The pool starts again on next use.
+
+        Args:
+            timeout: Seconds to wait for the sessions to disconnect
+        """
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            owned = self._pid == os.getpid()
+            self._loop = self._thread = self._pid = None
+        if loop is None or thread is None or not owned:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._close(), loop).result(timeout)
+        except Exception as e:
+            logger.warning(f"Error closing Claude sessions: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        if not thread.is_alive():
+            loop.close()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """The pool's event loop, started on first use (and again after fork or close)."""
+        with self._lock:
+            if self._loop is None or self._pid != os.getpid():
+                # Sessions of a parent process belong to its loop thread, which did not fork
+                self._idle, self._size, self._resetting, self._tasks = {}, 0, {}, set()
+                self._loop = asyncio.new_event_loop()
+                self._changed = asyncio.Condition()
+                self._thread = threading.Thread(target=self._loop.run_forever, name="claude-sessions", daemon=True)
+                self._thread.start()
+                self._pid = os.getpid()
+            return self._loop
+
+    async def _collect(self, prompt: str, options: ClaudeAgentOptions) -> list[Message]:
+        async with self._lease(options) as session:
+            await session.client.query(prompt)
+            return [message async for message in session.client.receive_response()]
+
+    def _lease(self, options: ClaudeAgentOptions) -> _Lease:
+        return _Lease(self, options)
+
+    async def _acquire(self, options: ClaudeAgentOptions) -> _Session:
+        """Take a healthy idle session for options, or connect a new one."""
+        key = repr(options)
+        closing = []
+        async with self._changed:
+            while True:
+                idle = self._idle.get(key, [])
+                while idle:
+                    session = idle.pop()
+                    if self._healthy(session):
+                        session.uses += 1
+                        self.reused += 1
+                        return session
+                    closing.append(self._retire(session))
+                if self._resetting.get(key):
+                    # A session for these options is clearing its conversation: much faster than a CLI start
+                    await self._changed.wait()
+                    continue
+                if self._size < self.max_sessions:
+                    self._size += 1
+                    break
+                # Full: make room by closing the longest-idle session started for other options
+                oldest = min(
+                    (s for sessions in self._idle.values() for s in sessions),
+                    key=lambda s: s.last_used,
+                    default=None,
+                )
+                if oldest is not None:
+                    self._idle[oldest.key].remove(oldest)
+                    closing.append(self._retire(oldest))
+                else:
+                    await self._changed.wait()
+
+        # Sessions closed to make room must be gone before another process starts
+        await asyncio.gather(*closing)
+        client = self.client_factory(options=options)
+        try:
+            await client.connect()
+        except BaseException:
+            self._spawn(self._disconnect(client))
+            self._size -= 1
+            self._spawn(self._notify())
+            raise
+        self.started += 1
+        now = time.monotonic()
+        return _Session(key=key, client=client, created=now, last_used=now)
+
+    def _release(self, session: _Session) -> None:
+        """Hand back a session that served a query; it is reset in the background."""
+        session.last_used = time.monotonic()
+        reusable = not session.broken and session.uses < self.max_uses and self._healthy(session)
+        if reusable:
+            self._resetting[session.key] = self._resetting.get(session.key, 0) + 1
+        self._spawn(self._return(session, reusable))
+
+    async def _return(self, session: _Session, reusable: bool) -> None:
+        """Reset the session and put it back among the idle ones, or close it."""
+        if reusable:
+            reusable = await self._reset(session)
+            self._resetting[session.key] -= 1
+        if not reusable:
+            await self._disconnect(session.client)
+        async with self._changed:
+            if reusable:
+                self._idle.setdefault(session.key, []).append(session)
+            else:
+                self._size -= 1
+                self.recycled += 1
+            self._changed.notify_all()
+
+    async def _reset(self, session: _Session) -> bool:
+        """Start a new conversation on the session; False if it did not answer."""
+        try:
+            async with asyncio.timeout(self.reset_timeout):
+                await session.client.query("/clear")
+                async for message in session.client.receive_response():
+                    if isinstance(message, ResultMessage):
+                        return not message.is_error
+        except Exception as e:
+            logger.warning(f"Claude session did not reset, closing it: {e}")
+        return False
+
+    def _healthy(self, session: _Session) -> bool:
+        """Whether the session is within its age and idle limits."""
+        now = time.monotonic()
+        return now - session.created < self.max_age and now - session.last_used < self.max_idle
+
+    def _retire(self, session: _Session) -> asyncio.Task[None]:
+        """Drop a session from the pool and disconnect it in the background."""
+        self._size -= 1
+        self.recycled += 1
+        return self._spawn(self._disconnect(session.client))
+
+    async def _disconnect(self, client: Any) -> None:
+        try:
+            await client.disconnect()
+        except Exception as e:
+            logger.warning(f"Error closing Claude session: {e}")
+
+    async def _notify(self) -> None:
+        async with self._changed:
+            self._changed.notify_all()
+
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> asyncio.Task[None]:
+        task = asyncio.get_running_loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _close(self) -> None:
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        async with self._changed:
+            sessions = [s for sessions in self._idle.values() for s in sessions]
+            self._idle.clear()
+            self._size -= len(sessions)
+        await asyncio.gather(*(self._disconnect(s.client) for s in sessions))
+
+
+class _Lease:
+    """Async context manager holding one session for one query."""
+
+    session: _Session
+
+    def __init__(self, pool: SessionPool, options: ClaudeAgentOptions):
+        self.pool = pool
+        self.options = options
+
+    async def __aenter__(self) -> _Session:
+        self.session = await self.pool._acquire(self.options)
+        return self.session
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        # A failed or cancelled query may leave a response half read: never reuse that session
+        self.session.broken = exc_type is not None
+        self.pool._release(self.session)
+
+
+_default_pool: SessionPool | None = None
+
+
+def get_session_pool() -> SessionPool:
+    """The process-wide pool used by brinksmanship.llm and the LLM opponents."""
+    if _default_pool is None:
+        return configure_session_pool()
+    return _default_pool
+
+
+def configure_session_pool(**kwargs: Any) -> SessionPool:
+    """Replace the process-wide pool, closing the current one.
+
+    Args:
+        **kwargs: SessionPool arguments (max_sessions, max_uses, ...)
+
+    Returns:
+        The new pool
+    """
+    global _default_pool
+    if _default_pool is not None:
+        _default_pool.close()
+        atexit.unregister(_default_pool.close)
+    _default_pool = SessionPool(**kwargs)
+    atexit.register(_default_pool.close)
+    return _default_pool
+
+
+__all__ = ["SessionPool", "configure_session_pool", "get_session_pool"]
@@ -38,10 +38,12 @@ from .actions import (
 )
 from .state import (
     ActionResult,
+    EngineState,
     GameState,
     InformationState,
     PlayerState,
     apply_action_result,
+    apply_action_result_in_place,
     clamp,
     update_cooperation_score,
     update_stability,
@@ -56,6 +58,7 @@ __all__ = [
     "ActionMenu",
     # State Models
     "GameState",
+    "EngineState",
     "PlayerState",
     "InformationState",
     "ActionResult",
@@ -72,6 +75,7 @@ __all__ = [
     "validate_action_availability",
     # State Functions
     "apply_action_result",
+    "apply_action_result_in_place",
     "clamp",
     "update_cooperation_score",
     "update_stability",
@@ -11,6 +11,7 @@ See ENGINEERING_DESIGN.md Milestone 1.2 for implementation details.
 
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Protocol, runtime_checkable
 
 from pydantic import BaseModel, ConfigDict, field_validator, model_validator
@@ -880,11 +881,16 @@ CONSTRUCTORS: dict[MatrixType, type[MatrixConstructor]] = {
 }
 
 
+@lru_cache(maxsize=1024)
 def build_matrix(matrix_type: MatrixType, params: MatrixParameters) -> PayoffMatrix:
     """Build a payoff matrix from type and parameters.
 
     This is the main entry point for matrix construction.
     Raises ValueError if parameters violate the game type's constraints.
+
+    Results are memoized on (matrix_type, params); both are immutable, as is
+    the returned PayoffMatrix, so callers share one instance per distinct
+    pair. Invalid parameters are not cached and raise on every call.
     """
     constructor = CONSTRUCTORS.get(matrix_type)
     if constructor is None:
@@ -12,16 +12,36 @@ Key formulas from GAME_MANUAL.md:
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
 from pydantic import BaseModel, Field, field_validator, model_validator
 
 from brinksmanship.models.actions import ActionType
 
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
 
 def clamp(value: float, min_val: float, max_val: float) -> float:
     """Clamp a value to the specified range."""
     return max(min_val, min(max_val, value))
 
 
+def _construct(model_cls: type[_ModelT], values: dict) -> _ModelT:
+    """Build a model from already-valid values for every field.
+
+    Equivalent to model_cls.model_construct(**values) for the state models
+    here (no aliases, extras or private attributes), without its per-field
+    default lookup. Takes ownership of values.
+    """
+    model = model_cls.__new__(model_cls)
+    object.__setattr__(model, "__dict__", values)
+    object.__setattr__(model, "__pydantic_fields_set__", set(values))
+    object.__setattr__(model, "__pydantic_extra__", None)
+    object.__setattr__(model, "__pydantic_private__", None)
+    return model
+
+
 class InformationState(BaseModel):
     """What one player knows about the other.
 
@@ -77,6 +97,10 @@ class InformationState(BaseModel):
             radius = (self.resources_bounds[1] - self.resources_bounds[0]) / 2
             return midpoint, radius
 
+    def fast_copy(self) -> InformationState:
+        """Independent copy; all fields are immutable, so a shallow copy suffices."""
+        return _construct(InformationState, self.__dict__.copy())
+
     def update_position(self, position: float, turn: int) -> None:
         """Update known position from successful reconnaissance."""
         self.known_position = position
@@ -326,6 +350,209 @@ class GameState(BaseModel):
         return cls.model_validate(data)
 
 
+# EngineState field values in declaration order, information states as tuples of their field values
+EngineStateTuple = tuple[
+    float,
+    float,
+    float,
+    float,
+    ActionType | None,
+    ActionType | None,
+    float,
+    float,
+    float,
+    int,
+    int,
+    float,
+    float,
+    float,
+    int,
+    tuple[Any, ...],
+    tuple[Any, ...],
+]
+
+
+@dataclass(slots=True)
+class EngineState:
+    """Compact mutable game state for the engine hot path.
+
+    Same values as GameState, flattened into one slotted object with no
+    validation or nested models. GameEngine updates it in place each turn
+    and converts to GameState only at API boundaries. Callers are
+    responsible for keeping values in range (the update functions clamp).
+
+    The field names match GameState's flat accessors, so functions that
+    only read or assign those (update_stability, apply_surplus_effects,
+    calculate_shared_sigma) accept either type.
+    """
+
+    position_a: float = 5.0
+    position_b: float = 5.0
+    resources_a: float = 5.0
+    resources_b: float = 5.0
+    previous_type_a: ActionType | None = None
+    previous_type_b: ActionType | None = None
+    cooperation_score: float = 5.0
+    stability: float = 5.0
+    risk_level: float = 2.0
+    turn: int = 1
+    max_turns: int = 14
+    cooperation_surplus: float = 0.0
+    surplus_captured_a: float = 0.0
+    surplus_captured_b: float = 0.0
+    cooperation_streak: int = 0
+    information_a: InformationState = field(default_factory=InformationState)
+    information_b: InformationState = field(default_factory=InformationState)
+
+    @classmethod
+    def from_game_state(cls, state: GameState, copy_information: bool = True) -> EngineState:
+        """Flatten a GameState.
+
+        Args:
+            state: State to convert
+            copy_information: Copy the information states; if False they are
+                shared with the GameState, so updates are visible through both
+        """
+        info_a, info_b = state.player_a.information, state.player_b.information
+        if copy_information:
+            info_a, info_b = info_a.fast_copy(), info_b.fast_copy()
+        return cls(
+            position_a=state.player_a.position,
+            position_b=state.player_b.position,
+            resources_a=state.player_a.resources,
+            resources_b=state.player_b.resources,
+            previous_type_a=state.player_a.previous_type,
+            previous_type_b=state.player_b.previous_type,
+            cooperation_score=state.cooperation_score,
+            stability=state.stability,
+            risk_level=state.risk_level,
+            turn=state.turn,
+            max_turns=state.max_turns,
+            cooperation_surplus=state.cooperation_surplus,
+            surplus_captured_a=state.surplus_captured_a,
+            surplus_captured_b=state.surplus_captured_b,
+            cooperation_streak=state.cooperation_streak,
+            information_a=info_a,
+            information_b=info_b,
+        )
+
+    def to_game_state(self, copy_information: bool = True) -> GameState:
+        """Build the equivalent GameState without re-running validation.
+
+        Args:
+            copy_information: Copy the information states; if False they are
+                shared with this EngineState
+        """
+        info_a, info_b = self.information_a, self.information_b
+        if copy_information:
+            info_a, info_b = info_a.fast_copy(), info_b.fast_copy()
+        player_a = {
+            "position": self.position_a,
+            "resources": self.resources_a,
+            "previous_type": self.previous_type_a,
+            "information": info_a,
+        }
+        player_b = {
+            "position": self.position_b,
+            "resources": self.resources_b,
+            "previous_type": self.previous_type_b,
+            "information": info_b,
+        }
+        return _construct(
+            GameState,
+            {
+                "player_a": _construct(PlayerState, player_a),
+                "player_b": _construct(PlayerState, player_b),
+                "cooperation_score": self.cooperation_score,
+                "stability": self.stability,
+                "risk_level": self.risk_level,
+                "turn": self.turn,
+                "max_turns": self.max_turns,
+                "cooperation_surplus": self.cooperation_surplus,
+                "surplus_captured_a": self.surplus_captured_a,
+                "surplus_captured_b": self.surplus_captured_b,
+                "cooperation_streak": self.cooperation_streak,
+            },
+        )
+
+    def copy(self, copy_information: bool = True) -> EngineState:
+        """Independent copy of the state.
+
+        Args:
+            copy_information: Copy the information states; if False they are
+                shared with the copy (safe only while neither side updates
+                them in place)
+        """
+        info_a, info_b = self.information_a, self.information_b
+        if copy_information:
+            info_a, info_b = info_a.fast_copy(), info_b.fast_copy()
+        return EngineState(
+            self.position_a,
+            self.position_b,
+            self.resources_a,
+            self.resources_b,
+            self.previous_type_a,
+            self.previous_type_b,
+            self.cooperation_score,
+            self.stability,
+            self.risk_level,
+            self.turn,
+            self.max_turns,
+            self.cooperation_surplus,
+            self.surplus_captured_a,
+            self.surplus_captured_b,
+            self.cooperation_streak,
+            info_a,
+            info_b,
+        )
+
+    def to_tuple(self) -> EngineStateTuple:
+        """Immutable snapshot of every field, in declaration order.
+
+        Information states are included as tuples of their field values, so
+        later in-place updates do not leak into the snapshot.
+        """
+        return (
+            self.position_a,
+            self.position_b,
+            self.resources_a,
+            self.resources_b,
+            self.previous_type_a,
+            self.previous_type_b,
+            self.cooperation_score,
+            self.stability,
+            self.risk_level,
+            self.turn,
+            self.max_turns,
+            self.cooperation_surplus,
+            self.surplus_captured_a,
+            self.surplus_captured_b,
+            self.cooperation_streak,
+            tuple(self.information_a.__dict__.values()),
+            tuple(self.information_b.__dict__.values()),
+        )
+
+    @classmethod
+    def from_tuple(cls, values: EngineStateTuple) -> EngineState:
+        """Rebuild an EngineState from to_tuple output."""
+        info_fields = InformationState.model_fields
+        return cls(
+            *values[:15],
+            _construct(InformationState, dict(zip(info_fields, values[15], strict=True))),
+            _construct(InformationState, dict(zip(info_fields, values[16], strict=True))),
+        )
+
+    @property
+    def act_multiplier(self) -> float:
+        """Act multiplier for state deltas and variance (see GameState.act_multiplier)."""
+        if self.turn <= 4:
+            return 0.7
+        elif self.turn <= 8:
+            return 1.0
+        else:
+            return 1.3
+
+
 class ActionResult(BaseModel):
     """Result of resolving a turn's actions.
 
@@ -382,7 +609,7 @@ class ActionResult(BaseModel):
         return not self.is_mutual_cooperation and not self.is_mutual_defection
 
 
-def update_cooperation_score(state: GameState, result: ActionResult) -> float:
+def update_cooperation_score(state: GameState | EngineState, result: ActionResult) -> float:
     """Calculate new cooperation score after a turn.
 
     From GAME_MANUAL.md:
@@ -407,7 +634,7 @@ def update_cooperation_score(state: GameState, result: ActionResult) -> float:
     return clamp(state.cooperation_score + delta, 0.0, 10.0)
 
 
-def update_stability(state: GameState, result: ActionResult) -> float:
+def update_stability(state: GameState | EngineState, result: ActionResult) -> float:
     """Calculate new stability after a turn.
 
     From GAME_MANUAL.md (decay-based formula):
@@ -475,41 +702,38 @@ def apply_action_result(state: GameState, result: ActionResult) -> GameState:
     Returns:
         New game state with all changes applied
     """
-    act_mult = state.act_multiplier
+    engine_state = EngineState.from_game_state(state)
+    apply_action_result_in_place(engine_state, result)
+    return engine_state.to_game_state(copy_information=False)
 
-    # Calculate new values
-    new_position_a = clamp(state.position_a + (result.position_delta_a * act_mult), 0.0, 10.0)
-    new_position_b = clamp(state.position_b + (result.position_delta_b * act_mult), 0.0, 10.0)
-    new_resources_a = clamp(state.resources_a - result.resource_cost_a, 0.0, 10.0)
-    new_resources_b = clamp(state.resources_b - result.resource_cost_b, 0.0, 10.0)
-    new_risk = clamp(state.risk_level + (result.risk_delta * act_mult), 0.0, 10.0)
 
-    # Calculate cooperation and stability updates
+def apply_action_result_in_place(state: EngineState, result: ActionResult) -> EngineState:
+    """Apply an action result to an EngineState, modifying it in place.
+
+    Same update as apply_action_result, without building new models.
+    Surplus fields are left unchanged (see apply_surplus_effects).
+
+    Args:
+        state: Current engine state (modified in place)
+        result: Result to apply
+
+    Returns:
+        The modified engine state
+    """
+    act_mult = state.act_multiplier
+
+    # Cooperation and stability read the previous action types, so compute first
     new_cooperation = update_cooperation_score(state, result)
     new_stability = update_stability(state, result)
 
-    # Create new state
-    return GameState(
-        player_a=PlayerState(
-            position=new_position_a,
-            resources=new_resources_a,
-            previous_type=result.action_a,
-            information=state.player_a.information.model_copy(deep=True),
-        ),
-        player_b=PlayerState(
-            position=new_position_b,
-            resources=new_resources_b,
-            previous_type=result.action_b,
-            information=state.player_b.information.model_copy(deep=True),
-        ),
-        cooperation_score=new_cooperation,
-        stability=new_stability,
-        risk_level=new_risk,
-        turn=state.turn + 1,
-        max_turns=state.max_turns,
-        # Preserve surplus fields (actual mechanics implemented in T04)
-        cooperation_surplus=state.cooperation_surplus,
-        surplus_captured_a=state.surplus_captured_a,
-        surplus_captured_b=state.surplus_captured_b,
-        cooperation_streak=state.cooperation_streak,
-    )
+    state.position_a = clamp(state.position_a + (result.position_delta_a * act_mult), 0.0, 10.0)
+    state.position_b = clamp(state.position_b + (result.position_delta_b * act_mult), 0.0, 10.0)
+    state.resources_a = clamp(state.resources_a - result.resource_cost_a, 0.0, 10.0)
+    state.resources_b = clamp(state.resources_b - result.resource_cost_b, 0.0, 10.0)
+    state.risk_level = clamp(state.risk_level + (result.risk_delta * act_mult), 0.0, 10.0)
+    state.cooperation_score = new_cooperation
+    state.stability = new_stability
+    state.previous_type_a = result.action_a
+    state.previous_type_b = result.action_b
+    state.turn += 1
+    return state
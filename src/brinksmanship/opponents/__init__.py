@@ -17,6 +17,10 @@ from brinksmanship.opponents.base import (
     get_opponent_by_type,
     list_opponent_types,
 )
+from brinksmanship.opponents.batch_policies import (
+    BATCH_POLICIES,
+    DeterministicBatchPolicy,
+)
 from brinksmanship.opponents.deterministic import (
     DeterministicOpponent,
     Erratic,
@@ -57,6 +61,9 @@ __all__ = [
     "Erratic",
     "TitForTat",
     "GrimTrigger",
+    # Vectorized deterministic policies (BatchGameEngine)
+    "BATCH_POLICIES",
+    "DeterministicBatchPolicy",
     # Historical personas
     "HistoricalPersona",
     "PERSONA_DISPLAY_NAMES",
@@ -6,6 +6,7 @@ along with settlement-related dataclasses and factory functions.
 See ENGINEERING_DESIGN.md Milestone 4.1 for specification.
 """
 
+import random
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Literal
@@ -92,6 +93,9 @@ class Opponent(ABC):
             name: Display name for the opponent
         """
         self.name = name
+        # Stream for every random choice this opponent makes; runners
+        # replace it with a per-game stream (see brinksmanship.engine.rng)
+        self.rng = random.Random()
         self._history: list[tuple[Action, Action, ActionResult]] = []
 
     @abstractmethod
@@ -0,0 +1,357 @@
+"""Vectorized deterministic opponents for BatchGameEngine.
+
+Each policy here is the struct-of-arrays counterpart of one class in
+brinksmanship.opponents.deterministic: the same decision rules, thresholds
+and probabilities, evaluated for many games at once. Settlement thresholds
+are read from the scalar classes so the two implementations stay in sync.
+
+Policies decide whether to cooperate; BatchGameEngine then picks a concrete
+action of that type from the turn's menu, as
+DeterministicOpponent._select_random_from_type does.
+
+Each policy also states its decisions as probabilities
+(cooperate_probability, proposal_distribution, response_distribution) so
+the exact solver in brinksmanship.engine.solver can weight every branch
+instead of sampling.
+"""
+
+from __future__ import annotations
+
+from typing import ClassVar
+
+import numpy as np
+
+from brinksmanship.engine.batch_engine import COMPETITIVE, BatchView
+from brinksmanship.opponents.deterministic import (
+    DeterministicOpponent,
+    Erratic,
+    GrimTrigger,
+    NashCalculator,
+    Opportunist,
+    SecuritySeeker,
+    TitForTat,
+)
+
+
+class DeterministicBatchPolicy:
+    """Base class for vectorized deterministic opponents.
+
+    Subclasses set opponent_class and implement choose_cooperative and
+    propose_settlement; evaluate_settlement defaults to
+    DeterministicOpponent.evaluate_settlement.
+    """
+
+    opponent_class: ClassVar[type[DeterministicOpponent]]
+
+    # Per-game state arrays (indexed by game, updated by observe) that the
+    # solver must carry along with each game state
+    memory_fields: ClassVar[tuple[str, ...]] = ()
+
+    # Deterministic opponents pick a random action of the chosen type
+    first_action: ClassVar[bool] = False
+
+    def __init__(self, num_games: int, is_player_a: bool):
+        """Initialize the policy.
+
+        Args:
+            num_games: Number of games in the batch (size of per-game state)
+            is_player_a: True if this policy plays player A
+        """
+        self.num_games = num_games
+        self.is_player_a = is_player_a
+        self.name = self.opponent_class().name
+        self.settlement_threshold = self.opponent_class.settlement_threshold
+        self.counter_threshold = self.opponent_class.counter_threshold
+        self.counter_adjustment = self.opponent_class.counter_adjustment
+
+    def choose_cooperative(self, view: BatchView, rng: np.random.Generator) -> np.ndarray:
+        """Return True where the policy plays a cooperative action."""
+        raise NotImplementedError("Subclasses must implement choose_cooperative")
+
+    def cooperate_probability(self, view: BatchView) -> np.ndarray:
+        """Probability that choose_cooperative returns True for each game."""
+        raise NotImplementedError("Subclasses must implement cooperate_probability")
+
+    def observe(self, idx: np.ndarray, opponent_action: np.ndarray) -> None:
+        """Receive the opponent's resolved action type (receive_result)."""
+
+    def propose_settlement(self, view: BatchView, rng: np.random.Generator) -> tuple[np.ndarray, np.ndarray]:
+        """Return (proposing mask, offered VP)."""
+        return np.zeros(len(view), dtype=bool), np.zeros(len(view), dtype=np.int64)
+
+    def evaluate_settlement(
+        self,
+        view: BatchView,
+        offered_vp: np.ndarray,
+        is_final_offer: bool,
+        rng: np.random.Generator,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return (accept mask, counter mask, counter VP).
+
+        Accept if the offer is within threshold of fair value.
+        """
+        fair_vp = view.fair_vp()
+        vp_diff = (100 - offered_vp) - fair_vp
+
+        accept = vp_diff >= self.settlement_threshold
+        counter = ~accept & (vp_diff >= self.counter_threshold) & (not is_final_offer)
+        counter_vp = np.clip(np.trunc(fair_vp + self.counter_adjustment), 20, 80).astype(np.int64)
+        return accept, counter, np.where(counter, counter_vp, 0)
+
+    def proposal_distribution(self, view: BatchView) -> tuple[np.ndarray, np.ndarray]:
+        """Return (probability, offered VP) arrays of shape (games, offers).
+
+        Defaults to propose_settlement, for policies that propose deterministically.
+        """
+        proposing, offered = self.propose_settlement(view, None)
+        return proposing.astype(float)[:, None], np.asarray(offered)[:, None]
+
+    def response_distribution(
+        self,
+        view: BatchView,
+        offered_vp: np.ndarray,
+        is_final_offer: bool,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return (accept probability, counter probabilities, counter VPs).
+
+        Counter arrays have shape (games, counters). Defaults to
+        evaluate_settlement, for policies that respond deterministically.
+        """
+        accept, counter, counter_vp = self.evaluate_settlement(view, offered_vp, is_final_offer, None)
+        return accept.astype(float), counter.astype(float)[:, None], counter_vp[:, None]
+
+
+class BatchNashCalculator(DeterministicBatchPolicy):
+    """Vectorized NashCalculator."""
+
+    opponent_class = NashCalculator
+
+    def choose_cooperative(self, view: BatchView, rng: np.random.Generator) -> np.ndarray:
+        u_risk, u_position = rng.random(len(view)), rng.random(len(view))
+
+        # Ahead or even: press advantage; behind: 60% competitive hedge
+        cooperative = np.where(view.my_position >= view.opponent_position, False, u_position >= 0.6)
+
+        # Elevated risk: 60% chance to de-escalate; extreme risk: always (if possible)
+        elevated = (view.risk_level >= 6) & (view.risk_level < 8)
+        cooperative |= elevated & (u_risk < 0.6)
+        cooperative |= (view.risk_level >= 8) & view.has_cooperative_action
+        return cooperative
+
+    def cooperate_probability(self, view: BatchView) -> np.ndarray:
+        p = np.where(view.my_position >= view.opponent_position, 0.0, 0.4)
+        elevated = (view.risk_level >= 6) & (view.risk_level < 8)
+        p = 1.0 - (1.0 - p) * (1.0 - 0.6 * elevated)
+        return np.where((view.risk_level >= 8) & view.has_cooperative_action, 1.0, p)
+
+    def propose_settlement(self, view: BatchView, rng: np.random.Generator) -> tuple[np.ndarray, np.ndarray]:
+        clearly_ahead = (view.my_position > view.opponent_position + 1.0) & (view.risk_level >= 3)
+        high_risk = view.risk_level >= 5
+        return clearly_ahead | high_risk, view.fair_vp()
+
+
+class BatchSecuritySeeker(DeterministicBatchPolicy):
+    """Vectorized SecuritySeeker."""
+
+    opponent_class = SecuritySeeker
+
+    def choose_cooperative(self, view: BatchView, rng: np.random.Generator) -> np.ndarray:
+        # Defensive escalation (60%) against a competitive opponent, unless risk is high
+        retaliate = (view.opponent_previous_type == COMPETITIVE) & (rng.random(len(view)) < 0.6)
+        return (view.risk_level >= 7) | ~retaliate
+
+    def cooperate_probability(self, view: BatchView) -> np.ndarray:
+        p = np.where(view.opponent_previous_type == COMPETITIVE, 0.4, 1.0)
+        return np.where(view.risk_level >= 7, 1.0, p)
+
+    def propose_settlement(self, view: BatchView, rng: np.random.Generator) -> tuple[np.ndarray, np.ndarray]:
+        proposing = ~((view.risk_level < 3) & (view.turn < 7))
+        return proposing, np.maximum(20, view.fair_vp() - 5)
+
+
+class BatchOpportunist(DeterministicBatchPolicy):
+    """Vectorized Opportunist."""
+
+    opponent_class = Opportunist
+
+    def choose_cooperative(self, view: BatchView, rng: np.random.Generator) -> np.ndarray:
+        u_risk, u_position = rng.random(len(view)), rng.random(len(view))
+        advantage = view.my_position - view.opponent_position
+
+        # Clearly ahead: press; far behind: 60% regroup; even: 60% probe
+        cooperative = np.where(
+            advantage >= 1.0,
+            False,
+            np.where(advantage <= -1.5, u_position < 0.6, u_position >= 0.6),
+        )
+        cooperative |= (view.risk_level >= 5) & (view.risk_level < 7) & (u_risk < 0.4)
+        cooperative |= view.risk_level >= 7
+        return cooperative
+
+    def cooperate_probability(self, view: BatchView) -> np.ndarray:
+        advantage = view.my_position - view.opponent_position
+        p = np.where(advantage >= 1.0, 0.0, np.where(advantage <= -1.5, 0.6, 0.4))
+        probing = (view.risk_level >= 5) & (view.risk_level < 7)
+        p = 1.0 - (1.0 - p) * (1.0 - 0.4 * probing)
+        return np.where(view.risk_level >= 7, 1.0, p)
+
+    def propose_settlement(self, view: BatchView, rng: np.random.Generator) -> tuple[np.ndarray, np.ndarray]:
+        significantly_ahead = view.my_position > view.opponent_position + 2.0
+        high_risk_advantage = (view.risk_level >= 6) & (view.my_position >= view.opponent_position)
+        return significantly_ahead | high_risk_advantage, np.minimum(80, view.fair_vp() + 5)
+
+
+class BatchErratic(DeterministicBatchPolicy):
+    """Vectorized Erratic."""
+
+    opponent_class = Erratic
+
+    def choose_cooperative(self, view: BatchView, rng: np.random.Generator) -> np.ndarray:
+        u_survival, u_normal = rng.random(len(view)), rng.random(len(view))
+        return ((view.risk_level >= 8) & (u_survival < 0.7)) | (u_normal < 0.4)
+
+    def cooperate_probability(self, view: BatchView) -> np.ndarray:
+        return 1.0 - (1.0 - 0.7 * (view.risk_level >= 8)) * 0.6
+
+    def propose_settlement(self, view: BatchView, rng: np.random.Generator) -> tuple[np.ndarray, np.ndarray]:
+        proposing = rng.random(len(view)) < 0.2
+        deviation = rng.integers(-15, 16, size=len(view))
+        return proposing, np.clip(view.fair_vp() + deviation, 20, 80)
+
+    def evaluate_settlement(
+        self,
+        view: BatchView,
+        offered_vp: np.ndarray,
+        is_final_offer: bool,
+        rng: np.random.Generator,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # ~40% accept, ~30% counter, ~30% reject regardless of fairness
+        roll = rng.random(len(view))
+        accept = roll < 0.4
+        counter = ~accept & (roll < 0.7) & (not is_final_offer)
+        counter_vp = rng.integers(30, 71, size=len(view))
+        return accept, counter, np.where(counter, counter_vp, 0)
+
+    def proposal_distribution(self, view: BatchView) -> tuple[np.ndarray, np.ndarray]:
+        deviations = np.arange(-15, 16)
+        offered = np.clip(view.fair_vp()[:, None] + deviations, 20, 80)
+        return np.full(offered.shape, 0.2 / len(deviations)), offered
+
+    def response_distribution(
+        self,
+        view: BatchView,
+        offered_vp: np.ndarray,
+        is_final_offer: bool,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        counter_vp = np.broadcast_to(np.arange(30, 71), (len(view), 41))
+        p_counter = 0.0 if is_final_offer else 0.3 / 41
+        return np.full(len(view), 0.4), np.full(counter_vp.shape, p_counter), counter_vp
+
+
+class BatchTitForTat(DeterministicBatchPolicy):
+    """Vectorized TitForTat."""
+
+    opponent_class = TitForTat
+
+    def choose_cooperative(self, view: BatchView, rng: np.random.Generator) -> np.ndarray:
+        # Cooperate first, then mirror
+        return view.opponent_previous_type != COMPETITIVE
+
+    def cooperate_probability(self, view: BatchView) -> np.ndarray:
+        return (view.opponent_previous_type != COMPETITIVE).astype(float)
+
+    def propose_settlement(self, view: BatchView, rng: np.random.Generator) -> tuple[np.ndarray, np.ndarray]:
+        good_cooperation = (view.cooperation_score >= 5) & (view.risk_level >= 2)
+        late_game = view.turn >= 8
+        return good_cooperation | late_game, view.fair_vp()
+
+    def evaluate_settlement(
+        self,
+        view: BatchView,
+        offered_vp: np.ndarray,
+        is_final_offer: bool,
+        rng: np.random.Generator,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # More generous with high cooperation, risk and late turns
+        coop_bonus = np.maximum(0, (view.cooperation_score - 5) * 2)
+        risk_bonus = np.maximum(0, (view.risk_level - 4) * 2)
+        turn_bonus = np.maximum(0, view.turn - 6)
+        effective_threshold = self.settlement_threshold - coop_bonus - risk_bonus - turn_bonus
+
+        fair_vp = view.fair_vp()
+        vp_diff = (100 - offered_vp) - fair_vp
+        accept = vp_diff >= effective_threshold
+        counter = ~accept & (vp_diff >= self.counter_threshold - risk_bonus) & (not is_final_offer)
+        counter_vp = np.clip(np.trunc(fair_vp + self.counter_adjustment), 20, 80).astype(np.int64)
+        return accept, counter, np.where(counter, counter_vp, 0)
+
+
+class BatchGrimTrigger(DeterministicBatchPolicy):
+    """Vectorized GrimTrigger, with per-game trigger state."""
+
+    opponent_class = GrimTrigger
+    memory_fields = ("triggered",)
+
+    def __init__(self, num_games: int, is_player_a: bool):
+        super().__init__(num_games, is_player_a)
+        self.triggered = np.zeros(num_games, dtype=bool)
+
+    def observe(self, idx: np.ndarray, opponent_action: np.ndarray) -> None:
+        self.triggered[idx] |= opponent_action == COMPETITIVE
+
+    def choose_cooperative(self, view: BatchView, rng: np.random.Generator) -> np.ndarray:
+        self.triggered[view.idx] |= view.opponent_previous_type == COMPETITIVE
+        triggered = self.triggered[view.idx]
+
+        # Punishment mode, except a 70% survival instinct at extreme risk
+        survival = (view.risk_level >= 8) & (rng.random(len(view)) < 0.7)
+        return ~triggered | survival
+
+    def cooperate_probability(self, view: BatchView) -> np.ndarray:
+        triggered = self.triggered[view.idx] | (view.opponent_previous_type == COMPETITIVE)
+        return np.where(triggered, 0.7 * (view.risk_level >= 8), 1.0)
+
+    def propose_settlement(self, view: BatchView, rng: np.random.Generator) -> tuple[np.ndarray, np.ndarray]:
+        good_cooperation = view.cooperation_score >= 5
+        trust_held_long = view.turn >= 8
+        proposing = ~self.triggered[view.idx] & (good_cooperation | trust_held_long)
+        return proposing, view.fair_vp()
+
+    def evaluate_settlement(
+        self,
+        view: BatchView,
+        offered_vp: np.ndarray,
+        is_final_offer: bool,
+        rng: np.random.Generator,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        accept, counter, counter_vp = super().evaluate_settlement(view, offered_vp, is_final_offer, rng)
+
+        # After betrayal: no counters, accept only fair offers at extreme risk
+        triggered = self.triggered[view.idx]
+        self_preservation = (view.risk_level >= 7) & ((100 - offered_vp) >= view.fair_vp() - 5)
+        accept = np.where(triggered, self_preservation, accept)
+        counter &= ~triggered
+        return accept, counter, np.where(counter, counter_vp, 0)
+
+
+# Registry keyed like DETERMINISTIC_OPPONENTS
+BATCH_POLICIES: dict[str, type[DeterministicBatchPolicy]] = {
+    "NashCalculator": BatchNashCalculator,
+    "SecuritySeeker": BatchSecuritySeeker,
+    "Opportunist": BatchOpportunist,
+    "Erratic": BatchErratic,
+    "TitForTat": BatchTitForTat,
+    "GrimTrigger": BatchGrimTrigger,
+}
+
+
+__all__ = [
+    "BATCH_POLICIES",
+    "DeterministicBatchPolicy",
+    "BatchNashCalculator",
+    "BatchSecuritySeeker",
+    "BatchOpportunist",
+    "BatchErratic",
+    "BatchTitForTat",
+    "BatchGrimTrigger",
+]
@@ -10,7 +10,6 @@ See GAME_MANUAL.md for game mechanics.
 
 from __future__ import annotations
 
-import random
 from typing import TYPE_CHECKING, ClassVar
 
 from brinksmanship.models.actions import Action, ActionType
@@ -100,9 +99,9 @@ class DeterministicOpponent(Opponent):
         """
         typed_actions = [a for a in available_actions if a.action_type == action_type]
         if typed_actions:
-            return random.choice(typed_actions)
+            return self.rng.choice(typed_actions)
         # Fallback to any action
-        return random.choice(available_actions)
+        return self.rng.choice(available_actions)
 
     async def choose_action(self, state: GameState, available_actions: list[Action]) -> Action:
         """Choose action - must be overridden by subclasses.
@@ -208,10 +207,10 @@ class NashCalculator(DeterministicOpponent):
         if state.risk_level >= 8:
             coop_actions = self._get_cooperative_actions(available_actions)
             if coop_actions:
-                return random.choice(coop_actions)
+                return self.rng.choice(coop_actions)
         elif state.risk_level >= 6:
             # Elevated risk: 60% chance to de-escalate
-            if random.random() < 0.6:
+            if self.rng.random() < 0.6:
                 return self._select_random_from_type(available_actions, ActionType.COOPERATIVE)
 
         # Standard Nash reasoning: defection is typically dominant or risk-dominant
@@ -222,7 +221,7 @@ class NashCalculator(DeterministicOpponent):
         else:
             # Behind: still defect (Nash), but less aggressively
             # 60% competitive, 40% cooperative (hedge)
-            if random.random() < 0.6:
+            if self.rng.random() < 0.6:
                 return self._select_random_from_type(available_actions, ActionType.COMPETITIVE)
             else:
                 return self._select_random_from_type(available_actions, ActionType.COOPERATIVE)
@@ -300,7 +299,7 @@ class SecuritySeeker(DeterministicOpponent):
         if opponent_prev == ActionType.COMPETITIVE:
             # Defensive escalation - but not always
             # 60% respond competitively, 40% try to break the spiral
-            if random.random() < 0.6:
+            if self.rng.random() < 0.6:
                 return self._select_random_from_type(available_actions, ActionType.COMPETITIVE)
             else:
                 return self._select_random_from_type(available_actions, ActionType.COOPERATIVE)
@@ -373,7 +372,7 @@ class Opportunist(DeterministicOpponent):
             return self._select_random_from_type(available_actions, ActionType.COOPERATIVE)
         elif state.risk_level >= 5:
             # Elevated risk: 40% chance to de-escalate
-            if random.random() < 0.4:
+            if self.rng.random() < 0.4:
                 return self._select_random_from_type(available_actions, ActionType.COOPERATIVE)
 
         # Check if we're ahead
@@ -384,14 +383,14 @@ class Opportunist(DeterministicOpponent):
             return self._select_random_from_type(available_actions, ActionType.COMPETITIVE)
         elif position_advantage <= -1.5:
             # Significantly behind: tactical cooperation to regroup
-            if random.random() < 0.6:
+            if self.rng.random() < 0.6:
                 return self._select_random_from_type(available_actions, ActionType.COOPERATIVE)
             else:
                 return self._select_random_from_type(available_actions, ActionType.COMPETITIVE)
         else:
             # Roughly even: probe for weakness
             # 60% competitive, 40% cooperative (feel out opponent)
-            if random.random() < 0.6:
+            if self.rng.random() < 0.6:
                 return self._select_random_from_type(available_actions, ActionType.COMPETITIVE)
             else:
                 return self._select_random_from_type(available_actions, ActionType.COOPERATIVE)
@@ -456,11 +455,11 @@ class Erratic(DeterministicOpponent):
         # Survival instinct at very high risk
         if state.risk_level >= 8:
             # 70% chance to cooperate at extreme risk
-            if random.random() < 0.7:
+            if self.rng.random() < 0.7:
                 return self._select_random_from_type(available_actions, ActionType.COOPERATIVE)
 
         # Normal erratic behavior: 40% cooperative, 60% competitive
-        if random.random() < 0.4:
+        if self.rng.random() < 0.4:
             return self._select_random_from_type(available_actions, ActionType.COOPERATIVE)
         else:
             return self._select_random_from_type(available_actions, ActionType.COMPETITIVE)
@@ -475,13 +474,13 @@ class Erratic(DeterministicOpponent):
 
         ~40% accept, ~30% counter, ~30% reject regardless of fairness.
         """
-        roll = random.random()
+        roll = self.rng.random()
         if roll < 0.4:
             # 40% chance to accept
             return SettlementResponse(action="accept")
         elif roll < 0.7 and not is_final_offer:
             # 30% chance to counter with random VP
-            counter_vp = random.randint(30, 70)
+            counter_vp = self.rng.randint(30, 70)
             return SettlementResponse(
                 action="counter",
                 counter_vp=counter_vp,
@@ -499,11 +498,11 @@ class Erratic(DeterministicOpponent):
         if state.turn <= 4 or state.stability <= 2:
             return None
 
-        if random.random() >= 0.2:
+        if self.rng.random() >= 0.2:
             return None
 
         fair_vp = self.get_position_fair_vp(state, self._is_player_a or False)
-        deviation = random.randint(-15, 15)
+        deviation = self.rng.randint(-15, 15)
         offer_vp = max(20, min(80, fair_vp + deviation))
         return SettlementProposal(
             offered_vp=offer_vp,
@@ -682,7 +681,7 @@ class GrimTrigger(DeterministicOpponent):
             # Betrayed, but self-preservation overrides at extreme risk
             if state.risk_level >= 8:
                 # Survival instinct: 70% de-escalate at extreme risk
-                if random.random() < 0.7:
+                if self.rng.random() < 0.7:
                     return self._select_random_from_type(available_actions, ActionType.COOPERATIVE)
             # Otherwise, defect (punishment mode)
             return self._select_random_from_type(available_actions, ActionType.COMPETITIVE)
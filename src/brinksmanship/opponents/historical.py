@@ -4,9 +4,9 @@ This module implements the HistoricalPersona class that uses LLM with persona-sp
 prompts to make strategic decisions. Each persona embodies a historical figure's
 documented strategic patterns and decision-making style.
 
-Each HistoricalPersona maintains a ClaudeSDKClient instance that preserves conversation
-history across turns, allowing the LLM to reference its prior reasoning and adapt
-strategy based on observed opponent patterns.
+LLM queries run on warm Claude sessions from brinksmanship.llm_pool, shared across
+turns and games. Each query is independent: the persona adapts through the game
+state and history included in its prompts.
 
 See GAME_MANUAL.md for authoritative game mechanics.
 See prompts.py for persona definitions (PERSONA_BISMARCK, PERSONA_NIXON, etc.).
@@ -18,11 +18,11 @@ from typing import Any
 from claude_agent_sdk import (
     AssistantMessage,
     ClaudeAgentOptions,
-    ClaudeSDKClient,
     ResultMessage,
     TextBlock,
 )
 
+from brinksmanship.llm_pool import get_session_pool
 from brinksmanship.models.actions import Action, ActionType
 from brinksmanship.models.state import ActionResult, GameState
 from brinksmanship.opponents.base import (
@@ -148,8 +148,8 @@ class HistoricalPersona(Opponent):
     Uses LLM with persona-specific prompts to make decisions. The persona
     influences action selection, settlement evaluation, and negotiation style.
 
-    Maintains a ClaudeSDKClient instance for conversation continuity, allowing
-    the LLM to reference its prior reasoning across turns within a game.
+    Queries run on warm sessions from the shared Claude session pool, so no
+    decision waits for a Claude Code CLI process to start.
 
     Attributes:
         persona_name: The lowercase key for the persona (e.g., 'bismarck')
@@ -159,7 +159,6 @@ class HistoricalPersona(Opponent):
         is_player_a: Whether this opponent is playing as Player A
         role_name: The scenario-specific role name (e.g., "Soviet Premier")
         role_description: Description of the role in the scenario
-        _client: Lazily-initialized ClaudeSDKClient for conversation continuity
         _conversation_turn_count: Number of LLM interactions in this game
     """
 
@@ -203,8 +202,7 @@ class HistoricalPersona(Opponent):
         self.action_history: list[tuple[Action, GameState]] = []
         self.settlement_history: list[tuple[SettlementProposal, SettlementResponse, GameState]] = []
 
-        # ClaudeSDKClient for conversation continuity (lazy initialized)
-        self._client: ClaudeSDKClient | None = None
+        # Number of LLM queries made by this persona
         self._conversation_turn_count: int = 0
 
     def _get_my_state(self, state: GameState) -> tuple[float, float, ActionType | None]:
@@ -229,35 +227,15 @@ class HistoricalPersona(Opponent):
 
         return info_state.get_position_estimate(state.turn)
 
-    def _get_client(self) -> ClaudeSDKClient:
-        """Lazily initialize and return the ClaudeSDKClient.
-
-        The client maintains conversation history across all LLM calls within
-        a single game, allowing the persona to reference prior reasoning.
-
-        Returns:
-            The ClaudeSDKClient instance for this persona's game session.
-        """
-        if self._client is None:
-            options = ClaudeAgentOptions(
-                max_turns=10,
-                allowed_tools=["Read"],  # Enable file reading for GAME_MANUAL.md
-                system_prompt=HISTORICAL_PERSONA_SYSTEM_PROMPT,
-            )
-            self._client = ClaudeSDKClient(options=options)
-            logger.debug(f"{self.display_name}: Initialized ClaudeSDKClient for conversation continuity")
-        return self._client
-
     async def _query_llm(
         self,
         prompt: str,
         schema: dict[str, Any],
     ) -> dict[str, Any]:
-        """Query the LLM using the SDK's query function.
+        """Query the LLM on a pooled Claude session.
 
-        Note: The current SDK version (0.1.20) does not properly support
-        ClaudeSDKClient for conversation continuity, so we use the simpler
-        query() function instead. Each call is independent.
+        Each call is independent: the session's conversation is cleared
+        before it serves another query.
 
         Args:
             prompt: The prompt to send to the LLM
@@ -272,8 +250,6 @@ class HistoricalPersona(Opponent):
         import json
         import re
 
-        from claude_agent_sdk import query
-
         self._conversation_turn_count += 1
 
         logger.debug(f"{self.display_name}: LLM query #{self._conversation_turn_count}, prompt={len(prompt)} chars")
@@ -293,7 +269,7 @@ class HistoricalPersona(Opponent):
         response_text = ""
         structured_output = None
 
-        async for message in query(prompt=full_prompt, options=options):
+        for message in await get_session_pool().query(full_prompt, options):
             if isinstance(message, AssistantMessage):
                 for block in message.content:
                     if isinstance(block, TextBlock):
@@ -582,20 +558,6 @@ class HistoricalPersona(Opponent):
             "conversation_turns": self._conversation_turn_count,
         }
 
-    async def cleanup(self) -> None:
-        """Clean up resources, including the ClaudeSDKClient.
-
-        Should be called when the game ends to properly close the client connection.
-        """
-        if self._client is not None:
-            try:
-                await self._client.__aexit__(None, None, None)
-            except Exception as e:
-                logger.warning(f"{self.display_name}: Error closing client: {e}")
-            finally:
-                self._client = None
-                logger.debug(f"{self.display_name}: ClaudeSDKClient closed after {self._conversation_turn_count} turns")
-
     def __repr__(self) -> str:
         """String representation of this persona."""
         return f"HistoricalPersona('{self.persona_name}', is_player_a={self.is_player_a})"
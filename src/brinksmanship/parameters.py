@@ -12,11 +12,21 @@ Parameter Categories:
 Usage:
     from brinksmanship.parameters import SURPLUS_BASE, CAPTURE_RATE
 
+    # A variant parameter set for one engine (module constants are untouched)
+    from brinksmanship.parameters import DEFAULT_PARAMETERS
+    params = DEFAULT_PARAMETERS.replace(capture_rate=0.5)
+    engine = GameEngine(scenario_id, repo, params=params)
+
 Note: These parameters are NOT fixed constants. They should be tuned through
 simulation to achieve balanced gameplay. Each parameter includes analysis
 notes and tuning guidance.
 """
 
+from __future__ import annotations
+
+import dataclasses
+from dataclasses import dataclass
+
 # =============================================================================
 # SURPLUS CREATION PARAMETERS
 # =============================================================================
@@ -404,6 +414,78 @@ Values:
 """
 
 
+# =============================================================================
+# PARAMETER SETS
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class GameParameters:
+    """An immutable set of the tunable constants above.
+
+    The engines take a GameParameters instead of reading the module
+    constants, so several parameter sets can be simulated side by side in
+    one process (or as one vectorized batch, see BatchGameEngine). Field
+    defaults are the module constants; see each constant for analysis and
+    tuning notes.
+
+    Attributes:
+        surplus_base: SURPLUS_BASE
+        surplus_streak_bonus: SURPLUS_STREAK_BONUS
+        capture_rate: CAPTURE_RATE
+        exploit_position_gain: EXPLOIT_POSITION_GAIN
+        cc_risk_reduction: CC_RISK_REDUCTION
+        exploit_risk_increase: EXPLOIT_RISK_INCREASE
+        dd_risk_increase: DD_RISK_INCREASE
+        dd_burn_rate: DD_BURN_RATE
+        rejection_base_penalty: REJECTION_BASE_PENALTY
+        rejection_escalation: REJECTION_ESCALATION
+        variance_scale: Multiplier on the shared sigma of final resolution
+            (1.0 = the GAME_MANUAL.md Section 4.2 formula)
+    """
+
+    surplus_base: float = SURPLUS_BASE
+    surplus_streak_bonus: float = SURPLUS_STREAK_BONUS
+    capture_rate: float = CAPTURE_RATE
+    exploit_position_gain: float = EXPLOIT_POSITION_GAIN
+    cc_risk_reduction: float = CC_RISK_REDUCTION
+    exploit_risk_increase: float = EXPLOIT_RISK_INCREASE
+    dd_risk_increase: float = DD_RISK_INCREASE
+    dd_burn_rate: float = DD_BURN_RATE
+    rejection_base_penalty: float = REJECTION_BASE_PENALTY
+    rejection_escalation: float = REJECTION_ESCALATION
+    variance_scale: float = 1.0
+
+    def __post_init__(self) -> None:
+        for name in ("capture_rate", "dd_burn_rate"):
+            value = getattr(self, name)
+            if not 0.0 <= value <= 1.0:
+                raise ValueError(f"{name} must be in [0, 1], got {value}")
+        for field in dataclasses.fields(self):
+            if getattr(self, field.name) < 0:
+                raise ValueError(f"{field.name} must be non-negative, got {getattr(self, field.name)}")
+
+    def replace(self, **changes: float) -> GameParameters:
+        """Copy with some fields changed (dataclasses.replace)."""
+        return dataclasses.replace(self, **changes)
+
+    def to_dict(self) -> dict[str, float]:
+        """Convert to dictionary for JSON serialization."""
+        return dataclasses.asdict(self)
+
+    def surplus_for_streak(self, streak: int) -> float:
+        """VP created by a CC outcome at a cooperation streak (see calculate_surplus_for_streak)."""
+        return self.surplus_base * (1.0 + self.surplus_streak_bonus * streak)
+
+    def rejection_penalty(self, rejection_number: int) -> float:
+        """Risk penalty for a rejection in sequence (see calculate_rejection_penalty)."""
+        return self.rejection_base_penalty * (1.0 + self.rejection_escalation * (rejection_number - 1))
+
+
+DEFAULT_PARAMETERS = GameParameters()
+"""The module constants as a GameParameters; used when an engine gets none."""
+
+
 # =============================================================================
 # DERIVED CONSTANTS (Computed from parameters)
 # =============================================================================
@@ -31,6 +31,7 @@ from .config import (
     get_storage_backend,
 )
 from .file_repo import FileGameRecordRepository, FileScenarioRepository
+from .memory_repo import InMemoryScenarioRepository
 from .repository import GameRecordRepository, ScenarioRepository
 from .sqlite_repo import SQLiteGameRecordRepository, SQLiteScenarioRepository
 
@@ -44,6 +45,8 @@ __all__ = [
     # SQLite implementations
     "SQLiteScenarioRepository",
     "SQLiteGameRecordRepository",
+    # In-memory implementation (unsaved scenarios)
+    "InMemoryScenarioRepository",
     # Configuration
     "StorageBackend",
     "get_storage_backend",
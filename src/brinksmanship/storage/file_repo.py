@@ -87,6 +87,15 @@ class FileScenarioRepository(ScenarioRepository):
             data["id"] = scenario_id
             return data
 
+    def get_scenario_version(self, scenario_id: str) -> str | None:
+        """Return a version stamp from the file's path, mtime and size."""
+        path = self._get_scenario_path(scenario_id)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        return f"{path.resolve()}:{stat.st_mtime_ns}:{stat.st_size}"
+
     def get_scenario_by_name(self, name: str) -> dict | None:
         """Load scenario by name (case-insensitive search)."""
         name_lower = name.lower()
@@ -0,0 +1,80 @@
+"""In-memory scenario repository.
+
+Holds scenarios that were never written to disk, such as a freshly
+generated scenario under validation, so the engines can play them. The
+repository is a plain dict and pickles with its contents, so it can be
+handed to worker processes.
+"""
+
+import copy
+
+from .file_repo import slugify
+from .repository import ScenarioRepository
+
+
+class InMemoryScenarioRepository(ScenarioRepository):
+    """Scenario repository backed by a dict.
+
+    Scenario IDs are the scenario's 'id' or 'scenario_id' field, or the
+    slugified name. Versions are content hashes, so the engine's compiled
+    scenario cache never confuses two scenarios that share an ID.
+    """
+
+    def __init__(self, scenarios: list[dict] | None = None):
+        """Initialize repository.
+
+        Args:
+            scenarios: Scenarios to save up front
+        """
+        self._scenarios: dict[str, dict] = {}
+        self._versions: dict[str, str] = {}
+        for scenario in scenarios or []:
+            self.save_scenario(scenario)
+
+    def list_scenarios(self) -> list[dict]:
+        """Return metadata for all stored scenarios."""
+        scenarios = [
+            {
+                "id": scenario_id,
+                "name": data.get("name", data.get("title", scenario_id)),
+                "setting": data.get("setting", ""),
+                "max_turns": data.get("max_turns", 14),
+            }
+            for scenario_id, data in self._scenarios.items()
+        ]
+        return sorted(scenarios, key=lambda x: x["name"])
+
+    def get_scenario(self, scenario_id: str) -> dict | None:
+        """Return a copy of the scenario, so callers cannot alter the stored one."""
+        scenario = self._scenarios.get(scenario_id)
+        return copy.deepcopy(scenario) if scenario is not None else None
+
+    def get_scenario_version(self, scenario_id: str) -> str | None:
+        """Return the content hash computed when the scenario was saved."""
+        return self._versions.get(scenario_id)
+
+    def get_scenario_by_name(self, name: str) -> dict | None:
+        """Load scenario by name (case-insensitive search)."""
+        name_lower = name.lower()
+        for scenario_id, data in self._scenarios.items():
+            if data.get("name", data.get("title", "")).lower() == name_lower:
+                return self.get_scenario(scenario_id)
+        return None
+
+    def save_scenario(self, scenario: dict) -> str:
+        """Save scenario, return ID."""
+        scenario_id = scenario.get("id") or scenario.get("scenario_id")
+        if not scenario_id:
+            name = scenario.get("name") or scenario.get("title")
+            if not name:
+                raise ValueError("Scenario must have an 'id', 'scenario_id', 'name' or 'title' field")
+            scenario_id = slugify(name)
+
+        self._scenarios[scenario_id] = {**copy.deepcopy(scenario), "id": scenario_id}
+        self._versions[scenario_id] = super().get_scenario_version(scenario_id)
+        return scenario_id
+
+    def delete_scenario(self, scenario_id: str) -> bool:
+        """Delete scenario."""
+        self._versions.pop(scenario_id, None)
+        return self._scenarios.pop(scenario_id, None) is not None
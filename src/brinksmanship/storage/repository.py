@@ -6,6 +6,8 @@ interfaces, allowing the CLI and webapp to use storage without knowing
 which backend is active.
 """
 
+import hashlib
+import json
 from abc import ABC, abstractmethod
 
 
@@ -33,6 +35,26 @@ class ScenarioRepository(ABC):
         """
         pass
 
+    def get_scenario_version(self, scenario_id: str) -> str | None:
+        """Return a token that changes whenever the scenario's content changes.
+
+        Used by the engine's compiled-scenario cache to decide whether a
+        cached turn graph is still valid. The default implementation hashes
+        the loaded scenario; backends override it with a cheaper stamp
+        (file mtime, row timestamp) that avoids loading the scenario at all.
+
+        Args:
+            scenario_id: Unique identifier for the scenario
+
+        Returns:
+            Opaque version string, or None if not found
+        """
+        scenario = self.get_scenario(scenario_id)
+        if scenario is None:
+            return None
+        payload = json.dumps(scenario, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(payload).hexdigest()
+
     @abstractmethod
     def get_scenario_by_name(self, name: str) -> dict | None:
         """Load scenario by name (case-insensitive search).
@@ -87,6 +87,22 @@ class SQLiteScenarioRepository(ScenarioRepository):
         data["id"] = scenario_id
         return data
 
+    def get_scenario_version(self, scenario_id: str) -> str | None:
+        """Return a version stamp from the row's update time and data length."""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT updated_at, LENGTH(data) AS size FROM scenarios WHERE id = ?",
+            (scenario_id,),
+        )
+        row = cursor.fetchone()
+        conn.close()
+
+        if row is None:
+            return None
+
+        return f"{self.database_path.resolve()}:{row['updated_at']}:{row['size']}"
+
     def get_scenario_by_name(self, name: str) -> dict | None:
         """Load scenario by name (case-insensitive search)."""
         conn = self._get_connection()
@@ -8,6 +8,11 @@ Key classes:
 - GameRunner: Runs single games using real GameEngine and Opponent instances
 - BatchRunner: Orchestrates parallel batch execution for balance testing
 - HumanSimulator: Simulates human player behavior for playtesting
+- RunningStats, QuantileSketch, Histogram: Mergeable constant-memory statistics
+- GameTableWriter, GameTable: Columnar, memory-mapped per-game results
+- RunCheckpoint: Shards of long runs, for resuming after a crash
+- Coordinator, SQLiteWorkQueue, run_worker: Simulations spread over several machines
+- TournamentRunner: All scenarios x all pairings on one shared process pool
 
 Usage:
     from brinksmanship.testing import GameRunner, BatchRunner
@@ -23,6 +28,7 @@ Usage:
     # Run batch simulations
     runner = BatchRunner(scenario_id="cuban_missile_crisis")
     results = runner.run_all_pairings(num_games=100)
+    results = runner.run_all_pairings(num_games=100_000, vectorized=True)
 
     # Human simulation
     simulator = HumanSimulator()
@@ -38,14 +44,27 @@ from .batch_runner import (
     BatchResults,
     BatchRunner,
     PairingStats,
+    PrecisionTarget,
     create_opponent,
     print_results_summary,
 )
+from .checkpoint import RunCheckpoint
+from .distributed import (
+    Coordinator,
+    SQLiteWorkQueue,
+    WorkQueue,
+    WorkUnit,
+    run_worker,
+)
 from .game_runner import (
     GameResult,
     GameRunner,
     run_game_sync,
 )
+from .game_table import (
+    GameTable,
+    GameTableWriter,
+)
 from .human_simulator import (
     # Response models
     ActionSelection,
@@ -55,6 +74,17 @@ from .human_simulator import (
     MistakeCheck,
     SettlementResponse,
 )
+from .result_cache import ResultCache
+from .streaming_stats import (
+    Histogram,
+    QuantileSketch,
+    RunningStats,
+)
+from .tournament import (
+    TournamentResults,
+    TournamentRunner,
+    print_tournament_results,
+)
 
 __all__ = [
     # Game Runner (single games)
@@ -64,11 +94,33 @@ __all__ = [
     # Batch Runner (parallel simulations)
     "BatchRunner",
     "PairingStats",
+    "PrecisionTarget",
     "BatchResults",
     "DETERMINISTIC_OPPONENTS",
     "ALL_OPPONENTS",
     "create_opponent",
     "print_results_summary",
+    # Streaming statistics
+    "RunningStats",
+    "QuantileSketch",
+    "Histogram",
+    # Columnar per-game results
+    "GameTableWriter",
+    "GameTable",
+    # Checkpoints of long runs
+    "RunCheckpoint",
+    # Content-addressed result cache
+    "ResultCache",
+    # Coordinator/worker mode
+    "Coordinator",
+    "WorkQueue",
+    "SQLiteWorkQueue",
+    "WorkUnit",
+    "run_worker",
+    # Cross-scenario tournaments
+    "TournamentRunner",
+    "TournamentResults",
+    "print_tournament_results",
     # Human Simulator
     "HumanSimulator",
     "HumanPersona",
@@ -10,16 +10,25 @@ Uses the unified GameRunner with actual opponent implementations.
 
 from __future__ import annotations
 
+import contextlib
 import json
+import math
 import statistics
 import time
-from collections import defaultdict
-from concurrent.futures import ProcessPoolExecutor, as_completed
-from dataclasses import dataclass, field
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
+
+from brinksmanship.engine.batch_engine import BatchGameEngine, BatchOutcome
+from brinksmanship.engine.rng import fresh_seed
+from brinksmanship.engine.solver import GameTreeSolver, SolverResult
 from brinksmanship.opponents.base import Opponent, get_opponent_by_type, list_opponent_types
+from brinksmanship.opponents.batch_policies import BATCH_POLICIES
 from brinksmanship.opponents.deterministic import (
     DeterministicOpponent,
     Erratic,
@@ -29,7 +38,13 @@ from brinksmanship.opponents.deterministic import (
     SecuritySeeker,
     TitForTat,
 )
+from brinksmanship.parameters import GameParameters
+from brinksmanship.storage import ScenarioRepository, get_scenario_repository
+from brinksmanship.testing.checkpoint import RunCheckpoint
 from brinksmanship.testing.game_runner import GameResult, run_game_sync
+from brinksmanship.testing.game_table import GameTableWriter, columns_from_batch, columns_from_results
+from brinksmanship.testing.result_cache import ResultCache, pairing_cell
+from brinksmanship.testing.streaming_stats import Histogram, QuantileSketch, RunningStats
 
 # Registry of all deterministic opponents (for fast, non-LLM simulation)
 DETERMINISTIC_OPPONENTS: dict[str, type[DeterministicOpponent]] = {
@@ -73,9 +88,24 @@ def create_opponent(name: str, is_player_a: bool = False) -> Opponent:
     return get_opponent_by_type(name, is_player_a=is_player_a)
 
 
+def _z_score(confidence: float) -> float:
+    """Two-sided standard normal quantile for a confidence level."""
+    return statistics.NormalDist().inv_cdf(0.5 + confidence / 2)
+
+
+def _finite_or_none(value: float, digits: int) -> float | None:
+    return round(value, digits) if math.isfinite(value) else None
+
+
 @dataclass
 class PairingStats:
-    """Statistics for a single opponent pairing."""
+    """Statistics for a single opponent pairing.
+
+    Per-game values are summarized by constant-memory accumulators
+    (RunningStats, QuantileSketch, Histogram), so a million-game pairing
+    takes a few KB. The per-game lists are also filled unless keep_games
+    is False; they are only needed by callers that want raw values.
+    """
 
     opponent_a: str
     opponent_b: str
@@ -90,28 +120,49 @@ class PairingStats:
     resource_exhaustions: int = 0
     total_games: int = 0
     total_turns: int = 0
+    keep_games: bool = True
     vp_a_list: list[float] = field(default_factory=list)
     vp_b_list: list[float] = field(default_factory=list)
     total_value_list: list[float] = field(default_factory=list)  # VP_A + VP_B per game
     vp_share_a_list: list[float] = field(default_factory=list)  # VP_A / Total per game
     final_risks: list[float] = field(default_factory=list)
     final_cooperations: list[float] = field(default_factory=list)
+    # Streaming summaries (always maintained)
+    vp_a_stats: RunningStats = field(default_factory=RunningStats, compare=False)
+    vp_b_stats: RunningStats = field(default_factory=RunningStats, compare=False)
+    total_value_stats: RunningStats = field(default_factory=RunningStats, compare=False)
+    vp_share_a_stats: RunningStats = field(default_factory=RunningStats, compare=False)
+    risk_stats: RunningStats = field(default_factory=RunningStats, compare=False)
+    cooperation_stats: RunningStats = field(default_factory=RunningStats, compare=False)
+    total_value_sketch: QuantileSketch = field(default_factory=QuantileSketch, compare=False)
+    vp_share_a_histogram: Histogram = field(default_factory=lambda: Histogram(0.0, 1.0, 20), compare=False)
 
     def add_result(self, result: GameResult) -> None:
         """Add a game result to statistics."""
         self.total_games += 1
         self.total_turns += result.turns_played
-        self.vp_a_list.append(result.vp_a)
-        self.vp_b_list.append(result.vp_b)
-        self.final_risks.append(result.final_risk)
-        self.final_cooperations.append(result.final_cooperation)
 
         # Track Total Value and VP Share (dual metrics)
         total_value = result.vp_a + result.vp_b
-        self.total_value_list.append(total_value)
         # Avoid division by zero for mutual destruction (0, 0)
         vp_share_a = result.vp_a / total_value if total_value > 0 else 0.5
-        self.vp_share_a_list.append(vp_share_a)
+
+        self.vp_a_stats.add(result.vp_a)
+        self.vp_b_stats.add(result.vp_b)
+        self.total_value_stats.add(total_value)
+        self.vp_share_a_stats.add(vp_share_a)
+        self.risk_stats.add(result.final_risk)
+        self.cooperation_stats.add(result.final_cooperation)
+        self.total_value_sketch.add(total_value)
+        self.vp_share_a_histogram.add(vp_share_a)
+
+        if self.keep_games:
+            self.vp_a_list.append(result.vp_a)
+            self.vp_b_list.append(result.vp_b)
+            self.final_risks.append(result.final_risk)
+            self.final_cooperations.append(result.final_cooperation)
+            self.total_value_list.append(total_value)
+            self.vp_share_a_list.append(vp_share_a)
 
         # Track winner
         if result.winner == "A":
@@ -138,6 +189,91 @@ class PairingStats:
         elif "exhaustion" in ending:
             self.resource_exhaustions += 1
 
+    def add_batch(self, outcome: BatchOutcome) -> None:
+        """Add all games of a BatchGameEngine run to statistics."""
+        winners = outcome.winners()
+        endings = outcome.ending_type_values()
+        total_value = outcome.vp_a + outcome.vp_b
+        safe_total = np.where(total_value > 0, total_value, 1.0)
+        vp_share_a = np.where(total_value > 0, outcome.vp_a / safe_total, 0.5)
+
+        self.total_games += outcome.num_games
+        self.total_turns += int(outcome.turns_played.sum())
+        self.vp_a_stats.add_array(outcome.vp_a)
+        self.vp_b_stats.add_array(outcome.vp_b)
+        self.total_value_stats.add_array(total_value)
+        self.vp_share_a_stats.add_array(vp_share_a)
+        self.risk_stats.add_array(outcome.final_risk)
+        self.cooperation_stats.add_array(outcome.final_cooperation)
+        self.total_value_sketch.add_array(total_value)
+        self.vp_share_a_histogram.add_array(vp_share_a)
+
+        if self.keep_games:
+            self.vp_a_list.extend(outcome.vp_a.tolist())
+            self.vp_b_list.extend(outcome.vp_b.tolist())
+            self.final_risks.extend(outcome.final_risk.tolist())
+            self.final_cooperations.extend(outcome.final_cooperation.tolist())
+            self.total_value_list.extend(total_value.tolist())
+            self.vp_share_a_list.extend(vp_share_a.tolist())
+
+        # Same winner and ending buckets as add_result
+        self.wins_a += int((winners == "A").sum())
+        self.wins_b += int((winners == "B").sum())
+        self.ties += int((winners == "tie").sum())
+        self.mutual_destructions += int((winners == "mutual_destruction").sum())
+        self.crisis_terminations += int((endings == "crisis_termination").sum())
+        self.natural_endings += int((endings == "natural_ending").sum())
+        self.settlements += int((endings == "settlement").sum())
+        self.position_collapses += int((np.char.find(endings, "collapse") >= 0).sum())
+        self.resource_exhaustions += int((np.char.find(endings, "exhaustion") >= 0).sum())
+
+    def merge(self, other: PairingStats) -> None:
+        """Add another PairingStats for the same pairing, e.g. a worker's chunk.
+
+        Per-game lists are appended in order, so merging chunks in game
+        order gives the same lists as adding the games one by one. They are
+        dropped if other did not keep them.
+        """
+        self.wins_a += other.wins_a
+        self.wins_b += other.wins_b
+        self.ties += other.ties
+        self.mutual_destructions += other.mutual_destructions
+        self.crisis_terminations += other.crisis_terminations
+        self.natural_endings += other.natural_endings
+        self.settlements += other.settlements
+        self.position_collapses += other.position_collapses
+        self.resource_exhaustions += other.resource_exhaustions
+        self.total_games += other.total_games
+        self.total_turns += other.total_turns
+        self.vp_a_stats.merge(other.vp_a_stats)
+        self.vp_b_stats.merge(other.vp_b_stats)
+        self.total_value_stats.merge(other.total_value_stats)
+        self.vp_share_a_stats.merge(other.vp_share_a_stats)
+        self.risk_stats.merge(other.risk_stats)
+        self.cooperation_stats.merge(other.cooperation_stats)
+        self.total_value_sketch.merge(other.total_value_sketch)
+        self.vp_share_a_histogram.merge(other.vp_share_a_histogram)
+
+        if self.keep_games and other.keep_games:
+            self.vp_a_list.extend(other.vp_a_list)
+            self.vp_b_list.extend(other.vp_b_list)
+            self.total_value_list.extend(other.total_value_list)
+            self.vp_share_a_list.extend(other.vp_share_a_list)
+            self.final_risks.extend(other.final_risks)
+            self.final_cooperations.extend(other.final_cooperations)
+        elif self.keep_games:
+            self.discard_games()
+
+    def discard_games(self) -> None:
+        """Drop the per-game lists and stop filling them."""
+        self.keep_games = False
+        self.vp_a_list = []
+        self.vp_b_list = []
+        self.total_value_list = []
+        self.vp_share_a_list = []
+        self.final_risks = []
+        self.final_cooperations = []
+
     @property
     def win_rate_a(self) -> float:
         return self.wins_a / self.total_games if self.total_games > 0 else 0.0
@@ -152,40 +288,60 @@ class PairingStats:
 
     @property
     def avg_vp_a(self) -> float:
-        return statistics.mean(self.vp_a_list) if self.vp_a_list else 0.0
+        return self.vp_a_stats.mean
 
     @property
     def avg_vp_b(self) -> float:
-        return statistics.mean(self.vp_b_list) if self.vp_b_list else 0.0
+        return self.vp_b_stats.mean
 
     @property
     def avg_total_value(self) -> float:
         """Average Total Value (VP_A + VP_B) across all games."""
-        return statistics.mean(self.total_value_list) if self.total_value_list else 0.0
+        return self.total_value_stats.mean
 
     @property
     def total_value_std(self) -> float:
         """Standard deviation of Total Value."""
-        return statistics.stdev(self.total_value_list) if len(self.total_value_list) > 1 else 0.0
+        return self.total_value_stats.stdev
 
     @property
     def total_value_min(self) -> float:
         """Minimum Total Value."""
-        return min(self.total_value_list) if self.total_value_list else 0.0
+        return self.total_value_stats.min if self.total_value_stats.count else 0.0
 
     @property
     def total_value_max(self) -> float:
         """Maximum Total Value."""
-        return max(self.total_value_list) if self.total_value_list else 0.0
+        return self.total_value_stats.max if self.total_value_stats.count else 0.0
+
+    def total_value_quantile(self, q: float) -> float:
+        """Estimated q-quantile of Total Value (within 1%)."""
+        return self.total_value_sketch.quantile(q)
+
+    def total_value_half_width(self, confidence: float = 0.95) -> float:
+        """Half-width of the normal confidence interval for mean Total Value (inf below two games)."""
+        n = self.total_value_stats.count
+        if n < 2:
+            return math.inf
+        return _z_score(confidence) * self.total_value_stats.stdev / math.sqrt(n)
+
+    def win_rate_half_width(self, confidence: float = 0.95) -> float:
+        """Half-width of the Wilson score interval for player A's win rate (inf with no games)."""
+        n = self.total_games
+        if n == 0:
+            return math.inf
+        z = _z_score(confidence)
+        p = self.win_rate_a
+        return z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / (1 + z * z / n)
 
     @property
     def avg_vp_share_a(self) -> float:
         """Average VP Share for opponent A."""
-        return statistics.mean(self.vp_share_a_list) if self.vp_share_a_list else 0.5
+        return self.vp_share_a_stats.mean if self.vp_share_a_stats.count else 0.5
 
     @property
     def avg_risk(self) -> float:
-        return statistics.mean(self.final_risks) if self.final_risks else 0.0
+        return self.risk_stats.mean
 
     @property
     def mutual_destruction_rate(self) -> float:
@@ -228,14 +384,20 @@ class PairingStats:
             "resource_exhaustions": self.resource_exhaustions,
             "win_rate_a": round(self.win_rate_a, 4),
             "win_rate_b": round(self.win_rate_b, 4),
+            "win_rate_a_ci95": _finite_or_none(self.win_rate_half_width(), 4),
             "avg_game_length": round(self.avg_game_length, 2),
             "avg_vp_a": round(self.avg_vp_a, 2),
             "avg_vp_b": round(self.avg_vp_b, 2),
             "avg_total_value": round(self.avg_total_value, 2),
             "total_value_std": round(self.total_value_std, 2),
+            "total_value_ci95": _finite_or_none(self.total_value_half_width(), 2),
             "total_value_min": round(self.total_value_min, 2),
             "total_value_max": round(self.total_value_max, 2),
+            "total_value_p10": round(self.total_value_quantile(0.1), 2),
+            "total_value_p50": round(self.total_value_quantile(0.5), 2),
+            "total_value_p90": round(self.total_value_quantile(0.9), 2),
             "avg_vp_share_a": round(self.avg_vp_share_a, 4),
+            "vp_share_a_histogram": self.vp_share_a_histogram.counts.tolist(),
             "avg_risk": round(self.avg_risk, 2),
             "mutual_destruction_rate": round(self.mutual_destruction_rate, 4),
             "settlement_rate": round(self.settlement_rate, 4),
@@ -245,6 +407,47 @@ class PairingStats:
         }
 
 
+@dataclass(frozen=True)
+class PrecisionTarget:
+    """When a pairing has been simulated enough (sequential early stopping).
+
+    A pairing stops once every given interval half-width is reached at the
+    confidence level, after at least min_games games. Checks happen after
+    each chunk of games, so a pairing may overshoot by up to one chunk.
+
+    Attributes:
+        total_value_half_width: Target half-width for mean Total Value (VP)
+        win_rate_half_width: Target half-width for player A's win rate
+        confidence: Confidence level of the intervals
+        min_games: Games to play before the target is first checked
+    """
+
+    total_value_half_width: float | None = None
+    win_rate_half_width: float | None = None
+    confidence: float = 0.95
+    min_games: int = 100
+
+    def __post_init__(self) -> None:
+        if self.total_value_half_width is None and self.win_rate_half_width is None:
+            raise ValueError("PrecisionTarget needs total_value_half_width or win_rate_half_width")
+        if not 0 < self.confidence < 1:
+            raise ValueError(f"confidence must be in (0, 1), got {self.confidence}")
+
+    def is_met(self, stats: PairingStats) -> bool:
+        """Whether stats are precise enough to stop."""
+        if stats.total_games < self.min_games:
+            return False
+        if (
+            self.total_value_half_width is not None
+            and stats.total_value_half_width(self.confidence) > self.total_value_half_width
+        ):
+            return False
+        return not (
+            self.win_rate_half_width is not None
+            and stats.win_rate_half_width(self.confidence) > self.win_rate_half_width
+        )
+
+
 @dataclass
 class BatchResults:
     """Results from a batch run of games."""
@@ -262,9 +465,11 @@ class BatchResults:
 
         total_games = 0
         total_turns = 0
-        all_vp_a = []
-        all_vp_b = []
-        all_total_value = []
+        vp_a = RunningStats()
+        vp_b = RunningStats()
+        vp_all = RunningStats()  # VP of both players
+        total_value = RunningStats()
+        total_value_sketch = QuantileSketch()
         total_md = 0
         total_elim = 0
         total_settlements = 0
@@ -274,9 +479,12 @@ class BatchResults:
         for stats in self.pairings.values():
             total_games += stats.total_games
             total_turns += stats.total_turns
-            all_vp_a.extend(stats.vp_a_list)
-            all_vp_b.extend(stats.vp_b_list)
-            all_total_value.extend(stats.total_value_list)
+            vp_a.merge(stats.vp_a_stats)
+            vp_b.merge(stats.vp_b_stats)
+            vp_all.merge(stats.vp_a_stats)
+            vp_all.merge(stats.vp_b_stats)
+            total_value.merge(stats.total_value_stats)
+            total_value_sketch.merge(stats.total_value_sketch)
             total_md += stats.mutual_destructions
             total_elim += stats.position_collapses + stats.resource_exhaustions
             total_settlements += stats.settlements
@@ -287,14 +495,17 @@ class BatchResults:
             self.aggregate = {
                 "total_games": total_games,
                 "avg_turns": round(total_turns / total_games, 2),
-                "avg_vp_a": round(statistics.mean(all_vp_a), 2) if all_vp_a else 0,
-                "avg_vp_b": round(statistics.mean(all_vp_b), 2) if all_vp_b else 0,
-                "vp_std_dev": round(statistics.stdev(all_vp_a + all_vp_b), 2) if len(all_vp_a) > 1 else 0,
+                "avg_vp_a": round(vp_a.mean, 2),
+                "avg_vp_b": round(vp_b.mean, 2),
+                "vp_std_dev": round(vp_all.stdev, 2),
                 # New Total Value metrics
-                "avg_total_value": round(statistics.mean(all_total_value), 2) if all_total_value else 0,
-                "total_value_std": round(statistics.stdev(all_total_value), 2) if len(all_total_value) > 1 else 0,
-                "total_value_min": round(min(all_total_value), 2) if all_total_value else 0,
-                "total_value_max": round(max(all_total_value), 2) if all_total_value else 0,
+                "avg_total_value": round(total_value.mean, 2),
+                "total_value_std": round(total_value.stdev, 2),
+                "total_value_min": round(total_value.min, 2),
+                "total_value_max": round(total_value.max, 2),
+                "total_value_p10": round(total_value_sketch.quantile(0.1), 2),
+                "total_value_p50": round(total_value_sketch.quantile(0.5), 2),
+                "total_value_p90": round(total_value_sketch.quantile(0.9), 2),
                 # Ending type rates
                 "mutual_destruction_rate": round(total_md / total_games, 4),
                 "settlement_rate": round(total_settlements / total_games, 4),
@@ -322,27 +533,215 @@ def _run_single_game(args: tuple) -> dict:
     """Worker function for running a single game in a subprocess.
 
     Args:
-        args: Tuple of (scenario_id, opponent_a_name, opponent_b_name, seed)
+        args: Tuple of (scenario_id, opponent_a_name, opponent_b_name, seed, game_index)
 
     Returns:
         GameResult as dictionary
     """
-    scenario_id, opponent_a_name, opponent_b_name, seed = args
-
+    return _play_game(*args).to_dict()
+
+
+def _play_game(
+    scenario_id: str,
+    opponent_a_name: str,
+    opponent_b_name: str,
+    seed: int | None,
+    game_index: int,
+    params: GameParameters | None = None,
+    common_random_numbers: bool = False,
+    antithetic: bool = False,
+    repo: ScenarioRepository | None = None,
+) -> GameResult:
+    """Play one game between fresh opponent instances."""
     # Create fresh opponent instances (required for subprocess isolation)
     # Player A is first opponent, Player B is second
     opponent_a = create_opponent(opponent_a_name, is_player_a=True)
     opponent_b = create_opponent(opponent_b_name, is_player_a=False)
 
     # Run game synchronously
-    result = run_game_sync(
+    return run_game_sync(
         scenario_id=scenario_id,
         opponent_a=opponent_a,
         opponent_b=opponent_b,
         random_seed=seed,
+        game_index=game_index,
+        params=params,
+        common_random_numbers=common_random_numbers,
+        antithetic=antithetic,
+        repo=repo,
     )
 
-    return result.to_dict()
+
+@dataclass(frozen=True)
+class GameOptions:
+    """Settings every game of a run is played with (see BatchRunner).
+
+    Sent to worker processes with each chunk, so scenario_repo must pickle.
+    """
+
+    params: GameParameters | None = None
+    common_random_numbers: bool = False
+    antithetic: bool = False
+    scenario_repo: ScenarioRepository | None = None
+
+    def repo(self) -> ScenarioRepository:
+        """Repository for engines built in this process."""
+        return self.scenario_repo if self.scenario_repo is not None else get_scenario_repository()
+
+    def cache_key(
+        self,
+        cache: ResultCache | None,
+        scenario_id: str,
+        opponent_a: str,
+        opponent_b: str,
+        seed: int | None,
+        num_games: int,
+        vectorized: bool,
+        keep_games: bool,
+        first_game: int = 0,
+        param_sets: list[GameParameters] | None = None,
+    ) -> str | None:
+        """Address in cache of a pairing's games played with these options.
+
+        Args:
+            cache: Result cache to address (None: no cache)
+            scenario_id: Scenario the games are played in
+            opponent_a: Name of opponent for player A
+            opponent_b: Name of opponent for player B
+            seed: Base random seed (None: unseeded games, never cached)
+            num_games: Number of games
+            vectorized: Games played on BatchGameEngine
+            keep_games: Per-game value lists kept
+            first_game: Index of the first game
+            param_sets: Parameter sets of a run_parameter_sets_vectorized
+                batch, in place of params
+
+        Returns:
+            The cache key, or None if there is no cache or the games are unseeded
+        """
+        if cache is None or seed is None:
+            return None
+        cell = pairing_cell(
+            self.repo(),
+            scenario_id,
+            opponent_a,
+            opponent_b,
+            seed,
+            num_games,
+            vectorized,
+            params=param_sets if param_sets is not None else self.params,
+            common_random_numbers=self.common_random_numbers,
+            antithetic=self.antithetic,
+            keep_games=keep_games,
+            first_game=first_game,
+        )
+        return cache.key(**cell)
+
+
+@dataclass(frozen=True)
+class GameChunk:
+    """Games first_game .. first_game + num_games - 1 of one pairing, as one worker task.
+
+    With a seed, game i draws from game_streams(seed, i), so the chunks of
+    a pairing can be played anywhere and merged in game order. A
+    vectorized chunk is one BatchGameEngine batch: with common random
+    numbers game i keeps its draws whichever chunk plays it; otherwise the
+    batch is seeded with seed + first_game.
+    """
+
+    scenario_id: str
+    opponent_a: str
+    opponent_b: str
+    seed: int | None
+    num_games: int
+    first_game: int = 0
+    options: GameOptions = field(default_factory=GameOptions)
+    vectorized: bool = False
+    keep_games: bool = True
+    record_games: bool = False
+
+
+def play_chunk(chunk: GameChunk) -> tuple[PairingStats, dict[str, np.ndarray] | None]:
+    """Play a chunk's games, in a worker process or in this one.
+
+    Only the aggregated statistics (and, if requested, the chunk's game
+    table columns) travel back to the parent process, not each game's
+    result and history.
+
+    Args:
+        chunk: The games to play
+
+    Returns:
+        PairingStats for the chunk's games, and their game table columns if
+        chunk.record_games
+
+    Raises:
+        ValueError: If a vectorized chunk has an opponent without a vectorized policy
+    """
+    options = chunk.options
+    stats = PairingStats(opponent_a=chunk.opponent_a, opponent_b=chunk.opponent_b, keep_games=chunk.keep_games)
+
+    if chunk.vectorized:
+        check_batch_policies(chunk.opponent_a, chunk.opponent_b)
+        seed = chunk.seed
+        if seed is not None and not options.common_random_numbers:
+            seed += chunk.first_game
+        engine = BatchGameEngine(
+            chunk.scenario_id,
+            options.repo(),
+            num_games=chunk.num_games,
+            seed=seed,
+            params=options.params,
+            common_random_numbers=options.common_random_numbers,
+            antithetic=options.antithetic,
+            game_keys=np.arange(chunk.first_game, chunk.first_game + chunk.num_games),
+        )
+        outcome = engine.run(
+            BATCH_POLICIES[chunk.opponent_a](chunk.num_games, is_player_a=True),
+            BATCH_POLICIES[chunk.opponent_b](chunk.num_games, is_player_a=False),
+        )
+        stats.add_batch(outcome)
+        if not chunk.record_games:
+            return stats, None
+        return stats, columns_from_batch(outcome, chunk.opponent_a, chunk.opponent_b, chunk.seed)
+
+    game_indices = range(chunk.first_game, chunk.first_game + chunk.num_games)
+    results = [
+        _play_game(
+            chunk.scenario_id,
+            chunk.opponent_a,
+            chunk.opponent_b,
+            chunk.seed,
+            i,
+            options.params,
+            options.common_random_numbers,
+            options.antithetic,
+            options.scenario_repo,
+        )
+        for i in game_indices
+    ]
+    for result in results:
+        stats.add_result(result)
+    if not chunk.record_games:
+        return stats, None
+    return stats, columns_from_results(results, chunk.opponent_a, chunk.opponent_b, chunk.seed, game_indices)
+
+
+def check_batch_policies(*opponent_names: str) -> None:
+    """Raise ValueError unless every opponent has a vectorized policy."""
+    for name in opponent_names:
+        if name not in BATCH_POLICIES:
+            raise ValueError(f"No vectorized policy for opponent: {name}. Available: {list(BATCH_POLICIES)}")
+
+
+def default_chunk_size(num_games: int, max_workers: int) -> int:
+    """Games per worker task: about four tasks per worker, for load balancing."""
+    return max(1, math.ceil(num_games / (max_workers * 4)))
+
+
+def sequential_chunk_size(num_games: int, max_workers: int, target: PrecisionTarget) -> int:
+    """Games per worker task with early stopping: small enough to check the target often."""
+    return min(default_chunk_size(num_games, max_workers), max(1, math.ceil(target.min_games / max_workers)))
 
 
 class BatchRunner:
@@ -351,23 +750,260 @@ class BatchRunner:
     Uses the actual DeterministicOpponent implementations from
     brinksmanship.opponents.deterministic.
 
+    Games run on a process pool in chunks of consecutive games; each task
+    returns a partial PairingStats that is merged in game order. Used as a
+    context manager, the runner keeps one pool alive across calls;
+    otherwise each run_pairing or run_all_pairings call starts its own.
+
     Usage:
         runner = BatchRunner(scenario_id="cuban_missile_crisis")
 
         # Run single pairing
         stats = runner.run_pairing("NashCalculator", "TitForTat", num_games=100)
 
-        # Run all pairings
+        # Run all pairings (one pool for all of them)
         results = runner.run_all_pairings(num_games=100)
+
+        # Reuse one pool across several calls
+        with BatchRunner(scenario_id="cuban_missile_crisis", max_workers=8) as runner:
+            for name_a, name_b in pairings:
+                stats = runner.run_pairing(name_a, name_b, num_games=1000)
+
+        # Deterministic opponents only: lockstep NumPy engine
+        stats = runner.run_pairing_vectorized("NashCalculator", "TitForTat", num_games=100_000)
+
+        # Other balance parameters
+        runner = BatchRunner("cuban_missile_crisis", params=DEFAULT_PARAMETERS.replace(capture_rate=0.5))
+
+        # Variance reduction: every pairing on the same random numbers
+        runner = BatchRunner("cuban_missile_crisis", common_random_numbers=True, antithetic=True)
+
+        # A scenario that is not in the configured repository
+        repo = InMemoryScenarioRepository([scenario_dict])
+        runner = BatchRunner(scenario_dict["scenario_id"], scenario_repo=repo)
+
+        # Reuse seeded pairings whose scenario, parameters and engine are unchanged
+        runner = BatchRunner("cuban_missile_crisis", result_cache=ResultCache(".cache/simulations"))
     """
 
-    def __init__(self, scenario_id: str):
+    def __init__(
+        self,
+        scenario_id: str,
+        max_workers: int = 4,
+        params: GameParameters | None = None,
+        common_random_numbers: bool = False,
+        antithetic: bool = False,
+        scenario_repo: ScenarioRepository | None = None,
+        result_cache: ResultCache | None = None,
+    ):
         """Initialize batch runner.
 
         Args:
             scenario_id: ID of scenario to use for all games
+            max_workers: Worker processes of the pool kept open by the
+                context manager
+            params: Game balance parameters for every game (default:
+                DEFAULT_PARAMETERS)
+            common_random_numbers: Play game i of every pairing (and every
+                runner on the same seed) on the same crisis termination,
+                final resolution and per-side opponent streams, so
+                differences between pairings or parameter sets are not
+                drowned in sampling noise. run_all_pairings then seeds
+                every pairing alike.
+            antithetic: Negate the final resolution noise of odd games,
+                pairing them with the game before. Confidence intervals
+                treat games as independent, so they become conservative.
+            scenario_repo: Repository to load the scenario from (default: the
+                configured one). Sent to worker processes, so it must pickle.
+            result_cache: Cache of seeded pairings: a pairing whose inputs
+                (scenario content, parameters, engine version, opponents,
+                seed, games) were played before is not played again. Runs
+                with a target or a game table bypass it.
         """
         self.scenario_id = scenario_id
+        self.max_workers = max_workers
+        self.params = params
+        self.common_random_numbers = common_random_numbers
+        self.antithetic = antithetic
+        self.scenario_repo = scenario_repo
+        self.result_cache = result_cache
+        self._pool: ProcessPoolExecutor | None = None
+
+    def __enter__(self) -> BatchRunner:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the runner's pool, if it has one."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    @contextlib.contextmanager
+    def _executor(self, max_workers: int) -> Iterator[Executor]:
+        """The runner's open pool, or a pool that lives for one call."""
+        if self._pool is not None:
+            yield self._pool
+            return
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            yield executor
+
+    def _submit_pairing(
+        self,
+        executor: Executor,
+        opponent_a_name: str,
+        opponent_b_name: str,
+        num_games: int,
+        seed: int | None,
+        first_game: int,
+        chunk_size: int,
+        keep_games: bool,
+        record_games: bool,
+    ) -> list[Future]:
+        """Submit a pairing's games as chunks; futures are in game order."""
+        return [
+            executor.submit(
+                play_chunk,
+                GameChunk(
+                    self.scenario_id,
+                    opponent_a_name,
+                    opponent_b_name,
+                    seed,
+                    min(chunk_size, first_game + num_games - start),
+                    first_game=start,
+                    options=self.game_options,
+                    keep_games=keep_games,
+                    record_games=record_games,
+                ),
+            )
+            for start in range(first_game, first_game + num_games, chunk_size)
+        ]
+
+    @property
+    def game_options(self) -> GameOptions:
+        """The runner's per-game settings, as sent to workers."""
+        return GameOptions(self.params, self.common_random_numbers, self.antithetic, self.scenario_repo)
+
+    def pairing_seed(self, seed: int | None, idx: int, num_games: int) -> int | None:
+        """Seed of the idx-th pairing of a run (shared by all pairings with common random numbers)."""
+        if seed is None or self.common_random_numbers:
+            return seed
+        return seed + idx * num_games
+
+    def _workers(self, max_workers: int) -> int:
+        """Worker count of the pool _executor(max_workers) yields."""
+        return self.max_workers if self._pool is not None else max_workers
+
+    def _run_sequential(
+        self,
+        executor: Executor,
+        pairings: list[tuple[str, str, int | None]],
+        first_game: int,
+        num_games: int,
+        chunk_size: int,
+        keep_games: bool,
+        games: GameTableWriter | None,
+        target: PrecisionTarget,
+        workers: int,
+        start: list[PairingStats] | None = None,
+        on_merge: Callable[[int, PairingStats], None] | None = None,
+    ) -> list[PairingStats]:
+        """Run (opponent_a, opponent_b, seed) pairings chunk by chunk until each meets target.
+
+        About two chunks per worker are in flight at a time. The next chunk
+        always goes to the unfinished pairing with the fewest games
+        submitted, so the pool's time goes to pairings that are still
+        uncertain. Each pairing's chunks are merged in game order and the
+        target is checked after every merge; a pairing that meets it gets
+        no further chunks and its queued ones are cancelled. Game table rows
+        are appended as chunks are merged, so pairings interleave.
+
+        Pairings continue from start (games first_game .. first_game +
+        total_games - 1 already played), and on_merge(i, stats) is called
+        after every merge into pairing i.
+        """
+        if start is None:
+            start = [PairingStats(opponent_a=a, opponent_b=b, keep_games=keep_games) for a, b, _ in pairings]
+        stats = start
+        queued: list[deque[Future]] = [deque() for _ in pairings]
+        next_game = [first_game + s.total_games for s in stats]
+        stopped = [target.is_met(s) for s in stats]
+        in_flight: dict[Future, int] = {}
+        end = first_game + num_games
+
+        def submit_chunks() -> None:
+            while len(in_flight) < 2 * workers:
+                open_pairings = [i for i in range(len(pairings)) if not stopped[i] and next_game[i] < end]
+                if not open_pairings:
+                    return
+                i = min(open_pairings, key=lambda k: next_game[k])
+                name_a, name_b, seed = pairings[i]
+                size = min(chunk_size, end - next_game[i])
+                chunk = GameChunk(
+                    self.scenario_id,
+                    name_a,
+                    name_b,
+                    seed,
+                    size,
+                    first_game=next_game[i],
+                    options=self.game_options,
+                    keep_games=keep_games,
+                    record_games=games is not None,
+                )
+                future = executor.submit(play_chunk, chunk)
+                queued[i].append(future)
+                in_flight[future] = i
+                next_game[i] += size
+
+        submit_chunks()
+        while in_flight:
+            finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for i in {in_flight.pop(future) for future in finished}:
+                while queued[i] and queued[i][0].done() and not stopped[i]:
+                    chunk_stats, columns = queued[i].popleft().result()
+                    stats[i].merge(chunk_stats)
+                    if games is not None:
+                        games.append_columns(columns)
+                    stopped[i] = target.is_met(stats[i])
+                    if on_merge is not None:
+                        on_merge(i, stats[i])
+                if stopped[i]:
+                    for future in queued[i]:
+                        future.cancel()
+                        in_flight.pop(future, None)
+                    queued[i].clear()
+            submit_chunks()
+        return stats
+
+    @staticmethod
+    def _collect_pairing(
+        opponent_a_name: str,
+        opponent_b_name: str,
+        futures: list[Future],
+        keep_games: bool,
+        games: GameTableWriter | None,
+        stats: PairingStats | None = None,
+        on_merge: Callable[[PairingStats], None] | None = None,
+    ) -> PairingStats:
+        """Merge chunk results (and append their games) in submission (game) order.
+
+        Chunks are merged into stats if given (games played earlier), and
+        on_merge(stats) is called after every chunk.
+        """
+        if stats is None:
+            stats = PairingStats(opponent_a=opponent_a_name, opponent_b=opponent_b_name, keep_games=keep_games)
+        for future in futures:
+            chunk_stats, columns = future.result()
+            stats.merge(chunk_stats)
+            if games is not None:
+                games.append_columns(columns)
+            if on_merge is not None:
+                on_merge(stats)
+        return stats
 
     def run_pairing(
         self,
@@ -376,56 +1012,243 @@ class BatchRunner:
         num_games: int = 100,
         seed: int | None = None,
         max_workers: int = 4,
+        first_game: int = 0,
+        chunk_size: int | None = None,
+        keep_games: bool = True,
+        games: GameTableWriter | None = None,
+        target: PrecisionTarget | None = None,
     ) -> PairingStats:
         """Run games between two opponent types.
 
+        With a seed, game i draws from game_streams(seed, i) and results are
+        aggregated in game order, so the statistics do not depend on
+        max_workers or chunk_size, and a run can be sharded with first_game.
+        With a target, games stop once it is met (num_games is then the
+        maximum); the statistics depend on chunk_size, where it is checked.
+        Seeded runs without a target or game table are looked up in (and
+        added to) the runner's result_cache.
+
         Args:
             opponent_a_name: Name of opponent for player A
             opponent_b_name: Name of opponent for player B
             num_games: Number of games to run
-            seed: Base random seed (game i uses seed + i)
-            max_workers: Maximum parallel workers
+            seed: Base random seed
+            max_workers: Maximum parallel workers (ignored inside a with block,
+                which uses the runner's pool)
+            first_game: Index of the first game (for sharding a seeded run)
+            chunk_size: Games per worker task (default: default_chunk_size)
+            keep_games: Keep per-game value lists (False: streaming summaries only)
+            games: Game table to append one row per game to, in game order
+            target: Stop early once this precision is reached
 
         Returns:
             PairingStats with aggregated statistics
         """
-        stats = PairingStats(opponent_a=opponent_a_name, opponent_b=opponent_b_name)
+        if target is not None:
+            if chunk_size is None:
+                chunk_size = sequential_chunk_size(num_games, max_workers, target)
+            with self._executor(max_workers) as executor:
+                return self._run_sequential(
+                    executor,
+                    [(opponent_a_name, opponent_b_name, seed)],
+                    first_game,
+                    num_games,
+                    chunk_size,
+                    keep_games,
+                    games,
+                    target,
+                    self._workers(max_workers),
+                )[0]
+
+        cache = self.result_cache if games is None else None
+        key = self.game_options.cache_key(
+            cache, self.scenario_id, opponent_a_name, opponent_b_name, seed, num_games, False, keep_games, first_game
+        )
+        if cache is not None and key is not None:
+            cached: PairingStats | None = cache.get(key)
+            if cached is not None:
+                return cached
+
+        if chunk_size is None:
+            chunk_size = default_chunk_size(num_games, max_workers)
+
+        with self._executor(max_workers) as executor:
+            futures = self._submit_pairing(
+                executor,
+                opponent_a_name,
+                opponent_b_name,
+                num_games,
+                seed,
+                first_game,
+                chunk_size,
+                keep_games,
+                games is not None,
+            )
+            stats = self._collect_pairing(opponent_a_name, opponent_b_name, futures, keep_games, games)
+        if cache is not None and key is not None:
+            cache.put(key, stats)
+        return stats
 
-        # Prepare game arguments
-        game_args = []
-        for i in range(num_games):
-            game_seed = (seed + i) if seed is not None else None
-            game_args.append((self.scenario_id, opponent_a_name, opponent_b_name, game_seed))
+    def run_pairing_vectorized(
+        self,
+        opponent_a_name: str,
+        opponent_b_name: str,
+        num_games: int = 100,
+        seed: int | None = None,
+        keep_games: bool = True,
+        games: GameTableWriter | None = None,
+    ) -> PairingStats:
+        """Run games between two deterministic opponents on BatchGameEngine.
 
-        # Run games in parallel
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            futures = [executor.submit(_run_single_game, args) for args in game_args]
-
-            for future in as_completed(futures):
-                result_dict = future.result()
-                # Reconstruct GameResult from dict
-                result = GameResult(
-                    winner=result_dict["winner"],
-                    ending_type=result_dict["ending_type"],
-                    turns_played=result_dict["turns_played"],
-                    final_pos_a=result_dict["final_pos_a"],
-                    final_pos_b=result_dict["final_pos_b"],
-                    final_res_a=result_dict["final_res_a"],
-                    final_res_b=result_dict["final_res_b"],
-                    final_risk=result_dict["final_risk"],
-                    final_cooperation=result_dict["final_cooperation"],
-                    final_stability=result_dict["final_stability"],
-                    vp_a=result_dict["vp_a"],
-                    vp_b=result_dict["vp_b"],
-                    history=result_dict["history"],
-                    scenario_id=result_dict["scenario_id"],
-                    opponent_a_name=result_dict["opponent_a_name"],
-                    opponent_b_name=result_dict["opponent_b_name"],
-                )
-                stats.add_result(result)
+        All games advance in lockstep in one process, so this is orders of
+        magnitude faster than run_pairing. Results are statistically
+        equivalent, not game-for-game identical, for the same seed.
+
+        Args:
+            opponent_a_name: Name of deterministic opponent for player A
+            opponent_b_name: Name of deterministic opponent for player B
+            num_games: Number of games to run
+            seed: Random seed for the whole batch
+            keep_games: Keep per-game value lists (False: streaming summaries only)
+            games: Game table to append one row per game to
 
+        Returns:
+            PairingStats with aggregated statistics
+
+        Raises:
+            ValueError: If either opponent has no vectorized policy
+        """
+        check_batch_policies(opponent_a_name, opponent_b_name)
+
+        cache = self.result_cache if games is None else None
+        key = self.game_options.cache_key(
+            cache, self.scenario_id, opponent_a_name, opponent_b_name, seed, num_games, True, keep_games
+        )
+        if cache is not None and key is not None:
+            cached: PairingStats | None = cache.get(key)
+            if cached is not None:
+                return cached
+
+        stats, columns = play_chunk(
+            GameChunk(
+                self.scenario_id,
+                opponent_a_name,
+                opponent_b_name,
+                seed,
+                num_games,
+                options=self.game_options,
+                vectorized=True,
+                keep_games=keep_games,
+                record_games=games is not None,
+            )
+        )
+        if games is not None and columns is not None:
+            games.append_columns(columns)
+        if cache is not None and key is not None:
+            cache.put(key, stats)
         return stats
 
+    def run_parameter_sets_vectorized(
+        self,
+        opponent_a_name: str,
+        opponent_b_name: str,
+        param_sets: Sequence[GameParameters],
+        num_games: int = 100,
+        seed: int | None = None,
+        keep_games: bool = True,
+    ) -> list[PairingStats]:
+        """Run one pairing under several parameter sets as a single batch.
+
+        The batch has a parameter axis: games k * num_games .. (k + 1) *
+        num_games - 1 use param_sets[k]. Every set is played in the same
+        BatchGameEngine run, so a whole sweep costs one lockstep batch
+        instead of one run (or process) per set. With common random
+        numbers, game i of every set shares its engine draws.
+
+        Args:
+            opponent_a_name: Name of deterministic opponent for player A
+            opponent_b_name: Name of deterministic opponent for player B
+            param_sets: Parameter sets to compare (the runner's params are ignored)
+            num_games: Number of games per parameter set
+            seed: Random seed for the whole batch
+            keep_games: Keep per-game value lists (False: streaming summaries only)
+
+        Returns:
+            PairingStats per parameter set, in param_sets order
+
+        Raises:
+            ValueError: If either opponent has no vectorized policy or param_sets is empty
+        """
+        check_batch_policies(opponent_a_name, opponent_b_name)
+        if not param_sets:
+            raise ValueError("param_sets must not be empty")
+        cache = self.result_cache
+        key = self.game_options.cache_key(
+            cache,
+            self.scenario_id,
+            opponent_a_name,
+            opponent_b_name,
+            seed,
+            num_games,
+            True,
+            keep_games,
+            param_sets=list(param_sets),
+        )
+        if cache is not None and key is not None:
+            cached: list[PairingStats] | None = cache.get(key)
+            if cached is not None:
+                return cached
+
+        total = num_games * len(param_sets)
+        engine = BatchGameEngine(
+            self.scenario_id,
+            self.game_options.repo(),
+            num_games=total,
+            seed=seed,
+            params=[params for params in param_sets for _ in range(num_games)],
+            common_random_numbers=self.common_random_numbers,
+            antithetic=self.antithetic,
+            game_keys=np.tile(np.arange(num_games), len(param_sets)),
+        )
+        outcome = engine.run(
+            BATCH_POLICIES[opponent_a_name](total, is_player_a=True),
+            BATCH_POLICIES[opponent_b_name](total, is_player_a=False),
+        )
+
+        results = []
+        for k in range(len(param_sets)):
+            stats = PairingStats(opponent_a=opponent_a_name, opponent_b=opponent_b_name, keep_games=keep_games)
+            stats.add_batch(outcome.take(slice(k * num_games, (k + 1) * num_games)))
+            results.append(stats)
+        if cache is not None and key is not None:
+            cache.put(key, results)
+        return results
+
+    def solve_pairing(self, opponent_a_name: str, opponent_b_name: str) -> SolverResult:
+        """Compute the outcome distribution of a pairing without sampling.
+
+        Uses GameTreeSolver: for mostly deterministic pairings the result is
+        what run_pairing_vectorized converges to as num_games grows; pairings
+        with random policies merge nearby states (see SolverResult.resolution).
+
+        Args:
+            opponent_a_name: Name of deterministic opponent for player A
+            opponent_b_name: Name of deterministic opponent for player B
+
+        Returns:
+            SolverResult with ending, winner and VP expectations
+
+        Raises:
+            ValueError: If either opponent has no vectorized policy
+        """
+        check_batch_policies(opponent_a_name, opponent_b_name)
+
+        solver = GameTreeSolver(self.scenario_id, self.game_options.repo(), params=self.params)
+        return solver.solve(
+            BATCH_POLICIES[opponent_a_name](1, is_player_a=True),
+            BATCH_POLICIES[opponent_b_name](1, is_player_a=False),
+        )
+
     def run_all_pairings(
         self,
         opponent_names: list[str] | None = None,
@@ -433,53 +1256,151 @@ class BatchRunner:
         seed: int | None = None,
         max_workers: int = 4,
         output_dir: str | None = None,
+        vectorized: bool = False,
+        chunk_size: int | None = None,
+        keep_games: bool = True,
+        games: GameTableWriter | None = None,
+        target: PrecisionTarget | None = None,
+        quiet: bool = False,
+        checkpoint_dir: str | Path | None = None,
+        resume: bool = False,
     ) -> BatchResults:
         """Run all unique pairings of opponents.
 
+        All pairings share one process pool and every chunk is submitted up
+        front, so workers stay busy across pairing boundaries. With a target,
+        chunks are instead submitted as pairings need them and each pairing
+        stops once it is precise enough (see run_pairing). Vectorized runs
+        send each pairing to the pool as one BatchGameEngine batch.
+
+        With a checkpoint_dir, each pairing's statistics are saved as a
+        shard whenever they grow (after every chunk; vectorized pairings
+        once done). A resumed run skips finished pairings and plays only the
+        missing games of the others, merging them into the saved statistics.
+
+        With the runner's result_cache, seeded pairings already in the cache
+        are not played again (runs with a target or game table bypass it).
+
         Args:
             opponent_names: List of opponent names (default: all deterministic)
             num_games: Number of games per pairing
             seed: Base random seed
-            max_workers: Maximum parallel workers
+            max_workers: Maximum parallel workers (ignored inside a with block,
+                which uses the runner's pool)
             output_dir: Optional directory to save results
+            vectorized: Run each pairing on BatchGameEngine, one pairing per
+                worker task (in this process if max_workers is 1)
+            chunk_size: Games per worker task (default: default_chunk_size)
+            keep_games: Keep per-game value lists (False: streaming summaries only)
+            games: Game table to append one row per game to, pairing by pairing
+                (interleaved across pairings with a target)
+            target: Stop each pairing early once this precision is reached;
+                num_games is then the maximum per pairing
+            quiet: Suppress progress output
+            checkpoint_dir: Directory for checkpoint shards (see RunCheckpoint)
+            resume: Continue the run stored in checkpoint_dir (its seed is
+                used if seed is None; games' rows beyond its last shard are
+                dropped from the game table)
 
         Returns:
             BatchResults with all statistics
+
+        Raises:
+            ValueError: If target is combined with vectorized, a vectorized
+                run has an opponent without a vectorized policy, or
+                checkpoint_dir holds a different run (or any run, without resume)
         """
+        if target is not None and vectorized:
+            raise ValueError("Early stopping needs the process pool; vectorized runs play every game at once")
         if opponent_names is None:
             opponent_names = list(DETERMINISTIC_OPPONENTS.keys())
+        if vectorized:
+            check_batch_policies(*opponent_names)
+        if chunk_size is None:
+            if target is not None:
+                chunk_size = sequential_chunk_size(num_games, max_workers, target)
+            else:
+                chunk_size = default_chunk_size(num_games, max_workers)
+
+        run = _PairingsRun(self, opponent_names, num_games, seed, games)
+        if checkpoint_dir is not None:
+            config = self._checkpoint_config(opponent_names, num_games, vectorized, target, chunk_size, games)
+            run.open_checkpoint(checkpoint_dir, config, resume)
+        elif seed is None and self.common_random_numbers:
+            run.seed = fresh_seed()
+        # Pairings found in the result cache are played like finished checkpoint shards
+        # (run_pairing_vectorized looks up in-process batches itself)
+        if target is None and games is None and not (vectorized and self._workers(max_workers) <= 1):
+            run.load_cached(vectorized, keep_games)
 
         start_time = time.time()
-        timestamp = datetime.now().isoformat()
-
-        results = BatchResults(
-            scenario_id=self.scenario_id,
-            timestamp=timestamp,
-        )
-
-        # Generate all unique pairings (including self-play)
-        pairings = []
-        for i, name_a in enumerate(opponent_names):
-            for name_b in opponent_names[i:]:
-                pairings.append((name_a, name_b))
-
-        # Run each pairing
-        for idx, (name_a, name_b) in enumerate(pairings):
-            pairing_key = f"{name_a}:{name_b}"
-            print(f"  [{idx + 1}/{len(pairings)}] {pairing_key}...", end=" ", flush=True)
-
-            pairing_seed = (seed + idx * num_games) if seed is not None else None
-
-            stats = self.run_pairing(
-                name_a,
-                name_b,
-                num_games=num_games,
-                seed=pairing_seed,
-                max_workers=max_workers,
-            )
-
-            results.pairings[pairing_key] = stats
-            print(f"A:{stats.win_rate_a * 100:.0f}% B:{stats.win_rate_b * 100:.0f}%")
+        results = BatchResults(scenario_id=self.scenario_id, timestamp=datetime.now().isoformat())
+
+        with contextlib.ExitStack() as stack:
+            # Submit every pairing's chunks before collecting any of them
+            submitted: list[list[Future]] = []
+            sequential: list[PairingStats] = []
+            if target is not None:
+                executor = stack.enter_context(self._executor(max_workers))
+                sequential = self._run_sequential(
+                    executor,
+                    [(name_a, name_b, run.pairing_seed(idx)) for idx, (name_a, name_b) in enumerate(run.pairings)],
+                    0,
+                    num_games,
+                    chunk_size,
+                    keep_games,
+                    games,
+                    target,
+                    self._workers(max_workers),
+                    start=[run.start(idx, keep_games) for idx in range(len(run.pairings))],
+                    on_merge=run.save,
+                )
+            elif not vectorized or self._workers(max_workers) > 1:
+                executor = stack.enter_context(self._executor(max_workers))
+                submitted = self._submit_run(executor, run, vectorized, chunk_size, keep_games)
+
+            # Collect each pairing
+            for idx, (name_a, name_b) in enumerate(run.pairings):
+                pairing_key = run.key(idx)
+                if not quiet:
+                    print(f"  [{idx + 1}/{len(run.pairings)}] {pairing_key}...", end=" ", flush=True)
+
+                resumed = run.resumed[idx]
+                if target is not None:
+                    stats = sequential[idx]
+                elif submitted:
+                    stats = self._collect_pairing(
+                        name_a,
+                        name_b,
+                        submitted[idx],
+                        keep_games,
+                        games,
+                        stats=resumed,
+                        on_merge=lambda merged, idx=idx: run.save(idx, merged),
+                    )
+                elif resumed is not None:
+                    stats = resumed
+                else:
+                    stats = self.run_pairing_vectorized(
+                        name_a,
+                        name_b,
+                        num_games=num_games,
+                        seed=run.pairing_seed(idx),
+                        keep_games=keep_games,
+                        games=games,
+                    )
+                    run.save(idx, stats)
+
+                results.pairings[pairing_key] = stats
+                run.finish(idx, stats)
+                line = f"A:{stats.win_rate_a * 100:.0f}% B:{stats.win_rate_b * 100:.0f}%"
+                if target is not None:
+                    line += (
+                        f" ({stats.total_games} games, TV +/-{stats.total_value_half_width(target.confidence):.1f}"
+                        f", win +/-{stats.win_rate_half_width(target.confidence) * 100:.1f}%)"
+                    )
+                if not quiet:
+                    print(line)
 
         # Compute aggregates
         results.compute_aggregate()
@@ -492,10 +1413,188 @@ class BatchRunner:
             results_path = output_path / "batch_results.json"
             with open(results_path, "w") as f:
                 f.write(results.to_json())
-            print(f"\nResults saved to: {results_path}")
+            if not quiet:
+                print(f"\nResults saved to: {results_path}")
 
         return results
 
+    def _checkpoint_config(
+        self,
+        opponent_names: list[str],
+        num_games: int,
+        vectorized: bool,
+        target: PrecisionTarget | None,
+        chunk_size: int,
+        games: GameTableWriter | None,
+    ) -> dict:
+        """Settings a resumed run_all_pairings must share with the checkpointed one."""
+        return {
+            "scenario_id": self.scenario_id,
+            "opponents": opponent_names,
+            "num_games": num_games,
+            "vectorized": vectorized,
+            "params": asdict(self.params) if self.params is not None else None,
+            "common_random_numbers": self.common_random_numbers,
+            "antithetic": self.antithetic,
+            # Early-stopped statistics depend on where the target is checked
+            "target": asdict(target) if target is not None else None,
+            "chunk_size": chunk_size if target is not None else None,
+            "game_table": games is not None,
+        }
+
+    def _submit_run(
+        self,
+        executor: Executor,
+        run: _PairingsRun,
+        vectorized: bool,
+        chunk_size: int,
+        keep_games: bool,
+    ) -> list[list[Future]]:
+        """Submit the games each pairing of run still needs; futures per pairing, in game order."""
+        record_games = run.games is not None
+        submitted: list[list[Future]] = []
+        for idx, (name_a, name_b) in enumerate(run.pairings):
+            if vectorized:
+                # A vectorized pairing is a single batch: a resumed one is finished
+                if run.resumed[idx] is not None:
+                    submitted.append([])
+                    continue
+                chunk = GameChunk(
+                    self.scenario_id,
+                    name_a,
+                    name_b,
+                    run.pairing_seed(idx),
+                    run.num_games,
+                    options=self.game_options,
+                    vectorized=True,
+                    keep_games=keep_games,
+                    record_games=record_games,
+                )
+                submitted.append([executor.submit(play_chunk, chunk)])
+            else:
+                done = run.played(idx)
+                submitted.append(
+                    self._submit_pairing(
+                        executor,
+                        name_a,
+                        name_b,
+                        run.num_games - done,
+                        run.pairing_seed(idx),
+                        done,
+                        chunk_size,
+                        keep_games,
+                        record_games,
+                    )
+                )
+        return submitted
+
+
+class _PairingsRun:
+    """Pairings of one run_all_pairings call and the statistics known before they are played.
+
+    Statistics come from the checkpoint's shards (on resume) or the
+    runner's result cache; pairings are saved as shards as they grow and
+    put in the cache once finished.
+    """
+
+    def __init__(
+        self,
+        runner: BatchRunner,
+        opponent_names: list[str],
+        num_games: int,
+        seed: int | None,
+        games: GameTableWriter | None,
+    ):
+        self.runner = runner
+        self.num_games = num_games
+        self.seed = seed
+        self.games = games
+        # All unique pairings (including self-play)
+        self.pairings = [(name_a, name_b) for i, name_a in enumerate(opponent_names) for name_b in opponent_names[i:]]
+        self.resumed: list[PairingStats | None] = [None] * len(self.pairings)
+        self.checkpoint: RunCheckpoint | None = None
+        self._cache_keys: list[str | None] = [None] * len(self.pairings)
+        self._cached: set[int] = set()
+
+    def key(self, idx: int) -> str:
+        """Results (and shard) key of the idx-th pairing."""
+        name_a, name_b = self.pairings[idx]
+        return f"{name_a}:{name_b}"
+
+    def pairing_seed(self, idx: int) -> int | None:
+        return self.runner.pairing_seed(self.seed, idx, self.num_games)
+
+    def played(self, idx: int) -> int:
+        """Games of the idx-th pairing already played by an earlier run (or found in the cache)."""
+        resumed = self.resumed[idx]
+        return resumed.total_games if resumed is not None else 0
+
+    def start(self, idx: int, keep_games: bool) -> PairingStats:
+        """Statistics the idx-th pairing continues from."""
+        resumed = self.resumed[idx]
+        if resumed is not None:
+            return resumed
+        name_a, name_b = self.pairings[idx]
+        return PairingStats(opponent_a=name_a, opponent_b=name_b, keep_games=keep_games)
+
+    def open_checkpoint(self, checkpoint_dir: str | Path, config: dict, resume: bool) -> None:
+        """Open the run's checkpoint, taking its seed and the statistics of its shards.
+
+        Game table rows beyond the checkpoint's last shard are dropped.
+        """
+        table_rows = self.games.num_rows if self.games is not None else None
+        self.checkpoint = RunCheckpoint(checkpoint_dir, config, self.seed, resume, table_rows)
+        self.seed = self.checkpoint.seed
+        rows = self.checkpoint.table_rows()
+        if self.games is not None and rows is not None:
+            self.games.truncate(rows)
+        for idx in range(len(self.pairings)):
+            shard = self.checkpoint.load(self.key(idx))
+            if shard is not None:
+                self.resumed[idx] = shard.result
+
+    def load_cached(self, vectorized: bool, keep_games: bool) -> None:
+        """Take the statistics of pairings found in the runner's result cache (and checkpoint them)."""
+        cache = self.runner.result_cache
+        if cache is None:
+            return
+        for idx, (name_a, name_b) in enumerate(self.pairings):
+            key = self.runner.game_options.cache_key(
+                cache,
+                self.runner.scenario_id,
+                name_a,
+                name_b,
+                self.pairing_seed(idx),
+                self.num_games,
+                vectorized,
+                keep_games,
+            )
+            self._cache_keys[idx] = key
+            if key is not None and self.resumed[idx] is None:
+                cached = cache.get(key)
+                if cached is not None:
+                    self.resumed[idx] = cached
+                    self._cached.add(idx)
+                    self.save(idx, cached)
+
+    def save(self, idx: int, stats: PairingStats) -> None:
+        """Save the idx-th pairing's statistics as a checkpoint shard, if the run has a checkpoint."""
+        if self.checkpoint is not None:
+            self.checkpoint.save(
+                self.key(idx),
+                stats,
+                self.pairing_seed(idx),
+                stats.total_games,
+                table_rows=self.games.num_rows if self.games is not None else None,
+            )
+
+    def finish(self, idx: int, stats: PairingStats) -> None:
+        """Put the idx-th pairing's final statistics in the result cache, unless they came from it."""
+        key = self._cache_keys[idx]
+        cache = self.runner.result_cache
+        if cache is not None and key is not None and idx not in self._cached:
+            cache.put(key, stats)
+
 
 def print_results_summary(results: BatchResults) -> None:
     """Print a human-readable summary of batch results."""
@@ -579,18 +1678,18 @@ def print_results_summary(results: BatchResults) -> None:
         # Opponent A stats
         opponent_metrics[name_a]["wins"] += stats.wins_a
         opponent_metrics[name_a]["games"] += stats.total_games
-        opponent_metrics[name_a]["total_value_sum"] += sum(stats.total_value_list)
-        opponent_metrics[name_a]["vp_share_sum"] += sum(stats.vp_share_a_list)
-        opponent_metrics[name_a]["game_count"] += len(stats.total_value_list)
+        opponent_metrics[name_a]["total_value_sum"] += stats.total_value_stats.total
+        opponent_metrics[name_a]["vp_share_sum"] += stats.vp_share_a_stats.total
+        opponent_metrics[name_a]["game_count"] += stats.total_value_stats.count
 
         # Opponent B stats (if not self-play)
         if name_a != name_b:
             opponent_metrics[name_b]["wins"] += stats.wins_b
             opponent_metrics[name_b]["games"] += stats.total_games
-            opponent_metrics[name_b]["total_value_sum"] += sum(stats.total_value_list)
+            opponent_metrics[name_b]["total_value_sum"] += stats.total_value_stats.total
             # VP share for B is 1 - share_a
-            opponent_metrics[name_b]["vp_share_sum"] += sum(1 - s for s in stats.vp_share_a_list)
-            opponent_metrics[name_b]["game_count"] += len(stats.total_value_list)
+            opponent_metrics[name_b]["vp_share_sum"] += stats.vp_share_a_stats.count - stats.vp_share_a_stats.total
+            opponent_metrics[name_b]["game_count"] += stats.total_value_stats.count
 
     print(f"{'Opponent':<20} {'Avg Total':>10} {'VP Share':>10} {'Win Rate':>10} {'Status':>12}")
     print("-" * 65)
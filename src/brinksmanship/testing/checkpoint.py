@@ -0,0 +1,185 @@
+"""Checkpoints for long batch and sweep runs.
+
+A checkpoint is a directory holding the run's configuration and one shard
+file per finished unit of work (a pairing, a sweep point, a defection
+turn), each with the seed range it covers:
+
+    checkpoint/
+        run.json
+        shards/
+            TitForTat_Erratic.pkl
+            ...
+
+Shards are written atomically as work completes, so a crash, Ctrl-C or a
+preempted machine loses at most the units in flight. A run resumed from
+the same directory loads the finished shards, skips their work and merges
+their partial aggregates into the results. Seeded runs derive every game's
+random streams from the seed and the game index, so a resumed run gives
+the same statistics as an uninterrupted one.
+
+Shards are pickles: only resume from checkpoint directories you created.
+
+Usage:
+    from brinksmanship.testing.checkpoint import RunCheckpoint
+
+    checkpoint = RunCheckpoint("runs/sweep", config={"num_games": 1000}, seed=42, resume=True)
+    shard = checkpoint.load("point_1")
+    if shard is None:
+        result = simulate(checkpoint.seed)
+        checkpoint.save("point_1", result, seed=checkpoint.seed, num_games=1000)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import pickle
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from brinksmanship.engine.rng import fresh_seed
+
+FORMAT_VERSION = 1
+RUN_FILE = "run.json"
+SHARD_DIR = "shards"
+
+
+@dataclass
+class Shard:
+    """A finished unit of work and the games it covers.
+
+    The games are first_game .. first_game + num_games - 1, with random
+    streams derived from seed.
+    """
+
+    key: str
+    result: Any
+    seed: int | None
+    first_game: int
+    num_games: int
+    table_rows: int | None = None  # Game table rows once this shard's games were appended
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write data so that readers see either the old file or the whole new one."""
+    tmp = path.with_name(f"{path.name}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    tmp.replace(path)
+
+
+def _normalized(config: dict) -> dict:
+    """Config as it reads back from JSON (tuples become lists)."""
+    return json.loads(json.dumps(config, sort_keys=True))
+
+
+class RunCheckpoint:
+    """Shard directory of one run.
+
+    Opening a directory that already holds a run requires resume=True and
+    the same configuration; the stored seed is then used (a run started
+    without a seed gets a fresh one, so it can be resumed reproducibly).
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        config: dict,
+        seed: int | None = None,
+        resume: bool = False,
+        table_rows: int | None = None,
+    ):
+        """Open (or create) the checkpoint at path.
+
+        Args:
+            path: Checkpoint directory
+            config: JSON-serializable run settings; a resumed run must match them
+            seed: Base seed of the run (default: fresh, or the stored one on resume)
+            resume: Continue the run stored at path
+            table_rows: Rows of the run's game table before the run started
+
+        Raises:
+            ValueError: If path holds a run and resume is False, or the stored
+                run has a different config or seed
+        """
+        self.path = Path(path)
+        self.config = _normalized(config)
+        run_file = self.path / RUN_FILE
+        if run_file.exists():
+            if not resume:
+                raise ValueError(f"{self.path} already holds a run; resume it or use a new checkpoint directory")
+            stored = json.loads(run_file.read_text())
+            if stored.get("version") != FORMAT_VERSION:
+                raise ValueError(f"Unsupported checkpoint version in {self.path}: {stored.get('version')}")
+            if stored["config"] != self.config:
+                raise ValueError(f"{self.path} holds a run with other settings: {stored['config']}")
+            if seed is not None and seed != stored["seed"]:
+                raise ValueError(f"{self.path} holds a run with seed {stored['seed']}, not {seed}")
+            self.seed: int = stored["seed"]
+            self.start_table_rows: int | None = stored.get("table_rows")
+        else:
+            self.seed = seed if seed is not None else fresh_seed()
+            self.start_table_rows = table_rows
+            (self.path / SHARD_DIR).mkdir(parents=True, exist_ok=True)
+            meta = {"version": FORMAT_VERSION, "config": self.config, "seed": self.seed, "table_rows": table_rows}
+            write_atomic(run_file, json.dumps(meta, indent=2).encode("utf-8"))
+        self._shards = self._read_shards()
+
+    def _shard_path(self, key: str) -> Path:
+        return self.path / SHARD_DIR / f"{re.sub(r'[^A-Za-z0-9_.=-]', '_', key)}.pkl"
+
+    def _read_shards(self) -> dict[str, Shard]:
+        shards = {}
+        for path in sorted((self.path / SHARD_DIR).glob("*.pkl")):
+            shard = pickle.loads(path.read_bytes())
+            shards[shard.key] = shard
+        return shards
+
+    def __len__(self) -> int:
+        return len(self._shards)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._shards
+
+    def load(self, key: str) -> Shard | None:
+        """The finished shard for key, if any."""
+        return self._shards.get(key)
+
+    def save(
+        self,
+        key: str,
+        result: Any,
+        seed: int | None,
+        num_games: int,
+        first_game: int = 0,
+        table_rows: int | None = None,
+    ) -> Shard:
+        """Record a finished (or grown) unit of work, replacing any shard with the same key.
+
+        Args:
+            key: Unit of work, unique within the run
+            result: Picklable result or partial aggregate
+            seed: Seed the games' random streams derive from
+            num_games: Games covered
+            first_game: Index of the first game covered
+            table_rows: Game table rows once these games were appended
+
+        Returns:
+            The saved Shard
+        """
+        shard = Shard(key, result, seed, first_game, num_games, table_rows)
+        write_atomic(self._shard_path(key), pickle.dumps(shard))
+        self._shards[key] = shard
+        return shard
+
+    def table_rows(self) -> int | None:
+        """Game table rows covered by the saved shards (rows beyond were never checkpointed)."""
+        rows = [shard.table_rows for shard in self._shards.values() if shard.table_rows is not None]
+        return max(rows, default=self.start_table_rows)
+
+
+__all__ = ["RunCheckpoint", "Shard", "write_atomic"]
@@ -0,0 +1,612 @@
+"""Coordinator/worker mode for simulations that span several machines.
+
+A coordinator splits a run into work units (scenario, pairing, parameter
+set, seed range) and publishes them to a queue. Any number of worker
+processes, on any host that can reach the queue, lease units, play their
+games and store a partial PairingStats. The coordinator reports progress
+and merges each pairing's partial statistics in game order:
+
+    coordinator host                       worker hosts
+    ----------------                       ------------
+    Coordinator.run_all_pairings  --->  queue  <---  run_worker (x N)
+
+The default queue is a SQLite file (SQLiteWorkQueue); put it on a shared
+filesystem, or implement WorkQueue on a real broker. Leases expire, so a
+unit whose worker crashed or lost its host is handed to another worker;
+a unit that fails max_attempts times fails the run. Units of a job are
+kept in the queue, so rerunning a coordinator with the same job name picks
+up the finished units instead of playing them again.
+
+Seeded runs derive every game's random streams from the seed and the game
+index, so they give the same statistics whichever worker plays which unit.
+Workers load the scenario from the unit's scenario_repo if it has one, and
+from their configured repository otherwise. Payloads and results are
+pickles: only share a queue with machines you trust.
+
+Usage:
+    # Coordinator
+    queue = SQLiteWorkQueue("/shared/brinksmanship-queue.db")
+    runner = BatchRunner("cuban_missile_crisis")
+    results = Coordinator(queue).run_all_pairings(runner, num_games=100_000, seed=42, job="balance-42")
+
+    # Each worker host
+    run_worker(SQLiteWorkQueue("/shared/brinksmanship-queue.db"), idle_timeout=60)
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+import socket
+import sqlite3
+import threading
+import time
+import traceback
+import uuid
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from collections.abc import Sequence
+from contextlib import closing
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from brinksmanship.engine.rng import fresh_seed
+from brinksmanship.parameters import GameParameters
+from brinksmanship.storage import ScenarioRepository
+from brinksmanship.testing.batch_runner import (
+    DETERMINISTIC_OPPONENTS,
+    BatchResults,
+    BatchRunner,
+    GameChunk,
+    GameOptions,
+    PairingStats,
+    check_batch_policies,
+    play_chunk,
+)
+
+# Unit states in the queue
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+UNIT_STATES = (PENDING, LEASED, DONE, FAILED)
+
+
+@dataclass(frozen=True)
+class WorkUnit:
+    """Games first_game .. first_game + num_games - 1 of one pairing.
+
+    Units of a job with the same key are merged into one PairingStats.
+    Vectorized units run as one BatchGameEngine batch: with common random
+    numbers game i keeps its draws whichever unit plays it; otherwise each
+    unit's batch is seeded with seed + first_game.
+    """
+
+    job: str
+    key: str
+    scenario_id: str
+    opponent_a: str
+    opponent_b: str
+    seed: int | None
+    first_game: int
+    num_games: int
+    params: GameParameters | None = None
+    vectorized: bool = False
+    common_random_numbers: bool = False
+    antithetic: bool = False
+    keep_games: bool = False
+    scenario_repo: ScenarioRepository | None = field(default=None, compare=False)
+
+    @property
+    def unit_id(self) -> str:
+        """Queue ID, unique within the queue."""
+        return f"{self.job}/{self.key}/{self.first_game}+{self.num_games}"
+
+    def run(self) -> PairingStats:
+        """Play the unit's games and return their statistics."""
+        options = GameOptions(self.params, self.common_random_numbers, self.antithetic, self.scenario_repo)
+        chunk = GameChunk(
+            self.scenario_id,
+            self.opponent_a,
+            self.opponent_b,
+            self.seed,
+            self.num_games,
+            first_game=self.first_game,
+            options=options,
+            vectorized=self.vectorized,
+            keep_games=self.keep_games,
+        )
+        stats, _ = play_chunk(chunk)
+        return stats
+
+
+class WorkQueue(ABC):
+    """Queue of work units shared by a coordinator and its workers.
+
+    A unit is pending until a worker leases it. The lease lasts
+    lease_seconds unless renewed; an expired lease makes the unit available
+    again. Each lease counts as an attempt, and a unit whose last attempt
+    fails (or whose lease expires) after max_attempts is failed for good.
+    """
+
+    @abstractmethod
+    def publish(self, units: Sequence[WorkUnit], max_attempts: int = 3) -> int:
+        """Add units, skipping those already in the queue.
+
+        Returns:
+            Number of units added
+
+        Raises:
+            ValueError: If a unit ID is already queued with other settings
+        """
+        pass
+
+    @abstractmethod
+    def lease(self, worker: str, lease_seconds: float) -> WorkUnit | None:
+        """Lease the oldest available unit to worker, or return None if there is none."""
+        pass
+
+    @abstractmethod
+    def renew(self, unit_id: str, worker: str, lease_seconds: float) -> bool:
+        """Extend worker's lease of a unit; False if the worker no longer holds it."""
+        pass
+
+    @abstractmethod
+    def complete(self, unit_id: str, worker: str, result: Any) -> bool:
+        """Store a leased unit's result; False (result dropped) if the worker no longer holds it."""
+        pass
+
+    @abstractmethod
+    def fail(self, unit_id: str, worker: str, error: str) -> None:
+        """Give up a leased unit after an error, to be retried if it has attempts left."""
+        pass
+
+    @abstractmethod
+    def progress(self, job: str) -> dict[str, int]:
+        """Number of units of job in each state (see UNIT_STATES)."""
+        pass
+
+    @abstractmethod
+    def results(self, job: str) -> dict[str, Any]:
+        """Results of the finished units of job, by unit ID."""
+        pass
+
+    @abstractmethod
+    def errors(self, job: str) -> dict[str, str]:
+        """Last error of each failed unit of job, by unit ID."""
+        pass
+
+
+class SQLiteWorkQueue(WorkQueue):
+    """Work queue in a SQLite database file.
+
+    Every call opens its own connection and state changes run in
+    immediate transactions, so any number of processes (and threads) can
+    share the file. Hosts need a shared filesystem with working file
+    locks; for larger clusters implement WorkQueue on a broker instead.
+    """
+
+    def __init__(self, database_path: str | Path = "instance/work_queue.db", busy_timeout: float = 60.0):
+        """Open (or create) the queue.
+
+        Args:
+            database_path: Path to the SQLite database file
+            busy_timeout: Seconds to wait for another process's transaction
+        """
+        self.database_path = Path(database_path)
+        self.database_path.parent.mkdir(parents=True, exist_ok=True)
+        self.busy_timeout = busy_timeout
+        with closing(self._get_connection()) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS units (
+                    id TEXT PRIMARY KEY,
+                    job TEXT NOT NULL,
+                    payload BLOB NOT NULL,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    max_attempts INTEGER NOT NULL,
+                    worker TEXT,
+                    lease_expires REAL,
+                    result BLOB,
+                    error TEXT
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_units_job_status ON units(job, status)")
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get a connection in autocommit mode (transactions are explicit)."""
+        return sqlite3.connect(self.database_path, timeout=self.busy_timeout, isolation_level=None)
+
+    def publish(self, units: Sequence[WorkUnit], max_attempts: int = 3) -> int:
+        """Add units, skipping those already in the queue."""
+        if max_attempts < 1:
+            raise ValueError(f"max_attempts must be at least 1, got {max_attempts}")
+        added = 0
+        with closing(self._get_connection()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for unit in units:
+                    row = conn.execute("SELECT payload FROM units WHERE id = ?", (unit.unit_id,)).fetchone()
+                    if row is not None:
+                        if pickle.loads(row[0]) != unit:
+                            raise ValueError(f"Unit {unit.unit_id} is already queued with other settings")
+                        continue
+                    conn.execute(
+                        "INSERT INTO units (id, job, payload, status, max_attempts) VALUES (?, ?, ?, ?, ?)",
+                        (unit.unit_id, unit.job, pickle.dumps(unit), PENDING, max_attempts),
+                    )
+                    added += 1
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return added
+
+    def lease(self, worker: str, lease_seconds: float) -> WorkUnit | None:
+        """Lease the oldest available unit to worker, or return None if there is none."""
+        now = time.time()
+        with closing(self._get_connection()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    "UPDATE units SET status = ?, worker = NULL, lease_expires = NULL,"
+                    " error = 'lease expired on its last attempt'"
+                    " WHERE status = ? AND lease_expires < ? AND attempts >= max_attempts",
+                    (FAILED, LEASED, now),
+                )
+                row = conn.execute(
+                    "SELECT id, payload FROM units WHERE status = ? OR (status = ? AND lease_expires < ?)"
+                    " ORDER BY rowid LIMIT 1",
+                    (PENDING, LEASED, now),
+                ).fetchone()
+                if row is not None:
+                    conn.execute(
+                        "UPDATE units SET status = ?, worker = ?, lease_expires = ?, attempts = attempts + 1"
+                        " WHERE id = ?",
+                        (LEASED, worker, now + lease_seconds, row[0]),
+                    )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return pickle.loads(row[1]) if row is not None else None
+
+    def renew(self, unit_id: str, worker: str, lease_seconds: float) -> bool:
+        """Extend worker's lease of a unit; False if the worker no longer holds it."""
+        with closing(self._get_connection()) as conn:
+            cursor = conn.execute(
+                "UPDATE units SET lease_expires = ? WHERE id = ? AND status = ? AND worker = ?",
+                (time.time() + lease_seconds, unit_id, LEASED, worker),
+            )
+            return cursor.rowcount == 1
+
+    def complete(self, unit_id: str, worker: str, result: Any) -> bool:
+        """Store a leased unit's result; False (result dropped) if the worker no longer holds it."""
+        with closing(self._get_connection()) as conn:
+            cursor = conn.execute(
+                "UPDATE units SET status = ?, result = ?, worker = NULL, lease_expires = NULL, error = NULL"
+                " WHERE id = ? AND status = ? AND worker = ?",
+                (DONE, pickle.dumps(result), unit_id, LEASED, worker),
+            )
+            return cursor.rowcount == 1
+
+    def fail(self, unit_id: str, worker: str, error: str) -> None:
+        """Give up a leased unit after an error, to be retried if it has attempts left."""
+        with closing(self._get_connection()) as conn:
+            conn.execute(
+                "UPDATE units SET status = CASE WHEN attempts >= max_attempts THEN ? ELSE ? END,"
+                " worker = NULL, lease_expires = NULL, error = ?"
+                " WHERE id = ? AND status = ? AND worker = ?",
+                (FAILED, PENDING, error, unit_id, LEASED, worker),
+            )
+
+    def progress(self, job: str) -> dict[str, int]:
+        """Number of units of job in each state (see UNIT_STATES)."""
+        with closing(self._get_connection()) as conn:
+            rows = conn.execute("SELECT status, COUNT(*) FROM units WHERE job = ? GROUP BY status", (job,)).fetchall()
+        counts = dict.fromkeys(UNIT_STATES, 0)
+        counts.update(dict(rows))
+        return counts
+
+    def results(self, job: str) -> dict[str, Any]:
+        """Results of the finished units of job, by unit ID."""
+        with closing(self._get_connection()) as conn:
+            rows = conn.execute("SELECT id, result FROM units WHERE job = ? AND status = ?", (job, DONE)).fetchall()
+        return {unit_id: pickle.loads(result) for unit_id, result in rows}
+
+    def errors(self, job: str) -> dict[str, str]:
+        """Last error of each failed unit of job, by unit ID."""
+        with closing(self._get_connection()) as conn:
+            rows = conn.execute("SELECT id, error FROM units WHERE job = ? AND status = ?", (job, FAILED)).fetchall()
+        return dict(rows)
+
+
+def default_worker_id() -> str:
+    """Worker name used in leases: host and process ID."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _renew_lease(queue: WorkQueue, unit_id: str, worker: str, lease_seconds: float, stop: threading.Event) -> None:
+    """Renew a lease every third of lease_seconds until stop is set or the lease is lost."""
+    while not stop.wait(lease_seconds / 3):
+        if not queue.renew(unit_id, worker, lease_seconds):
+            return
+
+
+def run_worker(
+    queue: WorkQueue,
+    worker_id: str | None = None,
+    lease_seconds: float = 300.0,
+    poll_interval: float = 1.0,
+    idle_timeout: float | None = None,
+    max_units: int | None = None,
+    quiet: bool = True,
+) -> int:
+    """Lease and play work units until the queue stays empty.
+
+    While a unit runs, a background thread renews its lease every third of
+    lease_seconds, so only a worker that died (or hangs its host) loses it.
+    An exception in a unit is recorded in the queue and the worker moves on.
+
+    Args:
+        queue: Queue to pull units from
+        worker_id: Name in leases (default: host and process ID)
+        lease_seconds: Lease length; another worker takes over a unit whose
+            lease was not renewed for this long
+        poll_interval: Seconds between polls of an empty queue
+        idle_timeout: Return after the queue has been empty this long
+            (default: run until interrupted)
+        max_units: Return after this many units
+        quiet: Suppress progress output
+
+    Returns:
+        Number of units completed
+    """
+    worker_id = worker_id or default_worker_id()
+    completed = 0
+    idle_since = time.monotonic()
+    while max_units is None or completed < max_units:
+        unit = queue.lease(worker_id, lease_seconds)
+        if unit is None:
+            if idle_timeout is not None and time.monotonic() - idle_since >= idle_timeout:
+                break
+            time.sleep(poll_interval)
+            continue
+
+        if not quiet:
+            print(f"[{worker_id}] {unit.unit_id}...", end=" ", flush=True)
+        stop = threading.Event()
+        renewer = threading.Thread(
+            target=_renew_lease, args=(queue, unit.unit_id, worker_id, lease_seconds, stop), daemon=True
+        )
+        renewer.start()
+        try:
+            result = unit.run()
+        except Exception:
+            queue.fail(unit.unit_id, worker_id, traceback.format_exc())
+            if not quiet:
+                print("failed")
+        else:
+            if queue.complete(unit.unit_id, worker_id, result):
+                completed += 1
+            if not quiet:
+                print("done")
+        finally:
+            stop.set()
+            renewer.join()
+        idle_since = time.monotonic()
+    return completed
+
+
+def pairing_units(
+    runner: BatchRunner,
+    job: str,
+    opponent_names: list[str] | None = None,
+    num_games: int = 100,
+    seed: int | None = None,
+    games_per_unit: int | None = None,
+    vectorized: bool = False,
+    keep_games: bool = False,
+    key_prefix: str = "",
+) -> list[WorkUnit]:
+    """Work units playing every unique pairing of opponent_names with runner's settings.
+
+    Pairings are seeded as in BatchRunner.run_all_pairings, so a seeded
+    distributed run gives the same statistics as a local one.
+
+    Args:
+        runner: Scenario, parameters and random number options of the games
+        job: Job name of the units
+        opponent_names: List of opponent names (default: all deterministic)
+        num_games: Number of games per pairing
+        seed: Base random seed
+        games_per_unit: Games per unit (default: a tenth of a pairing for
+            the process pool, a whole pairing if vectorized)
+        vectorized: Play units on BatchGameEngine
+        keep_games: Keep per-game value lists (False: streaming summaries only)
+        key_prefix: Prefix of the units' keys ("<opponent_a>:<opponent_b>"),
+            to tell apart several runs in one job
+
+    Returns:
+        Units in pairing, then game order
+
+    Raises:
+        ValueError: If a vectorized run has an opponent without a vectorized policy
+    """
+    if opponent_names is None:
+        opponent_names = list(DETERMINISTIC_OPPONENTS.keys())
+    if vectorized:
+        check_batch_policies(*opponent_names)
+    if games_per_unit is None:
+        games_per_unit = num_games if vectorized else max(1, -(-num_games // 10))
+
+    pairings = [(name_a, name_b) for i, name_a in enumerate(opponent_names) for name_b in opponent_names[i:]]
+    return [
+        WorkUnit(
+            job=job,
+            key=f"{key_prefix}{name_a}:{name_b}",
+            scenario_id=runner.scenario_id,
+            opponent_a=name_a,
+            opponent_b=name_b,
+            seed=runner.pairing_seed(seed, idx, num_games),
+            first_game=start,
+            num_games=min(games_per_unit, num_games - start),
+            params=runner.params,
+            vectorized=vectorized,
+            common_random_numbers=runner.common_random_numbers,
+            antithetic=runner.antithetic,
+            keep_games=keep_games,
+            scenario_repo=runner.scenario_repo,
+        )
+        for idx, (name_a, name_b) in enumerate(pairings)
+        for start in range(0, num_games, games_per_unit)
+    ]
+
+
+class Coordinator:
+    """Publishes a job's work units, waits for the workers and merges their results.
+
+    Usage:
+        coordinator = Coordinator(SQLiteWorkQueue("/shared/queue.db"))
+        stats = coordinator.run(units)  # key -> merged PairingStats
+    """
+
+    def __init__(
+        self,
+        queue: WorkQueue,
+        poll_interval: float = 1.0,
+        timeout: float | None = None,
+        max_attempts: int = 3,
+        quiet: bool = False,
+    ):
+        """Initialize coordinator.
+
+        Args:
+            queue: Queue shared with the workers
+            poll_interval: Seconds between progress checks
+            timeout: Give up waiting after this many seconds (the units stay
+                queued, so a later run of the same job continues)
+            max_attempts: Leases per unit before it fails the job
+            quiet: Suppress progress output
+        """
+        self.queue = queue
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.max_attempts = max_attempts
+        self.quiet = quiet
+
+    def run(self, units: Sequence[WorkUnit]) -> dict[str, PairingStats]:
+        """Publish units of one job and merge the results of each key in game order.
+
+        Args:
+            units: Units of a single job
+
+        Returns:
+            Merged PairingStats by unit key, in order of first appearance
+
+        Raises:
+            ValueError: If units is empty or spans several jobs
+            RuntimeError: If a unit failed on every attempt
+            TimeoutError: If the units are not done within timeout
+        """
+        jobs = {unit.job for unit in units}
+        if len(jobs) != 1:
+            raise ValueError(f"Units must belong to exactly one job, got {sorted(jobs)}")
+        job = jobs.pop()
+        added = self.queue.publish(units, self.max_attempts)
+        if sum(self.queue.progress(job).values()) != len(units):
+            raise ValueError(f"Job {job} already holds other units; use a new job name")
+        if not self.quiet:
+            print(f"Job {job}: {len(units)} units ({len(units) - added} already queued)")
+
+        start = time.monotonic()
+        last = None
+        while True:
+            progress = self.queue.progress(job)
+            if progress[FAILED]:
+                unit_id, error = next(iter(self.queue.errors(job).items()))
+                raise RuntimeError(f"{progress[FAILED]} units of job {job} failed; {unit_id}:\n{error}")
+            if progress != last and not self.quiet:
+                print(f"  {job}: {progress[DONE]}/{len(units)} units done, {progress[LEASED]} running")
+                last = progress
+            if progress[DONE] >= len(units):
+                break
+            if self.timeout is not None and time.monotonic() - start >= self.timeout:
+                raise TimeoutError(f"Job {job}: {progress[DONE]}/{len(units)} units done after {self.timeout}s")
+            time.sleep(self.poll_interval)
+
+        results = self.queue.results(job)
+        merged: dict[str, PairingStats] = {}
+        chunks: defaultdict[str, list[WorkUnit]] = defaultdict(list)
+        for unit in units:
+            chunks[unit.key].append(unit)
+        for key, key_units in chunks.items():
+            first = key_units[0]
+            stats = PairingStats(opponent_a=first.opponent_a, opponent_b=first.opponent_b, keep_games=first.keep_games)
+            for unit in sorted(key_units, key=lambda u: u.first_game):
+                stats.merge(results[unit.unit_id])
+            merged[key] = stats
+        return merged
+
+    def run_all_pairings(
+        self,
+        runner: BatchRunner,
+        opponent_names: list[str] | None = None,
+        num_games: int = 100,
+        seed: int | None = None,
+        job: str | None = None,
+        games_per_unit: int | None = None,
+        vectorized: bool = False,
+        keep_games: bool = False,
+    ) -> BatchResults:
+        """Run all unique pairings of opponents on the workers.
+
+        The distributed counterpart of BatchRunner.run_all_pairings; see
+        pairing_units for the arguments.
+
+        Args:
+            runner: Scenario, parameters and random number options of the games
+            opponent_names: List of opponent names (default: all deterministic)
+            num_games: Number of games per pairing
+            seed: Base random seed
+            job: Job name (default: a new one); rerun with the same name to
+                continue a job that was interrupted or timed out
+            games_per_unit: Games per unit
+            vectorized: Play units on BatchGameEngine
+            keep_games: Keep per-game value lists (False: streaming summaries only)
+
+        Returns:
+            BatchResults with all statistics
+        """
+        if seed is None and runner.common_random_numbers:
+            seed = fresh_seed()
+        start_time = time.time()
+        units = pairing_units(
+            runner,
+            job or uuid.uuid4().hex[:12],
+            opponent_names,
+            num_games,
+            seed,
+            games_per_unit,
+            vectorized,
+            keep_games,
+        )
+        results = BatchResults(scenario_id=runner.scenario_id, timestamp=datetime.now().isoformat())
+        results.pairings = self.run(units)
+        results.compute_aggregate()
+        results.duration_seconds = time.time() - start_time
+        return results
+
+
+__all__ = [
+    "Coordinator",
+    "SQLiteWorkQueue",
+    "UNIT_STATES",
+    "WorkQueue",
+    "WorkUnit",
+    "default_worker_id",
+    "pairing_units",
+    "run_worker",
+]
@@ -14,21 +14,45 @@ the game loop between two Opponent instances.
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Coroutine
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from brinksmanship.engine.game_engine import (
     EndingType,
     GameEnding,
     GameEngine,
 )
+from brinksmanship.engine.rng import game_streams
 from brinksmanship.models.state import GameState
 from brinksmanship.opponents.base import Opponent, SettlementProposal
+from brinksmanship.opponents.deterministic import DeterministicOpponent
 from brinksmanship.storage import get_scenario_repository
 
 if TYPE_CHECKING:
+    from brinksmanship.parameters import GameParameters
     from brinksmanship.storage import ScenarioRepository
 
+T = TypeVar("T")
+
+
+def run_without_loop(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine that never suspends, without an event loop.
+
+    Deterministic opponents implement the async Opponent interface but
+    never await anything that suspends, so a game between them can be
+    driven to completion with a single send().
+
+    Raises:
+        RuntimeError: If the coroutine suspends (it needs a real event loop)
+    """
+    try:
+        coro.send(None)
+    except StopIteration as stop:
+        return stop.value
+    coro.close()
+    raise RuntimeError("Coroutine suspended; run it with asyncio instead")
+
 
 @dataclass
 class GameResult:
@@ -96,6 +120,9 @@ class GameRunner:
         )
 
         result = await runner.run_game()
+
+        # Both opponents deterministic: no event loop needed
+        result = runner.run_game_direct()
     """
 
     def __init__(
@@ -105,21 +132,40 @@ class GameRunner:
         opponent_b: Opponent,
         repo: ScenarioRepository | None = None,
         random_seed: int | None = None,
+        game_index: int = 0,
+        params: GameParameters | None = None,
+        common_random_numbers: bool = False,
+        antithetic: bool = False,
     ):
         """Initialize the game runner.
 
+        A seeded game draws from the streams game_streams(random_seed,
+        game_index): the engine and each opponent get their own, so the game
+        is reproducible regardless of what ran before it in the process.
+
         Args:
             scenario_id: ID of the scenario to use
             opponent_a: Opponent instance for player A
             opponent_b: Opponent instance for player B
             repo: Optional scenario repository (uses default if not provided)
             random_seed: Optional seed for reproducibility
+            game_index: Index of this game within a seeded run
+            params: Game balance parameters (default: DEFAULT_PARAMETERS)
+            common_random_numbers: Give crisis termination and final
+                resolution their own streams, so runs that share the seed
+                share those draws game by game
+            antithetic: Negate final resolution noise in odd games, pairing
+                them with the game before
         """
         self.scenario_id = scenario_id
         self.opponent_a = opponent_a
         self.opponent_b = opponent_b
         self.repo = repo or get_scenario_repository()
         self.random_seed = random_seed
+        self.game_index = game_index
+        self.params = params
+        self.common_random_numbers = common_random_numbers
+        self.antithetic = antithetic
 
         # Set player sides on opponents that support it
         if hasattr(opponent_a, "set_player_side"):
@@ -127,17 +173,43 @@ class GameRunner:
         if hasattr(opponent_b, "set_player_side"):
             opponent_b.set_player_side(is_player_a=False)
 
+    @property
+    def can_run_direct(self) -> bool:
+        """Whether run_game_direct can be used (both opponents deterministic)."""
+        return isinstance(self.opponent_a, DeterministicOpponent) and isinstance(self.opponent_b, DeterministicOpponent)
+
+    def run_game_direct(self) -> GameResult:
+        """Run the game synchronously, without an event loop.
+
+        Same game loop as run_game, for opponents whose coroutines never
+        suspend (see can_run_direct).
+
+        Returns:
+            GameResult with all game data
+
+        Raises:
+            RuntimeError: If an opponent suspends
+        """
+        return run_without_loop(self.run_game())
+
     async def run_game(self) -> GameResult:
         """Run a complete game between the two opponents.
 
         Returns:
             GameResult with all game data
         """
-        # Create engine with optional seed
+        # Create engine; seeded games put every player on its own stream
+        streams = game_streams(
+            self.random_seed, self.game_index, common=self.common_random_numbers, antithetic=self.antithetic
+        )
+        if self.random_seed is not None:
+            self.opponent_a.rng = streams.player_a
+            self.opponent_b.rng = streams.player_b
         engine = GameEngine(
             self.scenario_id,
             self.repo,
-            random_seed=self.random_seed,
+            streams=streams,
+            params=self.params,
         )
 
         history: list[tuple[str, str]] = []
@@ -316,10 +388,16 @@ def run_game_sync(
     opponent_b: Opponent,
     repo: ScenarioRepository | None = None,
     random_seed: int | None = None,
+    game_index: int = 0,
+    params: GameParameters | None = None,
+    common_random_numbers: bool = False,
+    antithetic: bool = False,
 ) -> GameResult:
     """Synchronous wrapper for running a single game.
 
     Useful for testing and batch processing where async isn't needed.
+    Games between deterministic opponents run without an event loop;
+    others get one from asyncio.run.
 
     Args:
         scenario_id: ID of the scenario to use
@@ -327,6 +405,10 @@ def run_game_sync(
         opponent_b: Opponent instance for player B
         repo: Optional scenario repository
         random_seed: Optional seed for reproducibility
+        game_index: Index of this game within a seeded run
+        params: Game balance parameters (default: DEFAULT_PARAMETERS)
+        common_random_numbers: Separate crisis/resolution streams (see GameRunner)
+        antithetic: Antithetic final resolution noise (see GameRunner)
 
     Returns:
         GameResult with all game data
@@ -337,5 +419,11 @@ def run_game_sync(
         opponent_b=opponent_b,
         repo=repo,
         random_seed=random_seed,
+        game_index=game_index,
+        params=params,
+        common_random_numbers=common_random_numbers,
+        antithetic=antithetic,
     )
+    if runner.can_run_direct:
+        return runner.run_game_direct()
     return asyncio.run(runner.run_game())
@@ -0,0 +1,344 @@
+"""Columnar per-game result store for batch simulations.
+
+A game table is a directory with one raw little-endian file per column
+plus meta.json (row count, dtypes and the labels of categorical columns):
+
+    games/
+        meta.json
+        vp_a.bin
+        opponent_a.bin
+        ...
+
+Each row is one game: seed, game index, scenario, opponents, ending,
+winner, turns, final state and VP. Categorical columns store small
+integer codes. Floats are stored as float32, which is ample for analysis
+and halves the size. Columns are appended chunk by chunk while a batch
+runs, and read back with np.memmap, so analysis over tens of millions of
+games touches only the columns it uses and never parses JSON.
+
+Tables can also be exported to Parquet when pyarrow is installed.
+
+Usage:
+    from brinksmanship.testing.game_table import GameTable, GameTableWriter
+
+    with GameTableWriter("results/games") as games:
+        runner.run_all_pairings(num_games=10_000, seed=1, games=games)
+
+    table = GameTable.open("results/games")
+    nash_a = table.where(opponent_a="NashCalculator")
+    print(table["vp_a"][nash_a].mean())
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pa = None
+    pq = None
+    PYARROW_AVAILABLE = False
+
+if TYPE_CHECKING:
+    from brinksmanship.engine.batch_engine import BatchOutcome
+    from brinksmanship.testing.game_runner import GameResult
+
+FORMAT_VERSION = 1
+META_FILE = "meta.json"
+
+# Column name -> storage dtype, in row order
+GAME_COLUMNS: dict[str, np.dtype] = {
+    "seed": np.dtype("<i8"),  # -1 for unseeded games
+    "game_index": np.dtype("<i8"),
+    "scenario_id": np.dtype("<i2"),
+    "opponent_a": np.dtype("<i2"),
+    "opponent_b": np.dtype("<i2"),
+    "ending_type": np.dtype("<i2"),
+    "winner": np.dtype("<i2"),
+    "turns_played": np.dtype("<i2"),
+    "final_pos_a": np.dtype("<f4"),
+    "final_pos_b": np.dtype("<f4"),
+    "final_res_a": np.dtype("<f4"),
+    "final_res_b": np.dtype("<f4"),
+    "final_risk": np.dtype("<f4"),
+    "final_cooperation": np.dtype("<f4"),
+    "final_stability": np.dtype("<f4"),
+    "vp_a": np.dtype("<f4"),
+    "vp_b": np.dtype("<f4"),
+}
+
+# Columns stored as codes into a per-table list of labels
+CATEGORICAL_COLUMNS = ("scenario_id", "opponent_a", "opponent_b", "ending_type", "winner")
+
+_STATE_FIELDS = (
+    "turns_played",
+    "final_pos_a",
+    "final_pos_b",
+    "final_res_a",
+    "final_res_b",
+    "final_risk",
+    "final_cooperation",
+    "final_stability",
+    "vp_a",
+    "vp_b",
+)
+
+
+def columns_from_results(
+    results: Sequence[GameResult],
+    opponent_a: str,
+    opponent_b: str,
+    seed: int | None,
+    game_indices: Sequence[int],
+) -> dict[str, np.ndarray]:
+    """Turn GameResults of one pairing into one array per column (labels, not codes).
+
+    Args:
+        results: Finished games
+        opponent_a: Registry name of player A's opponent type
+        opponent_b: Registry name of player B's opponent type
+        seed: Base seed of the run (None if unseeded)
+        game_indices: Game index of each result
+
+    Returns:
+        Columns for GameTableWriter.append_columns
+    """
+    columns = {
+        "seed": np.full(len(results), -1 if seed is None else seed, dtype=np.int64),
+        "game_index": np.asarray(game_indices, dtype=np.int64),
+        "scenario_id": np.array([r.scenario_id for r in results]),
+        "opponent_a": np.full(len(results), opponent_a),
+        "opponent_b": np.full(len(results), opponent_b),
+        "ending_type": np.array([r.ending_type for r in results]),
+        "winner": np.array([r.winner for r in results]),
+    }
+    for name in _STATE_FIELDS:
+        columns[name] = np.array([getattr(r, name) for r in results], dtype=GAME_COLUMNS[name])
+    return columns
+
+
+def columns_from_batch(
+    outcome: BatchOutcome, opponent_a: str, opponent_b: str, seed: int | None
+) -> dict[str, np.ndarray]:
+    """Turn a BatchGameEngine outcome into one array per column.
+
+    Games of a batch share the engine's seed and are indexed by position.
+    """
+    n = outcome.num_games
+    return {
+        "seed": np.full(n, -1 if seed is None else seed, dtype=np.int64),
+        "game_index": np.arange(n, dtype=np.int64),
+        "scenario_id": np.full(n, outcome.scenario_id),
+        "opponent_a": np.full(n, opponent_a),
+        "opponent_b": np.full(n, opponent_b),
+        "ending_type": outcome.ending_type_values(),
+        "winner": outcome.winners(),
+        **{name: getattr(outcome, name) for name in _STATE_FIELDS},
+    }
+
+
+def _read_meta(path: Path) -> dict:
+    meta = json.loads((path / META_FILE).read_text())
+    if meta.get("version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported game table version in {path}: {meta.get('version')}")
+    return meta
+
+
+class GameTableWriter:
+    """Appends games to a game table directory.
+
+    Opening an existing table appends to it. meta.json is rewritten after
+    every append, so a reader (or a resumed run) always sees whole rows.
+    """
+
+    def __init__(self, path: str | Path):
+        """Open (or create) the table at path.
+
+        Args:
+            path: Table directory
+
+        Raises:
+            ValueError: If path holds a table of another format version
+        """
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        if (self.path / META_FILE).exists():
+            meta = _read_meta(self.path)
+            self.num_rows: int = meta["num_rows"]
+            self.categories: dict[str, list[str]] = meta["categories"]
+        else:
+            self.num_rows = 0
+            self.categories = {name: [] for name in CATEGORICAL_COLUMNS}
+            self._write_meta()
+        self._codes = {
+            name: {label: code for code, label in enumerate(labels)} for name, labels in self.categories.items()
+        }
+        self._files = {name: open(self.path / f"{name}.bin", "ab") for name in GAME_COLUMNS}  # noqa: SIM115
+        # Drop bytes of a partial append that never reached meta.json
+        for name, f in self._files.items():
+            f.truncate(self.num_rows * GAME_COLUMNS[name].itemsize)
+
+    def _encode(self, name: str, labels: np.ndarray) -> np.ndarray:
+        unique, inverse = np.unique(labels.astype(str), return_inverse=True)
+        codes = self._codes[name]
+        for label in unique.tolist():
+            if label not in codes:
+                codes[label] = len(self.categories[name])
+                self.categories[name].append(label)
+        return np.array([codes[label] for label in unique.tolist()], dtype=GAME_COLUMNS[name])[inverse]
+
+    def append_columns(self, columns: Mapping[str, np.ndarray]) -> None:
+        """Append rows given as one array per column.
+
+        Categorical columns hold labels (strings); they are encoded here.
+
+        Raises:
+            ValueError: If a column is missing or the lengths differ
+        """
+        missing = set(GAME_COLUMNS) - set(columns)
+        if missing:
+            raise ValueError(f"Missing game table columns: {sorted(missing)}")
+        lengths = {len(columns[name]) for name in GAME_COLUMNS}
+        if len(lengths) != 1:
+            raise ValueError(f"Game table columns have different lengths: {sorted(lengths)}")
+
+        for name, dtype in GAME_COLUMNS.items():
+            values = np.asarray(columns[name])
+            if name in CATEGORICAL_COLUMNS:
+                values = self._encode(name, values)
+            values.astype(dtype, copy=False).tofile(self._files[name])
+            self._files[name].flush()
+        self.num_rows += lengths.pop()
+        self._write_meta()
+
+    def truncate(self, num_rows: int) -> None:
+        """Drop every row from num_rows on (e.g. games of a run resumed from a checkpoint).
+
+        Raises:
+            ValueError: If num_rows is negative or beyond the table
+        """
+        if not 0 <= num_rows <= self.num_rows:
+            raise ValueError(f"Cannot truncate a table of {self.num_rows} rows to {num_rows}")
+        for name, f in self._files.items():
+            f.truncate(num_rows * GAME_COLUMNS[name].itemsize)
+        self.num_rows = num_rows
+        self._write_meta()
+
+    def _write_meta(self) -> None:
+        meta = {
+            "version": FORMAT_VERSION,
+            "num_rows": self.num_rows,
+            "columns": {name: dtype.str for name, dtype in GAME_COLUMNS.items()},
+            "categories": self.categories,
+        }
+        tmp = self.path / f"{META_FILE}.tmp"
+        tmp.write_text(json.dumps(meta, indent=2))
+        tmp.replace(self.path / META_FILE)
+
+    def close(self) -> None:
+        """Close the column files (meta.json is already current)."""
+        for f in self._files.values():
+            f.close()
+        self._files = {}
+
+    def __enter__(self) -> GameTableWriter:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class GameTable:
+    """Read-only, memory-mapped view of a game table.
+
+    Indexing by column name returns a np.memmap (codes for categorical
+    columns); use decode for labels and where for filtering by label.
+    """
+
+    def __init__(self, path: Path, num_rows: int, categories: dict[str, list[str]], columns: dict[str, np.ndarray]):
+        self.path = path
+        self.num_rows = num_rows
+        self.categories = categories
+        self.columns = columns
+
+    @classmethod
+    def open(cls, path: str | Path) -> GameTable:
+        """Memory-map the table at path.
+
+        Raises:
+            FileNotFoundError: If path has no meta.json
+            ValueError: If the table has an unsupported format version
+        """
+        path = Path(path)
+        meta = _read_meta(path)
+        num_rows = meta["num_rows"]
+        columns = {}
+        for name, dtype_str in meta["columns"].items():
+            if num_rows == 0:
+                columns[name] = np.empty(0, dtype=np.dtype(dtype_str))
+            else:
+                columns[name] = np.memmap(path / f"{name}.bin", dtype=np.dtype(dtype_str), mode="r", shape=(num_rows,))
+        return cls(path, num_rows, meta["categories"], columns)
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def code(self, column: str, label: str) -> int:
+        """Code of label in a categorical column (-1 if it never occurs)."""
+        labels = self.categories[column]
+        return labels.index(label) if label in labels else -1
+
+    def decode(self, column: str) -> np.ndarray:
+        """Labels of a categorical column, one per row."""
+        return np.array(self.categories[column])[self.columns[column]]
+
+    def where(self, **labels: str) -> np.ndarray:
+        """Boolean row mask for games whose categorical columns equal labels.
+
+        Example: table.where(opponent_a="TitForTat", ending_type="settlement")
+        """
+        mask = np.ones(self.num_rows, dtype=bool)
+        for column, label in labels.items():
+            mask &= self.columns[column] == self.code(column, label)
+        return mask
+
+    def to_parquet(self, path: str | Path) -> None:
+        """Write the table to a Parquet file (categorical columns as dictionaries).
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError("Parquet export requires pyarrow (pip install pyarrow)")
+        arrays = {}
+        for name, values in self.columns.items():
+            if name in CATEGORICAL_COLUMNS:
+                arrays[name] = pa.DictionaryArray.from_arrays(
+                    np.asarray(values, dtype=np.int32), pa.array(self.categories[name])
+                )
+            else:
+                arrays[name] = pa.array(np.asarray(values))
+        pq.write_table(pa.table(arrays), str(path))
+
+
+__all__ = [
+    "CATEGORICAL_COLUMNS",
+    "GAME_COLUMNS",
+    "PYARROW_AVAILABLE",
+    "GameTable",
+    "GameTableWriter",
+    "columns_from_batch",
+    "columns_from_results",
+]
@@ -7,7 +7,6 @@ to ensure the game is engaging for real human players.
 See ENGINEERING_DESIGN.md Milestone 5.1 for specification.
 """
 
-import random
 from typing import Literal
 
 from pydantic import BaseModel, Field
@@ -441,7 +440,7 @@ class HumanSimulator(Opponent):
         final_prob = min(base_prob * emotional_mod * risk_mod, 0.7)  # Cap at 70%
 
         # Random check for mistake
-        if random.random() > final_prob:
+        if self.rng.random() > final_prob:
             return chosen_action  # No mistake
 
         # Get player position and opponent's last action
@@ -508,20 +507,20 @@ class HumanSimulator(Opponent):
         if mistake_type == "impulsive":
             # Pick the most aggressive available action
             if competitive_actions:
-                return random.choice(competitive_actions)
+                return self.rng.choice(competitive_actions)
 
         elif mistake_type == "overcautious":
             # Pick the safest available action (cooperative, low cost)
             safe_actions = [a for a in cooperative_actions if a.resource_cost == 0]
             if safe_actions:
-                return random.choice(safe_actions)
+                return self.rng.choice(safe_actions)
             elif cooperative_actions:
-                return random.choice(cooperative_actions)
+                return self.rng.choice(cooperative_actions)
 
         elif mistake_type == "vindictive":
             # Defect regardless of strategic merit
             if competitive_actions:
-                return random.choice(competitive_actions)
+                return self.rng.choice(competitive_actions)
 
         elif mistake_type == "overconfident":
             # Take a risky action even when it's not warranted
@@ -529,7 +528,7 @@ class HumanSimulator(Opponent):
                 a for a in available_actions if a.action_type == ActionType.COMPETITIVE or a.resource_cost > 0
             ]
             if risky_actions:
-                return random.choice(risky_actions)
+                return self.rng.choice(risky_actions)
 
         # Fallback: return original
         return current_choice
@@ -562,17 +561,17 @@ class HumanSimulator(Opponent):
         # Decide cooperative vs competitive
         if self.persona.personality == "erratic":
             # Random choice
-            use_coop = random.random() > 0.5
+            use_coop = self.rng.random() > 0.5
         else:
             # Bias toward personality preference
-            use_coop = random.random() < (0.5 + coop_bias)
+            use_coop = self.rng.random() < (0.5 + coop_bias)
 
         if use_coop and cooperative_actions:
-            return random.choice(cooperative_actions)
+            return self.rng.choice(cooperative_actions)
         elif competitive_actions:
-            return random.choice(competitive_actions)
+            return self.rng.choice(competitive_actions)
         else:
-            return random.choice(available_actions)
+            return self.rng.choice(available_actions)
 
     async def evaluate_settlement(
         self,
@@ -732,19 +731,19 @@ class HumanSimulator(Opponent):
             settle_probability += 0.25  # High risk encourages settlement
 
         # Random decision
-        if random.random() > settle_probability:
+        if self.rng.random() > settle_probability:
             return None
 
         # Calculate offer
         # Add personality-based adjustment
         if self.persona.personality == "cooperative":
             # Offer closer to fair
-            adjustment = random.randint(-3, 3)
+            adjustment = self.rng.randint(-3, 3)
         elif self.persona.personality == "competitive":
             # Try to get more
-            adjustment = random.randint(2, 8)
+            adjustment = self.rng.randint(2, 8)
         else:  # erratic
-            adjustment = random.randint(-5, 10)
+            adjustment = self.rng.randint(-5, 10)
 
         offered_vp = int(base_vp + adjustment)
         offered_vp = max(20, min(80, offered_vp))  # Clamp to valid range
@@ -787,27 +786,27 @@ class HumanSimulator(Opponent):
         if result_for_player == "exploited" or position_change < -0.5:
             if self.persona.emotional_state == "calm":
                 # 40% chance to become stressed
-                if random.random() < 0.4:
+                if self.rng.random() < 0.4:
                     self.persona.emotional_state = "stressed"
             elif self.persona.emotional_state == "stressed":
                 # 30% chance to become desperate
-                if random.random() < 0.3:
+                if self.rng.random() < 0.3:
                     self.persona.emotional_state = "desperate"
 
         # Positive outcomes can reduce stress
         elif result_for_player == "exploiter" or position_change > 0.5:
             if self.persona.emotional_state == "desperate":
                 # 50% chance to improve to stressed
-                if random.random() < 0.5:
+                if self.rng.random() < 0.5:
                     self.persona.emotional_state = "stressed"
             elif self.persona.emotional_state == "stressed":
                 # 30% chance to calm down
-                if random.random() < 0.3:
+                if self.rng.random() < 0.3:
                     self.persona.emotional_state = "calm"
 
         # Mutual cooperation tends to calm
         elif result_for_player == "mutual_coop":
-            if self.persona.emotional_state != "calm" and random.random() < 0.25:
+            if self.persona.emotional_state != "calm" and self.rng.random() < 0.25:
                 if self.persona.emotional_state == "desperate":
                     self.persona.emotional_state = "stressed"
                 else:
@@ -0,0 +1,199 @@
+"""Content-addressed cache of simulation aggregates.
+
+Each cell of a run (one pairing's seeded games, one defection turn of the
+timing analysis, ...) is stored under the SHA-256 of everything its result
+depends on:
+
+- the scenario's content (not its file's timestamp),
+- the GameParameters values,
+- the engine version: a hash of the source of the modules that play and
+  aggregate games (engine, models, opponents, parameters, game and batch
+  runners),
+- what the cell plays: opponents, seed, game range and run options.
+
+Rerunning a simulation after an unrelated change finds every cell in the
+cache and returns instantly; after a change to one scenario, parameter or
+engine module only the cells that depend on it are played again. Unseeded
+cells are random and are never cached.
+
+    cache/
+        3f/
+            3f9c...e1.pkl
+        ...
+
+Entries are pickles: only use cache directories you created.
+
+Usage:
+    from brinksmanship.testing.result_cache import ResultCache
+
+    runner = BatchRunner("cuban_missile_crisis", result_cache=ResultCache(".cache/simulations"))
+    results = runner.run_all_pairings(num_games=10_000, seed=42)  # second run: all cached
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import pickle
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+import brinksmanship
+from brinksmanship.parameters import DEFAULT_PARAMETERS, GameParameters
+from brinksmanship.storage import ScenarioRepository
+from brinksmanship.testing.checkpoint import write_atomic
+
+FORMAT_VERSION = 1
+
+# Sources (relative to the brinksmanship package) whose code decides game outcomes and their aggregates
+ENGINE_SOURCES = (
+    "engine",
+    "models",
+    "opponents",
+    "parameters.py",
+    "testing/game_runner.py",
+    "testing/batch_runner.py",
+    "testing/streaming_stats.py",
+)
+
+
+def _hash_files(files: dict[str, Path]) -> str:
+    """Hash of files by name, independent of where the checkout lives."""
+    digest = hashlib.sha256()
+    for name, path in sorted(files.items()):
+        digest.update(name.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def engine_version() -> str:
+    """Hash of the ENGINE_SOURCES files (computed once per process)."""
+    root = Path(brinksmanship.__file__).parent
+    paths = []
+    for source in ENGINE_SOURCES:
+        path = root / source
+        if path.is_dir():
+            paths += [p for p in path.rglob("*") if p.is_file() and p.suffix in (".py", ".json")]
+        else:
+            paths.append(path)
+    return _hash_files({path.relative_to(root).as_posix(): path for path in paths})
+
+
+def source_version(*files: str | Path) -> str:
+    """Hash of extra source files, e.g. a script that defines its own opponents."""
+    return _hash_files({Path(f).name: Path(f) for f in files})
+
+
+def scenario_hash(repo: ScenarioRepository, scenario_id: str) -> str:
+    """Hash of the scenario's content.
+
+    Raises:
+        ValueError: If the scenario is not in repo
+    """
+    scenario = repo.get_scenario(scenario_id)
+    if scenario is None:
+        raise ValueError(f"Scenario not found: {scenario_id}")
+    return hashlib.sha256(json.dumps(scenario, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def params_values(params: GameParameters | None) -> dict:
+    """Values of the parameters a run uses (DEFAULT_PARAMETERS if None)."""
+    return asdict(params if params is not None else DEFAULT_PARAMETERS)
+
+
+def pairing_cell(
+    repo: ScenarioRepository,
+    scenario_id: str,
+    opponent_a: str,
+    opponent_b: str,
+    seed: int,
+    num_games: int,
+    vectorized: bool,
+    params: GameParameters | list[GameParameters] | None = None,
+    common_random_numbers: bool = False,
+    antithetic: bool = False,
+    keep_games: bool = True,
+    first_game: int = 0,
+) -> dict:
+    """Inputs of one pairing's seeded games, for ResultCache.key.
+
+    Pool (GameEngine) and vectorized (BatchGameEngine) games are different
+    cells; a list of params is a run_parameter_sets_vectorized batch.
+    """
+    return {
+        "kind": "pairing_batch" if vectorized else "pairing_games",
+        "scenario": scenario_hash(repo, scenario_id),
+        "params": [params_values(p) for p in params] if isinstance(params, list) else params_values(params),
+        "common_random_numbers": common_random_numbers,
+        "antithetic": antithetic,
+        "opponents": [opponent_a, opponent_b],
+        "seed": seed,
+        "first_game": first_game,
+        "num_games": num_games,
+        "keep_games": keep_games,
+    }
+
+
+class ResultCache:
+    """Directory of results addressed by the hash of their inputs.
+
+    Attributes:
+        hits: Lookups answered from the cache
+        misses: Lookups that found nothing
+    """
+
+    def __init__(self, path: str | Path):
+        """Open (or create) the cache at path.
+
+        Args:
+            path: Cache directory
+        """
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, **inputs: Any) -> str:
+        """Address of a result: hash of its JSON-serializable inputs and the engine version."""
+        payload = {"version": FORMAT_VERSION, "engine": engine_version(), **inputs}
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.path / key[:2] / f"{key}.pkl"
+
+    def get(self, key: str) -> Any | None:
+        """The result stored under key, or None."""
+        path = self._entry_path(key)
+        if not path.exists():
+            self.misses += 1
+            return None
+        self.hits += 1
+        return pickle.loads(path.read_bytes())
+
+    def put(self, key: str, result: Any) -> None:
+        """Store a picklable result under key."""
+        path = self._entry_path(key)
+        path.parent.mkdir(exist_ok=True)
+        write_atomic(path, pickle.dumps(result))
+
+    def __contains__(self, key: str) -> bool:
+        return self._entry_path(key).exists()
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.path.glob("*/*.pkl"))
+
+
+__all__ = [
+    "ENGINE_SOURCES",
+    "ResultCache",
+    "engine_version",
+    "pairing_cell",
+    "params_values",
+    "scenario_hash",
+    "source_version",
+]
@@ -0,0 +1,406 @@
+"""Cross-scenario tournaments on one shared process pool.
+
+A tournament plays every scenario x every ordered pairing of opponents,
+so each opponent plays both sides against every other (self-play once).
+Instead of one BatchRunner per scenario, each leaving cores idle while its
+last pairings finish, all games go to a single pool:
+
+- Each (scenario, pairing) job is split into chunks of consecutive games.
+- Jobs are ordered longest first by estimated cost: games times expected
+  game length, measured by a small vectorized pilot batch (or the
+  scenario's max_turns for opponents without a vectorized policy).
+- Chunks are queued in that order; idle workers take the next chunk, so
+  short jobs fill the gaps at the end instead of long ones starting last.
+
+Chunks are merged per job in game order, and the results are one
+BatchResults (and one opponent x opponent matrix per metric) per scenario.
+Seeds are assigned in scenario and pairing order, so seeded statistics do
+not depend on the schedule, the chunk size or the number of workers.
+
+Usage:
+    from brinksmanship.testing.tournament import TournamentRunner, print_tournament_results
+
+    runner = TournamentRunner(max_workers=16)
+    results = runner.run(num_games=1000, seed=42)
+    print_tournament_results(results, metric="avg_vp_share_a")
+    share = results.matrix("cuban_missile_crisis", "avg_vp_share_a")  # rows: side A, columns: side B
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections.abc import Sequence
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime
+
+import numpy as np
+
+from brinksmanship.engine.rng import fresh_seed
+from brinksmanship.opponents.batch_policies import BATCH_POLICIES
+from brinksmanship.parameters import GameParameters
+from brinksmanship.storage import ScenarioRepository
+from brinksmanship.testing.batch_runner import (
+    DETERMINISTIC_OPPONENTS,
+    BatchResults,
+    GameChunk,
+    GameOptions,
+    PairingStats,
+    check_batch_policies,
+    default_chunk_size,
+    play_chunk,
+)
+from brinksmanship.testing.result_cache import ResultCache
+
+# PairingStats properties available as tournament matrices (from side A's point of view)
+TOURNAMENT_METRICS = (
+    "avg_vp_share_a",
+    "win_rate_a",
+    "avg_vp_a",
+    "avg_total_value",
+    "settlement_rate",
+    "mutual_destruction_rate",
+    "avg_game_length",
+)
+
+
+@dataclass(frozen=True)
+class TournamentJob:
+    """All games of one ordered pairing in one scenario."""
+
+    scenario_id: str
+    opponent_a: str
+    opponent_b: str
+    seed: int | None
+    num_games: int
+    estimated_cost: float  # Expected turns played by all of the job's games
+
+    @property
+    def pairing_key(self) -> str:
+        return f"{self.opponent_a}:{self.opponent_b}"
+
+
+@dataclass
+class TournamentResults:
+    """Results of a tournament: one BatchResults per scenario."""
+
+    opponents: list[str]
+    scenarios: dict[str, BatchResults] = field(default_factory=dict)
+    timestamp: str = ""
+    duration_seconds: float = 0.0
+
+    def matrix(self, scenario_id: str, metric: str = "avg_vp_share_a") -> np.ndarray:
+        """Opponent x opponent matrix of a metric in one scenario.
+
+        Entry [i, j] is the metric of opponents[i] as player A against
+        opponents[j] as player B.
+
+        Raises:
+            ValueError: If metric is not in TOURNAMENT_METRICS
+        """
+        if metric not in TOURNAMENT_METRICS:
+            raise ValueError(f"Unknown tournament metric: {metric}. Available: {list(TOURNAMENT_METRICS)}")
+        pairings = self.scenarios[scenario_id].pairings
+        return np.array([[getattr(pairings[f"{a}:{b}"], metric) for b in self.opponents] for a in self.opponents])
+
+    def opponent_scores(self, scenario_id: str) -> dict[str, float]:
+        """Mean VP share of each opponent over all its games in a scenario, on both sides."""
+        share_sum = dict.fromkeys(self.opponents, 0.0)
+        games = dict.fromkeys(self.opponents, 0)
+        for key, stats in self.scenarios[scenario_id].pairings.items():
+            name_a, name_b = key.split(":")
+            share_a = stats.vp_share_a_stats
+            share_sum[name_a] += share_a.total
+            share_sum[name_b] += share_a.count - share_a.total
+            games[name_a] += share_a.count
+            games[name_b] += share_a.count
+        return {name: share_sum[name] / games[name] if games[name] else 0.0 for name in self.opponents}
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "opponents": self.opponents,
+            "timestamp": self.timestamp,
+            "duration_seconds": round(self.duration_seconds, 2),
+            "scenarios": {
+                scenario_id: {
+                    **results.to_dict(),
+                    "matrices": {
+                        metric: np.round(self.matrix(scenario_id, metric), 4).tolist() for metric in TOURNAMENT_METRICS
+                    },
+                    "opponent_scores": {
+                        name: round(score, 4) for name, score in self.opponent_scores(scenario_id).items()
+                    },
+                }
+                for scenario_id, results in self.scenarios.items()
+            },
+        }
+
+    def to_json(self, indent: int = 2) -> str:
+        """Convert to JSON string."""
+        return json.dumps(self.to_dict(), indent=indent)
+
+
+class TournamentRunner:
+    """Runs every scenario x ordered pairing of opponents on one process pool.
+
+    Usage:
+        runner = TournamentRunner(["cuban_missile_crisis", "berlin_blockade"], max_workers=8)
+        results = runner.run(num_games=500, seed=1)
+
+        # Deterministic opponents only: one BatchGameEngine batch per job
+        results = runner.run(num_games=100_000, seed=1, vectorized=True)
+    """
+
+    def __init__(
+        self,
+        scenario_ids: Sequence[str] | None = None,
+        opponent_names: Sequence[str] | None = None,
+        max_workers: int = 4,
+        params: GameParameters | None = None,
+        common_random_numbers: bool = False,
+        antithetic: bool = False,
+        scenario_repo: ScenarioRepository | None = None,
+        result_cache: ResultCache | None = None,
+    ):
+        """Initialize tournament runner.
+
+        Args:
+            scenario_ids: Scenarios to play (default: all in the repository)
+            opponent_names: Opponents (default: all deterministic)
+            max_workers: Worker processes of the shared pool (1: play in
+                this process)
+            params: Game balance parameters for every game
+            common_random_numbers: Play game i of every job on the same
+                random numbers (see BatchRunner)
+            antithetic: Antithetic final resolution noise
+            scenario_repo: Repository to load scenarios from (default: the
+                configured one); sent to worker processes, so it must pickle
+            result_cache: Cache of seeded jobs' statistics; jobs found in it
+                are not played again
+        """
+        self.max_workers = max_workers
+        self.params = params
+        self.common_random_numbers = common_random_numbers
+        self.antithetic = antithetic
+        self.scenario_repo = scenario_repo
+        self.result_cache = result_cache
+        repo = self.game_options.repo()
+        self.scenario_ids = list(scenario_ids) if scenario_ids is not None else [s["id"] for s in repo.list_scenarios()]
+        self.opponent_names = list(opponent_names) if opponent_names is not None else list(DETERMINISTIC_OPPONENTS)
+        self._max_turns = {s["id"]: s.get("max_turns", 14) for s in repo.list_scenarios()}
+
+    @property
+    def game_options(self) -> GameOptions:
+        """The tournament's per-game settings, as sent to workers."""
+        return GameOptions(self.params, self.common_random_numbers, self.antithetic, self.scenario_repo)
+
+    def _pairings(self) -> list[tuple[str, str]]:
+        """Ordered pairings: every opponent on both sides against every other, self-play once."""
+        return [(name_a, name_b) for name_a in self.opponent_names for name_b in self.opponent_names]
+
+    def _expected_turns(self, scenario_id: str, opponent_a: str, opponent_b: str, pilot_games: int) -> float:
+        """Expected game length of a pairing, from a pilot batch if the opponents have vectorized policies."""
+        if pilot_games > 0 and opponent_a in BATCH_POLICIES and opponent_b in BATCH_POLICIES:
+            pilot = GameChunk(
+                scenario_id, opponent_a, opponent_b, 0, pilot_games, options=self.game_options, vectorized=True
+            )
+            stats, _ = play_chunk(pilot)
+            return stats.avg_game_length
+        return float(self._max_turns.get(scenario_id, 14))
+
+    def jobs(self, num_games: int, seed: int | None = None, pilot_games: int = 16) -> list[TournamentJob]:
+        """The tournament's jobs, longest first.
+
+        Args:
+            num_games: Games per job
+            seed: Base random seed; job k of the scenario-by-pairing order
+                gets seed + k * num_games (every job gets seed with common
+                random numbers)
+            pilot_games: Games of the pilot batch estimating each job's game
+                length (0: assume max_turns)
+
+        Returns:
+            Jobs by decreasing estimated cost (ties in scenario and pairing order)
+        """
+        jobs: list[TournamentJob] = []
+        for scenario_id in self.scenario_ids:
+            for name_a, name_b in self._pairings():
+                job_seed = seed
+                if seed is not None and not self.common_random_numbers:
+                    job_seed = seed + len(jobs) * num_games
+                turns = self._expected_turns(scenario_id, name_a, name_b, pilot_games)
+                jobs.append(TournamentJob(scenario_id, name_a, name_b, job_seed, num_games, num_games * turns))
+        return sorted(jobs, key=lambda job: -job.estimated_cost)
+
+    def run(
+        self,
+        num_games: int = 100,
+        seed: int | None = None,
+        vectorized: bool = False,
+        chunk_size: int | None = None,
+        keep_games: bool = False,
+        pilot_games: int = 16,
+        quiet: bool = False,
+    ) -> TournamentResults:
+        """Play the tournament.
+
+        Args:
+            num_games: Games per scenario and ordered pairing
+            seed: Base random seed (see jobs)
+            vectorized: Play each job as one BatchGameEngine batch (one task
+                per job) instead of chunks of GameEngine games
+            chunk_size: Games per task (default: default_chunk_size per job)
+            keep_games: Keep per-game value lists (False: streaming summaries only)
+            pilot_games: Games of the pilot batch estimating each job's cost
+            quiet: Suppress progress output
+
+        Returns:
+            TournamentResults with one BatchResults per scenario
+
+        Raises:
+            ValueError: If a vectorized tournament has an opponent without a
+                vectorized policy
+        """
+        if vectorized:
+            check_batch_policies(*self.opponent_names)
+        if seed is None and self.common_random_numbers:
+            seed = fresh_seed()
+        if chunk_size is None:
+            chunk_size = default_chunk_size(num_games, self.max_workers)
+
+        start_time = time.time()
+        jobs = self.jobs(num_games, seed, pilot_games)
+        cache = self.result_cache
+        cache_keys = [
+            self.game_options.cache_key(
+                cache,
+                job.scenario_id,
+                job.opponent_a,
+                job.opponent_b,
+                job.seed,
+                job.num_games,
+                vectorized,
+                keep_games,
+            )
+            for job in jobs
+        ]
+        cached: list[PairingStats | None] = [
+            cache.get(key) if cache is not None and key is not None else None for key in cache_keys
+        ]
+        if not quiet:
+            print(
+                f"Tournament: {len(self.scenario_ids)} scenarios x {len(self.opponent_names) ** 2} pairings,"
+                f" {len(jobs)} jobs of {num_games} games on {self.max_workers} workers"
+            )
+            if cache is not None:
+                print(f"  {sum(c is not None for c in cached)} jobs from the result cache")
+
+        # Chunks of every job not in the cache, longest job first, each job's chunks in game order
+        tasks: list[tuple[int, GameChunk]] = []
+        for idx, job in enumerate(jobs):
+            if cached[idx] is not None:
+                continue
+            starts = [0] if vectorized else range(0, num_games, chunk_size)
+            for start in starts:
+                chunk = GameChunk(
+                    job.scenario_id,
+                    job.opponent_a,
+                    job.opponent_b,
+                    job.seed,
+                    num_games if vectorized else min(chunk_size, num_games - start),
+                    first_game=start,
+                    options=self.game_options,
+                    vectorized=vectorized,
+                    keep_games=keep_games,
+                )
+                tasks.append((idx, chunk))
+
+        stats = [
+            job_cached
+            if job_cached is not None
+            else PairingStats(opponent_a=job.opponent_a, opponent_b=job.opponent_b, keep_games=keep_games)
+            for job, job_cached in zip(jobs, cached, strict=True)
+        ]
+        remaining = [0] * len(jobs)
+        for idx, _ in tasks:
+            remaining[idx] += 1
+        finished = sum(c is not None for c in cached)
+
+        def report(idx: int) -> None:
+            nonlocal finished
+            remaining[idx] -= 1
+            if remaining[idx] == 0:
+                finished += 1
+                if not quiet:
+                    job = jobs[idx]
+                    print(f"  [{finished}/{len(jobs)}] {job.scenario_id} {job.pairing_key}")
+
+        if self.max_workers == 1:
+            for idx, chunk in tasks:
+                chunk_stats, _ = play_chunk(chunk)
+                stats[idx].merge(chunk_stats)
+                report(idx)
+        else:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                futures: list[tuple[int, Future]] = [(idx, executor.submit(play_chunk, chunk)) for idx, chunk in tasks]
+                job_of = {future: idx for idx, future in futures}
+                for future in as_completed(job_of):
+                    report(job_of[future])
+                # Merge in submission order, i.e. game order within each job
+                for idx, future in futures:
+                    stats[idx].merge(future.result()[0])
+        for idx, key in enumerate(cache_keys):
+            if cache is not None and key is not None and cached[idx] is None:
+                cache.put(key, stats[idx])
+
+        job_stats = {(job.scenario_id, job.pairing_key): job_stats for job, job_stats in zip(jobs, stats, strict=True)}
+        results = TournamentResults(opponents=self.opponent_names, timestamp=datetime.now().isoformat())
+        for scenario_id in self.scenario_ids:
+            batch_results = BatchResults(scenario_id=scenario_id, timestamp=results.timestamp)
+            for name_a, name_b in self._pairings():
+                batch_results.pairings[f"{name_a}:{name_b}"] = job_stats[(scenario_id, f"{name_a}:{name_b}")]
+            batch_results.compute_aggregate()
+            results.scenarios[scenario_id] = batch_results
+        results.duration_seconds = time.time() - start_time
+        return results
+
+
+def print_tournament_results(results: TournamentResults, metric: str = "avg_vp_share_a") -> None:
+    """Print one opponent x opponent matrix per scenario and each opponent's mean VP share.
+
+    Args:
+        results: Results from TournamentRunner.run
+        metric: Matrix entries (see TOURNAMENT_METRICS)
+    """
+    names = results.opponents
+    width = max(8, *(len(name) for name in names))
+    percent = metric.endswith(("_rate", "_rate_a", "_share_a"))
+
+    for scenario_id in results.scenarios:
+        matrix = results.matrix(scenario_id, metric)
+        scores = results.opponent_scores(scenario_id)
+        print()
+        print(f"{scenario_id}: {metric} (rows: player A, columns: player B)")
+        print("-" * (width + (width + 3) * len(names) + 12))
+        print(f"{'':<{width}} | " + " | ".join(f"{name[:width]:>{width}}" for name in names) + " |  VP share")
+        for i, name in enumerate(names):
+            cells = [f"{v * 100:>{width - 1}.1f}%" if percent else f"{v:>{width}.1f}" for v in matrix[i]]
+            print(f"{name:<{width}} | " + " | ".join(cells) + f" | {scores[name] * 100:>8.1f}%")
+
+    print()
+    print("MEAN VP SHARE ACROSS SCENARIOS (both sides)")
+    print("-" * 50)
+    overall = {name: np.mean([results.opponent_scores(s)[name] for s in results.scenarios]) for name in names}
+    for name, score in sorted(overall.items(), key=lambda item: -item[1]):
+        print(f"  {name:<{width}} {score * 100:>6.1f}%")
+
+
+__all__ = [
+    "TOURNAMENT_METRICS",
+    "TournamentJob",
+    "TournamentResults",
+    "TournamentRunner",
+    "print_tournament_results",
+]
@@ -4,6 +4,7 @@ import logging
 import os
 
 from flask import Flask, request
+from sqlalchemy import inspect, text
 
 from .config import Config
 from .extensions import db, login_manager
@@ -14,12 +15,14 @@ logger = logging.getLogger(__name__)
 THEMES = ["default", "cold-war", "renaissance", "byzantine", "corporate"]
 
 
-def seed_db():
-    """Seed database with default test user if it doesn't exist.
-
-    Also ensures all models are imported so their tables are created.
-    """
+def import_models():
+    """Import all models so their tables are registered on db.metadata."""
     from .models.game_record import GameRecord, SettlementAttempt, TurnHistory  # noqa: F401
+    from .models.user import User  # noqa: F401
+
+
+def seed_db():
+    """Seed database with default test user if it doesn't exist."""
     from .models.user import User
 
     # Create default test user
@@ -30,6 +33,29 @@ def seed_db():
         db.session.commit()
 
 
+def add_missing_columns():
+    """Add model columns that an existing database predates.
+
+    db.create_all() creates missing tables but never alters existing ones,
+    so nullable columns added to a model later (e.g. GameRecord.engine_snapshot)
+    are added here with ALTER TABLE. Rows written before the upgrade get NULL.
+    """
+    inspector = inspect(db.engine)
+    for table in db.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            if not column.nullable:
+                raise RuntimeError(f"Cannot add NOT NULL column {table.name}.{column.name} to an existing table")
+            column_type = column.type.compile(dialect=db.engine.dialect)
+            logger.info("Adding column %s.%s (%s)", table.name, column.name, column_type)
+            with db.engine.begin() as connection:
+                connection.execute(text(f'ALTER TABLE "{table.name}" ADD COLUMN "{column.name}" {column_type}'))
+
+
 async def check_claude_api_credentials():
     """Check if Claude API credentials are available and test the connection.
 
@@ -149,9 +175,11 @@ def create_app(config_class=Config):
             theme = "default"
         return {"theme": theme, "available_themes": THEMES}
 
-    # Create database tables and seed
+    # Create database tables, add columns older databases lack, and seed
     with app.app_context():
+        import_models()
         db.create_all()
+        add_missing_columns()
         seed_db()
 
     return app
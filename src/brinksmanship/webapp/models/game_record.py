@@ -95,6 +95,9 @@ class GameRecord(db.Model):
     surplus_captured_opponent = db.Column(db.Float, default=0.0, nullable=False)
     cooperation_streak = db.Column(db.Integer, default=0, nullable=False)
 
+    # Binary GameEngine snapshot (authoritative engine state for resuming)
+    engine_snapshot = db.Column(db.LargeBinary, nullable=True)
+
     # Last actions (for display)
     last_action_player = db.Column(db.String(64), nullable=True)
     last_action_opponent = db.Column(db.String(64), nullable=True)
@@ -290,6 +293,7 @@ class GameRecord(db.Model):
             "surplus_captured_player": self.surplus_captured_player,
             "surplus_captured_opponent": self.surplus_captured_opponent,
             "cooperation_streak": self.cooperation_streak,
+            "engine_snapshot": self.engine_snapshot,
         }
 
     def update_from_state(self, value: dict[str, Any]) -> None:
@@ -320,6 +324,7 @@ class GameRecord(db.Model):
             "surplus_captured_player": "surplus_captured_player",
             "surplus_captured_opponent": "surplus_captured_opponent",
             "cooperation_streak": "cooperation_streak",
+            "engine_snapshot": "engine_snapshot",
         }
         for key, attr in field_map.items():
             if key in value:
@@ -1,8 +1,9 @@
 """Engine adapter - wraps GameEngine for webapp use.
 
 This adapter provides a stateless interface to the game engine.
-Game state is stored in the database, and engines are created
-on-demand from the scenario and synced with stored state.
+Game state is stored in the database along with a binary engine
+snapshot, and engines are restored on demand from that snapshot.
+Older games without a snapshot are rebuilt from the flattened state.
 """
 
 import asyncio
@@ -34,9 +35,9 @@ def _run_opponent_method(method, *args, **kwargs):
 class RealGameEngine:
     """Stateless adapter that wraps GameEngine for webapp use.
 
-    Each operation creates a fresh engine from the scenario and
-    syncs it with the stored game state. This eliminates the need
-    for in-memory caching and makes the webapp properly stateless.
+    Each operation restores an engine from the snapshot stored with
+    the game. This eliminates the need for in-memory caching and
+    makes the webapp properly stateless.
     """
 
     def __init__(self) -> None:
@@ -113,6 +114,7 @@ class RealGameEngine:
             "surplus_captured_player": surplus_captured_player,
             "surplus_captured_opponent": surplus_captured_opponent,
             "cooperation_streak": engine.state.cooperation_streak,
+            "engine_snapshot": engine.snapshot(),
         }
 
     def get_scenarios(self) -> list[dict[str, Any]]:
@@ -321,6 +323,7 @@ class RealGameEngine:
                 "cooperation_streak": gs.cooperation_streak,
             },
             "is_finished": result.ending is not None,
+            "engine_snapshot": engine.snapshot(),
         }
 
         if result.ending:
@@ -336,7 +339,16 @@ class RealGameEngine:
         return new_state
 
     def _create_engine_from_state(self, state: dict[str, Any]) -> GameEngine:
-        """Create a fresh engine and sync it to stored state."""
+        """Restore the engine from the stored snapshot.
+
+        States saved before snapshots existed are rebuilt by creating a
+        fresh engine and syncing it to the flattened fields; that path
+        cannot recover branch position, information or RNG state.
+        """
+        snapshot = state.get("engine_snapshot")
+        if snapshot:
+            return GameEngine.restore(snapshot, self._scenario_repo)
+
         scenario_id = state.get("scenario_id")
         if not scenario_id:
             raise ValueError("No scenario_id in state")
@@ -25,3 +25,25 @@ def sample_game_state():
     from brinksmanship.models.state import GameState
 
     return GameState()
+
+
+@pytest.fixture(scope="session")
+def scenario_id():
+    """Scenario the batch, cache and distributed simulation tests run."""
+    return "cuban_missile_crisis"
+
+
+@pytest.fixture(scope="session")
+def opponent_names():
+    """Small mix of deterministic and random opponents for simulation tests."""
+    return ["TitForTat", "Erratic", "Opportunist"]
+
+
+@pytest.fixture
+def summaries():
+    """Provide a function reducing BatchResults to comparable per-pairing dicts."""
+
+    def summarize(results) -> dict:
+        return {key: stats.to_dict() for key, stats in results.pairings.items()}
+
+    return summarize
@@ -8,6 +8,9 @@ Tests cover:
 - History tracking: turn recording, state before/after
 - Game ending detection: deterministic endings, crisis termination
 - Information state updates: reconnaissance, inspection
+- Snapshot/restore: exact resumption, branch position, endings
+- Fork: lockstep play, independence from the parent
+- Instrumentation: per-phase metrics and sinks
 
 Removed tests (see test_removal_log.md):
 - TestTurnRecord: Basic dataclass tests (trivial)
@@ -19,6 +22,9 @@ Removed tests (see test_removal_log.md):
 - TestInformationStateUpdates: test_successful_recon/inspection_updates (weak assertions)
 """
 
+import json
+import tracemalloc
+
 import pytest
 
 from brinksmanship.engine.game_engine import (
@@ -26,8 +32,17 @@ from brinksmanship.engine.game_engine import (
     GameEnding,
     GameEngine,
     TurnPhase,
+    clear_scenario_cache,
     create_game,
+    get_compiled_scenario,
+)
+from brinksmanship.engine.instrumentation import (
+    CallbackSink,
+    EngineInstrumentation,
+    HistogramSink,
+    JsonlSink,
 )
+from brinksmanship.engine.rng import game_streams
 from brinksmanship.models.actions import (
     DEESCALATE,
     ESCALATE,
@@ -37,7 +52,9 @@ from brinksmanship.models.actions import (
     ActionCategory,
     ActionType,
 )
-from brinksmanship.storage import ScenarioRepository
+from brinksmanship.models.state import GameState
+from brinksmanship.parameters import GameParameters
+from brinksmanship.storage import FileScenarioRepository, ScenarioRepository
 
 # =============================================================================
 # Mock Scenario Repository
@@ -334,6 +351,266 @@ class TestStateUpdates:
 # =============================================================================
 
 
+class TestStateView:
+    """Tests for the public GameState view over the engine's internal state."""
+
+    def test_edits_through_view_are_used(self, engine):
+        """Assignments through engine.state are picked up by the next turn."""
+        engine.state.risk_level = 6.0
+        engine.state.player_a.position = 7.0
+
+        engine.submit_actions(DEESCALATE, DEESCALATE)
+
+        # CC: risk falls from the edited value, not the initial 2.0
+        assert engine.state.risk_level < 6.0
+        assert engine.state.risk_level > 2.0
+        assert engine.state.position_a >= 6.0
+
+    def test_assigning_state_replaces_it(self, engine):
+        """Assigning a GameState to engine.state replaces the engine state."""
+        engine.state = engine.state.model_copy(update={"risk_level": 8.5})
+
+        assert engine.get_current_state().risk_level == pytest.approx(8.5)
+
+    def test_get_current_state_is_independent(self, engine):
+        """get_current_state returns a copy that does not alias engine state."""
+        snapshot = engine.get_current_state()
+        snapshot.risk_level = 9.0
+        snapshot.player_a.information.update_position(1.0, 1)
+
+        assert engine.state.risk_level == pytest.approx(2.0)
+        assert engine.get_information_state("A").known_position is None
+
+    def test_view_is_refreshed_after_turn(self, engine):
+        """The view reflects the state after each turn."""
+        view = engine.state
+        engine.submit_actions(DEESCALATE, ESCALATE)
+
+        assert view.turn == 1
+        assert engine.state.turn == 2
+        assert engine.state.previous_type_a == ActionType.COOPERATIVE
+
+
+class TestSnapshot:
+    """Tests for GameEngine.snapshot() and GameEngine.restore()."""
+
+    def test_restore_continues_identically(self, engine, mock_repo):
+        """A restored engine plays out exactly like the original."""
+        engine.submit_actions(ESCALATE, DEESCALATE)
+        engine.submit_actions(RECONNAISSANCE, ESCALATE)
+
+        restored = GameEngine.restore(engine.snapshot(), mock_repo)
+
+        assert restored.state == engine.state
+        assert restored.get_information_state("A") == engine.get_information_state("A")
+        while not engine.is_game_over():
+            engine.submit_actions(ESCALATE, DEESCALATE)
+            restored.submit_actions(ESCALATE, DEESCALATE)
+            assert restored.state == engine.state
+        assert restored.get_ending() == engine.get_ending()
+
+    def test_restore_keeps_branch_position(self):
+        """The current turn key survives, not just the turn number."""
+        branching = {
+            "name": "Branching",
+            "turns": [{"turn": 1, "branches": {"CC": "calm", "DD": "tense"}}],
+            "branches": {
+                "calm": {"turn": 2, "narrative_briefing": "Calm"},
+                "tense": {"turn": 2, "narrative_briefing": "Tense"},
+            },
+        }
+        repo = MockScenarioRepository({"branching": branching})
+        engine = GameEngine("branching", repo, max_turns=14, random_seed=1)
+        engine.submit_actions(DEESCALATE, DEESCALATE)
+
+        restored = GameEngine.restore(engine.snapshot(), repo)
+
+        assert restored.get_briefing() == "Calm"
+        assert restored.phase == TurnPhase.BRIEFING
+        assert [record.turn for record in restored.get_history()] == [2]
+
+    def test_restore_finished_game(self, engine, mock_repo):
+        """The ending round-trips."""
+        engine.state.risk_level = 10.0
+        engine.submit_actions(ESCALATE, ESCALATE)
+        assert engine.is_game_over()
+
+        restored = GameEngine.restore(engine.snapshot(), mock_repo)
+
+        assert restored.is_game_over()
+        assert restored.get_ending() == engine.get_ending()
+
+    def test_restore_keeps_streams_and_parameters(self, mock_repo):
+        """Common random number streams, antithetic noise and parameters survive a restore."""
+        params = GameParameters(capture_rate=0.6, variance_scale=1.5)
+
+        def new_engine():
+            streams = game_streams(seed=11, game_index=1, common=True, antithetic=True)
+            return GameEngine("test-scenario", mock_repo, max_turns=14, params=params, streams=streams)
+
+        engine, reference = new_engine(), new_engine()
+        for _ in range(3):
+            engine.submit_actions(ESCALATE, DEESCALATE)
+            reference.submit_actions(ESCALATE, DEESCALATE)
+
+        restored = GameEngine.restore(engine.snapshot(), mock_repo)
+
+        assert restored.params == params
+        while not reference.is_game_over():
+            reference.submit_actions(ESCALATE, DEESCALATE)
+            restored.submit_actions(ESCALATE, DEESCALATE)
+            assert restored.state == reference.state
+        assert restored.get_ending() == reference.get_ending()
+        with pytest.raises(ValueError, match="params differ"):
+            GameEngine.restore(engine.snapshot(), mock_repo, params=GameParameters())
+
+    def test_restore_rejects_bad_data(self, engine, mock_repo):
+        data = engine.snapshot()
+
+        with pytest.raises(ValueError, match="Not an engine snapshot"):
+            GameEngine.restore(b"XXXX" + data[4:], mock_repo)
+        with pytest.raises(ValueError, match="Malformed"):
+            GameEngine.restore(data[:-3], mock_repo)
+
+
+class TestFork:
+    """Tests for GameEngine.fork()."""
+
+    def test_fork_plays_out_like_original(self, engine):
+        """With the same RNG stream, a fork and its parent stay in lockstep."""
+        engine.submit_actions(ESCALATE, DEESCALATE)
+
+        forked = engine.fork()
+        while not engine.is_game_over():
+            engine.submit_actions(ESCALATE, ESCALATE)
+            forked.submit_actions(ESCALATE, ESCALATE)
+            assert forked.state == engine.state
+        assert forked.get_ending() == engine.get_ending()
+
+    def test_fork_is_independent(self, engine):
+        """Turns and edits on a fork do not affect the parent."""
+        engine.submit_actions(DEESCALATE, DEESCALATE)
+        before = engine.get_current_state()
+
+        forked = engine.fork(random_seed=7)
+        forked.state.risk_level = 9.0
+        forked.submit_actions(RECONNAISSANCE, ESCALATE)
+
+        assert engine.get_current_state() == before
+        assert engine.get_information_state("A").known_position is None
+        assert len(engine.get_history()) == 2
+        assert engine.get_history()[-1].action_a is None
+        assert len(forked.get_history()) == 3
+
+    def test_parent_information_does_not_leak_into_fork(self, engine):
+        """Information learned by the parent after forking stays with the parent."""
+        forked = engine.fork()
+
+        engine.state.player_a.information.update_position(3.0, 1)
+        engine.submit_actions(RECONNAISSANCE, ESCALATE)
+
+        assert forked.get_information_state("A").known_position is None
+
+    def test_fork_shares_compiled_scenario(self, engine):
+        assert engine.fork()._scenario is engine._scenario
+
+
+class TestInstrumentation:
+    """Tests for opt-in submit_actions instrumentation."""
+
+    def test_phases_timed_in_order(self, engine):
+        recorded = []
+        engine.instrumentation = EngineInstrumentation(CallbackSink(recorded.append))
+
+        engine.submit_actions(DEESCALATE, DEESCALATE)
+
+        (metrics,) = recorded
+        assert metrics.turn == 1
+        assert list(metrics.phase_seconds) == [
+            "decision",
+            "resolution",
+            "state_update",
+            "check_deterministic",
+            "check_crisis",
+            "check_natural",
+            "advance",
+        ]
+        assert metrics.total_seconds >= sum(metrics.phase_seconds.values()) - 1e-9
+        assert metrics.matrix_resolved is True
+        assert metrics.ending is None
+        assert metrics.allocated_bytes is None
+
+    def test_ending_and_validation_failure(self, engine):
+        recorded = []
+        engine.instrumentation = EngineInstrumentation(CallbackSink(recorded.append), track_allocations=True)
+        engine.state.player_a.resources = 0.1
+        engine.submit_actions(RECONNAISSANCE, DEESCALATE)
+        engine.state.risk_level = 10.0
+        engine.submit_actions(ESCALATE, ESCALATE)
+
+        engine.submit_actions(ESCALATE, ESCALATE)
+
+        rejected, ended, after_end = recorded
+        assert "resources" in rejected.validation_error.lower()
+        assert list(rejected.phase_seconds) == ["decision"]
+        assert rejected.matrix_resolved is False
+        assert ended.ending == EndingType.MUTUAL_DESTRUCTION.value
+        assert ended.ending_phase == "check_deterministic"
+        assert ended.matrix_resolved is True
+        assert ended.peak_bytes >= 0
+        assert after_end.validation_error is None
+        assert not tracemalloc.is_tracing()
+
+    def test_special_action_not_matrix_resolved(self, engine):
+        recorded = []
+        engine.instrumentation = EngineInstrumentation(CallbackSink(recorded.append))
+
+        engine.submit_actions(RECONNAISSANCE, DEESCALATE)
+
+        assert recorded[0].matrix_resolved is False
+        assert recorded[0].validation_error is None
+
+    def test_exception_still_reported(self, engine, monkeypatch):
+        recorded = []
+        engine.instrumentation = EngineInstrumentation(CallbackSink(recorded.append))
+
+        def fail(*args):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(engine, "_resolve_actions", fail)
+        with pytest.raises(RuntimeError):
+            engine.submit_actions(DEESCALATE, DEESCALATE)
+
+        assert recorded[0].aborted is True
+        assert list(recorded[0].phase_seconds) == ["decision", "resolution"]
+
+    def test_histogram_and_jsonl_sinks(self, engine, tmp_path):
+        histogram = HistogramSink()
+        engine.instrumentation = EngineInstrumentation(histogram)
+        for _ in range(3):
+            engine.submit_actions(DEESCALATE, DEESCALATE)
+
+        summary = histogram.summary()
+        assert summary["turns"] == 3
+        assert summary["matrix_resolutions"] == 3
+        assert summary["phases"]["resolution"]["count"] == 3
+        assert sum(summary["phases"]["advance"]["buckets"].values()) == 3
+
+        with JsonlSink(tmp_path / "metrics.jsonl") as sink:
+            engine.instrumentation = EngineInstrumentation(sink)
+            engine.submit_actions(DEESCALATE, DEESCALATE)
+        lines = (tmp_path / "metrics.jsonl").read_text().splitlines()
+        assert json.loads(lines[0])["turn"] == 4
+
+    def test_phase_calls_outside_turn_rejected(self):
+        instrumentation = EngineInstrumentation(HistogramSink())
+
+        with pytest.raises(RuntimeError, match="outside begin_turn"):
+            instrumentation.mark(TurnPhase.RESOLUTION)
+        with pytest.raises(RuntimeError, match="outside begin_turn"):
+            instrumentation.end_turn(None)
+
+
 class TestActionValidation:
     """Tests for action validation."""
 
@@ -466,6 +743,36 @@ class TestHistoryTracking:
         assert history[0].outcome is not None
         assert history[0].outcome.outcome_code == "CC"
 
+    def test_history_states_match_live_states(self, engine):
+        """Lazily rebuilt history states equal the states seen during play."""
+        seen = [engine.get_current_state()]
+        for action_a, action_b in [(DEESCALATE, DEESCALATE), (ESCALATE, DEESCALATE), (ESCALATE, ESCALATE)]:
+            engine.submit_actions(action_a, action_b)
+            seen.append(engine.get_current_state())
+
+        history = engine.get_history()
+        for i in range(3):
+            assert history[i].state_before == seen[i]
+            assert history[i].state_after == seen[i + 1]
+        assert history[3].state_before == seen[3]
+        assert history[3].state_after is None
+
+    def test_history_state_keeps_information_at_that_turn(self, engine):
+        """Information gained later does not leak into earlier history states."""
+        engine.submit_actions(DEESCALATE, DEESCALATE)
+        engine._core.information_a.update_position(4.0, 2)
+
+        assert engine.get_history()[0].state_after.player_a.information.known_position is None
+
+    def test_history_state_can_be_overridden(self, engine):
+        """TurnRecord states can still be assigned directly."""
+        record = engine.get_history()[0]
+        replacement = GameState(risk_level=7.0)
+
+        record.state_before = replacement
+
+        assert record.state_before is replacement
+
 
 # =============================================================================
 # Game Ending Detection Tests
@@ -701,6 +1008,68 @@ class TestCreateGame:
             )
 
 
+class TestScenarioCache:
+    """Tests for the shared compiled scenario cache."""
+
+    def test_engines_share_compiled_turn_configs(self, mock_repo):
+        """Engines for the same scenario reuse one parsed turn graph."""
+        engine1 = GameEngine("test-scenario", mock_repo, random_seed=1)
+        engine2 = GameEngine("test-scenario", mock_repo, random_seed=2)
+
+        assert engine1._turn_configs is engine2._turn_configs
+
+    def test_scenario_edit_invalidates_cache(self, mock_repo, minimal_scenario):
+        """Changing scenario content produces a fresh compilation."""
+        before = get_compiled_scenario("test-scenario", mock_repo)
+        minimal_scenario["turns"][0]["narrative_briefing"] = "Edited briefing"
+        after = get_compiled_scenario("test-scenario", mock_repo)
+
+        assert after is not before
+        assert after.turn_configs["turn_1"].narrative_briefing == "Edited briefing"
+
+    def test_default_turn_config_does_not_mutate_shared_graph(self, mock_repo):
+        """Falling back to a default config leaves the compiled graph untouched."""
+        engine = GameEngine("test-scenario", mock_repo, random_seed=42)
+        engine.state.turn = 7
+        engine._current_turn_key = "turn_7"
+
+        config = engine._get_current_config()
+
+        assert config.turn == 7
+        assert "turn_7" not in get_compiled_scenario("test-scenario", mock_repo).turn_configs
+
+    def test_file_repository_change_invalidates_cache(self, tmp_path, minimal_scenario):
+        """Rewriting a scenario file is picked up by the next engine."""
+        repo = FileScenarioRepository(tmp_path)
+        scenario_id = repo.save_scenario(minimal_scenario)
+        first = get_compiled_scenario(scenario_id, repo)
+        assert get_compiled_scenario(scenario_id, repo) is first
+
+        minimal_scenario["turns"][0]["narrative_briefing"] = "A much longer rewritten briefing"
+        repo.save_scenario(minimal_scenario)
+        second = get_compiled_scenario(scenario_id, repo)
+
+        assert second is not first
+        assert second.turn_configs["turn_1"].narrative_briefing == "A much longer rewritten briefing"
+
+    def test_turn_configs_carry_prebuilt_matrices(self, mock_repo):
+        """Each turn configuration holds the matrix used at resolution time."""
+        compiled = get_compiled_scenario("test-scenario", mock_repo)
+        turn_1 = compiled.turn_configs["turn_1"]
+        turn_2 = compiled.turn_configs["turn_2"]
+
+        assert turn_1.payoff_matrix.matrix_type == turn_1.matrix_type
+        # Identical (type, params) pairs share one matrix
+        assert turn_1.payoff_matrix is turn_2.payoff_matrix
+
+    def test_clear_scenario_cache(self, mock_repo):
+        """Clearing the cache forces recompilation."""
+        first = get_compiled_scenario("test-scenario", mock_repo)
+        clear_scenario_cache()
+
+        assert get_compiled_scenario("test-scenario", mock_repo) is not first
+
+
 # =============================================================================
 # Edge Cases and Integration Tests
 # =============================================================================
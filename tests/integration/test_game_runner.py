@@ -2,7 +2,9 @@
 
 Tests cover:
 - GameRunner class with actual opponents
+- Direct (event-loop free) execution for deterministic opponents
 - BatchRunner for parallel execution
+- Sequential early stopping with PrecisionTarget
 - Integration with deterministic opponents
 - LLM opponent integration (marked for environments with API keys)
 
@@ -10,12 +12,14 @@ This module tests the unified framework that uses ACTUAL opponent implementation
 from brinksmanship.opponents.deterministic.
 """
 
+import asyncio
 import random
 import tempfile
 from pathlib import Path
 
 import pytest
 
+from brinksmanship.opponents.base import Opponent
 from brinksmanship.opponents.deterministic import (
     Erratic,
     GrimTrigger,
@@ -29,6 +33,7 @@ from brinksmanship.testing.batch_runner import (
     BatchResults,
     BatchRunner,
     PairingStats,
+    PrecisionTarget,
     create_opponent,
 )
 from brinksmanship.testing.game_runner import (
@@ -122,6 +127,58 @@ class TestGameRunner:
         assert result1.winner in ["A", "B", "tie", "mutual_destruction"]
         assert result2.winner in ["A", "B", "tie", "mutual_destruction"]
 
+    @pytest.mark.asyncio
+    async def test_direct_run_matches_event_loop(self):
+        """run_game_direct plays the same seeded game as run_game."""
+        for game_index in range(5):
+            looped = await GameRunner(
+                scenario_id="cuban_missile_crisis",
+                opponent_a=Erratic(),
+                opponent_b=GrimTrigger(),
+                random_seed=9,
+                game_index=game_index,
+            ).run_game()
+            runner = GameRunner(
+                scenario_id="cuban_missile_crisis",
+                opponent_a=Erratic(),
+                opponent_b=GrimTrigger(),
+                random_seed=9,
+                game_index=game_index,
+            )
+
+            assert runner.can_run_direct
+            assert runner.run_game_direct().to_dict() == looped.to_dict()
+
+    def test_run_game_sync_uses_event_loop_for_other_opponents(self):
+        """Opponents that suspend still run under asyncio."""
+
+        class Suspending(Opponent):
+            """Plays like TitForTat but yields to the event loop each turn."""
+
+            def __init__(self):
+                super().__init__(name="Suspending")
+                self.delegate = TitForTat()
+
+            async def choose_action(self, state, available_actions):
+                await asyncio.sleep(0)
+                return await self.delegate.choose_action(state, available_actions)
+
+            async def evaluate_settlement(self, proposal, state, is_final_offer):
+                return await self.delegate.evaluate_settlement(proposal, state, is_final_offer)
+
+            async def propose_settlement(self, state):
+                return await self.delegate.propose_settlement(state)
+
+        runner = GameRunner(scenario_id="cuban_missile_crisis", opponent_a=Suspending(), opponent_b=TitForTat())
+        assert not runner.can_run_direct
+        with pytest.raises(RuntimeError, match="suspended"):
+            runner.run_game_direct()
+
+        result = run_game_sync(
+            scenario_id="cuban_missile_crisis", opponent_a=Suspending(), opponent_b=TitForTat(), random_seed=1
+        )
+        assert result.turns_played > 0
+
     def test_game_result_to_dict(self):
         """Test GameResult.to_dict() serialization."""
         result = run_game_sync(
@@ -282,6 +339,152 @@ class TestBatchRunner:
             results_file = Path(tmpdir) / "batch_results.json"
             assert results_file.exists()
 
+    def test_seeded_pairing_independent_of_workers(self):
+        """Seeded results do not depend on worker count or sharding."""
+        runner = BatchRunner(scenario_id="cuban_missile_crisis")
+
+        serial = runner.run_pairing("Erratic", "Opportunist", num_games=8, seed=7, max_workers=1)
+        parallel = runner.run_pairing("Erratic", "Opportunist", num_games=8, seed=7, max_workers=3)
+        first_half = runner.run_pairing("Erratic", "Opportunist", num_games=4, seed=7, max_workers=2)
+        second_half = runner.run_pairing("Erratic", "Opportunist", num_games=4, seed=7, max_workers=2, first_game=4)
+
+        assert parallel.to_dict() == serial.to_dict()
+        assert first_half.vp_a_list + second_half.vp_a_list == serial.vp_a_list
+
+    def test_chunked_pairing_matches_single_games(self):
+        """Chunked workers aggregate exactly what single games would."""
+        runner = BatchRunner(scenario_id="cuban_missile_crisis")
+
+        expected = PairingStats(opponent_a="Erratic", opponent_b="TitForTat")
+        for game_index in range(7):
+            expected.add_result(
+                run_game_sync(
+                    scenario_id="cuban_missile_crisis",
+                    opponent_a=create_opponent("Erratic", is_player_a=True),
+                    opponent_b=create_opponent("TitForTat", is_player_a=False),
+                    random_seed=11,
+                    game_index=game_index,
+                )
+            )
+
+        for chunk_size in (1, 3, 7):
+            stats = runner.run_pairing(
+                "Erratic", "TitForTat", num_games=7, seed=11, max_workers=2, chunk_size=chunk_size
+            )
+            assert stats.to_dict() == expected.to_dict()
+            assert stats.vp_a_list == expected.vp_a_list
+
+    def test_pairing_stats_merge(self):
+        """Merging partial PairingStats equals adding every game to one."""
+        results = [
+            run_game_sync(
+                scenario_id="cuban_missile_crisis",
+                opponent_a=Erratic(),
+                opponent_b=Opportunist(),
+                random_seed=3,
+                game_index=game_index,
+            )
+            for game_index in range(4)
+        ]
+        whole = PairingStats(opponent_a="Erratic", opponent_b="Opportunist")
+        first = PairingStats(opponent_a="Erratic", opponent_b="Opportunist")
+        second = PairingStats(opponent_a="Erratic", opponent_b="Opportunist")
+        for i, result in enumerate(results):
+            whole.add_result(result)
+            (first if i < 2 else second).add_result(result)
+
+        first.merge(second)
+
+        assert first == whole
+
+    def test_persistent_pool_across_pairings(self):
+        """A runner used as a context manager keeps one pool for all calls."""
+        reference = BatchRunner(scenario_id="cuban_missile_crisis").run_all_pairings(
+            opponent_names=["TitForTat", "Erratic"], num_games=4, seed=5, max_workers=1
+        )
+
+        with BatchRunner(scenario_id="cuban_missile_crisis", max_workers=2) as runner:
+            pool = runner._pool
+            results = runner.run_all_pairings(opponent_names=["TitForTat", "Erratic"], num_games=4, seed=5)
+            stats = runner.run_pairing("Erratic", "Erratic", num_games=4, seed=5 + 2 * 4)
+            assert runner._pool is pool
+
+        assert runner._pool is None
+        assert {k: v.to_dict() for k, v in results.pairings.items()} == {
+            k: v.to_dict() for k, v in reference.pairings.items()
+        }
+        assert stats.to_dict() == reference.pairings["Erratic:Erratic"].to_dict()
+
+
+class TestEarlyStopping:
+    """Pairings that stop once their confidence intervals are narrow enough."""
+
+    def test_deterministic_pairing_stops_at_min_games(self):
+        """A pairing without variance stops as soon as it may."""
+        target = PrecisionTarget(total_value_half_width=1.0, min_games=6)
+        stats = BatchRunner(scenario_id="cuban_missile_crisis").run_pairing(
+            "TitForTat", "TitForTat", num_games=200, seed=1, max_workers=2, chunk_size=3, target=target
+        )
+
+        assert stats.total_games == 6
+        assert stats.total_value_half_width() == 0.0
+
+    def test_noisy_pairing_runs_until_target_or_maximum(self):
+        """Games are added chunk by chunk, in game order, until the target is met."""
+        runner = BatchRunner(scenario_id="cuban_missile_crisis")
+        loose = PrecisionTarget(total_value_half_width=15.0, min_games=4)
+        strict = PrecisionTarget(total_value_half_width=0.01, min_games=4)
+
+        stopped = runner.run_pairing(
+            "Erratic", "Erratic", num_games=60, seed=3, max_workers=2, chunk_size=4, target=loose
+        )
+        capped = runner.run_pairing(
+            "Erratic", "Erratic", num_games=24, seed=3, max_workers=2, chunk_size=4, target=strict
+        )
+        full = runner.run_pairing("Erratic", "Erratic", num_games=60, seed=3, max_workers=1)
+        first_24 = runner.run_pairing("Erratic", "Erratic", num_games=24, seed=3, max_workers=1)
+
+        assert 4 <= stopped.total_games < 60 and stopped.total_games % 4 == 0
+        assert stopped.total_value_half_width() <= 15.0
+        assert stopped.total_value_list == full.total_value_list[: stopped.total_games]
+        assert capped.to_dict() == first_24.to_dict()
+
+    def test_all_pairings_spend_games_where_uncertain(self):
+        """Deterministic pairings stop early; noisy ones get the remaining games."""
+        target = PrecisionTarget(total_value_half_width=2.0, min_games=8)
+        results = BatchRunner(scenario_id="cuban_missile_crisis").run_all_pairings(
+            opponent_names=["TitForTat", "Erratic"], num_games=40, seed=2, max_workers=2, chunk_size=4, target=target
+        )
+
+        assert results.pairings["TitForTat:TitForTat"].total_games == 8
+        assert results.pairings["Erratic:Erratic"].total_games > 8
+        assert results.pairings["Erratic:Erratic"].to_dict()["total_value_ci95"] is not None
+
+    def test_win_rate_interval(self):
+        """The win-rate half-width is the Wilson score interval."""
+        stats = BatchRunner(scenario_id="cuban_missile_crisis").run_pairing_vectorized(
+            "Erratic", "Opportunist", num_games=400, seed=1
+        )
+        p, n, z = stats.win_rate_a, stats.total_games, 1.959964
+        center = (p + z * z / (2 * n)) / (1 + z * z / n)
+
+        assert stats.win_rate_half_width() == pytest.approx(
+            z * (p * (1 - p) / n + z * z / (4 * n * n)) ** 0.5 / (1 + z * z / n), rel=1e-5
+        )
+        assert 0 <= center - stats.win_rate_half_width() and center + stats.win_rate_half_width() <= 1
+        assert PairingStats(opponent_a="A", opponent_b="B").win_rate_half_width() == float("inf")
+
+    def test_invalid_targets(self):
+        """Targets need a width, a valid confidence and the process pool."""
+        with pytest.raises(ValueError):
+            PrecisionTarget()
+        with pytest.raises(ValueError):
+            PrecisionTarget(win_rate_half_width=0.05, confidence=1.0)
+        with pytest.raises(ValueError):
+            BatchRunner(scenario_id="cuban_missile_crisis").run_all_pairings(
+                num_games=10, vectorized=True, target=PrecisionTarget(win_rate_half_width=0.05)
+            )
+
 
 # =============================================================================
 # Opponent Behavior Tests
@@ -5,6 +5,7 @@ Tests cover:
 - check_* threshold functions
 - analyze_mechanics main function
 - format_text_report function
+- load_playtest_results for JSON files and game table directories
 
 Note: Trivial enum tests (TestIssueSeverity), dataclass tests (TestIssue,
 TestAnalysisReport), and constant tests (TestDefaultThresholds) were removed.
@@ -470,6 +471,31 @@ class TestLoadPlaytestResults:
         finally:
             path.unlink()
 
+    def test_load_game_table(self, tmp_path):
+        """Test a game table directory is summarized like batch results JSON."""
+        from brinksmanship.testing.batch_runner import BatchResults, BatchRunner
+        from brinksmanship.testing.game_table import GameTableWriter
+
+        runner = BatchRunner(scenario_id="cuban_missile_crisis")
+        batch = BatchResults()
+        with GameTableWriter(tmp_path / "games") as games:
+            for seed, (name_a, name_b) in enumerate([("TitForTat", "Erratic"), ("Opportunist", "TitForTat")]):
+                batch.pairings[f"{name_a}:{name_b}"] = runner.run_pairing_vectorized(
+                    name_a, name_b, num_games=400, seed=seed, games=games
+                )
+        batch.compute_aggregate()
+
+        results = load_playtest_results(tmp_path / "games")
+        summary = compute_summary_from_results(results)
+
+        assert set(results["pairings"]) == set(batch.pairings)
+        for key, stats in batch.pairings.items():
+            for field in ("total_games", "total_turns", "wins_a", "wins_b", "ties", "settlements"):
+                assert results["pairings"][key][field] == getattr(stats, field)
+        assert summary["total_games"] == 800
+        assert summary["vp_std_dev"] == pytest.approx(batch.aggregate["vp_std_dev"], abs=0.01)
+        assert summary["settlement_rate"] == pytest.approx(batch.aggregate["settlement_rate"], abs=1e-4)
+
 
 # =============================================================================
 # Integration Tests
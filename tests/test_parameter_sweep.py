@@ -0,0 +1,167 @@
+"""Tests for scripts/parameter_sweep.py module.
+
+Tests cover:
+- SweepResult.check_criteria shortfall and ranking
+- run_parameter_sweep on the vectorized engine
+- run_adaptive_sweep successive halving
+- Resuming sweeps from checkpoint shards
+- Sweeps published to a work queue and played by workers
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from parameter_sweep import SweepResult, run_adaptive_sweep, run_parameter_sweep
+
+from brinksmanship.testing.batch_runner import BatchRunner
+from brinksmanship.testing.distributed import SQLiteWorkQueue, run_worker
+
+
+def passing_result(**changes) -> SweepResult:
+    values = {
+        "capture_rate": 0.4,
+        "rejection_base_penalty": 1.5,
+        "dd_risk_increase": 1.0,
+        "avg_total_value": 100.0,
+        "vp_std_dev": 20.0,
+        "settlement_rate": 0.5,
+        "mutual_destruction_rate": 0.1,
+        "avg_game_length": 12.0,
+    }
+    result = SweepResult(**{**values, **changes})
+    result.check_criteria()
+    return result
+
+
+class TestShortfall:
+    """Distance from the balance criteria."""
+
+    def test_passing_has_no_shortfall(self):
+        result = passing_result()
+        assert result.passes_all
+        assert result.shortfall == 0.0
+
+    def test_shortfall_grows_with_distance(self):
+        near = passing_result(avg_game_length=9.0)
+        far = passing_result(avg_game_length=6.0, settlement_rate=0.8)
+
+        assert not near.passes_all
+        assert near.shortfall == pytest.approx(0.5)
+        assert far.shortfall == pytest.approx(2.0 + 1.0)
+        assert sorted([far, near, passing_result()], key=lambda r: r.rank_key)[1:] == [near, far]
+
+    def test_dominant_strategies_count(self):
+        result = passing_result(dominant_strategies=["Opportunist", "NashCalculator"])
+        assert result.shortfall == pytest.approx(2.0)
+
+
+class TestSweeps:
+    """Grid and adaptive sweeps on the vectorized engine."""
+
+    def test_grid_sweep_vectorized(self):
+        results = run_parameter_sweep(
+            capture_rates=[0.3, 0.5],
+            rejection_penalties=[1.5],
+            dd_risks=[1.0],
+            num_games=20,
+            seed=1,
+            quiet=True,
+            vectorized=True,
+        )
+
+        assert [(r.capture_rate, r.games_per_pairing) for r in results] == [(0.3, 20), (0.5, 20)]
+
+    def test_adaptive_sweep_narrows_candidates(self):
+        results = run_adaptive_sweep(
+            capture_rates=[0.3, 0.5],
+            rejection_penalties=[1.0, 2.0],
+            dd_risks=[0.5, 1.5, 2.5],
+            num_games=40,
+            initial_games=5,
+            eta=3,
+            seed=2,
+            quiet=True,
+            vectorized=True,
+        )
+
+        assert len(results) == 3
+        assert all(r.games_per_pairing == 40 for r in results)
+        assert [r.rank_key for r in results] == sorted(r.rank_key for r in results)
+
+    def test_adaptive_sweep_samples(self):
+        results = run_adaptive_sweep(
+            capture_rates=[0.2, 0.6], num_games=10, initial_games=10, samples=4, seed=3, quiet=True, vectorized=True
+        )
+
+        assert len(results) == 4
+        assert all(0.2 <= r.capture_rate <= 0.6 for r in results)
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            run_adaptive_sweep(eta=1, quiet=True)
+        with pytest.raises(ValueError):
+            run_adaptive_sweep(num_games=10, initial_games=20, quiet=True)
+
+
+class TestCheckpointedSweeps:
+    """Sweeps saved shard by shard and resumed."""
+
+    def test_grid_sweep_resumes_without_simulating(self, tmp_path, monkeypatch):
+        kwargs = {"capture_rates": [0.3, 0.5], "num_games": 10, "quiet": True, "checkpoint_dir": tmp_path}
+        first = run_parameter_sweep(vectorized=True, **kwargs)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("resumed sweep simulated a saved pairing")
+
+        monkeypatch.setattr(BatchRunner, "run_parameter_sets_vectorized", fail)
+        resumed = run_parameter_sweep(vectorized=True, resume=True, **kwargs)
+
+        assert resumed == first
+        with pytest.raises(ValueError):
+            run_parameter_sweep(vectorized=True, **kwargs)
+
+    def test_adaptive_sweep_resumes(self, tmp_path):
+        kwargs = {
+            "capture_rates": [0.3, 0.5],
+            "dd_risks": [1.0, 2.0],
+            "num_games": 9,
+            "initial_games": 3,
+            "quiet": True,
+            "vectorized": True,
+            "checkpoint_dir": tmp_path,
+        }
+        first = run_adaptive_sweep(seed=5, **kwargs)
+        resumed = run_adaptive_sweep(resume=True, **kwargs)
+
+        assert resumed == first
+
+
+class TestDistributedSweeps:
+    """Sweeps played by workers pulling from a shared queue."""
+
+    def test_queued_sweep_matches_local_sweep(self, tmp_path):
+        queue_path = tmp_path / "queue.db"
+        worker = threading.Thread(
+            target=run_worker,
+            args=(SQLiteWorkQueue(queue_path),),
+            kwargs={"idle_timeout": 1, "poll_interval": 0.05},
+        )
+        worker.start()
+        kwargs = {"capture_rates": [0.3, 0.5], "num_games": 8, "seed": 4, "quiet": True}
+        queued = run_parameter_sweep(queue_path=queue_path, job="sweep", **kwargs)
+        worker.join()
+
+        local = run_parameter_sweep(max_workers=1, **kwargs)
+        assert [r.param_str for r in queued] == [r.param_str for r in local]
+        for q, r in zip(queued, local, strict=True):
+            assert q.avg_total_value == pytest.approx(r.avg_total_value)
+            assert q.settlement_rate == pytest.approx(r.settlement_rate)
+
+    def test_queue_excludes_checkpoint(self, tmp_path):
+        with pytest.raises(ValueError):
+            run_parameter_sweep(queue_path=tmp_path / "queue.db", checkpoint_dir=tmp_path / "run", quiet=True)
@@ -0,0 +1,186 @@
+"""Tests for the vectorized simulation scripts.
+
+Tests cover:
+- exploitation_timing_sim on BatchGameEngine against scalar timed defection games
+- Defection turns that do not depend on the rest of the batch
+- Exact crisis termination survival probabilities and their simulation
+- Exact final resolution moments and win rates
+- Vectorized settlement acceptance draws
+"""
+
+import statistics
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import sim_crisis_termination as crisis
+import sim_settlement as settlement
+import sim_variance as variance
+from exploitation_timing_sim import run_timing_analysis
+
+from brinksmanship.models.actions import Action, ActionType
+from brinksmanship.models.state import GameState
+from brinksmanship.opponents.base import Opponent, SettlementProposal, SettlementResponse
+from brinksmanship.opponents.deterministic import TitForTat
+from brinksmanship.testing.game_runner import GameRunner
+
+SCENARIO_ID = "cuban_missile_crisis"
+
+
+class TimedDefector(Opponent):
+    """Opponent that defects exactly once at a specified turn.
+
+    Cooperates on all turns except the specified defection turn.
+    Scalar reference for exploitation_timing_sim's BatchTimedDefector.
+    """
+
+    def __init__(self, defect_turn: int) -> None:
+        """Initialize with the turn to defect on.
+
+        Args:
+            defect_turn: The turn number (1-indexed) to defect on.
+                        Cooperates on all other turns.
+        """
+        super().__init__(name=f"TimedDefector(turn={defect_turn})")
+        self.defect_turn = defect_turn
+        self._is_player_a: bool = True
+        self._defected: bool = False
+
+    def set_player_side(self, is_player_a: bool) -> None:
+        """Set which side this opponent is playing."""
+        self._is_player_a = is_player_a
+
+    async def choose_action(self, state: GameState, available_actions: list[Action]) -> Action:
+        """Choose action based on timed defection strategy.
+
+        Defects only on the specified turn, cooperates otherwise.
+        """
+        # Determine action type for this turn
+        if state.turn == self.defect_turn and not self._defected:
+            self._defected = True
+            action_type = ActionType.COMPETITIVE
+        else:
+            action_type = ActionType.COOPERATIVE
+
+        # Find an action of the desired type
+        typed_actions = [a for a in available_actions if a.action_type == action_type]
+        if typed_actions:
+            return typed_actions[0]
+
+        # Fallback to any action if none of desired type
+        return (
+            available_actions[0]
+            if available_actions
+            else Action(name="Hold", action_type=ActionType.COOPERATIVE, description="Hold")
+        )
+
+    async def evaluate_settlement(
+        self,
+        proposal: SettlementProposal,
+        state: GameState,
+        is_final_offer: bool,
+    ) -> SettlementResponse:
+        """Reject all settlement proposals - we're testing defection timing."""
+        return SettlementResponse(
+            action="reject",
+            rejection_reason="Testing exploitation timing - no settlement.",
+        )
+
+    async def propose_settlement(self, state: GameState) -> SettlementProposal | None:
+        """Never propose settlement - we're testing defection timing."""
+        return None
+
+
+class TestExploitationTiming:
+    """Timed defection on the batch engine."""
+
+    @pytest.mark.parametrize("defect_turn", [1, 9, 10])
+    def test_matches_scalar_games(self, defect_turn):
+        # Fixed seeds; the VP and win rate bounds are about four standard errors of the difference
+        games = 1000
+        batch = run_timing_analysis(SCENARIO_ID, games_per_turn=4000, max_defect_turn=defect_turn, seed=1, quiet=True)
+        scalar = [
+            GameRunner(
+                SCENARIO_ID, TimedDefector(defect_turn), TitForTat(), random_seed=2, game_index=i
+            ).run_game_direct()
+            for i in range(games)
+        ]
+
+        result = batch[defect_turn]
+        assert result.avg_position == pytest.approx(statistics.mean(g.final_pos_a for g in scalar))
+        assert result.avg_vp == pytest.approx(statistics.mean(g.vp_a for g in scalar), abs=1.5)
+        assert result.win_rate == pytest.approx(sum(g.winner == "A" for g in scalar) / games, abs=0.05)
+
+    def test_turns_independent_of_batch(self):
+        alone = run_timing_analysis(SCENARIO_ID, games_per_turn=30, max_defect_turn=2, seed=5, quiet=True)
+        together = run_timing_analysis(SCENARIO_ID, games_per_turn=30, max_defect_turn=6, seed=5, quiet=True)
+
+        assert together[2] == alone[2]
+        assert sum(r.games_played for r in together.values()) == 6 * 30
+
+    def test_resume_plays_missing_turns(self, tmp_path):
+        full = run_timing_analysis(SCENARIO_ID, games_per_turn=20, max_defect_turn=4, seed=3, quiet=True)
+        run_timing_analysis(
+            SCENARIO_ID, games_per_turn=20, max_defect_turn=4, seed=3, quiet=True, checkpoint_dir=tmp_path
+        )
+        next(tmp_path.rglob("turn_3.pkl")).unlink()
+
+        resumed = run_timing_analysis(
+            SCENARIO_ID, games_per_turn=20, max_defect_turn=4, quiet=True, checkpoint_dir=tmp_path, resume=True
+        )
+        assert resumed == full
+
+
+class TestCrisisTermination:
+    """Markov survival of the crisis termination checks."""
+
+    def test_exact_reach_probabilities(self):
+        assert crisis.exact_reach_probabilities(8)[12] == pytest.approx(0.92**2)
+        assert crisis.exact_reach_probabilities(9)[16] == pytest.approx(0.84**6)
+        rate, _ = crisis.exact_termination_stats(9)
+        assert rate == pytest.approx(1 - 0.84**7)
+
+    def test_simulation_matches_exact(self):
+        rng = np.random.default_rng(0)
+        simulated = crisis.run_reach_turn_simulation(200_000, rng)
+        cumulative = crisis.run_cumulative_simulation(200_000, rng)
+
+        for risk in crisis.RISK_LEVELS:
+            exact = crisis.exact_reach_probabilities(risk)
+            assert simulated[risk] == pytest.approx(exact, abs=0.005)
+            rate, turn = crisis.exact_termination_stats(risk)
+            assert cumulative[risk].termination_rate == pytest.approx(rate, abs=0.005)
+            assert cumulative[risk].avg_termination_turn == pytest.approx(turn, abs=0.02)
+
+
+class TestVariance:
+    """Final resolution on arrays and in closed form."""
+
+    def test_exact_moments_match_samples(self):
+        rng = np.random.default_rng(1)
+        for pos_a, sigma in [(5.0, 8.0), (7.0, 30.0), (2.0, 40.0)]:
+            vp_a, vp_b = variance.final_resolution(pos_a, 10 - pos_a, rng.normal(0, sigma, 400_000))
+            mean, std = variance.exact_vp_moments(pos_a, 10 - pos_a, sigma)
+
+            assert vp_a.mean() == pytest.approx(mean, abs=0.1)
+            assert vp_a.std() == pytest.approx(std, abs=0.1)
+            assert (vp_a > vp_b).mean() == pytest.approx(variance.exact_win_rate(pos_a, 10 - pos_a, sigma), abs=0.005)
+            np.testing.assert_allclose(vp_a + vp_b, 100.0)
+
+    def test_no_noise_keeps_expected_vp(self):
+        vp_a, _ = variance.final_resolution(7.0, 3.0, np.zeros(1))
+        assert vp_a[0] == pytest.approx(70.0)
+
+
+class TestSettlement:
+    """Vectorized acceptance draws."""
+
+    def test_simulated_acceptance_matches_probabilities(self):
+        probabilities = [settlement.compute_acceptance_probability(offer, 50.0) for offer in (30, 45, 60)]
+        rates = settlement.simulate_acceptance(probabilities, 200_000, np.random.default_rng(2))
+
+        assert rates == pytest.approx(probabilities, abs=0.005)
@@ -3,7 +3,7 @@
 Tests cover:
 - FileScenarioRepository error boundaries and edge cases
 - Storage configuration functions
-- Parametrized integration tests to verify both backends pass identical tests
+- Parametrized integration tests to verify all scenario backends pass identical tests
 
 Redundancy Reduction (see tests/test_removal_log.md for rationale):
 - Removed TestSlugify (9 tests) - trivial utility function tested implicitly by save operations
@@ -28,6 +28,7 @@ from brinksmanship.storage.file_repo import (
     FileGameRecordRepository,
     FileScenarioRepository,
 )
+from brinksmanship.storage.memory_repo import InMemoryScenarioRepository
 from brinksmanship.storage.sqlite_repo import (
     SQLiteGameRecordRepository,
     SQLiteScenarioRepository,
@@ -159,13 +160,15 @@ def sqlite_game_repo(tmp_path):
 
 
 class TestScenarioRepositoryIntegration:
-    """Integration tests that run against both file and SQLite backends."""
+    """Integration tests that run against the file, SQLite and in-memory backends."""
 
-    @pytest.fixture(params=["file", "sqlite"])
+    @pytest.fixture(params=["file", "sqlite", "memory"])
     def scenario_repo(self, request, file_scenario_repo, sqlite_scenario_repo):
-        """Parametrized fixture that provides both repository implementations."""
+        """Parametrized fixture that provides every repository implementation."""
         if request.param == "file":
             return file_scenario_repo
+        if request.param == "memory":
+            return InMemoryScenarioRepository()
         return sqlite_scenario_repo
 
     def test_empty_list(self, scenario_repo):
@@ -0,0 +1,316 @@
+"""Unit tests for the lockstep NumPy batch engine.
+
+Tests cover:
+1. Vectorized state updates match apply_action_result + apply_surplus_effects
+2. Vectorized ending checks match the scalar endings
+3. Vectorized policies match the scalar deterministic opponents
+4. BatchGameEngine runs, is reproducible and agrees with GameRunner
+5. PairingStats.add_batch and BatchRunner.run_pairing_vectorized
+"""
+
+import asyncio
+import random
+
+import numpy as np
+import pytest
+
+from brinksmanship.engine.batch_engine import (
+    ACTION_TYPES,
+    COMPETITIVE,
+    COOPERATIVE,
+    ENDING_TYPES,
+    NO_ACTION,
+    NO_ENDING,
+    OUTCOME_CODES,
+    BatchActionResult,
+    BatchGameEngine,
+    BatchState,
+    BatchView,
+    batch_apply_action_result,
+    batch_apply_surplus_effects,
+    batch_deterministic_endings,
+)
+from brinksmanship.engine.game_engine import EndingType
+from brinksmanship.engine.state_deltas import apply_surplus_effects
+from brinksmanship.models.actions import ActionType
+from brinksmanship.models.state import ActionResult, GameState, PlayerState, apply_action_result
+from brinksmanship.opponents.base import SettlementProposal
+from brinksmanship.opponents.batch_policies import BATCH_POLICIES
+from brinksmanship.opponents.deterministic import TitForTat
+from brinksmanship.storage import get_scenario_repository
+from brinksmanship.testing.batch_runner import DETERMINISTIC_OPPONENTS, BatchRunner, PairingStats
+from brinksmanship.testing.game_runner import run_game_sync
+
+SCENARIO_ID = "cuban_missile_crisis"
+
+STATE_FIELDS = [
+    "position_a",
+    "position_b",
+    "resources_a",
+    "resources_b",
+    "risk_level",
+    "cooperation_score",
+    "stability",
+    "cooperation_surplus",
+    "surplus_captured_a",
+    "surplus_captured_b",
+    "cooperation_streak",
+    "turn",
+    "previous_type_a",
+    "previous_type_b",
+]
+
+
+def random_state(rng: random.Random) -> GameState:
+    """Random but valid mid-game state."""
+    previous_types = [None, ActionType.COOPERATIVE, ActionType.COMPETITIVE]
+    return GameState(
+        player_a=PlayerState(
+            position=rng.uniform(0, 10), resources=rng.uniform(0, 10), previous_type=rng.choice(previous_types)
+        ),
+        player_b=PlayerState(
+            position=rng.uniform(0, 10), resources=rng.uniform(0, 10), previous_type=rng.choice(previous_types)
+        ),
+        cooperation_score=rng.uniform(0, 10),
+        stability=rng.uniform(1, 10),
+        risk_level=rng.uniform(0, 10),
+        turn=rng.randint(1, 14),
+        max_turns=14,
+        cooperation_surplus=rng.uniform(0, 10),
+        surplus_captured_a=rng.uniform(0, 3),
+        surplus_captured_b=rng.uniform(0, 3),
+        cooperation_streak=rng.randint(0, 5),
+    )
+
+
+def random_result(rng: random.Random) -> ActionResult:
+    return ActionResult(
+        action_a=rng.choice(ACTION_TYPES),
+        action_b=rng.choice(ACTION_TYPES),
+        position_delta_a=rng.uniform(-1, 1),
+        position_delta_b=rng.uniform(-1, 1),
+        resource_cost_a=rng.uniform(0, 1),
+        resource_cost_b=rng.uniform(0, 1),
+        risk_delta=rng.uniform(-1, 1.5),
+        outcome_code=rng.choice(["CC", "CD", "DC", "DD", "RECON", "SETTLE_FAIL"]),
+    )
+
+
+def to_batch_result(results: list[ActionResult]) -> BatchActionResult:
+    return BatchActionResult(
+        action_a=np.array([ACTION_TYPES.index(r.action_a) for r in results]),
+        action_b=np.array([ACTION_TYPES.index(r.action_b) for r in results]),
+        position_delta_a=np.array([r.position_delta_a for r in results]),
+        position_delta_b=np.array([r.position_delta_b for r in results]),
+        resource_cost_a=np.array([r.resource_cost_a for r in results]),
+        resource_cost_b=np.array([r.resource_cost_b for r in results]),
+        risk_delta=np.array([r.risk_delta for r in results]),
+        outcome=np.array([OUTCOME_CODES.index(r.outcome_code) for r in results]),
+    )
+
+
+def make_view(states: list[GameState]) -> BatchView:
+    """Player A's view of a list of states."""
+    return BatchView(
+        idx=np.arange(len(states)),
+        my_position=np.array([s.position_a for s in states]),
+        opponent_position=np.array([s.position_b for s in states]),
+        risk_level=np.array([s.risk_level for s in states]),
+        cooperation_score=np.array([s.cooperation_score for s in states]),
+        stability=np.array([s.stability for s in states]),
+        turn=np.array([s.turn for s in states]),
+        opponent_previous_type=np.full(len(states), NO_ACTION, dtype=np.int8),
+        has_cooperative_action=np.ones(len(states), dtype=bool),
+    )
+
+
+# =============================================================================
+# Vectorized State Updates
+# =============================================================================
+
+
+class TestBatchStateUpdates:
+    """Vectorized updates against the scalar implementations."""
+
+    def test_round_trip_game_states(self):
+        rng = random.Random(1)
+        states = [random_state(rng) for _ in range(20)]
+        batch = BatchState.from_game_states(states)
+
+        for i, state in enumerate(states):
+            restored = batch.to_game_state(i)
+            for name in STATE_FIELDS:
+                assert getattr(restored, name) == pytest.approx(getattr(state, name))
+
+    def test_matches_scalar_apply_action_result(self):
+        rng = random.Random(0)
+        states = [random_state(rng) for _ in range(500)]
+        results = [random_result(rng) for _ in range(500)]
+
+        batch_result = to_batch_result(results)
+        updated = batch_apply_surplus_effects(
+            batch_apply_action_result(BatchState.from_game_states(states), batch_result), batch_result.outcome
+        )
+
+        for i, (state, result) in enumerate(zip(states, results, strict=True)):
+            expected = apply_action_result(state, result)
+            if result.outcome_code in ("CC", "CD", "DC", "DD"):
+                expected = apply_surplus_effects(expected, result.outcome_code)
+            actual = updated.to_game_state(i)
+            for name in STATE_FIELDS:
+                assert getattr(actual, name) == pytest.approx(getattr(expected, name)), (i, name)
+
+    def test_deterministic_endings(self):
+        states = [
+            GameState(risk_level=10.0),
+            GameState(player_a=PlayerState(position=0.0)),
+            GameState(player_b=PlayerState(resources=0.0)),
+            GameState(),
+        ]
+        endings = batch_deterministic_endings(BatchState.from_game_states(states))
+
+        assert ENDING_TYPES[endings[0]] == EndingType.MUTUAL_DESTRUCTION
+        assert ENDING_TYPES[endings[1]] == EndingType.POSITION_COLLAPSE_A
+        assert ENDING_TYPES[endings[2]] == EndingType.RESOURCE_EXHAUSTION_B
+        assert endings[3] == NO_ENDING
+
+
+# =============================================================================
+# Vectorized Policies
+# =============================================================================
+
+
+class TestBatchPolicies:
+    """Vectorized policies against the scalar deterministic opponents."""
+
+    def test_registry_covers_deterministic_opponents(self):
+        assert set(BATCH_POLICIES) == set(DETERMINISTIC_OPPONENTS)
+        for name, policy_class in BATCH_POLICIES.items():
+            assert policy_class(1, is_player_a=True).name == DETERMINISTIC_OPPONENTS[name]().name
+
+    def test_tit_for_tat_mirrors_opponent(self):
+        policy = BATCH_POLICIES["TitForTat"](3, is_player_a=True)
+        view = make_view([GameState()] * 3)
+        view.opponent_previous_type = np.array([NO_ACTION, COOPERATIVE, COMPETITIVE], dtype=np.int8)
+
+        cooperative = policy.choose_cooperative(view, np.random.default_rng(0))
+
+        assert cooperative.tolist() == [True, True, False]
+
+    def test_grim_trigger_stays_triggered(self):
+        policy = BATCH_POLICIES["GrimTrigger"](2, is_player_a=True)
+        policy.observe(np.array([0]), np.array([COMPETITIVE]))
+        view = make_view([GameState(risk_level=2.0)] * 2)
+
+        cooperative = policy.choose_cooperative(view, np.random.default_rng(0))
+
+        assert cooperative.tolist() == [False, True]
+
+    @pytest.mark.parametrize("name", ["NashCalculator", "SecuritySeeker", "Opportunist", "TitForTat", "GrimTrigger"])
+    def test_settlement_evaluation_matches_scalar(self, name):
+        rng = random.Random(3)
+        states = [random_state(rng) for _ in range(200)]
+        offers = np.array([rng.randint(20, 80) for _ in states])
+        policy = BATCH_POLICIES[name](len(states), is_player_a=True)
+
+        accept, counter, _ = policy.evaluate_settlement(
+            make_view(states), offers, is_final_offer=False, rng=np.random.default_rng(0)
+        )
+
+        for i, state in enumerate(states):
+            opponent = DETERMINISTIC_OPPONENTS[name]()
+            opponent.set_player_side(True)
+            proposal = SettlementProposal(offered_vp=int(offers[i]))
+            response = asyncio.run(opponent.evaluate_settlement(proposal, state, is_final_offer=False))
+            assert (response.action == "accept") == bool(accept[i]), i
+            assert (response.action == "counter") == bool(counter[i]), i
+
+
+# =============================================================================
+# BatchGameEngine
+# =============================================================================
+
+
+class TestBatchGameEngine:
+    """End-to-end batch runs."""
+
+    @pytest.fixture
+    def repo(self):
+        return get_scenario_repository()
+
+    def run(self, repo, name_a, name_b, num_games=500, seed=7):
+        engine = BatchGameEngine(SCENARIO_ID, repo, num_games=num_games, seed=seed)
+        return engine.run(
+            BATCH_POLICIES[name_a](num_games, is_player_a=True),
+            BATCH_POLICIES[name_b](num_games, is_player_a=False),
+        )
+
+    def test_all_games_end(self, repo):
+        outcome = self.run(repo, "Erratic", "Opportunist")
+
+        assert outcome.num_games == 500
+        assert not np.any(outcome.ending_type == NO_ENDING)
+        assert np.all((outcome.vp_a >= 0) & (outcome.vp_a <= 100))
+        assert np.all((outcome.vp_b >= 0) & (outcome.vp_b <= 100))
+
+    def test_reproducible_with_seed(self, repo):
+        first = self.run(repo, "Erratic", "NashCalculator", seed=11)
+        second = self.run(repo, "Erratic", "NashCalculator", seed=11)
+
+        np.testing.assert_array_equal(first.ending_type, second.ending_type)
+        np.testing.assert_array_equal(first.vp_a, second.vp_a)
+        np.testing.assert_array_equal(first.turns_played, second.turns_played)
+
+    def test_tit_for_tat_self_play_matches_game_runner(self, repo):
+        """Fully deterministic pairing: batch and scalar games are identical."""
+        opponent_a, opponent_b = TitForTat(), TitForTat()
+        opponent_a.set_player_side(True)
+        opponent_b.set_player_side(False)
+        scalar = run_game_sync(SCENARIO_ID, opponent_a, opponent_b, random_seed=1)
+
+        outcome = self.run(repo, "TitForTat", "TitForTat", num_games=50)
+
+        assert set(outcome.ending_type_values()) == {scalar.ending_type}
+        assert np.all(outcome.vp_a == scalar.vp_a)
+        assert np.all(outcome.turns_played == scalar.turns_played)
+
+    def test_zero_sum_settlement(self, repo):
+        outcome = self.run(repo, "SecuritySeeker", "TitForTat")
+
+        settled = outcome.ending_mask(EndingType.SETTLEMENT)
+        assert settled.any()
+        np.testing.assert_allclose(outcome.vp_a[settled] + outcome.vp_b[settled], 100.0)
+
+
+# =============================================================================
+# BatchRunner Integration
+# =============================================================================
+
+
+class TestVectorizedBatchRunner:
+    """PairingStats.add_batch and BatchRunner.run_pairing_vectorized."""
+
+    def test_run_pairing_vectorized(self):
+        runner = BatchRunner(scenario_id=SCENARIO_ID)
+
+        stats = runner.run_pairing_vectorized("NashCalculator", "Erratic", num_games=300, seed=5)
+
+        assert isinstance(stats, PairingStats)
+        assert stats.total_games == 300
+        assert len(stats.vp_a_list) == 300
+        assert stats.wins_a + stats.wins_b + stats.ties + stats.mutual_destructions == 300
+        endings = (
+            stats.mutual_destructions
+            + stats.crisis_terminations
+            + stats.natural_endings
+            + stats.settlements
+            + stats.position_collapses
+            + stats.resource_exhaustions
+        )
+        assert endings == 300
+
+    def test_unknown_opponent_raises(self):
+        runner = BatchRunner(scenario_id=SCENARIO_ID)
+
+        with pytest.raises(ValueError, match="No vectorized policy"):
+            runner.run_pairing_vectorized("Khrushchev", "TitForTat", num_games=10)
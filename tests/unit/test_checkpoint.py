@@ -0,0 +1,138 @@
+"""Unit tests for checkpointed, resumable batch runs.
+
+Tests cover:
+1. RunCheckpoint creation, resume checks, seeds and shard round trips
+2. run_all_pairings interrupted and resumed matches an uninterrupted run
+3. Game tables drop rows that were never checkpointed
+4. Vectorized and early-stopping runs resume from their shards
+"""
+
+import pytest
+
+from brinksmanship.testing.batch_runner import BatchRunner, PrecisionTarget
+from brinksmanship.testing.checkpoint import RunCheckpoint
+from brinksmanship.testing.game_table import GameTable, GameTableWriter
+
+
+class InterruptedRunError(Exception):
+    """Stands in for a crash or Ctrl-C."""
+
+
+@pytest.fixture
+def interrupt_after(monkeypatch):
+    """Make RunCheckpoint.save fail after a number of successful saves (monkeypatch.undo() lifts it)."""
+
+    def install(saves: int) -> None:
+        original = RunCheckpoint.save
+        remaining = [saves]
+
+        def save(self, *args, **kwargs):
+            if remaining[0] == 0:
+                raise InterruptedRunError
+            remaining[0] -= 1
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(RunCheckpoint, "save", save)
+
+    return install
+
+
+class TestRunCheckpoint:
+    """The shard directory."""
+
+    def test_shards_round_trip(self, tmp_path):
+        checkpoint = RunCheckpoint(tmp_path, {"games": 10}, seed=7)
+        checkpoint.save("a:b", {"wins": 3}, seed=7, num_games=10, first_game=20, table_rows=30)
+
+        reopened = RunCheckpoint(tmp_path, {"games": 10}, resume=True)
+        shard = reopened.load("a:b")
+
+        assert reopened.seed == 7
+        assert "a:b" in reopened and len(reopened) == 1
+        assert (shard.result, shard.seed, shard.first_game, shard.num_games) == ({"wins": 3}, 7, 20, 10)
+        assert reopened.table_rows() == 30
+        assert reopened.load("missing") is None
+
+    def test_fresh_seed_is_stored(self, tmp_path):
+        seed = RunCheckpoint(tmp_path, {}).seed
+        assert RunCheckpoint(tmp_path, {}, resume=True).seed == seed
+
+    def test_refuses_other_runs(self, tmp_path):
+        RunCheckpoint(tmp_path, {"games": 10, "opponents": ("A", "B")}, seed=1, table_rows=5)
+
+        with pytest.raises(ValueError, match="already holds"):
+            RunCheckpoint(tmp_path, {"games": 10, "opponents": ("A", "B")}, seed=1)
+        with pytest.raises(ValueError, match="other settings"):
+            RunCheckpoint(tmp_path, {"games": 20, "opponents": ("A", "B")}, resume=True)
+        with pytest.raises(ValueError, match="seed"):
+            RunCheckpoint(tmp_path, {"games": 10, "opponents": ("A", "B")}, seed=2, resume=True)
+        assert RunCheckpoint(tmp_path, {"games": 10, "opponents": ["A", "B"]}, resume=True).table_rows() == 5
+
+
+class TestResumedRuns:
+    """InterruptedRunError runs continue where their shards end."""
+
+    def run(self, runner: BatchRunner, opponent_names: list[str], **kwargs):
+        return runner.run_all_pairings(opponent_names, num_games=24, max_workers=2, chunk_size=5, quiet=True, **kwargs)
+
+    def test_pool_run(self, tmp_path, monkeypatch, interrupt_after, scenario_id, opponent_names, summaries):
+        runner = BatchRunner(scenario_id, max_workers=2)
+        expected = self.run(runner, opponent_names, seed=3)
+
+        interrupt_after(8)
+        with pytest.raises(InterruptedRunError):
+            self.run(runner, opponent_names, seed=3, checkpoint_dir=tmp_path)
+        monkeypatch.undo()
+        assert 0 < len(list((tmp_path / "shards").glob("*.pkl"))) < 6
+
+        # Chunks of another size: seeded statistics do not depend on them
+        resumed = runner.run_all_pairings(
+            opponent_names, num_games=24, max_workers=2, chunk_size=7, quiet=True, checkpoint_dir=tmp_path, resume=True
+        )
+        assert summaries(resumed) == summaries(expected)
+        assert resumed.aggregate == expected.aggregate
+
+    def test_game_table_drops_uncheckpointed_rows(
+        self, tmp_path, monkeypatch, interrupt_after, scenario_id, opponent_names
+    ):
+        runner = BatchRunner(scenario_id, max_workers=2)
+        with GameTableWriter(tmp_path / "expected") as games:
+            self.run(runner, opponent_names, seed=4, games=games)
+
+        interrupt_after(5)
+        with pytest.raises(InterruptedRunError), GameTableWriter(tmp_path / "games") as games:
+            self.run(runner, opponent_names, seed=4, games=games, checkpoint_dir=tmp_path / "checkpoint")
+        monkeypatch.undo()
+        with GameTableWriter(tmp_path / "games") as games:
+            self.run(runner, opponent_names, games=games, checkpoint_dir=tmp_path / "checkpoint", resume=True)
+
+        expected = GameTable.open(tmp_path / "expected")
+        table = GameTable.open(tmp_path / "games")
+        assert len(table) == len(expected) == 6 * 24
+        assert table["vp_a"].tolist() == expected["vp_a"].tolist()
+        assert table.decode("opponent_a").tolist() == expected.decode("opponent_a").tolist()
+
+    def test_vectorized_run(self, tmp_path, monkeypatch, interrupt_after, scenario_id, opponent_names, summaries):
+        runner = BatchRunner(scenario_id)
+        expected = self.run(runner, opponent_names, seed=5, vectorized=True)
+
+        interrupt_after(2)
+        with pytest.raises(InterruptedRunError):
+            self.run(runner, opponent_names, seed=5, vectorized=True, checkpoint_dir=tmp_path)
+        monkeypatch.undo()
+        resumed = self.run(runner, opponent_names, vectorized=True, checkpoint_dir=tmp_path, resume=True)
+
+        assert summaries(resumed) == summaries(expected)
+
+    def test_early_stopping_run(self, tmp_path, monkeypatch, interrupt_after, scenario_id, opponent_names, summaries):
+        runner = BatchRunner(scenario_id, max_workers=2)
+        target = PrecisionTarget(total_value_half_width=8.0, min_games=10)
+        expected = self.run(runner, opponent_names, seed=6, target=target)
+
+        interrupt_after(4)
+        with pytest.raises(InterruptedRunError):
+            self.run(runner, opponent_names, seed=6, target=target, checkpoint_dir=tmp_path)
+        monkeypatch.undo()
+        resumed = self.run(runner, opponent_names, target=target, checkpoint_dir=tmp_path, resume=True)
+
+        assert summaries(resumed) == summaries(expected)
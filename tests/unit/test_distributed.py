@@ -0,0 +1,169 @@
+"""Unit tests for the coordinator/worker mode.
+
+Tests cover:
+1. SQLiteWorkQueue publishing, leases, expiry, retries and failures
+2. Distributed seeded runs match local BatchRunner runs
+3. Vectorized units with common random numbers match one whole batch
+4. Coordinator errors: failed units, timeouts, reused job names
+"""
+
+import threading
+
+import pytest
+
+from brinksmanship.testing.batch_runner import BatchRunner
+from brinksmanship.testing.distributed import (
+    DONE,
+    FAILED,
+    LEASED,
+    PENDING,
+    Coordinator,
+    SQLiteWorkQueue,
+    WorkUnit,
+    pairing_units,
+    run_worker,
+)
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return SQLiteWorkQueue(tmp_path / "queue.db")
+
+
+@pytest.fixture
+def make_unit(scenario_id):
+    def make(job: str = "job", first_game: int = 0, **changes) -> WorkUnit:
+        values = {
+            "job": job,
+            "key": "TitForTat:Erratic",
+            "scenario_id": scenario_id,
+            "opponent_a": "TitForTat",
+            "opponent_b": "Erratic",
+            "seed": 1,
+            "first_game": first_game,
+            "num_games": 2,
+        }
+        return WorkUnit(**{**values, **changes})
+
+    return make
+
+
+class TestSQLiteWorkQueue:
+    """Queue states shared through the database file."""
+
+    def test_publish_is_idempotent(self, queue, make_unit):
+        units = [make_unit(first_game=0), make_unit(first_game=2)]
+
+        assert queue.publish(units) == 2
+        assert queue.publish(units) == 0
+        assert queue.progress("job") == {PENDING: 2, LEASED: 0, DONE: 0, FAILED: 0}
+        with pytest.raises(ValueError):
+            queue.publish([make_unit(seed=2)])
+
+    def test_lease_and_complete(self, queue, tmp_path, make_unit):
+        queue.publish([make_unit()])
+        other_handle = SQLiteWorkQueue(tmp_path / "queue.db")
+
+        unit = other_handle.lease("w1", lease_seconds=60)
+        assert unit == make_unit()
+        assert queue.lease("w2", lease_seconds=60) is None
+        assert not queue.complete(unit.unit_id, "w2", "result")
+        assert queue.complete(unit.unit_id, "w1", "result")
+        assert queue.results("job") == {unit.unit_id: "result"}
+
+    def test_expired_lease_moves_to_another_worker(self, queue, make_unit):
+        queue.publish([make_unit()])
+        unit = queue.lease("w1", lease_seconds=-1)
+
+        assert queue.lease("w2", lease_seconds=60) == unit
+        assert not queue.renew(unit.unit_id, "w1", 60)
+        assert not queue.complete(unit.unit_id, "w1", "late")
+        assert queue.complete(unit.unit_id, "w2", "result")
+
+    def test_failures_are_retried_up_to_max_attempts(self, queue, make_unit):
+        queue.publish([make_unit()], max_attempts=2)
+
+        queue.fail(queue.lease("w1", 60).unit_id, "w1", "boom 1")
+        assert queue.progress("job")[PENDING] == 1
+        queue.fail(queue.lease("w1", 60).unit_id, "w1", "boom 2")
+
+        assert queue.progress("job")[FAILED] == 1
+        assert queue.lease("w1", 60) is None
+        assert list(queue.errors("job").values()) == ["boom 2"]
+
+    def test_expired_last_attempt_fails(self, queue, make_unit):
+        queue.publish([make_unit()], max_attempts=1)
+        queue.lease("w1", lease_seconds=-1)
+
+        assert queue.lease("w2", lease_seconds=60) is None
+        assert queue.progress("job")[FAILED] == 1
+
+
+class TestDistributedRuns:
+    """Coordinator and workers against local runs."""
+
+    def test_seeded_run_matches_local_run(self, queue, scenario_id, opponent_names, summaries):
+        runner = BatchRunner(scenario_id)
+        worker = threading.Thread(target=run_worker, args=(queue,), kwargs={"idle_timeout": 1, "poll_interval": 0.05})
+        worker.start()
+        distributed = Coordinator(queue, poll_interval=0.05, quiet=True).run_all_pairings(
+            runner, opponent_names, num_games=8, seed=11, job="balance", games_per_unit=3
+        )
+        worker.join()
+
+        local = runner.run_all_pairings(
+            opponent_names, num_games=8, seed=11, max_workers=1, keep_games=False, quiet=True
+        )
+        assert summaries(distributed) == summaries(local)
+        assert queue.progress("balance")[DONE] == 6 * 3
+
+    def test_vectorized_units_share_common_random_numbers(self, queue, scenario_id, opponent_names):
+        runner = BatchRunner(scenario_id, common_random_numbers=True)
+        split = pairing_units(runner, "split", opponent_names, 40, seed=3, games_per_unit=15, vectorized=True)
+        whole = pairing_units(runner, "whole", opponent_names, 40, seed=3, vectorized=True)
+        queue.publish(split + whole)
+        run_worker(queue, idle_timeout=0)
+
+        coordinator = Coordinator(queue, quiet=True)
+        split_stats = coordinator.run(split)
+        whole_stats = coordinator.run(whole)
+
+        assert len(split) == 3 * len(whole)
+        assert {k: s.to_dict() for k, s in split_stats.items()} == {k: s.to_dict() for k, s in whole_stats.items()}
+
+    def test_rerun_job_uses_finished_units(self, queue, monkeypatch, scenario_id):
+        runner = BatchRunner(scenario_id)
+        units = pairing_units(runner, "job", ["TitForTat"], 4, seed=2)
+        queue.publish(units)
+        run_worker(queue, idle_timeout=0)
+        first = Coordinator(queue, quiet=True).run(units)
+
+        def fail(self):
+            raise AssertionError("finished unit played again")
+
+        monkeypatch.setattr(WorkUnit, "run", fail)
+        assert Coordinator(queue, quiet=True).run(units) == first
+
+
+class TestCoordinatorErrors:
+    """Failures surface on the coordinator."""
+
+    def test_failed_unit_raises(self, queue, make_unit):
+        unit = make_unit(opponent_b="NoSuchOpponent")
+        queue.publish([unit], max_attempts=1)
+        run_worker(queue, idle_timeout=0)
+
+        with pytest.raises(RuntimeError, match="NoSuchOpponent"):
+            Coordinator(queue, quiet=True).run([unit])
+
+    def test_timeout(self, queue, make_unit):
+        with pytest.raises(TimeoutError):
+            Coordinator(queue, poll_interval=0.01, timeout=0.05, quiet=True).run([make_unit()])
+
+    def test_job_with_other_units(self, queue, make_unit):
+        queue.publish([make_unit(first_game=0)])
+
+        with pytest.raises(ValueError):
+            Coordinator(queue, quiet=True).run([make_unit(first_game=2)])
+        with pytest.raises(ValueError):
+            Coordinator(queue, quiet=True).run([make_unit(job="a"), make_unit(job="b")])
@@ -0,0 +1,146 @@
+"""Unit tests for the columnar per-game result store.
+
+Tests cover:
+1. GameTableWriter/GameTable round trip for process-pool and vectorized runs
+2. Appending to an existing table and recovering from a partial append
+3. Filtering and decoding categorical columns
+4. Validation errors and optional Parquet export
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from brinksmanship.testing.batch_runner import BatchRunner
+from brinksmanship.testing.game_table import (
+    GAME_COLUMNS,
+    PYARROW_AVAILABLE,
+    GameTable,
+    GameTableWriter,
+    columns_from_batch,
+)
+
+SCENARIO_ID = "cuban_missile_crisis"
+
+
+class TestRoundTrip:
+    """Writing games and reading them back memory-mapped."""
+
+    def test_run_pairing_rows_in_game_order(self, tmp_path):
+        runner = BatchRunner(scenario_id=SCENARIO_ID)
+        with GameTableWriter(tmp_path / "games") as games:
+            stats = runner.run_pairing("Erratic", "TitForTat", num_games=9, seed=4, max_workers=2, games=games)
+
+        table = GameTable.open(tmp_path / "games")
+
+        assert len(table) == 9
+        assert isinstance(table["vp_a"], np.memmap)
+        assert table["game_index"].tolist() == list(range(9))
+        assert set(table["seed"].tolist()) == {4}
+        np.testing.assert_allclose(table["vp_a"], stats.vp_a_list, rtol=1e-6)
+        assert set(table.decode("opponent_a").tolist()) == {"Erratic"}
+        assert table.where(opponent_b="TitForTat").all()
+        assert int(table.where(winner="A").sum()) == stats.wins_a
+
+    def test_vectorized_rows(self, tmp_path):
+        runner = BatchRunner(scenario_id=SCENARIO_ID)
+        with GameTableWriter(tmp_path / "games") as games:
+            stats = runner.run_pairing_vectorized("NashCalculator", "Erratic", num_games=500, seed=2, games=games)
+
+        table = GameTable.open(tmp_path / "games")
+
+        assert len(table) == 500
+        assert int(table.where(ending_type="settlement").sum()) == stats.settlements
+        assert int(table["turns_played"].sum()) == stats.total_turns
+        assert table.where(opponent_a="GrimTrigger").sum() == 0
+
+    def test_empty_table(self, tmp_path):
+        GameTableWriter(tmp_path / "games").close()
+
+        table = GameTable.open(tmp_path / "games")
+
+        assert len(table) == 0
+        assert len(table["vp_a"]) == 0
+
+
+class TestAppend:
+    """Reopening a table for further runs."""
+
+    def test_reopen_appends_and_keeps_codes(self, tmp_path):
+        runner = BatchRunner(scenario_id=SCENARIO_ID)
+        with GameTableWriter(tmp_path / "games") as games:
+            runner.run_pairing_vectorized("TitForTat", "Erratic", num_games=50, seed=1, games=games)
+        first_codes = GameTable.open(tmp_path / "games").categories["opponent_a"]
+
+        with GameTableWriter(tmp_path / "games") as games:
+            runner.run_pairing_vectorized("Erratic", "TitForTat", num_games=30, seed=2, games=games)
+        table = GameTable.open(tmp_path / "games")
+
+        assert len(table) == 80
+        assert table.categories["opponent_a"][: len(first_codes)] == first_codes
+        assert int(table.where(opponent_a="TitForTat").sum()) == 50
+        assert int(table.where(opponent_a="Erratic").sum()) == 30
+
+    def test_partial_append_is_discarded(self, tmp_path):
+        runner = BatchRunner(scenario_id=SCENARIO_ID)
+        with GameTableWriter(tmp_path / "games") as games:
+            runner.run_pairing_vectorized("TitForTat", "Erratic", num_games=20, seed=1, games=games)
+        # Simulate a crash after some column bytes but before meta.json
+        with open(tmp_path / "games" / "vp_a.bin", "ab") as f:
+            f.write(b"\0" * 12)
+
+        with GameTableWriter(tmp_path / "games") as games:
+            runner.run_pairing_vectorized("TitForTat", "Erratic", num_games=5, seed=2, games=games)
+
+        for name, dtype in GAME_COLUMNS.items():
+            assert (tmp_path / "games" / f"{name}.bin").stat().st_size == 25 * dtype.itemsize
+
+
+class TestValidation:
+    """Errors and optional export."""
+
+    def test_missing_column_raises(self, tmp_path):
+        columns = {name: np.zeros(3) for name in GAME_COLUMNS if name != "vp_b"}
+        with GameTableWriter(tmp_path / "games") as games, pytest.raises(ValueError, match="vp_b"):
+            games.append_columns(columns)
+
+    def test_length_mismatch_raises(self, tmp_path):
+        columns = {name: np.zeros(4) for name in GAME_COLUMNS}
+        columns["vp_a"] = np.zeros(3)
+        with GameTableWriter(tmp_path / "games") as games, pytest.raises(ValueError, match="different lengths"):
+            games.append_columns(columns)
+
+    def test_unknown_version_raises(self, tmp_path):
+        GameTableWriter(tmp_path / "games").close()
+        meta_path = tmp_path / "games" / "meta.json"
+        meta = json.loads(meta_path.read_text())
+        meta["version"] = 99
+        meta_path.write_text(json.dumps(meta))
+
+        with pytest.raises(ValueError, match="version"):
+            GameTable.open(tmp_path / "games")
+
+    @pytest.mark.skipif(PYARROW_AVAILABLE, reason="pyarrow is installed")
+    def test_parquet_requires_pyarrow(self, tmp_path):
+        GameTableWriter(tmp_path / "games").close()
+        with pytest.raises(ImportError, match="pyarrow"):
+            GameTable.open(tmp_path / "games").to_parquet(tmp_path / "games.parquet")
+
+    def test_parquet_export(self, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        from brinksmanship.engine.batch_engine import BatchGameEngine
+        from brinksmanship.opponents.batch_policies import BATCH_POLICIES
+        from brinksmanship.storage import get_scenario_repository
+
+        engine = BatchGameEngine(SCENARIO_ID, get_scenario_repository(), num_games=10, seed=1)
+        outcome = engine.run(
+            BATCH_POLICIES["TitForTat"](10, is_player_a=True), BATCH_POLICIES["Erratic"](10, is_player_a=False)
+        )
+        with GameTableWriter(tmp_path / "games") as games:
+            games.append_columns(columns_from_batch(outcome, "TitForTat", "Erratic", 1))
+        GameTable.open(tmp_path / "games").to_parquet(tmp_path / "games.parquet")
+
+        exported = pq.read_table(tmp_path / "games.parquet")
+        assert exported.num_rows == 10
+        assert exported.column("opponent_a").to_pylist() == ["TitForTat"] * 10
@@ -0,0 +1,119 @@
+"""Unit tests for the delta-encoded turn history (engine/history.py).
+
+Tests cover:
+1. StateLog stores only changed fields, rebuilds every entry exactly and forks
+2. StateRef resolution to GameState
+3. LoggedState descriptor behavior on TurnRecord
+"""
+
+import pytest
+
+from brinksmanship.engine.game_engine import TurnPhase, TurnRecord
+from brinksmanship.engine.history import StateLog, StateRef
+from brinksmanship.models.actions import ActionType
+from brinksmanship.models.state import EngineState, GameState
+
+
+def make_states() -> list[EngineState]:
+    """A short sequence of engine states with a few fields changing per step."""
+    state = EngineState(max_turns=13)
+    states = [state.copy()]
+
+    state.risk_level = 3.5
+    state.turn = 2
+    state.previous_type_a = ActionType.COOPERATIVE
+    states.append(state.copy())
+
+    states.append(state.copy())  # unchanged
+
+    state.information_b.update_resources(4.0, 2)
+    state.position_a = 6.2
+    state.turn = 3
+    states.append(state.copy())
+    return states
+
+
+class TestStateLog:
+    """Tests for StateLog."""
+
+    def test_rebuilds_every_entry(self):
+        """Each entry reconstructs to the snapshot that was appended."""
+        log = StateLog()
+        states = make_states()
+        for state in states:
+            log.append(state)
+
+        assert len(log) == len(states)
+        for i, state in enumerate(states):
+            assert log.state_at(i).to_tuple() == state.to_tuple()
+
+    def test_stores_only_changed_fields(self):
+        """Deltas contain only fields that changed; unchanged entries are empty."""
+        log = StateLog()
+        for state in make_states():
+            log.append(state)
+
+        assert len(log._deltas[0]) == 3
+        assert log._deltas[1] == ()
+
+    def test_snapshot_is_independent_of_later_updates(self):
+        """Mutating the state after append does not change the logged entry."""
+        log = StateLog()
+        state = EngineState()
+        ref = log.append(state)
+
+        state.risk_level = 9.0
+        state.information_a.update_position(2.0, 1)
+
+        restored = log.state_at(ref.index)
+        assert restored.risk_level == pytest.approx(2.0)
+        assert restored.information_a.known_position is None
+
+    def test_fork_is_independent(self):
+        """Appending to a fork does not change the original, and vice versa."""
+        log = StateLog()
+        states = make_states()
+        for state in states[:2]:
+            log.append(state)
+
+        forked = log.fork()
+        forked.append(states[3])
+        log.append(states[2])
+
+        assert len(log) == len(forked) == 3
+        assert forked.state_at(2).to_tuple() == states[3].to_tuple()
+        assert log.state_at(2).to_tuple() == states[2].to_tuple()
+
+    def test_index_out_of_range(self):
+        """Reading past the end raises IndexError."""
+        log = StateLog()
+        log.append(EngineState())
+
+        with pytest.raises(IndexError):
+            log.values_at(1)
+
+
+class TestLoggedState:
+    """Tests for lazy TurnRecord states."""
+
+    def test_ref_resolves_on_first_access(self):
+        """A StateRef is replaced by the rebuilt GameState when read."""
+        log = StateLog()
+        ref = log.append(EngineState(risk_level=4.0))
+        record = TurnRecord(turn=1, phase=TurnPhase.BRIEFING, state_before=ref)
+
+        assert isinstance(record.__dict__["_state_before"], StateRef)
+        state = record.state_before
+
+        assert isinstance(state, GameState)
+        assert state.risk_level == pytest.approx(4.0)
+        assert record.state_before is state
+
+    def test_defaults_and_explicit_states(self):
+        """Records without states default to None; GameStates are stored as-is."""
+        explicit = GameState(turn=3)
+
+        record = TurnRecord(turn=3, phase=TurnPhase.BRIEFING, state_after=explicit)
+
+        assert record.state_before is None
+        assert record.state_after is explicit
@@ -0,0 +1,210 @@
+"""Unit tests for the pool of warm Claude sessions.
+
+Tests cover:
+1. Queries reuse a connected session, with its conversation cleared in between
+2. Sessions are bounded, keyed by options and evicted for other options
+3. Failed queries, failed resets and use and age limits recycle sessions
+4. Sessions survive across asyncio.run calls
+5. brinksmanship.llm and HistoricalPersona query through the pool
+"""
+
+import asyncio
+
+import pytest
+from claude_agent_sdk import AssistantMessage, ClaudeAgentOptions, ResultMessage, TextBlock
+
+from brinksmanship import llm_pool
+from brinksmanship.llm import generate_text, stream_text
+from brinksmanship.llm_pool import SessionPool, configure_session_pool
+from brinksmanship.opponents.historical import HistoricalPersona
+
+OPTIONS = ClaudeAgentOptions(max_turns=1, system_prompt="test")
+
+
+class FakeClient:
+    """Stands in for ClaudeSDKClient: echoes prompts and records them.
+
+    The prompt "exit" is answered, then the CLI process dies and every
+    later query fails.
+    """
+
+    connected = 0
+    max_connected = 0
+
+    def __init__(self, options=None):
+        self.options = options
+        self.prompts: list[str] = []
+        self.disconnected = False
+        self.alive = False
+
+    async def connect(self):
+        self.alive = True
+        FakeClient.connected += 1
+        FakeClient.max_connected = max(FakeClient.max_connected, FakeClient.connected)
+
+    async def query(self, prompt):
+        if prompt == "fail" or not self.alive:
+            raise RuntimeError("CLI error")
+        self.prompts.append(prompt)
+        await asyncio.sleep(0.01)
+        if prompt == "exit":
+            self.alive = False
+
+    async def receive_response(self):
+        prompt = self.prompts[-1]
+        if "Respond with valid JSON" in prompt:
+            yield AssistantMessage(content=[TextBlock(text='{"selected_action": "De-escalate"}')], model="test")
+        elif prompt != "/clear":
+            yield AssistantMessage(content=[TextBlock(text=f"echo {prompt}")], model="test")
+        yield ResultMessage(
+            subtype="success", duration_ms=0, duration_api_ms=0, is_error=False, num_turns=1, session_id="s"
+        )
+
+    async def disconnect(self):
+        self.disconnected = True
+        self.alive = False
+        FakeClient.connected -= 1
+
+
+@pytest.fixture
+def clients():
+    FakeClient.connected = FakeClient.max_connected = 0
+    return []
+
+
+@pytest.fixture
+def pool(clients):
+    def factory(options):
+        clients.append(FakeClient(options))
+        return clients[-1]
+
+    pool = SessionPool(max_sessions=2, client_factory=factory)
+    yield pool
+    pool.close()
+
+
+def texts(messages) -> list[str]:
+    return [block.text for m in messages if isinstance(m, AssistantMessage) for block in m.content]
+
+
+class TestReuse:
+    """Warm sessions serve many queries."""
+
+    async def test_sequential_queries_share_session(self, pool, clients):
+        assert texts(await pool.query("a", OPTIONS)) == ["echo a"]
+        assert texts(await pool.query("b", OPTIONS)) == ["echo b"]
+        pool.close()
+
+        assert len(clients) == 1
+        assert clients[0].prompts == ["a", "/clear", "b", "/clear"]
+        assert (pool.started, pool.reused) == (1, 1)
+        assert clients[0].disconnected
+
+    def test_sessions_survive_asyncio_run(self, pool, clients):
+        for prompt in ("a", "b", "c"):
+            asyncio.run(pool.query(prompt, OPTIONS))
+
+        assert len(clients) == 1
+        assert pool.reused == 2
+
+    async def test_stream(self, pool, clients):
+        messages = [message async for message in pool.stream("a", OPTIONS)]
+
+        assert texts(messages) == ["echo a"]
+        assert isinstance(messages[-1], ResultMessage)
+        await pool.query("b", OPTIONS)
+        assert len(clients) == 1
+
+
+class TestBounds:
+    """Session limits and keys."""
+
+    async def test_concurrent_queries_bounded(self, pool, clients):
+        results = await asyncio.gather(*(pool.query(str(i), OPTIONS) for i in range(6)))
+
+        assert [texts(r) for r in results] == [[f"echo {i}"] for i in range(6)]
+        assert len(clients) == 2
+        assert FakeClient.max_connected == 2
+
+    async def test_other_options_evict_idle_session(self, clients):
+        pool = SessionPool(
+            max_sessions=1, client_factory=lambda options: clients.append(FakeClient(options)) or clients[-1]
+        )
+        await pool.query("a", OPTIONS)
+        await pool.query("b", ClaudeAgentOptions(max_turns=3))
+        pool.close()
+
+        assert [c.options.max_turns for c in clients] == [1, 3]
+        assert pool.recycled == 1
+        assert FakeClient.max_connected == 1
+
+    def test_invalid_limits(self):
+        with pytest.raises(ValueError):
+            SessionPool(max_sessions=0)
+        with pytest.raises(ValueError):
+            SessionPool(max_uses=0)
+
+
+class TestRecycling:
+    """Health checks and limits."""
+
+    async def test_failed_query_recycles_session(self, pool, clients):
+        with pytest.raises(RuntimeError):
+            await pool.query("fail", OPTIONS)
+        await pool.query("a", OPTIONS)
+
+        assert len(clients) == 2
+        assert clients[0].disconnected and "/clear" not in clients[0].prompts
+
+    async def test_failed_reset_recycles_session(self, pool, clients):
+        assert texts(await pool.query("exit", OPTIONS)) == ["echo exit"]
+        assert texts(await pool.query("b", OPTIONS)) == ["echo b"]
+
+        assert len(clients) == 2
+        assert clients[0].disconnected and clients[0].prompts == ["exit"]
+        assert pool.recycled == 1
+
+    async def test_max_uses(self, clients):
+        pool = SessionPool(
+            max_uses=2, client_factory=lambda options: clients.append(FakeClient(options)) or clients[-1]
+        )
+        for prompt in ("a", "b", "c"):
+            await pool.query(prompt, OPTIONS)
+        pool.close()
+
+        assert [c.prompts for c in clients] == [["a", "/clear", "b"], ["c", "/clear"]]
+
+    async def test_max_age(self, pool, clients):
+        pool.max_age = 0.0
+        await pool.query("a", OPTIONS)
+        await pool.query("b", OPTIONS)
+
+        assert len(clients) == 2
+
+
+class TestCallers:
+    """LLM helpers and opponents use the shared pool."""
+
+    @pytest.fixture
+    def shared(self, clients):
+        pool = configure_session_pool(client_factory=lambda options: clients.append(FakeClient(options)) or clients[-1])
+        yield pool
+        pool.close()
+        llm_pool._default_pool = None
+
+    async def test_llm_helpers(self, shared, clients):
+        assert await generate_text("a", system_prompt="sys") == "echo a"
+        assert [chunk async for chunk in stream_text("b", system_prompt="sys")] == ["echo b"]
+        assert await generate_text("c", system_prompt="sys") == "echo c"
+
+        assert len(clients) == 1
+        assert shared.reused == 2
+
+    async def test_persona_queries_reuse_session(self, shared, clients):
+        persona = HistoricalPersona("nixon", is_player_a=True)
+        for _ in range(3):
+            result = await persona._query_llm("Choose an action", {"type": "object"})
+
+        assert result == {"selected_action": "De-escalate"}
+        assert len(clients) == 1
+        assert persona._conversation_turn_count == 3
@@ -823,6 +823,13 @@ class TestBuildMatrixFunction:
             build_matrix(MatrixType.PRISONERS_DILEMMA, invalid_params)
         assert "T > R > P > S" in str(exc_info.value)
 
+    def test_build_matrix_is_memoized_on_equal_params(self) -> None:
+        """Test that equal (type, params) pairs share one PayoffMatrix."""
+        first = build_matrix(MatrixType.CHICKEN, MatrixParameters(temptation=1.7))
+        second = build_matrix(MatrixType.CHICKEN, MatrixParameters(temptation=1.7))
+        assert first is second
+        assert build_matrix(MatrixType.CHICKEN, MatrixParameters(temptation=1.8)) is not first
+
 
 # =============================================================================
 # get_default_params_for_type Function Tests
@@ -0,0 +1,216 @@
+"""Unit tests for GameParameters and their use by the engines.
+
+Tests cover:
+1. GameParameters defaults, validation and derived values
+2. apply_surplus_effects, settlement rejection and variance with custom parameters
+3. GameEngine instances with different parameters side by side
+4. BatchGameEngine parameter axis and BatchRunner.run_parameter_sets_vectorized
+"""
+
+import pickle
+import random
+
+import numpy as np
+import pytest
+
+from brinksmanship import parameters
+from brinksmanship.engine.batch_engine import (
+    OUT_CC,
+    OUT_CD,
+    OUT_DC,
+    OUT_DD,
+    BatchGameEngine,
+    BatchParameters,
+    BatchState,
+    batch_apply_surplus_effects,
+)
+from brinksmanship.engine.game_engine import EndingType, GameEngine
+from brinksmanship.engine.resolution import handle_failed_settlement, handle_settlement_rejection
+from brinksmanship.engine.state_deltas import apply_surplus_effects
+from brinksmanship.engine.variance import calculate_shared_sigma
+from brinksmanship.models.actions import ActionType
+from brinksmanship.models.state import GameState
+from brinksmanship.opponents.batch_policies import BATCH_POLICIES
+from brinksmanship.parameters import DEFAULT_PARAMETERS
+from brinksmanship.storage import get_scenario_repository
+from brinksmanship.testing.batch_runner import BatchRunner
+
+SCENARIO_ID = "cuban_missile_crisis"
+
+VARIANT = DEFAULT_PARAMETERS.replace(
+    surplus_base=3.0,
+    capture_rate=0.9,
+    exploit_position_gain=1.5,
+    dd_burn_rate=0.5,
+    dd_risk_increase=2.5,
+    rejection_base_penalty=2.0,
+)
+
+
+class TestGameParameters:
+    """The parameter value object."""
+
+    def test_defaults_are_module_constants(self):
+        assert DEFAULT_PARAMETERS.surplus_base == parameters.SURPLUS_BASE
+        assert DEFAULT_PARAMETERS.capture_rate == parameters.CAPTURE_RATE
+        assert DEFAULT_PARAMETERS.dd_risk_increase == parameters.DD_RISK_INCREASE
+        assert DEFAULT_PARAMETERS.rejection_base_penalty == parameters.REJECTION_BASE_PENALTY
+        assert DEFAULT_PARAMETERS.variance_scale == 1.0
+
+    def test_derived_values_match_module_functions(self):
+        for n in range(1, 4):
+            assert DEFAULT_PARAMETERS.rejection_penalty(n) == parameters.calculate_rejection_penalty(n)
+        for streak in range(10):
+            assert DEFAULT_PARAMETERS.surplus_for_streak(streak) == parameters.calculate_surplus_for_streak(streak)
+
+    def test_immutable_and_picklable(self):
+        with pytest.raises(AttributeError):
+            DEFAULT_PARAMETERS.capture_rate = 0.9  # type: ignore[misc]
+        assert pickle.loads(pickle.dumps(VARIANT)) == VARIANT
+        assert VARIANT.replace(capture_rate=0.4).capture_rate == 0.4
+        assert DEFAULT_PARAMETERS.capture_rate == parameters.CAPTURE_RATE
+
+    @pytest.mark.parametrize("changes", [{"capture_rate": 1.5}, {"dd_burn_rate": -0.1}, {"surplus_base": -1.0}])
+    def test_invalid_values_raise(self, changes):
+        with pytest.raises(ValueError):
+            DEFAULT_PARAMETERS.replace(**changes)
+
+
+class TestScalarRules:
+    """State updates with custom parameters."""
+
+    def test_apply_surplus_effects(self):
+        state = apply_surplus_effects(GameState(), "CC", VARIANT)
+        assert state.cooperation_surplus == pytest.approx(3.0)
+
+        apply_surplus_effects(state, "CD", VARIANT)
+        assert state.surplus_captured_b == pytest.approx(2.7)
+        assert state.position_b == pytest.approx(6.5)
+
+        risk = state.risk_level
+        apply_surplus_effects(state, "DD", VARIANT)
+        assert state.cooperation_surplus == pytest.approx(0.15)
+        assert state.risk_level == pytest.approx(risk + 2.5)
+
+    def test_default_matches_no_params(self):
+        with_default = apply_surplus_effects(GameState(cooperation_surplus=10.0), "DC", DEFAULT_PARAMETERS)
+        without = apply_surplus_effects(GameState(cooperation_surplus=10.0), "DC")
+        assert with_default == without
+
+    def test_rejection_penalties(self):
+        state = GameState(risk_level=2.0)
+
+        _, result = handle_settlement_rejection(state, 2, VARIANT)
+        assert result.risk_penalty == pytest.approx(3.0)
+        assert handle_failed_settlement(state, 1, VARIANT).risk_level == pytest.approx(4.0)
+        assert handle_failed_settlement(state, 1).risk_level == pytest.approx(3.5)
+
+    def test_variance_scale(self):
+        state = GameState(risk_level=5.0, turn=6)
+        doubled = DEFAULT_PARAMETERS.replace(variance_scale=2.0)
+
+        assert calculate_shared_sigma(state, doubled) == pytest.approx(2.0 * calculate_shared_sigma(state))
+
+
+class TestGameEngineParameters:
+    """Engines with different parameters in one process."""
+
+    def play(self, engine: GameEngine, types: list[tuple[ActionType, ActionType]]) -> GameState:
+        for type_a, type_b in types:
+            action_a = next(a for a in engine.get_available_actions("A") if a.action_type == type_a)
+            action_b = next(b for b in engine.get_available_actions("B") if b.action_type == type_b)
+            engine.submit_actions(action_a, action_b)
+        return engine.get_current_state()
+
+    def test_side_by_side(self):
+        repo = get_scenario_repository()
+        default = GameEngine(SCENARIO_ID, repo, random_seed=3)
+        variant = GameEngine(SCENARIO_ID, repo, random_seed=3, params=VARIANT)
+        turns = [(ActionType.COOPERATIVE, ActionType.COOPERATIVE), (ActionType.COOPERATIVE, ActionType.COMPETITIVE)]
+
+        default_state = self.play(default, turns)
+        variant_state = self.play(variant, turns)
+
+        assert variant.params is VARIANT
+        assert default.params is DEFAULT_PARAMETERS
+        assert variant_state.cooperation_surplus + variant_state.surplus_captured_b == pytest.approx(
+            1.5 * (default_state.cooperation_surplus + default_state.surplus_captured_b)
+        )
+        assert variant_state.surplus_captured_b > default_state.surplus_captured_b
+
+    def test_fork_and_restore_keep_parameters(self):
+        repo = get_scenario_repository()
+        engine = GameEngine(SCENARIO_ID, repo, random_seed=1, params=VARIANT)
+
+        assert engine.fork().params is VARIANT
+        assert GameEngine.restore(engine.snapshot(), repo, params=VARIANT).params is VARIANT
+
+
+class TestBatchParameterAxis:
+    """One batch, several parameter sets."""
+
+    def test_per_game_parameters_match_scalar_rules(self):
+        rng = random.Random(0)
+        param_sets = [DEFAULT_PARAMETERS, VARIANT, DEFAULT_PARAMETERS.replace(cc_risk_reduction=1.0)]
+        states = [
+            GameState(
+                cooperation_surplus=rng.uniform(0, 20),
+                risk_level=rng.uniform(0, 9),
+                position_a=rng.uniform(1, 9),
+                position_b=rng.uniform(1, 9),
+            )
+            for _ in range(120)
+        ]
+        outcomes = [OUT_CC, OUT_CD, OUT_DC, OUT_DD] * 30
+        per_game = [param_sets[i % 3] for i in range(120)]
+
+        updated = batch_apply_surplus_effects(
+            BatchState.from_game_states(states), np.array(outcomes), BatchParameters.build(per_game, 120)
+        )
+
+        for i, (state, outcome) in enumerate(zip(states, outcomes, strict=True)):
+            expected = apply_surplus_effects(state.model_copy(deep=True), "CC CD DC DD".split()[outcome], per_game[i])
+            actual = updated.to_game_state(i)
+            for name in ("cooperation_surplus", "surplus_captured_a", "surplus_captured_b", "risk_level"):
+                assert getattr(actual, name) == pytest.approx(getattr(expected, name)), (i, name)
+
+    def test_build_validates_length(self):
+        assert not BatchParameters.build(None, 5).per_game
+        with pytest.raises(ValueError, match="one per game"):
+            BatchParameters.build([DEFAULT_PARAMETERS] * 3, 5)
+
+    def test_engine_with_parameter_axis(self):
+        repo = get_scenario_repository()
+        engine = BatchGameEngine(
+            SCENARIO_ID, repo, num_games=4000, seed=2, params=[DEFAULT_PARAMETERS] * 2000 + [VARIANT] * 2000
+        )
+        outcome = engine.run(
+            BATCH_POLICIES["Erratic"](4000, is_player_a=True),
+            BATCH_POLICIES["Erratic"](4000, is_player_a=False),
+        )
+
+        # Higher DD risk means more mutual destruction
+        default_md = outcome.take(slice(0, 2000)).ending_mask(EndingType.MUTUAL_DESTRUCTION).mean()
+        variant_md = outcome.take(slice(2000, 4000)).ending_mask(EndingType.MUTUAL_DESTRUCTION).mean()
+        assert variant_md > default_md
+
+    def test_run_parameter_sets_vectorized(self):
+        runner = BatchRunner(scenario_id=SCENARIO_ID)
+
+        same = runner.run_parameter_sets_vectorized(
+            "Opportunist", "Erratic", [DEFAULT_PARAMETERS, DEFAULT_PARAMETERS], num_games=500, seed=1
+        )
+        varied = runner.run_parameter_sets_vectorized(
+            "Opportunist", "Erratic", [DEFAULT_PARAMETERS, VARIANT], num_games=500, seed=1, keep_games=False
+        )
+
+        assert [s.total_games for s in same + varied] == [500] * 4
+        assert varied[1].mutual_destruction_rate > varied[0].mutual_destruction_rate
+        with pytest.raises(ValueError):
+            runner.run_parameter_sets_vectorized("Opportunist", "Erratic", [], num_games=10)
+
+    def test_runner_parameters_reach_solver(self):
+        default = BatchRunner(scenario_id=SCENARIO_ID).solve_pairing("TitForTat", "Opportunist")
+        variant = BatchRunner(scenario_id=SCENARIO_ID, params=VARIANT).solve_pairing("TitForTat", "Opportunist")
+
+        assert variant.ending_probabilities != default.ending_probabilities
@@ -0,0 +1,148 @@
+"""Unit tests for the content-addressed result cache.
+
+Tests cover:
+1. ResultCache storage, keys and engine version
+2. Rerunning seeded pairings reads them from the cache
+3. Changed parameters or scenario content invalidate only their cells
+4. Unseeded and target runs bypass the cache
+5. Tournaments reuse cached jobs
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from brinksmanship.parameters import GameParameters
+from brinksmanship.storage import InMemoryScenarioRepository
+from brinksmanship.testing import batch_runner
+from brinksmanship.testing.batch_runner import BatchRunner, PrecisionTarget
+from brinksmanship.testing.result_cache import ResultCache, engine_version, pairing_cell, scenario_hash
+from brinksmanship.testing.tournament import TournamentRunner
+
+SCENARIOS_DIR = Path(__file__).parent.parent.parent / "scenarios"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResultCache(tmp_path / "cache")
+
+
+@pytest.fixture
+def repo(scenario_id):
+    return InMemoryScenarioRepository(
+        [{**json.loads((SCENARIOS_DIR / f"{scenario_id}.json").read_text()), "scenario_id": scenario_id}]
+    )
+
+
+def no_batches(chunk):
+    raise AssertionError("cached pairing played again")
+
+
+class TestResultCache:
+    """Storage and keys."""
+
+    def test_put_get(self, cache):
+        key = cache.key(kind="test", seed=1)
+
+        assert cache.get(key) is None
+        cache.put(key, {"value": 1})
+        assert cache.get(key) == {"value": 1}
+        assert key in cache and len(cache) == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_keys_follow_inputs(self, cache):
+        assert cache.key(seed=1, kind="a") == cache.key(kind="a", seed=1)
+        assert cache.key(seed=1) != cache.key(seed=2)
+        assert engine_version() == engine_version.__wrapped__()
+
+    def test_scenario_hash(self, repo, scenario_id):
+        cell = pairing_cell(repo, scenario_id, "TitForTat", "Erratic", seed=1, num_games=10, vectorized=True)
+
+        assert cell["scenario"] == scenario_hash(repo, scenario_id)
+        with pytest.raises(ValueError):
+            scenario_hash(repo, "missing")
+
+
+class TestBatchRunner:
+    """Cached pairings."""
+
+    def test_rerun_reads_cache(self, cache, repo, monkeypatch, scenario_id, opponent_names, summaries):
+        runner = BatchRunner(scenario_id, scenario_repo=repo, result_cache=cache)
+        first = runner.run_all_pairings(
+            opponent_names, num_games=20, seed=3, max_workers=1, vectorized=True, quiet=True
+        )
+
+        monkeypatch.setattr(batch_runner, "play_chunk", no_batches)
+        second = runner.run_all_pairings(
+            opponent_names, num_games=20, seed=3, max_workers=1, vectorized=True, quiet=True
+        )
+
+        assert summaries(second) == summaries(first)
+        assert (cache.hits, cache.misses) == (6, 6)
+
+    def test_pooled_rerun_reads_cache(self, cache, repo, scenario_id, summaries):
+        runner = BatchRunner(scenario_id, scenario_repo=repo, result_cache=cache)
+        first = runner.run_all_pairings(["TitForTat", "Erratic"], num_games=6, seed=3, max_workers=1, quiet=True)
+        second = runner.run_all_pairings(["TitForTat", "Erratic"], num_games=6, seed=3, max_workers=1, quiet=True)
+
+        assert summaries(second) == summaries(first)
+        assert (cache.hits, cache.misses) == (3, 3)
+        stats = runner.run_pairing("TitForTat", "Erratic", num_games=6, seed=3 + 6, max_workers=1)
+        assert stats.to_dict() == first.pairings["TitForTat:Erratic"].to_dict()
+        assert cache.hits == 4
+
+    def test_changed_params_and_scenario_invalidate(self, cache, repo, scenario_id):
+        runner = BatchRunner(scenario_id, scenario_repo=repo, result_cache=cache)
+        runner.run_pairing_vectorized("TitForTat", "Erratic", num_games=20, seed=1)
+
+        BatchRunner(
+            scenario_id, params=GameParameters(capture_rate=0.5), scenario_repo=repo, result_cache=cache
+        ).run_pairing_vectorized("TitForTat", "Erratic", num_games=20, seed=1)
+        assert cache.misses == 2
+
+        scenario = repo.get_scenario(scenario_id)
+        scenario["max_turns"] = 12
+        repo.save_scenario(scenario)
+        runner.run_pairing_vectorized("TitForTat", "Erratic", num_games=20, seed=1)
+        assert (cache.hits, cache.misses) == (0, 3)
+
+    def test_parameter_sets(self, cache, repo, scenario_id):
+        runner = BatchRunner(scenario_id, scenario_repo=repo, result_cache=cache)
+        param_sets = [GameParameters(), GameParameters(capture_rate=0.5)]
+        first = runner.run_parameter_sets_vectorized("TitForTat", "Erratic", param_sets, num_games=10, seed=2)
+        second = runner.run_parameter_sets_vectorized("TitForTat", "Erratic", param_sets, num_games=10, seed=2)
+
+        assert [s.to_dict() for s in second] == [s.to_dict() for s in first]
+        assert cache.hits == 1
+
+    def test_unseeded_and_target_runs_bypass_cache(self, cache, repo, scenario_id):
+        runner = BatchRunner(scenario_id, scenario_repo=repo, result_cache=cache)
+        runner.run_pairing_vectorized("TitForTat", "Erratic", num_games=10)
+        runner.run_pairing(
+            "TitForTat",
+            "Erratic",
+            num_games=8,
+            seed=1,
+            max_workers=1,
+            target=PrecisionTarget(total_value_half_width=100.0, min_games=4),
+        )
+
+        assert len(cache) == 0
+        assert (cache.hits, cache.misses) == (0, 0)
+
+
+class TestTournament:
+    """Cached tournament jobs."""
+
+    def test_rerun_reads_cache(self, cache, repo, monkeypatch, scenario_id, summaries):
+        runner = TournamentRunner(
+            [scenario_id], ["TitForTat", "Erratic"], max_workers=1, scenario_repo=repo, result_cache=cache
+        )
+        first = runner.run(num_games=10, seed=4, vectorized=True, pilot_games=0, quiet=True)
+
+        monkeypatch.setattr("brinksmanship.testing.tournament.play_chunk", no_batches)
+        second = runner.run(num_games=10, seed=4, vectorized=True, pilot_games=0, quiet=True)
+
+        assert summaries(second.scenarios[scenario_id]) == summaries(first.scenarios[scenario_id])
+        assert cache.hits == 4
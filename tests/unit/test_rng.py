@@ -0,0 +1,229 @@
+"""Unit tests for per-game random streams.
+
+Tests cover:
+1. derive_rng depends only on (seed, key)
+2. game_streams gives each player an independent stream
+3. Module-level helpers use injected streams and leave global random alone
+4. Common random numbers and antithetic resolution noise (scalar and batch)
+"""
+
+import asyncio
+import random
+import statistics
+
+import numpy as np
+import pytest
+
+from brinksmanship.engine.batch_engine import KeyedGenerator
+from brinksmanship.engine.endings import check_crisis_termination
+from brinksmanship.engine.game_engine import GameEngine
+from brinksmanship.engine.rng import (
+    CRISIS_STREAM,
+    derive_rng,
+    game_streams,
+    hashed_normals,
+    hashed_uniforms,
+    resolve_rng,
+)
+from brinksmanship.engine.variance import final_resolution
+from brinksmanship.models.actions import ActionType
+from brinksmanship.models.state import GameState, PlayerState
+from brinksmanship.opponents.deterministic import Erratic
+from brinksmanship.parameters import DEFAULT_PARAMETERS
+from brinksmanship.storage import get_scenario_repository
+from brinksmanship.testing.batch_runner import BatchRunner
+from brinksmanship.testing.game_table import GameTable, GameTableWriter
+
+SCENARIO_ID = "cuban_missile_crisis"
+
+
+def draws(rng: random.Random, n: int = 5) -> list[float]:
+    return [rng.random() for _ in range(n)]
+
+
+class TestDeriveRng:
+    """Stream derivation."""
+
+    def test_same_key_same_stream(self):
+        assert draws(derive_rng(42, 3, 1)) == draws(derive_rng(42, 3, 1))
+
+    def test_different_keys_differ(self):
+        streams = [draws(derive_rng(42, *key)) for key in [(0,), (1,), (0, 0), (0, 1)]]
+        streams.append(draws(derive_rng(43, 0)))
+        assert len({tuple(s) for s in streams}) == len(streams)
+
+    def test_independent_of_order(self):
+        """Deriving other streams first does not change a stream."""
+        expected = draws(derive_rng(1, 9))
+        for index in range(9):
+            draws(derive_rng(1, index))
+        assert draws(derive_rng(1, 9)) == expected
+
+    def test_unseeded_streams(self):
+        assert draws(derive_rng(None, 0)) != draws(derive_rng(None, 0))
+
+
+class TestGameStreams:
+    """Per-game engine and player streams."""
+
+    def test_streams_are_distinct(self):
+        streams = game_streams(5, game_index=2)
+        values = {tuple(draws(r)) for r in (streams.engine, streams.player_a, streams.player_b)}
+        assert len(values) == 3
+
+    def test_streams_are_reproducible(self):
+        assert draws(game_streams(5, 2).player_b) == draws(game_streams(5, 2).player_b)
+
+    def test_opponent_draws_from_its_stream(self):
+        """Erratic's choices repeat when its stream is reseeded."""
+        state = GameState(turn=6)
+        opponent = Erratic()
+        opponent.set_player_side(is_player_a=True)
+        proposals = []
+        for _ in range(2):
+            opponent.rng = game_streams(11, 0).player_a
+            proposals.append([asyncio.run(opponent.propose_settlement(state)) for _ in range(20)])
+        assert proposals[0] == proposals[1]
+        assert any(p is not None for p in proposals[0])
+
+
+class TestInjectedStreams:
+    """variance and endings helpers."""
+
+    CRISIS_STATE = GameState(
+        player_a=PlayerState(position=6.0, resources=4.0),
+        player_b=PlayerState(position=4.0, resources=4.0),
+        risk_level=9.5,
+        turn=11,
+    )
+
+    def test_final_resolution_uses_rng(self):
+        a = final_resolution(self.CRISIS_STATE, rng=random.Random(3))
+        b = final_resolution(self.CRISIS_STATE, rng=random.Random(3))
+        assert a == b
+
+    def test_seed_does_not_touch_global_state(self):
+        random.seed(0)
+        expected = random.random()
+
+        random.seed(0)
+        final_resolution(self.CRISIS_STATE, seed=99)
+        check_crisis_termination(self.CRISIS_STATE, seed=99)
+        assert random.random() == expected
+
+    def test_resolve_rng_prefers_stream(self):
+        rng = random.Random(1)
+        assert resolve_rng(rng, 5) is rng
+        assert draws(resolve_rng(None, 5)) == draws(random.Random(5))
+
+
+class TestCommonRandomNumbers:
+    """Crisis and resolution streams shared across runs."""
+
+    def test_common_streams(self):
+        plain = game_streams(5, 2)
+        common = game_streams(5, 2, common=True)
+
+        assert plain.crisis is None and plain.resolution is None
+        assert draws(common.engine) == draws(plain.engine)
+        assert draws(common.crisis) == draws(derive_rng(5, 2, CRISIS_STREAM))
+        assert draws(common.resolution) != draws(game_streams(5, 3, common=True).resolution)
+
+    def test_antithetic_pairs_share_resolution_stream(self):
+        even, odd = game_streams(5, 6, antithetic=True), game_streams(5, 7, antithetic=True)
+
+        assert (even.antithetic, odd.antithetic) == (False, True)
+        assert draws(even.resolution) == draws(odd.resolution)
+        assert even.crisis is None
+
+    def test_engine_draws_one_crisis_number_per_turn(self):
+        streams = game_streams(1, 0, common=True)
+        engine = GameEngine(SCENARIO_ID, get_scenario_repository(), streams=streams)
+        for _ in range(3):
+            cooperate = [
+                next(a for a in engine.get_available_actions(side) if a.action_type == ActionType.COOPERATIVE)
+                for side in "AB"
+            ]
+            engine.submit_actions(*cooperate)
+
+        assert streams.crisis.random() == draws(game_streams(1, 0, common=True).crisis, 4)[3]
+
+    def test_antithetic_resolution_noise(self):
+        repo = get_scenario_repository()
+        even = GameEngine(SCENARIO_ID, repo, streams=game_streams(3, 0, antithetic=True))
+        odd = GameEngine(SCENARIO_ID, repo, streams=game_streams(3, 1, antithetic=True))
+
+        vp_even, _ = even._final_resolution()
+        vp_odd, _ = odd._final_resolution()
+
+        assert vp_even != pytest.approx(50.0)
+        assert vp_even + vp_odd == pytest.approx(100.0)
+
+    def test_hashed_draws_depend_only_on_key(self):
+        keys = np.arange(1000)
+        whole = hashed_uniforms(9, CRISIS_STREAM, keys, 4)
+
+        assert np.array_equal(hashed_uniforms(9, CRISIS_STREAM, keys[::7], 4), whole[::7])
+        assert not np.array_equal(hashed_uniforms(9, CRISIS_STREAM, keys, 5), whole)
+        assert 0.0 <= whole.min() and whole.max() < 1.0
+        assert abs(whole.mean() - 0.5) < 0.05
+
+        normals = hashed_normals(9, 4, keys, antithetic=True)
+        assert np.array_equal(normals[1::2], -normals[0::2])
+
+    def test_keyed_generator(self):
+        rng = KeyedGenerator(1, 20, np.arange(50), step=3)
+        first, second = rng.random(50), rng.random(50)
+        ints = rng.integers(30, 71, size=50)
+
+        assert not np.array_equal(first, second)
+        assert np.array_equal(first, KeyedGenerator(1, 20, np.arange(50), step=3).random(50))
+        assert ints.min() >= 30 and ints.max() <= 70
+        with pytest.raises(ValueError):
+            rng.random(10)
+
+
+class TestVarianceReduction:
+    """Runners with common random numbers."""
+
+    def test_batch_games_independent_of_batch_size(self):
+        runner = BatchRunner(scenario_id=SCENARIO_ID, common_random_numbers=True)
+        small = runner.run_pairing_vectorized("Erratic", "Opportunist", num_games=100, seed=4)
+        large = runner.run_pairing_vectorized("Erratic", "Opportunist", num_games=300, seed=4)
+
+        assert large.total_value_list[:100] == small.total_value_list
+        assert large.vp_a_list[:100] == small.vp_a_list
+
+    def test_parameter_sets_share_games(self):
+        runner = BatchRunner(scenario_id=SCENARIO_ID, common_random_numbers=True, antithetic=True)
+        same = runner.run_parameter_sets_vectorized(
+            "Erratic", "Opportunist", [DEFAULT_PARAMETERS, DEFAULT_PARAMETERS], num_games=200, seed=1
+        )
+
+        assert same[0].to_dict() == same[1].to_dict()
+
+    def test_common_numbers_shrink_comparison_noise(self):
+        variant = DEFAULT_PARAMETERS.replace(variance_scale=1.2)
+
+        def difference_spread(common: bool) -> float:
+            differences = []
+            for seed in range(4):
+                runs = [
+                    BatchRunner(SCENARIO_ID, params=params, common_random_numbers=common).run_pairing(
+                        "Erratic", "Opportunist", num_games=30, seed=seed * 100 + offset, max_workers=1
+                    )
+                    for params, offset in ((None, 0), (variant, 0 if common else 50))
+                ]
+                differences.append(runs[1].avg_vp_a - runs[0].avg_vp_a)
+            return statistics.stdev(differences)
+
+        assert difference_spread(True) < difference_spread(False) / 3
+
+    def test_all_pairings_share_the_seed(self, tmp_path):
+        runner = BatchRunner(scenario_id=SCENARIO_ID, common_random_numbers=True)
+        with GameTableWriter(tmp_path / "games") as games:
+            runner.run_all_pairings(opponent_names=["TitForTat", "Erratic"], num_games=4, max_workers=1, games=games)
+
+        seeds = GameTable.open(tmp_path / "games")["seed"]
+        assert len(seeds) == 12
+        assert len(set(seeds.tolist())) == 1
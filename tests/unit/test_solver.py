@@ -0,0 +1,196 @@
+"""Unit tests for the exact game-tree solver.
+
+Tests cover:
+1. Closed-form final resolution matches sampling final_resolution
+2. cooperate_probability matches the sampled choose_cooperative
+3. Solved distributions are normalized and agree with BatchGameEngine
+4. BatchRunner.solve_pairing
+"""
+
+import math
+import random
+import time
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from brinksmanship.engine.batch_engine import COMPETITIVE, COOPERATIVE, NO_ACTION, BatchGameEngine, BatchState
+from brinksmanship.engine.game_engine import EndingType
+from brinksmanship.engine.solver import GameTreeSolver, SolverResult, _norm_cdf, _Totals
+from brinksmanship.engine.variance import final_resolution
+from brinksmanship.models.state import GameState, PlayerState
+from brinksmanship.opponents.batch_policies import BATCH_POLICIES
+from brinksmanship.storage import get_scenario_repository
+from brinksmanship.testing.batch_runner import BatchRunner
+from tests.unit.test_batch_engine import make_view, random_state
+
+SCENARIO_ID = "cuban_missile_crisis"
+
+
+@pytest.fixture(scope="module")
+def solver():
+    return GameTreeSolver(SCENARIO_ID, get_scenario_repository())
+
+
+def solve(solver, name_a, name_b) -> SolverResult:
+    return solver.solve(BATCH_POLICIES[name_a](1, is_player_a=True), BATCH_POLICIES[name_b](1, is_player_a=False))
+
+
+# =============================================================================
+# Analytic Final Resolution
+# =============================================================================
+
+
+class TestAnalyticResolution:
+    """The clipped-normal integrals used for final resolution."""
+
+    def test_norm_cdf_matches_erfc(self):
+        x = np.linspace(-9.0, 9.0, 1001)
+        expected = [0.5 * math.erfc(-v / math.sqrt(2.0)) for v in x]
+
+        np.testing.assert_allclose(_norm_cdf(x), expected, atol=1e-7)
+
+    def test_resolution_matches_sampling(self):
+        """Expected VP and win rate of one state against final_resolution draws."""
+        state = GameState(
+            player_a=PlayerState(position=6.5, resources=4.0),
+            player_b=PlayerState(position=5.0, resources=5.0),
+            stability=3.0,
+            risk_level=6.0,
+            turn=9,
+        )
+        totals = _Totals()
+        totals.add_resolution(np.array([1.0]), BatchState.from_game_states([state]), EndingType.NATURAL_ENDING)
+
+        rng = random.Random(0)
+        samples = [final_resolution(state, rng=rng)[0] for _ in range(40_000)]
+        assert totals.vp_a == pytest.approx(np.mean(samples), abs=0.25)
+        assert totals.winner[0] == pytest.approx(np.mean(np.array(samples) > 50.005), abs=0.01)
+        assert totals.vp_a + totals.vp_b == pytest.approx(100.0)
+
+
+# =============================================================================
+# Policy Probabilities
+# =============================================================================
+
+
+class TestCooperateProbability:
+    """cooperate_probability is the law of choose_cooperative."""
+
+    @pytest.mark.parametrize("name", sorted(BATCH_POLICIES))
+    def test_matches_sampled_choice(self, name):
+        rng = random.Random(5)
+        states = [random_state(rng) for _ in range(40)]
+        view = make_view(states)
+        view.opponent_previous_type = np.resize(np.array([NO_ACTION, COOPERATIVE, COMPETITIVE], dtype=np.int8), 40)
+        policy = BATCH_POLICIES[name](len(states), is_player_a=True)
+
+        probability = policy.cooperate_probability(view)
+        draws = np.random.default_rng(0)
+        frequency = np.mean([policy.choose_cooperative(view, draws) for _ in range(2000)], axis=0)
+
+        np.testing.assert_allclose(frequency, probability, atol=0.05)
+
+
+# =============================================================================
+# GameTreeSolver
+# =============================================================================
+
+
+class TestGameTreeSolver:
+    """Solved distributions against sampled games."""
+
+    @pytest.mark.parametrize(("name_a", "name_b"), [("TitForTat", "Opportunist"), ("NashCalculator", "SecuritySeeker")])
+    def test_probabilities_sum_to_one(self, solver, name_a, name_b):
+        result = solve(solver, name_a, name_b)
+
+        assert sum(result.ending_probabilities.values()) == pytest.approx(1.0)
+        assert sum(result.winner_probabilities.values()) == pytest.approx(1.0)
+        assert result.unresolved_probability == 0.0
+        assert result.states_expanded > 0
+
+    def test_deterministic_pairing_has_single_ending(self, solver):
+        """TitForTat self-play never randomizes, so only the final noise remains."""
+        outcome = BatchGameEngine(SCENARIO_ID, get_scenario_repository(), num_games=200, seed=3).run(
+            BATCH_POLICIES["TitForTat"](200, is_player_a=True),
+            BATCH_POLICIES["TitForTat"](200, is_player_a=False),
+        )
+        result = solve(solver, "TitForTat", "TitForTat")
+
+        for ending_type in EndingType:
+            share = outcome.ending_mask(ending_type).mean()
+            assert result.ending_probabilities.get(ending_type, 0.0) == pytest.approx(share, abs=0.1)
+
+    @pytest.mark.parametrize(("name_a", "name_b"), [("TitForTat", "Opportunist"), ("NashCalculator", "SecuritySeeker")])
+    def test_agrees_with_batch_engine(self, solver, name_a, name_b):
+        num_games = 20_000
+        outcome = BatchGameEngine(SCENARIO_ID, get_scenario_repository(), num_games=num_games, seed=9).run(
+            BATCH_POLICIES[name_a](num_games, is_player_a=True),
+            BATCH_POLICIES[name_b](num_games, is_player_a=False),
+        )
+        result = solve(solver, name_a, name_b)
+
+        standard_error = outcome.vp_a.std() / math.sqrt(num_games)
+        assert result.expected_vp_a == pytest.approx(outcome.vp_a.mean(), abs=4 * standard_error + 1e-6)
+        for ending_type, probability in result.ending_probabilities.items():
+            assert probability == pytest.approx(outcome.ending_mask(ending_type).mean(), abs=0.015)
+
+    def test_deterministic_pairing_keeps_fine_grid(self, solver):
+        result = solve(solver, "TitForTat", "Opportunist")
+
+        assert result.resolution == solver.resolution
+
+    def test_erratic_pairing_is_bounded(self):
+        """A uniformly random policy coarsens the grid instead of exhausting memory."""
+        solver = GameTreeSolver(SCENARIO_ID, get_scenario_repository(), max_states=2_000)
+        num_games = 20_000
+        outcome = BatchGameEngine(SCENARIO_ID, get_scenario_repository(), num_games=num_games, seed=4).run(
+            BATCH_POLICIES["NashCalculator"](num_games, is_player_a=True),
+            BATCH_POLICIES["Erratic"](num_games, is_player_a=False),
+        )
+
+        tracemalloc.start()
+        started = time.perf_counter()
+        try:
+            result = solve(solver, "NashCalculator", "Erratic")
+            elapsed = time.perf_counter() - started
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        assert elapsed < 30
+        assert peak < 500 * 2**20
+        assert result.resolution > solver.resolution
+        assert sum(result.ending_probabilities.values()) == pytest.approx(1.0)
+        assert result.expected_vp_a == pytest.approx(outcome.vp_a.mean(), abs=1.5)
+
+    def test_max_states_too_small_raises(self):
+        """Discrete state alone can exceed the budget; that is an error, not a hang."""
+        solver = GameTreeSolver(SCENARIO_ID, get_scenario_repository(), max_states=1)
+
+        with pytest.raises(ValueError, match="max_states"):
+            solve(solver, "NashCalculator", "Erratic")
+
+    def test_min_probability_reports_dropped_mass(self):
+        solver = GameTreeSolver(SCENARIO_ID, get_scenario_repository(), min_probability=1e-3)
+
+        result = solve(solver, "TitForTat", "Opportunist")
+
+        assert result.unresolved_probability > 0
+        assert sum(result.ending_probabilities.values()) + result.unresolved_probability == pytest.approx(1.0)
+
+
+class TestSolvePairing:
+    """BatchRunner.solve_pairing."""
+
+    def test_solve_pairing(self):
+        result = BatchRunner(scenario_id=SCENARIO_ID).solve_pairing("GrimTrigger", "TitForTat")
+
+        assert isinstance(result, SolverResult)
+        assert result.opponent_a_name == BATCH_POLICIES["GrimTrigger"](1, is_player_a=True).name
+        assert result.expected_vp_a + result.expected_vp_b == pytest.approx(100.0)
+
+    def test_unknown_opponent_raises(self):
+        with pytest.raises(ValueError, match="No vectorized policy"):
+            BatchRunner(scenario_id=SCENARIO_ID).solve_pairing("Khrushchev", "TitForTat")
@@ -28,10 +28,12 @@ import pytest
 from brinksmanship.models.actions import ActionType
 from brinksmanship.models.state import (
     ActionResult,
+    EngineState,
     GameState,
     InformationState,
     PlayerState,
     apply_action_result,
+    apply_action_result_in_place,
     update_cooperation_score,
     update_stability,
 )
@@ -619,6 +621,78 @@ class TestApplyActionResult:
         assert new_state.cooperation_streak == 3
 
 
+class TestEngineState:
+    """Tests for the slotted engine-internal state."""
+
+    def test_round_trip_matches_game_state(self):
+        """Converting to EngineState and back reproduces the GameState."""
+        state = GameState(
+            player_a=PlayerState(position=6.5, resources=3.0, previous_type=ActionType.COMPETITIVE),
+            player_b=PlayerState(position=3.5, resources=7.0, previous_type=ActionType.COOPERATIVE),
+            cooperation_score=4.0,
+            stability=7.5,
+            risk_level=6.0,
+            turn=9,
+            max_turns=15,
+            cooperation_surplus=4.2,
+            surplus_captured_a=1.0,
+            surplus_captured_b=0.5,
+            cooperation_streak=2,
+        )
+        state.player_a.information.update_position(3.5, 7)
+
+        restored = EngineState.from_game_state(state).to_game_state()
+
+        assert restored == state
+        assert restored.to_json() == state.to_json()
+        assert restored.shared_sigma == pytest.approx(state.shared_sigma)
+
+    def test_copies_information_by_default(self):
+        """Information states are independent unless sharing is requested."""
+        state = GameState()
+
+        copied = EngineState.from_game_state(state)
+        shared = EngineState.from_game_state(state, copy_information=False)
+        state.player_a.information.update_resources(2.0, 3)
+
+        assert copied.information_a.known_resources is None
+        assert shared.information_a.known_resources == 2.0
+
+    def test_uses_slots(self):
+        """EngineState has no per-instance __dict__."""
+        assert not hasattr(EngineState(), "__dict__")
+
+    @pytest.mark.parametrize(
+        "action_a,action_b",
+        [
+            (ActionType.COOPERATIVE, ActionType.COOPERATIVE),
+            (ActionType.COOPERATIVE, ActionType.COMPETITIVE),
+            (ActionType.COMPETITIVE, ActionType.COMPETITIVE),
+        ],
+    )
+    def test_in_place_update_matches_apply_action_result(self, action_a, action_b):
+        """apply_action_result_in_place produces the same state as apply_action_result."""
+        state = GameState(
+            player_a=PlayerState(position=9.8, resources=0.2, previous_type=ActionType.COOPERATIVE),
+            risk_level=7.0,
+            turn=6,
+        )
+        result = ActionResult(
+            action_a=action_a,
+            action_b=action_b,
+            position_delta_a=0.8,
+            position_delta_b=-0.4,
+            resource_cost_a=0.5,
+            risk_delta=1.5,
+        )
+
+        engine_state = EngineState.from_game_state(state)
+        returned = apply_action_result_in_place(engine_state, result)
+
+        assert returned is engine_state
+        assert engine_state.to_game_state() == apply_action_result(state, result)
+
+
 class TestEdgeCases:
     """Tests for edge cases and boundary conditions."""
 
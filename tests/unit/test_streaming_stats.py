@@ -0,0 +1,186 @@
+"""Unit tests for constant-memory streaming statistics.
+
+Tests cover:
+1. RunningStats matches exact mean/variance and merges across splits
+2. QuantileSketch stays within its relative accuracy and merges exactly
+3. Histogram bin counts and merging
+4. PairingStats/BatchResults with and without per-game history
+"""
+
+import pickle
+import statistics
+
+import numpy as np
+import pytest
+
+from brinksmanship.testing.batch_runner import BatchResults, BatchRunner, PairingStats
+from brinksmanship.testing.streaming_stats import Histogram, QuantileSketch, RunningStats
+
+SCENARIO_ID = "cuban_missile_crisis"
+
+
+@pytest.fixture
+def values() -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return np.concatenate([rng.lognormal(3.0, 1.0, 5000), np.zeros(50), -rng.exponential(2.0, 500)])
+
+
+class TestRunningStats:
+    """Welford/Chan mean and variance."""
+
+    def test_matches_exact_statistics(self, values):
+        stats = RunningStats()
+        for value in values.tolist():
+            stats.add(value)
+
+        assert stats.count == len(values)
+        assert stats.mean == pytest.approx(statistics.mean(values.tolist()))
+        assert stats.stdev == pytest.approx(statistics.stdev(values.tolist()))
+        assert (stats.min, stats.max) == (values.min(), values.max())
+        assert stats.total == pytest.approx(values.sum())
+
+    def test_merge_of_splits_equals_whole(self, values):
+        whole = RunningStats()
+        whole.add_array(values)
+
+        merged = RunningStats()
+        for part in np.array_split(values, 7):
+            partial = RunningStats()
+            partial.add_array(part)
+            merged.merge(partial)
+
+        assert merged.count == whole.count
+        assert merged.mean == pytest.approx(whole.mean)
+        assert merged.variance == pytest.approx(whole.variance)
+        assert (merged.min, merged.max) == (whole.min, whole.max)
+
+    def test_empty_and_single(self):
+        stats = RunningStats()
+        stats.merge(RunningStats())
+        assert (stats.count, stats.mean, stats.stdev) == (0, 0.0, 0.0)
+
+        stats.add(4.0)
+        assert (stats.mean, stats.stdev) == (4.0, 0.0)
+
+
+class TestQuantileSketch:
+    """Relative-error quantiles."""
+
+    @pytest.mark.parametrize("q", [0.0, 0.01, 0.1, 0.25, 0.5, 0.9, 0.99, 1.0])
+    def test_within_relative_accuracy(self, values, q):
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        sketch.add_array(values)
+
+        exact = np.sort(values)[int(q * (len(values) - 1))]
+        assert abs(sketch.quantile(q) - exact) <= 0.01 * abs(exact) + 1e-12
+
+    def test_add_and_add_array_agree(self, values):
+        one_by_one = QuantileSketch()
+        for value in values.tolist():
+            one_by_one.add(value)
+        vectorized = QuantileSketch()
+        vectorized.add_array(values)
+
+        assert one_by_one.positive == vectorized.positive
+        assert one_by_one.negative == vectorized.negative
+        assert one_by_one.zero_count == vectorized.zero_count
+
+    def test_merge_is_exact(self, values):
+        whole = QuantileSketch()
+        whole.add_array(values)
+        merged = QuantileSketch()
+        for part in np.array_split(values, 4):
+            partial = QuantileSketch()
+            partial.add_array(part)
+            merged.merge(partial)
+
+        assert [merged.quantile(q) for q in (0.1, 0.5, 0.9)] == [whole.quantile(q) for q in (0.1, 0.5, 0.9)]
+
+    def test_size_is_logarithmic(self):
+        sketch = QuantileSketch()
+        sketch.add_array(np.random.default_rng(1).uniform(0.0, 200.0, 1_000_000))
+        assert sketch.count == 1_000_000
+        assert len(sketch) < 1000
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            QuantileSketch(relative_accuracy=0.0)
+        with pytest.raises(ValueError):
+            QuantileSketch().quantile(1.5)
+        with pytest.raises(ValueError):
+            QuantileSketch(relative_accuracy=0.01).merge(QuantileSketch(relative_accuracy=0.02))
+        assert QuantileSketch().quantile(0.5) == 0.0
+
+
+class TestHistogram:
+    """Fixed-range bins."""
+
+    def test_matches_numpy(self):
+        data = np.random.default_rng(2).uniform(0.0, 1.0, 1000)
+        histogram = Histogram(0.0, 1.0, 10)
+        histogram.add_array(data[:500])
+        for value in data[500:].tolist():
+            histogram.add(value)
+
+        expected, _ = np.histogram(data, bins=histogram.edges)
+        assert histogram.counts.tolist() == expected.tolist()
+
+    def test_clamps_and_merges(self):
+        first = Histogram(0.0, 1.0, 4)
+        first.add_array(np.array([-1.0, 0.1, 1.0, 5.0]))
+        second = Histogram(0.0, 1.0, 4)
+        second.add(0.6)
+        first.merge(second)
+
+        assert first.counts.tolist() == [2, 0, 1, 2]
+        with pytest.raises(ValueError):
+            first.merge(Histogram(0.0, 1.0, 5))
+
+
+class TestPairingStatsStreaming:
+    """PairingStats summaries with and without per-game lists."""
+
+    def test_summaries_without_history(self):
+        runner = BatchRunner(scenario_id=SCENARIO_ID)
+        kept = runner.run_pairing_vectorized("Opportunist", "Erratic", num_games=2000, seed=3)
+        streamed = runner.run_pairing_vectorized("Opportunist", "Erratic", num_games=2000, seed=3, keep_games=False)
+
+        assert streamed.vp_a_list == [] and streamed.total_value_list == []
+        assert streamed.to_dict() == kept.to_dict()
+        assert kept.avg_vp_a == pytest.approx(statistics.mean(kept.vp_a_list))
+        assert kept.total_value_std == pytest.approx(statistics.stdev(kept.total_value_list))
+        assert sum(kept.vp_share_a_histogram.counts) == 2000
+
+    def test_large_run_stays_small(self):
+        stats = BatchRunner(scenario_id=SCENARIO_ID).run_pairing_vectorized(
+            "NashCalculator", "Erratic", num_games=200_000, seed=4, keep_games=False
+        )
+
+        assert stats.total_games == 200_000
+        assert len(pickle.dumps(stats)) < 64_000
+
+    def test_merge_drops_history_if_either_side_dropped_it(self):
+        runner = BatchRunner(scenario_id=SCENARIO_ID)
+        kept = runner.run_pairing_vectorized("TitForTat", "Erratic", num_games=50, seed=1)
+        streamed = runner.run_pairing_vectorized("TitForTat", "Erratic", num_games=50, seed=2, keep_games=False)
+
+        kept.merge(streamed)
+
+        assert not kept.keep_games
+        assert kept.vp_a_list == []
+        assert kept.vp_a_stats.count == 100
+
+    def test_batch_results_aggregate_from_summaries(self):
+        runner = BatchRunner(scenario_id=SCENARIO_ID)
+        results = BatchResults(scenario_id=SCENARIO_ID)
+        for seed, pairing in enumerate([("TitForTat", "Erratic"), ("Erratic", "Erratic")]):
+            results.pairings[":".join(pairing)] = runner.run_pairing_vectorized(*pairing, num_games=500, seed=seed)
+
+        results.compute_aggregate()
+
+        all_vp = [vp for s in results.pairings.values() for vp in s.vp_a_list + s.vp_b_list]
+        all_total = [tv for s in results.pairings.values() for tv in s.total_value_list]
+        assert results.aggregate["total_games"] == 1000
+        assert results.aggregate["vp_std_dev"] == round(statistics.stdev(all_vp), 2)
+        assert results.aggregate["avg_total_value"] == round(statistics.mean(all_total), 2)
+        assert results.aggregate["total_value_p50"] == pytest.approx(np.median(all_total), rel=0.02)
@@ -0,0 +1,115 @@
+"""Unit tests for cross-scenario tournaments.
+
+Tests cover:
+1. Jobs cover every scenario x ordered pairing, longest first
+2. Seeded results do not depend on workers or schedule
+3. Tournament jobs match BatchRunner pairings with the same seeds
+4. Matrices, opponent scores and JSON export
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from brinksmanship.testing.batch_runner import BatchRunner
+from brinksmanship.testing.tournament import TOURNAMENT_METRICS, TournamentRunner
+
+SCENARIOS = ["cuban_missile_crisis", "berlin_blockade"]
+
+
+class TestJobs:
+    """Scheduling of scenario x pairing jobs."""
+
+    def test_every_scenario_and_side(self, opponent_names):
+        jobs = TournamentRunner(SCENARIOS, opponent_names).jobs(num_games=10, seed=1)
+
+        keys = {(job.scenario_id, job.opponent_a, job.opponent_b) for job in jobs}
+        assert len(jobs) == len(keys) == 2 * 9
+        assert ("berlin_blockade", "Erratic", "TitForTat") in keys
+        assert ("berlin_blockade", "TitForTat", "Erratic") in keys
+
+    def test_longest_first(self, opponent_names):
+        jobs = TournamentRunner(SCENARIOS, opponent_names).jobs(num_games=10, seed=1)
+        costs = [job.estimated_cost for job in jobs]
+
+        assert costs == sorted(costs, reverse=True)
+        assert costs[0] > costs[-1]
+
+    def test_seeds_follow_scenario_and_pairing_order(self, opponent_names):
+        jobs = TournamentRunner(SCENARIOS, opponent_names).jobs(num_games=10, seed=100, pilot_games=0)
+
+        assert sorted(job.seed for job in jobs) == [100 + k * 10 for k in range(18)]
+        crn = TournamentRunner(SCENARIOS, opponent_names, common_random_numbers=True).jobs(10, seed=100, pilot_games=0)
+        assert {job.seed for job in crn} == {100}
+
+
+class TestRun:
+    """Tournaments on one pool."""
+
+    def test_results_independent_of_schedule(self, opponent_names, summaries):
+        in_process = TournamentRunner(SCENARIOS, opponent_names, max_workers=1).run(
+            num_games=6, seed=3, chunk_size=4, quiet=True
+        )
+        pooled = TournamentRunner(SCENARIOS, opponent_names, max_workers=2).run(
+            num_games=6, seed=3, chunk_size=4, pilot_games=0, quiet=True
+        )
+
+        for scenario_id, batch in in_process.scenarios.items():
+            assert summaries(pooled.scenarios[scenario_id]) == summaries(batch)
+        assert list(pooled.scenarios) == SCENARIOS
+        assert list(in_process.scenarios) == SCENARIOS
+
+    def test_jobs_match_batch_runner(self):
+        runner = TournamentRunner(["berlin_blockade"], ["TitForTat", "Erratic"], max_workers=1)
+        results = runner.run(num_games=5, seed=7, quiet=True)
+        job = next(j for j in runner.jobs(5, seed=7) if j.pairing_key == "Erratic:TitForTat")
+
+        stats = BatchRunner("berlin_blockade").run_pairing(
+            "Erratic", "TitForTat", num_games=5, seed=job.seed, max_workers=1, keep_games=False
+        )
+        assert results.scenarios["berlin_blockade"].pairings["Erratic:TitForTat"].to_dict() == stats.to_dict()
+
+    def test_vectorized(self, opponent_names):
+        results = TournamentRunner(SCENARIOS, opponent_names, max_workers=1).run(
+            num_games=50, seed=1, vectorized=True, quiet=True
+        )
+
+        assert all(stats.total_games == 50 for batch in results.scenarios.values() for stats in batch.pairings.values())
+        with pytest.raises(ValueError):
+            TournamentRunner(SCENARIOS, ["NoSuchOpponent"]).run(num_games=5, vectorized=True, quiet=True)
+
+
+@pytest.fixture(scope="module")
+def results(opponent_names):
+    return TournamentRunner(SCENARIOS, opponent_names, max_workers=1).run(
+        num_games=40, seed=5, vectorized=True, quiet=True
+    )
+
+
+class TestResults:
+    """Matrices and export."""
+
+    def test_matrix_rows_are_side_a(self, results):
+        matrix = results.matrix("cuban_missile_crisis", "win_rate_a")
+        pairings = results.scenarios["cuban_missile_crisis"].pairings
+
+        assert matrix.shape == (3, 3)
+        assert matrix[1, 2] == pairings["Erratic:Opportunist"].win_rate_a
+        assert matrix[2, 1] == pairings["Opportunist:Erratic"].win_rate_a
+        with pytest.raises(ValueError):
+            results.matrix("cuban_missile_crisis", "no_such_metric")
+
+    def test_opponent_scores_cover_both_sides(self, results):
+        scores = results.opponent_scores("berlin_blockade")
+        share = results.matrix("berlin_blockade", "avg_vp_share_a")
+
+        expected = (share[0].sum() + (1 - share[:, 0]).sum()) / 6
+        assert scores["TitForTat"] == pytest.approx(expected)
+
+    def test_to_json(self, results, opponent_names):
+        data = json.loads(results.to_json())
+
+        assert data["opponents"] == opponent_names
+        assert set(data["scenarios"]["berlin_blockade"]["matrices"]) == set(TOURNAMENT_METRICS)
+        assert np.array(data["scenarios"]["berlin_blockade"]["matrices"]["avg_vp_a"]).shape == (3, 3)
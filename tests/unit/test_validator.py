@@ -0,0 +1,109 @@
+"""Unit tests for the engine-backed balance simulation in the scenario validator.
+
+Tests cover:
+1. run_balance_simulation matches BatchRunner on the stored scenario
+2. Results do not depend on the number of worker processes
+3. Unsaved scenarios (dict and Scenario object), scenario edits and compile errors
+4. InMemoryScenarioRepository versions and isolation
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from brinksmanship.generation.schemas import Scenario
+from brinksmanship.generation.validator import (
+    SIM_STRATEGIES,
+    ScenarioValidator,
+    check_dominant_strategy,
+    run_balance_simulation,
+)
+from brinksmanship.storage import InMemoryScenarioRepository
+from brinksmanship.testing.batch_runner import BatchRunner
+
+SCENARIO_ID = "cuban_missile_crisis"
+SCENARIO_PATH = Path(__file__).parent.parent.parent / "scenarios" / f"{SCENARIO_ID}.json"
+
+
+@pytest.fixture
+def scenario() -> dict:
+    return json.loads(SCENARIO_PATH.read_text())
+
+
+class TestBalanceSimulation:
+    """run_balance_simulation on the real mechanics."""
+
+    def test_matches_batch_runner(self, scenario):
+        sim = run_balance_simulation(scenario, games=40, seed=5, max_workers=1)
+        batch = BatchRunner(SCENARIO_ID).run_all_pairings(
+            opponent_names=SIM_STRATEGIES, num_games=40, seed=5, max_workers=1, vectorized=True, quiet=True
+        )
+
+        assert sim.games_played == batch.aggregate["total_games"]
+        assert sim.settlement_rate == pytest.approx(batch.aggregate["settlement_rate"], abs=1e-3)
+        assert sim.mutual_destruction_rate == pytest.approx(batch.aggregate["mutual_destruction_rate"], abs=1e-3)
+        for stats in batch.pairings.values():
+            assert sim.head_to_head[stats.opponent_a][stats.opponent_b] == stats.win_rate_a
+
+        # Every strategy sits in one seat per opponent and both seats of its self-pairing
+        seat_games = 40 * (len(SIM_STRATEGIES) + 1)
+        total_wins = sum(stats.wins_a + stats.wins_b for stats in batch.pairings.values())
+        assert sum(sim.strategy_win_rates.values()) * seat_games == pytest.approx(total_wins)
+
+    def test_independent_of_workers(self, scenario):
+        serial = run_balance_simulation(scenario, games=30, seed=2, max_workers=1)
+        parallel = run_balance_simulation(scenario, games=30, seed=2, max_workers=2)
+
+        assert parallel == serial
+        assert set(serial.strategy_win_rates) == set(SIM_STRATEGIES)
+
+    def test_scenario_object_and_edits(self, scenario):
+        scenario.pop("personas", None)
+        as_object = run_balance_simulation(Scenario.model_validate(scenario), games=30, seed=4, max_workers=1)
+        as_dict = run_balance_simulation(scenario, games=30, seed=4, max_workers=1)
+        assert as_object == as_dict
+
+        for turn in scenario["turns"]:
+            turn["matrix_type"] = "HARMONY"
+            turn.pop("matrix_parameters", None)
+        harmony = run_balance_simulation(scenario, games=30, seed=4, max_workers=1)
+        assert harmony != as_dict
+
+    def test_uncompilable_scenario(self, scenario):
+        scenario["turns"][0]["matrix_type"] = "NOT_A_GAME"
+        with pytest.raises(ValueError):
+            run_balance_simulation(scenario, games=2, max_workers=1)
+
+        result = ScenarioValidator(simulation_games=2).validate(scenario=scenario)
+
+        assert not result.balance.passed and not result.overall_passed
+        assert result.simulation_results is None
+        assert "NOT_A_GAME" in result.balance.issues[0].message
+
+    def test_validator_reports_balance(self, scenario):
+        result = ScenarioValidator(simulation_games=20, simulation_seed=1).validate(scenario=scenario)
+
+        assert result.simulation_results.games_played == 20 * len(SIM_STRATEGIES) * (len(SIM_STRATEGIES) + 1) // 2
+        assert result.balance == check_dominant_strategy(result.simulation_results)
+
+
+class TestInMemoryScenarioRepository:
+    """Versions and copies of unsaved scenarios."""
+
+    def test_version_follows_content(self):
+        repo = InMemoryScenarioRepository([{"scenario_id": "s", "turns": []}])
+        version = repo.get_scenario_version("s")
+
+        assert repo.save_scenario({"scenario_id": "s", "turns": []}) == "s"
+        assert repo.get_scenario_version("s") == version
+        repo.save_scenario({"scenario_id": "s", "turns": [{"turn": 1}]})
+        assert repo.get_scenario_version("s") != version
+        assert repo.get_scenario_version("missing") is None
+
+    def test_returns_copies(self):
+        repo = InMemoryScenarioRepository([{"name": "Copy Test", "turns": [{"turn": 1}]}])
+
+        repo.get_scenario("copy-test")["turns"].clear()
+
+        assert repo.get_scenario("copy-test")["turns"] == [{"turn": 1}]
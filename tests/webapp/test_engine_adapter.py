@@ -148,3 +148,23 @@ def test_game_flow(real_engine, test_scenario_file):
 
     assert turns_played > 0
     assert len(state["history"]) == turns_played
+
+
+def test_resume_from_engine_snapshot(real_engine):
+    """Stored snapshots resume the exact engine, including max_turns and RNG."""
+    state = real_engine.create_game("cuban_missile_crisis", "tit_for_tat", user_id=5)
+    assert isinstance(state["engine_snapshot"], bytes)
+
+    first = real_engine._create_engine_from_state(state)
+    second = real_engine._create_engine_from_state(state)
+
+    assert first.state.max_turns == state["max_turns"]
+    assert first.state == second.state
+    assert first._random.random() == second._random.random()
+
+    actions = real_engine.get_available_actions(state)
+    new_state = real_engine.submit_action(state, actions[0]["id"])
+    resumed = real_engine._create_engine_from_state(new_state)
+
+    assert resumed.state.turn == new_state["turn"]
+    assert resumed.state.max_turns == state["max_turns"]
@@ -23,6 +23,7 @@ def test_surplus_fields_synced_on_engine_recreation(engine: RealGameEngine) -> N
     state["surplus_captured_player"] = 5.0
     state["surplus_captured_opponent"] = 3.0
     state["cooperation_streak"] = 4
+    del state["engine_snapshot"]  # Legacy state dict, rebuilt from the flat fields
 
     recreated_engine = engine._create_engine_from_state(state)
 
@@ -45,6 +46,7 @@ def test_surplus_fields_synced_player_b(engine: RealGameEngine) -> None:
     state["surplus_captured_player"] = 8.0  # Player is B
     state["surplus_captured_opponent"] = 4.0  # Opponent is A
     state["cooperation_streak"] = 3
+    del state["engine_snapshot"]  # Legacy state dict, rebuilt from the flat fields
 
     recreated_engine = engine._create_engine_from_state(state)
 
@@ -0,0 +1,75 @@
+"""Tests for upgrading databases created with an older schema."""
+
+import sqlite3
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from brinksmanship.webapp.config import TestConfig
+from brinksmanship.webapp.extensions import db
+from brinksmanship.webapp.models import User
+from brinksmanship.webapp.models.game_record import GameRecord
+from brinksmanship.webapp.services.engine_adapter import RealGameEngine
+
+
+def make_app(database_path):
+    class FileConfig(TestConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{database_path}"
+
+    with patch("brinksmanship.webapp.app.check_claude_api_credentials", AsyncMock(return_value=True)):
+        from brinksmanship.webapp import create_app
+
+        return create_app(FileConfig)
+
+
+@pytest.fixture
+def old_database(tmp_path):
+    """A database with a game saved before GameRecord.engine_snapshot existed."""
+    database_path = tmp_path / "old.db"
+    app = make_app(database_path)
+    with app.app_context():
+        user = User(username="veteran")
+        user.set_password("password123")
+        db.session.add(user)
+        db.session.commit()
+
+        state = RealGameEngine().create_game("cuban_missile_crisis", "tit_for_tat", user_id=user.id, game_id="old-game")
+        del state["engine_snapshot"]
+        record = GameRecord(
+            game_id="old-game", user_id=user.id, scenario_id=state["scenario_id"], opponent_type="tit_for_tat"
+        )
+        record.state = state
+        db.session.add(record)
+        db.session.commit()
+        db.session.remove()
+        db.engine.dispose()
+
+    with sqlite3.connect(database_path) as connection:
+        connection.execute("ALTER TABLE game_records DROP COLUMN engine_snapshot")
+    return database_path
+
+
+def test_startup_adds_missing_column(old_database):
+    app = make_app(old_database)
+
+    with app.app_context():
+        record = GameRecord.query.filter_by(game_id="old-game").one()
+        assert record.engine_snapshot is None
+
+        # Old games resume through the flat-field reconstruction
+        engine = RealGameEngine()
+        action_id = engine.get_available_actions(record.state)[0]["id"]
+        record.state = engine.submit_action(record.state, action_id)
+        db.session.commit()
+        assert GameRecord.query.filter_by(game_id="old-game").one().engine_snapshot is not None
+        db.engine.dispose()
+
+
+def test_startup_is_idempotent(old_database):
+    make_app(old_database)
+    app = make_app(old_database)
+
+    with app.app_context():
+        columns = [row[1] for row in db.session.execute(db.text("PRAGMA table_info(game_records)"))]
+        assert columns.count("engine_snapshot") == 1
+        db.engine.dispose()